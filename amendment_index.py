@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+
+EPOCH = pd.Timestamp('1970-01-01')
+
+
+def build_amendment_index(amendment_data):
+    """Sort amendments by date once at build time so the page can binary-search them.
+
+    Returns a JSON-ready dict with:
+      t          - distinct amendment timestamps (ms since epoch, UTC), ascending
+      cumulative - number of amendments on or before each of those timestamps
+      total      - number of amendments
+      byFain     - per FAIN, parallel arrays t / date / type sorted by t
+
+    "Amendments up to X" is then cumulative[upperBound(t, X) - 1], and
+    "amendments for a FAIN within [start, end]" is a slice of its arrays.
+    """
+    frame = pd.DataFrame(
+        [(str(fain), amendment['date'], amendment['type'])
+         for fain, amendments in amendment_data.items() for amendment in amendments],
+        columns=['fain', 'date', 'type'],
+    )
+    frame['t'] = (pd.to_datetime(frame['date'], errors='coerce') - EPOCH) // pd.Timedelta(milliseconds=1)
+    frame = frame.dropna(subset=['t']).sort_values('t', kind='stable')
+    frame['t'] = frame['t'].astype('int64')
+
+    times, counts = np.unique(frame['t'].to_numpy(), return_counts=True)
+    by_fain = {
+        fain: {
+            't': group['t'].tolist(),
+            'date': group['date'].tolist(),
+            'type': group['type'].tolist(),
+        }
+        for fain, group in frame.groupby('fain', sort=False)
+    }
+    return {
+        't': times.tolist(),
+        'cumulative': np.cumsum(counts).tolist(),
+        'total': len(frame),
+        'byFain': by_fain,
+    }
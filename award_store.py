@@ -0,0 +1,277 @@
+import hashlib
+import json
+import math
+import os
+import sqlite3
+from datetime import datetime
+
+from cumulative_series import closeout_dates
+from facet_index import parse_states
+
+# Local database of the last build's awards and amendments, for ad-hoc questions
+# without re-reading the source exports
+STORE_PATH = 'awards.db'
+
+# Award record fields stored as their own (indexable) columns; the full record is kept as JSON
+AWARD_COLUMNS = {
+    'fain': 'FAIN',
+    'title': 'Title',
+    'start_date': 'Project Start Date',
+    'end_date': 'Project End Date',
+    'grant_lead': 'Grant Lead',
+    'programs_staff_lead': 'Programs Staff Lead',
+    'recipient': 'Recipient',
+    'grant_program': 'Grant Program',
+    'award_amount': 'Award Amount',
+}
+
+SCHEMA = '''
+CREATE TABLE awards (
+    row INTEGER PRIMARY KEY,  -- position in data/award_data.js
+    fain TEXT NOT NULL,
+    title TEXT,
+    start_date TEXT,          -- YYYY-MM-DD
+    end_date TEXT,
+    grant_lead TEXT,
+    programs_staff_lead TEXT,
+    recipient TEXT,
+    grant_program TEXT,
+    award_amount REAL,
+    closeout_date TEXT,       -- first closeout amendment, as the dashboards use it
+    record TEXT NOT NULL      -- the full award record as JSON
+);
+CREATE TABLE award_states (
+    row INTEGER NOT NULL REFERENCES awards(row),
+    state TEXT NOT NULL
+);
+CREATE TABLE amendments (
+    fain TEXT NOT NULL,
+    seq INTEGER NOT NULL,     -- order within the FAIN, as in the Award Details export
+    date TEXT NOT NULL,
+    type TEXT,
+    is_closeout INTEGER NOT NULL
+);
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+
+CREATE INDEX awards_fain ON awards(fain);
+CREATE INDEX awards_end_date ON awards(end_date);
+CREATE INDEX awards_grant_lead ON awards(grant_lead, end_date);
+CREATE INDEX awards_programs_staff_lead ON awards(programs_staff_lead, end_date);
+CREATE INDEX awards_recipient ON awards(recipient);
+CREATE INDEX awards_grant_program ON awards(grant_program, end_date);
+CREATE INDEX awards_closeout_date ON awards(closeout_date);
+CREATE INDEX award_states_state ON award_states(state, row);
+CREATE INDEX amendments_fain ON amendments(fain, seq);
+CREATE INDEX amendments_date ON amendments(date);
+'''
+
+
+def _value(value):
+    # NaN from the source becomes NULL, and null in the stored JSON
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    return value
+
+
+def _is_closeout(amendment):
+    return 'closeout' in str(amendment.get('type') or '').strip().lower()
+
+
+def _data_sha256(records, amendment_data):
+    # The schema is part of the hash, so a schema change rebuilds the store
+    payload = json.dumps([SCHEMA, records, amendment_data], sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def _stored_sha256(path):
+    """The data hash recorded in the store at path, or None."""
+    if not os.path.exists(path):
+        return None
+    conn = sqlite3.connect(f'file:{path}?mode=ro', uri=True)
+    try:
+        row = conn.execute("SELECT value FROM meta WHERE key = 'data_sha256'").fetchone()
+    except sqlite3.Error:
+        return None
+    finally:
+        conn.close()
+    return row[0] if row else None
+
+
+def write_award_store(records, amendment_data, path=STORE_PATH):
+    """Write the awards and amendments to a fresh SQLite database at path.
+
+    records are the shared award records in data/award_data.js order. The
+    database is built next to path and moved into place, so readers never
+    see a half-written file. A store that already holds the same data is
+    left untouched, so the data server's ETags stay valid. Returns path.
+    """
+    data_sha256 = _data_sha256(records, amendment_data)
+    if _stored_sha256(path) == data_sha256:
+        print(f"'{path}' is already up to date")
+        return path
+    closeouts = closeout_dates(amendment_data)
+    tmp_path = path + '.tmp'
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    conn = sqlite3.connect(tmp_path)
+    try:
+        with conn:
+            conn.executescript(SCHEMA)
+            conn.executemany(
+                f"INSERT INTO awards (row, {', '.join(AWARD_COLUMNS)}, closeout_date, record) "
+                f"VALUES ({', '.join('?' * (len(AWARD_COLUMNS) + 3))})",
+                (
+                    (row, *(_value(record.get(field)) for field in AWARD_COLUMNS.values()),
+                     closeouts.get(str(record.get('FAIN', '')).strip()),
+                     json.dumps({key: _value(value) for key, value in record.items()}))
+                    for row, record in enumerate(records)
+                ),
+            )
+            conn.executemany(
+                'INSERT INTO award_states (row, state) VALUES (?, ?)',
+                ((row, state) for row, record in enumerate(records) for state in parse_states(record.get('States'))),
+            )
+            conn.executemany(
+                'INSERT INTO amendments (fain, seq, date, type, is_closeout) VALUES (?, ?, ?, ?, ?)',
+                (
+                    (str(fain).strip(), seq, amendment['date'], amendment.get('type'), int(_is_closeout(amendment)))
+                    for fain, amendments in amendment_data.items()
+                    for seq, amendment in enumerate(amendments)
+                ),
+            )
+            conn.execute("INSERT INTO meta VALUES ('built_at', ?)", (datetime.now().isoformat(timespec='seconds'),))
+            conn.execute("INSERT INTO meta VALUES ('data_sha256', ?)", (data_sha256,))
+        conn.execute('ANALYZE')
+    finally:
+        conn.close()
+    os.replace(tmp_path, path)
+    print(f"Award store written to '{path}'")
+    return path
+
+
+# Dropdown filters, named after their awards columns ('state' goes through award_states)
+FACETS = ['grant_lead', 'programs_staff_lead', 'recipient', 'grant_program', 'state']
+
+
+def award_filters(grant_lead=None, programs_staff_lead=None, recipient=None, grant_program=None, state=None,
+                  ending_between=None, with_closeout=None):
+    """SQL WHERE clause and parameters for the award filters; None means no filter.
+
+    ending_between is an inclusive ('YYYY-MM-DD', 'YYYY-MM-DD') range of end
+    dates; with_closeout=True/False keeps awards with/without a closeout
+    amendment.
+    """
+    where, params = [], []
+    for column, value in (('grant_lead', grant_lead), ('programs_staff_lead', programs_staff_lead),
+                          ('recipient', recipient), ('grant_program', grant_program)):
+        if value is not None:
+            where.append(f'{column} = ?')
+            params.append(value)
+    if state is not None:
+        where.append('row IN (SELECT row FROM award_states WHERE state = ?)')
+        params.append(state)
+    if ending_between is not None:
+        where.append('end_date BETWEEN ? AND ?')
+        params.extend(ending_between)
+    if with_closeout is not None:
+        where.append('closeout_date IS NOT NULL' if with_closeout else 'closeout_date IS NULL')
+    return (' WHERE ' + ' AND '.join(where) if where else ''), params
+
+
+def fiscal_year_bounds(fiscal_year):
+    """First and last day of a federal fiscal year (FY2026 is 2025-10-01 to 2026-09-30)."""
+    return f'{fiscal_year - 1}-10-01', f'{fiscal_year}-09-30'
+
+
+class AwardStore:
+    """Read-only queries against the database written by write_award_store.
+
+    Awards come back as their full records (the dicts in data/award_data.js);
+    amendments as {'date', 'type'} dicts, like amendment_data.json.
+
+        with AwardStore() as store:
+            start, end = fiscal_year_bounds(2026)
+            store.awards(ending_between=(start, end), with_closeout=True)
+    """
+
+    def __init__(self, path=STORE_PATH):
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"No award store at '{path}'; run build_dashboards.py first")
+        self.conn = sqlite3.connect(f'file:{path}?mode=ro', uri=True)
+        self.conn.row_factory = sqlite3.Row
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    def query(self, sql, params=()):
+        """Run any read-only SQL; rows come back as dicts."""
+        return [dict(row) for row in self.conn.execute(sql, params)]
+
+    def award(self, fain):
+        row = self.conn.execute('SELECT record FROM awards WHERE fain = ?', (str(fain).strip(),)).fetchone()
+        return json.loads(row['record']) if row else None
+
+    def amendments(self, fain):
+        return [
+            {'date': row['date'], 'type': row['type']}
+            for row in self.conn.execute('SELECT date, type FROM amendments WHERE fain = ? ORDER BY seq',
+                                         (str(fain).strip(),))
+        ]
+
+    def awards(self, limit=None, offset=0, order_by='end_date', **filters):
+        """Awards matching every given filter (see award_filters), ordered by end date or any awards column."""
+        if order_by not in AWARD_COLUMNS and order_by not in ('row', 'closeout_date'):
+            raise ValueError(f"Cannot order awards by {order_by!r}")
+        where, params = award_filters(**filters)
+        sql = f'SELECT record FROM awards{where} ORDER BY {order_by}, row'
+        if limit is not None:
+            sql += ' LIMIT ? OFFSET ?'
+            params += [limit, offset]
+        return [json.loads(row['record']) for row in self.conn.execute(sql, params)]
+
+    def count_awards(self, **filters):
+        where, params = award_filters(**filters)
+        return self.conn.execute(f'SELECT count(*) FROM awards{where}', params).fetchone()[0]
+
+    def facet_counts(self, facet, **filters):
+        """{value: award count} for one dropdown, under every other filter (the dropdown's own is ignored)."""
+        if facet not in FACETS:
+            raise ValueError(f"Unknown facet {facet!r}")
+        filters.pop(facet, None)
+        where, params = award_filters(**filters)
+        if facet == 'state':
+            sql = f'SELECT state AS value, count(*) AS n FROM award_states JOIN awards USING (row){where} GROUP BY state'
+        else:
+            where += (' AND ' if where else ' WHERE ') + f'{facet} IS NOT NULL'
+            sql = f'SELECT {facet} AS value, count(*) AS n FROM awards{where} GROUP BY {facet}'
+        return {row['value']: row['n'] for row in self.conn.execute(sql, params)}
+
+    def amendment_rows(self, fain=None, date_between=None, closeout=None, limit=None, offset=0):
+        """Amendments as {'fain', 'date', 'type'} dicts, in date order; returns (rows, total)."""
+        where, params = [], []
+        if fain is not None:
+            where.append('fain = ?')
+            params.append(str(fain).strip())
+        if date_between is not None:
+            where.append('date BETWEEN ? AND ?')
+            params.extend(date_between)
+        if closeout is not None:
+            where.append('is_closeout = ?')
+            params.append(int(closeout))
+        where = ' WHERE ' + ' AND '.join(where) if where else ''
+        total = self.conn.execute(f'SELECT count(*) FROM amendments{where}', params).fetchone()[0]
+        sql = f'SELECT fain, date, type FROM amendments{where} ORDER BY date, fain, seq'
+        if limit is not None:
+            sql += ' LIMIT ? OFFSET ?'
+            params += [limit, offset]
+        return [dict(row) for row in self.conn.execute(sql, params)], total
+
+    def explain(self, sql, params=()):
+        """SQLite's query plan, e.g. to check that a query uses an index."""
+        return [row['detail'] for row in self.conn.execute('EXPLAIN QUERY PLAN ' + sql, params)]
@@ -0,0 +1,87 @@
+import argparse
+import os
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic_data import make_award_details
+from data_loader import group_amendments
+
+
+def group_amendments_iterrows(df):
+    """The per-row loop timeline_visualization.py used to run, kept as the baseline."""
+    amendment_data = {}
+    for _, row in df.iterrows():
+        fain = row['FAIN']
+        amendment_type = row['Amendment Type']
+
+        # Only process rows that have a FAIN and a non-empty Amendment Type
+        if pd.isna(fain) or pd.isna(amendment_type) or str(amendment_type).strip() == '':
+            continue
+
+        if fain not in amendment_data:
+            amendment_data[fain] = []
+
+        # Get the amendment date from Day of Award Issue Date
+        amendment_date = row['Day of Award Issue Date']
+        if pd.notna(amendment_date):
+            if isinstance(amendment_date, pd.Timestamp):
+                amendment_date = amendment_date.strftime('%Y-%m-%d')
+
+            amendment_data[fain].append({
+                'date': amendment_date,
+                'type': str(amendment_type).strip()
+            })
+    return amendment_data
+
+
+def check_same_output(vec_result, legacy_result):
+    """Assert the two groupings match apart from their one known difference.
+
+    The loop adds a FAIN before checking the date, so a FAIN whose typed rows
+    are all undated gets an empty list; group_amendments() leaves it out.
+    """
+    empty = {fain for fain, amendments in legacy_result.items() if not amendments}
+    assert not empty & set(vec_result), 'vectorized output lists a FAIN that has no dated amendments'
+    assert vec_result == {fain: amendments for fain, amendments in legacy_result.items() if fain not in empty}, \
+        'vectorized output differs from iterrows() output'
+
+
+def best_of(func, df, repeat):
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(df)
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark amendment grouping: iterrows() vs vectorized.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--skip-legacy-above', type=int, default=None,
+                        help='Skip the iterrows() baseline for sizes above this row count')
+    args = parser.parse_args()
+
+    print(f"{'rows':>10} {'iterrows (s)':>14} {'vectorized (s)':>16} {'speedup':>9}")
+    for n_rows in args.sizes:
+        df = make_award_details(n_rows)
+        vec_time, vec_result = best_of(lambda d: group_amendments(d, require_type=True), df, args.repeat)
+
+        if args.skip_legacy_above is not None and n_rows > args.skip_legacy_above:
+            print(f"{n_rows:>10} {'skipped':>14} {vec_time:>16.3f} {'-':>9}")
+            continue
+
+        # The baseline is slow enough that one run is representative
+        legacy_time, legacy_result = best_of(group_amendments_iterrows, df, 1)
+        check_same_output(vec_result, legacy_result)
+        print(f"{n_rows:>10} {legacy_time:>14.3f} {vec_time:>16.3f} {legacy_time / vec_time:>8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
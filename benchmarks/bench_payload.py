@@ -0,0 +1,100 @@
+import argparse
+import gzip
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic_data import BASE_AWARDS, make_master_tracker
+from columnar_payload import TIMELINE_FIELDS, encode_columnar
+
+
+def rows_payload(df):
+    """The timeline's row-per-award payload: every field, ISO date strings."""
+    records = df.assign(**{
+        column: df[column].dt.strftime('%Y-%m-%d') for column in ('Project Start Date', 'Project End Date')
+    }).to_dict('records')
+    return json.dumps(records)
+
+
+# Mirrors the page: JSON.parse, then build Date objects for every award
+NODE_DECODE = r'''
+const text = require('fs').readFileSync(process.argv[1], 'utf8');
+const repeat = Number(process.argv[2]);
+let best = Infinity;
+for (let r = 0; r < repeat; r++) {
+    const start = performance.now();
+    const payload = JSON.parse(text);
+    if (payload.format === 'columnar') {
+        const c = payload.columns;
+        for (let i = 0; i < payload.length; i++) {
+            new Date(c['Project Start Date'][i] * 86400000);
+            new Date(c['Project End Date'][i] * 86400000);
+        }
+    } else {
+        for (const d of payload) {
+            new Date(d['Project Start Date']);
+            new Date(d['Project End Date']);
+        }
+    }
+    best = Math.min(best, performance.now() - start);
+}
+console.log(best);
+'''
+
+
+def node_decode_ms(text, repeat):
+    """Best-of JSON.parse plus date decoding time in node, or None when node is not installed."""
+    node = shutil.which('node')
+    if node is None:
+        return None
+    with tempfile.NamedTemporaryFile('w', suffix='.json', delete=False, encoding='utf-8') as f:
+        f.write(text)
+    try:
+        result = subprocess.run([node, '-e', NODE_DECODE, f.name, str(repeat)],
+                                capture_output=True, text=True, check=True)
+        return float(result.stdout)
+    finally:
+        os.remove(f.name)
+
+
+def timed(func, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare row and columnar award payloads by size and parse time.')
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 10, 100],
+                        help=f'Multiples of {BASE_AWARDS} awards')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'awards':>8} {'payload':<22} {'bytes':>12} {'gzip bytes':>12} {'py parse (ms)':>14} {'node decode (ms)':>17}")
+    for scale in args.scales:
+        df = make_master_tracker(BASE_AWARDS * scale)
+        payloads = {
+            'rows (all fields)': rows_payload(df),
+            'rows (rendered fields)': rows_payload(df[TIMELINE_FIELDS]),
+            'columnar': json.dumps(encode_columnar(df), separators=(',', ':')),
+        }
+        for name, text in payloads.items():
+            raw = text.encode('utf-8')
+            parse_ms = timed(lambda: json.loads(text), args.repeat) * 1000
+            node_ms = node_decode_ms(text, args.repeat)
+            node_col = f"{node_ms:>17.2f}" if node_ms is not None else f"{'n/a':>17}"
+            print(f"{len(df):>8} {name:<22} {len(raw):>12,} {len(gzip.compress(raw)):>12,} {parse_ms:>14.2f} {node_col}")
+    print("\nThe generated timeline also logs its own decode time to the browser console.")
+
+
+if __name__ == '__main__':
+    main()
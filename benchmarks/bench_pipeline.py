@@ -0,0 +1,256 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+import pandas as pd
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+import timeline_visualization as timeline
+from benchmarks.synthetic_data import BASE_AWARDS, write_sources
+from dashboard_templates import render_dashboards
+from data_files import write_shared_data
+from data_loader import (AMENDMENT_DATE_COLUMN, AMENDMENT_TYPE_COLUMN, AWARD_DATE_COLUMNS, AWARD_DETAILS_COLUMNS,
+                         AWARD_DETAILS_SHEET, MASTER_TRACKER_COLUMNS, MASTER_TRACKER_FLAG_COLUMNS,
+                         MASTER_TRACKER_OPTIONAL_COLUMNS, group_amendments, read_csv_chunks, read_sheet_chunks)
+from normalize import parse_currency, parse_dates
+
+# Whole-script runs timed in a fresh interpreter, as a user would run them
+SCRIPTS = {
+    'timeline_visualization.py': ['--no-cache', '--full-rebuild'],
+    'process_amendments.py': [],
+    'build_dashboards.py': ['--no-cache', '--full-rebuild'],
+}
+
+
+def stage_read(state):
+    text_columns = [column for column in MASTER_TRACKER_COLUMNS + MASTER_TRACKER_OPTIONAL_COLUMNS
+                    if column not in MASTER_TRACKER_FLAG_COLUMNS]
+    state['awards'] = pd.concat(read_csv_chunks(state['tracker_path'], MASTER_TRACKER_COLUMNS,
+                                                MASTER_TRACKER_OPTIONAL_COLUMNS, text_columns), ignore_index=True)
+    state['amendments'] = pd.concat(read_sheet_chunks(state['details_path'], AWARD_DETAILS_SHEET, AWARD_DETAILS_COLUMNS,
+                                                      text_columns=['FAIN', AMENDMENT_TYPE_COLUMN]), ignore_index=True)
+
+
+def stage_clean(state):
+    awards, amendments = state['awards'], state['amendments']
+    awards['Award Amount'] = parse_currency(awards['Award Amount'], 'Award Amount')
+    for column in AWARD_DATE_COLUMNS:
+        awards[column] = parse_dates(awards[column], column)
+    amendments[AMENDMENT_DATE_COLUMN] = parse_dates(amendments[AMENDMENT_DATE_COLUMN], AMENDMENT_DATE_COLUMN)
+    state['awards'] = timeline.prepare_awards(awards)
+
+
+def stage_group_amendments(state):
+    state['amendment_data'] = group_amendments(state['amendments'])
+    state['timeline_amendments'] = group_amendments(state['amendments'], require_type=True)
+
+
+def stage_serialize(state):
+    state['award_rows'] = timeline.build_award_rows(state['awards'], {})[0]
+
+
+def stage_write_html(state):
+    out_dir = state['out_dir']
+    timeline.render_timeline(state['awards'], state['timeline_amendments'],
+                             path=os.path.join(out_dir, timeline.OUTPUT_PATH))
+    data_dir = os.path.join(out_dir, 'data')
+    versions = write_shared_data(timeline.shared_records(state['award_rows']), state['amendment_data'], data_dir)
+    render_dashboards(versions, out_dir=out_dir)
+
+
+STAGES = [
+    ('read', stage_read),
+    ('clean', stage_clean),
+    ('group_amendments', stage_group_amendments),
+    ('serialize', stage_serialize),
+    ('write_html', stage_write_html),
+]
+
+
+def run_stages(tracker_path, details_path, out_dir, measure_memory):
+    """Run every stage in order; returns {stage: seconds} or {stage: peak bytes}."""
+    state = {'tracker_path': tracker_path, 'details_path': details_path, 'out_dir': out_dir}
+    results = {}
+    if measure_memory:
+        tracemalloc.start()
+    try:
+        # The stages print progress; only the numbers are wanted here
+        with contextlib.redirect_stdout(io.StringIO()):
+            for name, stage in STAGES:
+                if measure_memory:
+                    tracemalloc.reset_peak()
+                    stage(state)
+                    results[name] = tracemalloc.get_traced_memory()[1]
+                else:
+                    start = time.perf_counter()
+                    stage(state)
+                    results[name] = time.perf_counter() - start
+    finally:
+        if measure_memory:
+            tracemalloc.stop()
+    return results
+
+
+def output_sizes(out_dir):
+    """Bytes per generated file, relative to out_dir."""
+    sizes = {}
+    for root, _, files in os.walk(out_dir):
+        for name in files:
+            path = os.path.join(root, name)
+            sizes[os.path.relpath(path, out_dir).replace(os.sep, '/')] = os.path.getsize(path)
+    return dict(sorted(sizes.items()))
+
+
+# Runs a script as __main__, then records the interpreter's own peak RSS. Linux's VmHWM belongs
+# to the image started by exec; ru_maxrss would carry over the benchmark process's own peak.
+PEAK_RSS_RUNNER = """
+import os, runpy, sys
+peak_file, script = sys.argv[1], sys.argv[2]
+sys.argv = sys.argv[2:]
+sys.path.insert(0, os.path.dirname(script))
+try:
+    runpy.run_path(script, run_name='__main__')
+finally:
+    peak = ''
+    try:
+        with open('/proc/self/status') as f:
+            peak = next((int(line.split()[1]) * 1024 for line in f if line.startswith('VmHWM:')), '')
+    except OSError:
+        pass
+    with open(peak_file, 'w') as f:
+        f.write(str(peak))
+"""
+
+
+def run_script(script, args, cwd):
+    """Wall time and (on Linux) peak RSS of one script run in cwd."""
+    # stderr goes to a file rather than a pipe, which could fill up while nothing reads it
+    with tempfile.TemporaryDirectory() as tmp_dir, tempfile.TemporaryFile() as stderr:
+        peak_file = os.path.join(tmp_dir, 'peak_rss')
+        start = time.perf_counter()
+        returncode = subprocess.call(
+            [sys.executable, '-c', PEAK_RSS_RUNNER, peak_file, os.path.join(REPO_ROOT, script)] + args,
+            cwd=cwd, stdout=subprocess.DEVNULL, stderr=stderr)
+        elapsed = time.perf_counter() - start
+        if returncode:
+            stderr.seek(0)
+            raise RuntimeError(f"{script} exited with {returncode}: {stderr.read().decode(errors='replace')}")
+        with open(peak_file) as f:
+            peak_rss = f.read().strip()
+    return {'seconds': elapsed, 'peak_rss_bytes': int(peak_rss) if peak_rss else None}
+
+
+def benchmark_scale(scale, repeat, measure_memory, run_scripts):
+    n_awards = BASE_AWARDS * scale
+    with tempfile.TemporaryDirectory() as work_dir:
+        source_dir = os.path.join(work_dir, 'source')
+        tracker_path, details_path = write_sources(source_dir, n_awards)
+        out_dir = os.path.join(work_dir, 'out')
+        os.makedirs(os.path.join(out_dir, 'data'))
+
+        runs = [run_stages(tracker_path, details_path, out_dir, False) for _ in range(repeat)]
+        result = {
+            'scale': scale,
+            'awards': n_awards,
+            'source_bytes': {os.path.basename(tracker_path): os.path.getsize(tracker_path),
+                             os.path.basename(details_path): os.path.getsize(details_path)},
+            'stage_seconds': {name: min(run[name] for run in runs) for name, _ in STAGES},
+            'output_bytes': output_sizes(out_dir),
+        }
+        if measure_memory:
+            result['stage_peak_bytes'] = run_stages(tracker_path, details_path, out_dir, True)
+        if run_scripts:
+            result['scripts'] = {script: run_script(script, args, source_dir) for script, args in SCRIPTS.items()}
+        return result
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_result(result):
+    print(f"\n{result['awards']:,} awards ({result['scale']}x)")
+    peaks = result.get('stage_peak_bytes', {})
+    for name, seconds in result['stage_seconds'].items():
+        peak = f"{peaks[name] / 1e6:>10.1f} MB" if name in peaks else ''
+        print(f"  {name:<18} {seconds:>8.3f} s{peak}")
+    for script, run in result.get('scripts', {}).items():
+        rss = f"{run['peak_rss_bytes'] / 1e6:>10.1f} MB RSS" if run['peak_rss_bytes'] else ''
+        print(f"  {script:<28} {run['seconds']:>8.2f} s{rss}")
+    sizes = result['output_bytes']
+    print(f"  output: {sum(sizes.values()):,} bytes in {len(sizes)} files "
+          f"({sizes.get(timeline.OUTPUT_PATH, 0):,} bytes timeline)")
+
+
+def compare(results, baseline_path):
+    """Print each stage's time against a previous results file, matched by scale."""
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    previous = {result['scale']: result for result in baseline['results']}
+    print(f"\nCompared with {baseline.get('commit') or baseline_path} (ratio > 1 is slower now):")
+    for result in results:
+        old = previous.get(result['scale'])
+        if not old:
+            continue
+        ratios = ', '.join(
+            f"{name} {seconds / old['stage_seconds'][name]:.2f}x"
+            for name, seconds in result['stage_seconds'].items()
+            if old['stage_seconds'].get(name)
+        )
+        print(f"  {result['awards']:,} awards: {ratios}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Time each stage of the dashboard build on synthetic data.')
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 10, 100],
+                        help=f'Multiples of {BASE_AWARDS} awards')
+    parser.add_argument('--repeat', type=int, default=3, help='Timing runs per scale; the fastest is kept')
+    parser.add_argument('--no-memory', action='store_true', help='Skip the tracemalloc pass for per-stage peak memory')
+    parser.add_argument('--no-scripts', action='store_true',
+                        help='Skip timing the whole scripts in a fresh interpreter')
+    parser.add_argument('--out', help='Results file (default: benchmarks/output/pipeline_<commit>_<time>.json)')
+    parser.add_argument('--compare', metavar='RESULTS_JSON', help='Earlier results file to compare stage times with')
+    args = parser.parse_args()
+
+    commit = git_commit()
+    results = []
+    for scale in args.scales:
+        results.append(benchmark_scale(scale, args.repeat, not args.no_memory, not args.no_scripts))
+        print_result(results[-1])
+
+    out = args.out or os.path.join(REPO_ROOT, 'benchmarks', 'output',
+                                   f"pipeline_{commit or 'nogit'}_{datetime.now():%Y%m%d_%H%M%S}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+    with open(out, 'w') as f:
+        json.dump({
+            'commit': commit,
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'pandas': pd.__version__,
+            'platform': platform.platform(),
+            'repeat': args.repeat,
+            'results': results,
+        }, f, indent=2)
+    print(f"\nResults saved to {out}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == '__main__':
+    main()
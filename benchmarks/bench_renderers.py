@@ -0,0 +1,55 @@
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from benchmarks.synthetic_data import BASE_AWARDS, write_sources
+
+GENERATOR = os.path.join(REPO_ROOT, 'timeline_visualization.py')
+TIMELINE_FILE = 'project_timeline_d3_filtered.html'
+
+
+def build_timeline(source_dir, renderer):
+    """Run the generator in source_dir and return (seconds, page size in bytes)."""
+    start = time.perf_counter()
+    subprocess.run([sys.executable, GENERATOR, '--renderer', renderer, '--no-cache', '--full-rebuild'],
+                   cwd=source_dir, check=True, stdout=subprocess.DEVNULL)
+    elapsed = time.perf_counter() - start
+    return elapsed, os.path.getsize(os.path.join(source_dir, TIMELINE_FILE))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build SVG and canvas timelines from synthetic data for FPS comparison.')
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 10, 100],
+                        help=f'Multiples of {BASE_AWARDS} awards')
+    parser.add_argument('--out-dir', default=os.path.join(REPO_ROOT, 'benchmarks', 'output'))
+    args = parser.parse_args()
+
+    os.makedirs(args.out_dir, exist_ok=True)
+    pages = []
+    print(f"{'awards':>8} {'renderer':<9} {'build (s)':>10} {'page bytes':>12}")
+    for scale in args.scales:
+        n_awards = BASE_AWARDS * scale
+        with tempfile.TemporaryDirectory() as source_dir:
+            write_sources(source_dir, n_awards)
+            for renderer in ('svg', 'canvas'):
+                elapsed, size = build_timeline(source_dir, renderer)
+                page = os.path.join(args.out_dir, f'timeline_{renderer}_{n_awards}.html')
+                shutil.copyfile(os.path.join(source_dir, TIMELINE_FILE), page)
+                pages.append(page)
+                print(f"{n_awards:>8} {renderer:<9} {elapsed:>10.2f} {size:>12,}")
+
+    print("\nOpen each page with ?benchmark appended to the URL; the slider is swept for 5 s and")
+    print("benchmarkSlider logs the frame rate to the browser console. Pages:")
+    for page in pages:
+        print(f"  {page}")
+
+
+if __name__ == '__main__':
+    main()
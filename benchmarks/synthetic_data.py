@@ -0,0 +1,71 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+# Roughly the current Master Tracker size
+BASE_AWARDS = 186
+
+AMENDMENT_TYPES = [
+    'Non-Monetary Amendment Type',
+    'Monetary Amendment Type',
+    'No Cost Extension',
+    'Grant Closeout',
+    '',
+    None,
+]
+
+
+def make_master_tracker(n_awards, seed=0):
+    """Synthetic cleaned Master Tracker rows with realistic cardinalities."""
+    rng = np.random.default_rng(seed)
+    starts = pd.Timestamp('2015-01-01') + pd.to_timedelta(rng.integers(0, 3650, n_awards), unit='D')
+    ends = starts + pd.to_timedelta(rng.integers(365, 3650, n_awards), unit='D')
+
+    def pick(pool):
+        return np.array(pool, dtype=object)[rng.integers(0, len(pool), n_awards)]
+
+    return pd.DataFrame({
+        'Title': [f'Synthetic Restoration Project {i}' for i in range(n_awards)],
+        'FAIN': [f'GNTSP{i:08d}' for i in range(n_awards)],
+        'Project Start Date': starts,
+        'Project End Date': ends,
+        'Grant Lead': pick([f'Grant Lead {i}' for i in range(12)]),
+        'Programs Staff Lead': pick([f'Program Staff {i}' for i in range(8)] + ['']),
+        'Recipient': pick([f'Recipient {i}' for i in range(40)]),
+        'Grant Program': pick(['SEP', 'CPS', 'FPL', 'RESTORE']),
+        'States': pick(['AL;#1', 'FL;#2', 'LA;#3', 'MS;#24', 'TX;#5']),
+        'Award Amount': rng.uniform(1e5, 5e7, n_awards).round(2),
+        'Abstract': ['Synthetic abstract text describing the restoration activities. ' * 12] * n_awards,
+    })
+
+
+def make_award_details(n_rows, n_fains=None, seed=0):
+    """Build a synthetic 'Award Details' sheet with n_rows amendment rows."""
+    rng = np.random.default_rng(seed)
+    n_fains = n_fains or max(1, n_rows // 8)
+    fains = np.array([f'GNTSP{i:08d}' for i in range(n_fains)], dtype=object)
+    dates = pd.Timestamp('2016-01-01') + pd.to_timedelta(rng.integers(0, 3650, n_rows), unit='D')
+    df = pd.DataFrame({
+        'FAIN': fains[rng.integers(0, n_fains, n_rows)],
+        'Day of Award Issue Date': dates,
+        'Amendment Type': np.array(AMENDMENT_TYPES, dtype=object)[rng.integers(0, len(AMENDMENT_TYPES), n_rows)],
+    })
+    # Sprinkle in the blanks the real export has
+    df.loc[rng.random(n_rows) < 0.01, 'FAIN'] = None
+    df.loc[rng.random(n_rows) < 0.01, 'Day of Award Issue Date'] = pd.NaT
+    return df
+
+
+def write_sources(out_dir, n_awards, amendments_per_award=3, seed=0):
+    """Write a Master Tracker CSV and an Award Details workbook the generator can read from out_dir."""
+    from data_loader import AWARD_DETAILS_PATH, AWARD_DETAILS_SHEET, MASTER_TRACKER_PATH
+
+    os.makedirs(out_dir, exist_ok=True)
+    awards = make_master_tracker(n_awards, seed)
+    awards['Award Amount'] = awards['Award Amount'].map(lambda amount: f'${amount:,.2f}')
+    awards.to_csv(os.path.join(out_dir, MASTER_TRACKER_PATH), index=False, encoding='windows-1252')
+
+    amendments = make_award_details(n_awards * amendments_per_award, n_fains=n_awards, seed=seed)
+    amendments.to_excel(os.path.join(out_dir, AWARD_DETAILS_PATH), sheet_name=AWARD_DETAILS_SHEET, index=False)
+    return os.path.join(out_dir, MASTER_TRACKER_PATH), os.path.join(out_dir, AWARD_DETAILS_PATH)
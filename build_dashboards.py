@@ -0,0 +1,120 @@
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import timeline_visualization as timeline
+from award_store import STORE_PATH, write_award_store
+from build_history import HISTORY_PATH, HistoryError, check_week, record_build
+from build_profile import PROFILE_MODES, REPORT_PATH, BuildProfile
+from dashboard_templates import TemplateError, render_dashboards
+from data_files import write_shared_data
+from data_loader import SchemaError, group_amendments, load_award_details, load_master_tracker
+from process_amendments import write_amendment_json
+
+# Exit codes, so update_graph.bat can stop on a bad weekly export
+EXIT_OK = 0
+EXIT_SCHEMA_ERROR = 2
+EXIT_MISSING_SOURCE = 3
+EXIT_HISTORY_ERROR = 4
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description='Build the award timeline and every dashboard from the source files in one run.')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count(),
+                        help='Number of outputs rendered at the same time (default: CPU count)')
+    parser.add_argument('--processes', action='store_true',
+                        help='Render in worker processes instead of threads')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Re-parse the source files instead of using the cache in .cache/sources')
+    parser.add_argument('--full-rebuild', action='store_true',
+                        help='Ignore the previous build manifest and re-serialize every award')
+    parser.add_argument('--no-history', action='store_true',
+                        help=f'Do not add this build to the weekly history in {HISTORY_PATH}')
+    parser.add_argument('--week', help='Date to file the history snapshot under (YYYY-MM-DD, default: today)')
+    parser.add_argument('--amendment-json', action='store_true',
+                        help='Also write amendment_data.json from the same parse of the Award Details workbook')
+    parser.add_argument('--payload', choices=['rows', 'columnar'], default='rows',
+                        help='Award payload embedded in the timeline')
+    parser.add_argument('--renderer', choices=['svg', 'canvas'], default='svg',
+                        help='Timeline renderer for bars and amendment markers')
+    parser.add_argument('--profile', choices=PROFILE_MODES,
+                        help='Also profile the run with cProfile, or record peak memory per stage with tracemalloc')
+    parser.add_argument('--report', default=REPORT_PATH,
+                        help=f'Where to write the JSON run report with stage timings and counters (default: {REPORT_PATH})')
+    return parser
+
+
+def build(args):
+    started = time.perf_counter()
+    profile = BuildProfile(args.profile)
+    # A week the history cannot take fails the run before anything is written
+    week = None if args.no_history else check_week(args.week)
+
+    # Both sources are loaded (and schema-checked) once, before anything is written
+    with profile.stage('read'):
+        awards = load_master_tracker(use_cache=not args.no_cache)
+        amendment_df = load_award_details(use_cache=not args.no_cache)
+    with profile.stage('clean'):
+        df = timeline.prepare_awards(awards)
+    if args.amendment_json:
+        with profile.stage('write'):
+            write_amendment_json(amendment_df)
+    with profile.stage('group'):
+        amendment_data = group_amendments(amendment_df)
+        timeline_amendments = group_amendments(amendment_df, require_type=True)
+    profile.count('amendment_rows', len(amendment_df))
+    profile.count('awards_with_amendments', len(amendment_data))
+    profile.count('amendments', sum(len(amendments) for amendments in amendment_data.values()))
+    print(f"Loaded {len(df)} awards and {len(amendment_data)} awards with amendments "
+          f"in {time.perf_counter() - started:.2f}s")
+
+    with profile.stage('serialize'):
+        manifest = timeline.load_build_manifest(df, args.full_rebuild)
+        award_rows, award_hashes, award_payloads, award_changes = timeline.build_award_rows(df, manifest)
+        records = timeline.shared_records(award_rows)
+    changes = timeline.report_changes(manifest, award_changes, amendment_data, len(award_hashes))
+
+    executor = ProcessPoolExecutor if args.processes else ThreadPoolExecutor
+    with profile.stage('write'), executor(max_workers=args.jobs) as pool:
+        # The timeline embeds its own data, so it renders while the shared data files are written;
+        # the other dashboards only need the data file versions
+        timeline_sha256 = pool.submit(timeline.render_timeline, df, timeline_amendments, args.payload, args.renderer)
+        store = pool.submit(write_award_store, records, amendment_data)
+        history = None if args.no_history else pool.submit(record_build, records, amendment_data, week)
+        versions = write_shared_data(records, amendment_data, executor=pool)
+        pages = render_dashboards(versions, executor=pool)
+        output_sha256 = timeline_sha256.result()
+        store.result()
+        if history is not None:
+            history.result()
+        timeline.save_build_manifest(df, award_hashes, award_payloads, amendment_data, output_sha256, changes)
+
+    timeline.count_build(profile, df, award_changes, versions, pages)
+    print(f"Built {timeline.OUTPUT_PATH}, {STORE_PATH} and {', '.join(pages)} in {time.perf_counter() - started:.2f}s")
+    profile.write_report(args.report)
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        build(args)
+    except SchemaError as e:
+        print(f"Schema error: {e}", file=sys.stderr)
+        return EXIT_SCHEMA_ERROR
+    except TemplateError as e:
+        print(f"Template error: {e}", file=sys.stderr)
+        return EXIT_SCHEMA_ERROR
+    except FileNotFoundError as e:
+        print(f"Missing file: {e}", file=sys.stderr)
+        return EXIT_MISSING_SOURCE
+    except HistoryError as e:
+        print(f"History error: {e}", file=sys.stderr)
+        return EXIT_HISTORY_ERROR
+    return EXIT_OK
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,294 @@
+import argparse
+import json
+import math
+import os
+import sqlite3
+import sys
+from datetime import date, datetime
+
+from build_manifest import new_amendments
+
+# Every recorded build's award and amendment data, as changes against the build before it
+HISTORY_PATH = 'history.db'
+
+# What a change row holds for one FAIN
+AWARDS = 'awards'          # that FAIN's award records (normally one), as in data/award_data.js
+AMENDMENTS = 'amendments'  # that FAIN's amendments as {'date', 'type'} dicts, in Award Details order
+KINDS = [AWARDS, AMENDMENTS]
+
+
+class HistoryError(ValueError):
+    """A build cannot be filed under the requested week."""
+
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS snapshots (
+    week TEXT PRIMARY KEY,    -- YYYY-MM-DD the snapshot is filed under
+    recorded_at TEXT NOT NULL,
+    awards INTEGER NOT NULL,  -- FAINs with award records in this snapshot
+    amendments INTEGER NOT NULL,
+    changes INTEGER NOT NULL  -- change rows written for this snapshot
+);
+CREATE TABLE IF NOT EXISTS changes (
+    kind TEXT NOT NULL,
+    fain TEXT NOT NULL,
+    week TEXT NOT NULL REFERENCES snapshots(week),
+    value TEXT,               -- the FAIN's new value as JSON; NULL when it was removed
+    PRIMARY KEY (kind, fain, week)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS changes_week ON changes(week);
+'''
+
+
+def _clean(value):
+    # NaN from the source becomes null, so equal records always serialize the same
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    if isinstance(value, dict):
+        return {key: _clean(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_clean(item) for item in value]
+    return value
+
+
+def _canonical(value):
+    return json.dumps(_clean(value), sort_keys=True, separators=(',', ':'))
+
+
+def snapshot_values(records, amendment_data):
+    """{kind: {FAIN: canonical JSON}} for one build's award records and grouped amendments."""
+    awards = {}
+    for record in records:
+        awards.setdefault(str(record.get('FAIN', '')).strip(), []).append(record)
+    return {
+        AWARDS: {fain: _canonical(fain_records) for fain, fain_records in awards.items()},
+        AMENDMENTS: {str(fain).strip(): _canonical(amendments) for fain, amendments in amendment_data.items()},
+    }
+
+
+def _week(value):
+    """A snapshot key from a date, datetime or 'YYYY-MM-DD' string."""
+    if isinstance(value, (date, datetime)):
+        return value.strftime('%Y-%m-%d')
+    try:
+        return datetime.strptime(str(value), '%Y-%m-%d').strftime('%Y-%m-%d')
+    except ValueError:
+        raise HistoryError(f"Not a YYYY-MM-DD date: {value!r}") from None
+
+
+class BuildHistory:
+    """Weekly snapshots of the award and amendment data, stored as deltas keyed by FAIN.
+
+    A snapshot only writes rows for the FAINs whose award records or
+    amendments changed since the previous snapshot (or that appeared or
+    disappeared), so the database grows with the number of changes rather
+    than with the number of weeks. Any week is rebuilt from the latest change
+    per FAIN at or before it, one primary-key seek each.
+
+        with BuildHistory() as history:
+            history.record('2025-05-05', records, amendment_data)
+            history.diff('2025-04-28', '2025-05-05')
+    """
+
+    def __init__(self, path=HISTORY_PATH):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    def weeks(self):
+        """Recorded snapshots, oldest first, as dicts."""
+        return [dict(row) for row in self.conn.execute('SELECT * FROM snapshots ORDER BY week')]
+
+    def latest_week(self):
+        """The most recent recorded week, or None for an empty history."""
+        return self.conn.execute('SELECT max(week) FROM snapshots').fetchone()[0]
+
+    def _resolve(self, week):
+        """The latest recorded week at or before week (so any date finds the snapshot in force)."""
+        row = self.conn.execute('SELECT max(week) FROM snapshots WHERE week <= ?', (_week(week),)).fetchone()
+        if row[0] is None:
+            raise KeyError(f"No snapshot on or before {_week(week)}")
+        return row[0]
+
+    def _values_at(self, week, kind, fains=None):
+        """{FAIN: JSON} of one kind as of week; only the given FAINs when fains is not None."""
+        sql = f'''
+            SELECT c.fain, c.value FROM changes c
+            WHERE c.kind = ?{' AND c.fain IN (SELECT value FROM json_each(?))' if fains is not None else ''}
+              AND c.week = (SELECT max(week) FROM changes
+                            WHERE kind = c.kind AND fain = c.fain AND week <= ?)
+        '''
+        params = [kind] + ([json.dumps(sorted(fains))] if fains is not None else []) + [week]
+        return {row['fain']: row['value'] for row in self.conn.execute(sql, params) if row['value'] is not None}
+
+    def record(self, week, records, amendment_data):
+        """Store one build's data as its changes against the previous snapshot; returns the change count.
+
+        Recording the latest week again replaces it. Snapshots must be
+        recorded in order, since each one is a delta on the one before.
+        """
+        week = _week(week)
+        _check_order(week, self.latest_week())
+        values = snapshot_values(records, amendment_data)
+        with self.conn:
+            self.conn.execute('DELETE FROM changes WHERE week = ?', (week,))
+            self.conn.execute('DELETE FROM snapshots WHERE week = ?', (week,))
+            n_changes = 0
+            for kind in KINDS:
+                previous = self._values_at(week, kind)
+                current = values[kind]
+                rows = [(kind, fain, week, value) for fain, value in current.items() if previous.get(fain) != value]
+                rows += [(kind, fain, week, None) for fain in previous if fain not in current]
+                self.conn.executemany('INSERT INTO changes (kind, fain, week, value) VALUES (?, ?, ?, ?)', rows)
+                n_changes += len(rows)
+            self.conn.execute(
+                'INSERT INTO snapshots (week, recorded_at, awards, amendments, changes) VALUES (?, ?, ?, ?, ?)',
+                (week, datetime.now().isoformat(timespec='seconds'), len(values[AWARDS]), len(values[AMENDMENTS]),
+                 n_changes),
+            )
+        return n_changes
+
+    def state(self, week):
+        """(records, amendment_data) as of week: award records by FAIN order, and {FAIN: [amendment, ...]}."""
+        week = self._resolve(week)
+        awards = self._values_at(week, AWARDS)
+        records = [record for fain in sorted(awards) for record in json.loads(awards[fain])]
+        amendments = self._values_at(week, AMENDMENTS)
+        return records, {fain: json.loads(amendments[fain]) for fain in sorted(amendments)}
+
+    def award(self, fain, week):
+        """One FAIN's award records and amendments as of week."""
+        week = self._resolve(week)
+        fain = str(fain).strip()
+        awards = self._values_at(week, AWARDS, [fain])
+        amendments = self._values_at(week, AMENDMENTS, [fain])
+        return {
+            'awards': json.loads(awards[fain]) if fain in awards else [],
+            'amendments': json.loads(amendments[fain]) if fain in amendments else [],
+        }
+
+    def diff(self, week_a, week_b):
+        """What changed from week_a to week_b, in the shape of the build manifest's change report.
+
+        Only FAINs with change rows between the two weeks are looked at.
+        Modified awards list the fields that differ as {field: [old, new]}.
+        """
+        week_a, week_b = sorted((self._resolve(week_a), self._resolve(week_b)))
+        result = {
+            'from': week_a,
+            'to': week_b,
+            'awards': {'added': [], 'removed': [], 'modified': {}},
+            'new_amendments': {},
+            'removed_amendments': {},
+        }
+        for kind in KINDS:
+            fains = [row[0] for row in self.conn.execute(
+                'SELECT DISTINCT fain FROM changes WHERE kind = ? AND week > ? AND week <= ?', (kind, week_a, week_b))]
+            if not fains:
+                continue
+            before = {fain: json.loads(value) for fain, value in self._values_at(week_a, kind, fains).items()}
+            after = {fain: json.loads(value) for fain, value in self._values_at(week_b, kind, fains).items()}
+            if kind == AMENDMENTS:
+                result['new_amendments'] = new_amendments(before, after)
+                result['removed_amendments'] = new_amendments(after, before)
+                continue
+            awards = result['awards']
+            for fain in sorted(fains):
+                if fain not in before and fain in after:
+                    awards['added'].append(fain)
+                elif fain in before and fain not in after:
+                    awards['removed'].append(fain)
+                elif fain in before and before[fain] != after[fain]:
+                    awards['modified'][fain] = _field_changes(before[fain], after[fain])
+        return result
+
+
+def _check_order(week, latest):
+    if latest is not None and week < latest:
+        raise HistoryError(f"Cannot record {week}: the history already runs to {latest}")
+
+
+def check_week(week=None, path=HISTORY_PATH):
+    """The week a build would be filed under (default: today); raises HistoryError if it cannot be recorded.
+
+    Builds call this before writing anything, so a bad --week stops the run
+    instead of failing after the pages are already replaced.
+    """
+    week = _week(week or date.today())
+    if os.path.exists(path):
+        with BuildHistory(path) as history:
+            _check_order(week, history.latest_week())
+    return week
+
+
+def _field_changes(old_records, new_records):
+    """{field: [old, new]} between a FAIN's records; a FAIN with several rows compares them pairwise."""
+    changes = {}
+    for i in range(max(len(old_records), len(new_records))):
+        old = old_records[i] if i < len(old_records) else {}
+        new = new_records[i] if i < len(new_records) else {}
+        suffix = f' (row {i + 1})' if max(len(old_records), len(new_records)) > 1 else ''
+        for field in sorted(set(old) | set(new)):
+            if old.get(field) != new.get(field):
+                changes[field + suffix] = [old.get(field), new.get(field)]
+    return changes
+
+
+def record_build(records, amendment_data, week=None, path=HISTORY_PATH):
+    """Add this build to the history under week (default: today); prints and returns the change count."""
+    week = _week(week or date.today())
+    with BuildHistory(path) as history:
+        n_changes = history.record(week, records, amendment_data)
+    print(f"History snapshot {week} recorded in '{path}' ({n_changes} changed FAIN entries)")
+    return n_changes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Query the weekly award history recorded by each build.')
+    parser.add_argument('--history', default=HISTORY_PATH, help='History database to read')
+    commands = parser.add_subparsers(dest='command', required=True)
+    commands.add_parser('weeks', help='List the recorded snapshots')
+    show = commands.add_parser('show', help="Print a week's awards and amendments (or one FAIN's) as JSON")
+    show.add_argument('week', help='YYYY-MM-DD; the latest snapshot on or before it is used')
+    show.add_argument('--fain')
+    diff = commands.add_parser('diff', help='Print what changed between two weeks as JSON')
+    diff.add_argument('week_a')
+    diff.add_argument('week_b')
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.history):
+        print(f"No history at '{args.history}'; run build_dashboards.py first", file=sys.stderr)
+        return 1
+    with BuildHistory(args.history) as history:
+        try:
+            if args.command == 'weeks':
+                for snapshot in history.weeks():
+                    print(f"{snapshot['week']}  {snapshot['awards']:>6} awards  {snapshot['amendments']:>6} with "
+                          f"amendments  {snapshot['changes']:>6} changes  (recorded {snapshot['recorded_at']})")
+            elif args.command == 'show':
+                if args.fain:
+                    result = history.award(args.fain, args.week)
+                else:
+                    records, amendment_data = history.state(args.week)
+                    result = {'awards': records, 'amendments': amendment_data}
+                print(json.dumps(result, indent=2))
+            else:
+                print(json.dumps(history.diff(args.week_a, args.week_b), indent=2))
+        except (KeyError, ValueError) as e:
+            print(e.args[0] if e.args else e, file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,82 @@
+import hashlib
+import json
+import os
+
+import pandas as pd
+
+MANIFEST_PATH = os.path.join('.cache', 'build_manifest.json')
+
+# Bump when the record serialization changes so every award is re-emitted
+MANIFEST_VERSION = 1
+
+
+def load_manifest(path=MANIFEST_PATH):
+    """The manifest written by the previous build, or an empty one."""
+    try:
+        with open(path) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if manifest.get('version') != MANIFEST_VERSION:
+        return {}
+    return manifest
+
+
+def save_manifest(manifest, path=MANIFEST_PATH):
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    manifest['version'] = MANIFEST_VERSION
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f)
+    os.replace(tmp_path, path)
+
+
+def schema_hash(df):
+    """Hash of the column names and dtypes; a change forces a full rebuild."""
+    schema = [[str(column), str(dtype)] for column, dtype in df.dtypes.items()]
+    return hashlib.sha256(json.dumps(schema).encode()).hexdigest()
+
+
+def fain_record_hashes(df):
+    """{FAIN: hash} over all columns of each FAIN's rows, computed vectorized."""
+    row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    grouped = {}
+    for fain, row_hash in zip(df['FAIN'].astype(str).to_numpy(), row_hashes):
+        grouped.setdefault(fain, []).append(format(row_hash, '016x'))
+    return {fain: ''.join(hashes) for fain, hashes in grouped.items()}
+
+
+def diff_hashes(old, new):
+    """Added, removed and modified keys between two {FAIN: hash} maps."""
+    return {
+        'added': sorted(fain for fain in new if fain not in old),
+        'removed': sorted(fain for fain in old if fain not in new),
+        'modified': sorted(fain for fain in new if fain in old and old[fain] != new[fain]),
+    }
+
+
+def new_amendments(old_amendment_data, amendment_data):
+    """{FAIN: [amendment, ...]} for amendments that were not in the previous build."""
+    added = {}
+    for fain, amendments in amendment_data.items():
+        previous = list(old_amendment_data.get(str(fain), []))
+        for amendment in amendments:
+            if amendment in previous:
+                # Remove the match so a repeated date/type pair still counts once per occurrence
+                previous.remove(amendment)
+            else:
+                added.setdefault(str(fain), []).append(amendment)
+    return added
+
+
+def print_change_report(changes):
+    awards = changes['awards']
+    print("\nChanges since the previous build:")
+    for label in ('added', 'removed', 'modified'):
+        fains = awards[label]
+        print(f"  {label.capitalize()} awards: {len(fains)}" + (f" ({', '.join(fains)})" if fains else ''))
+    total_new = sum(len(amendments) for amendments in changes['new_amendments'].values())
+    print(f"  New amendments: {total_new} across {len(changes['new_amendments'])} awards")
+    for fain, amendments in changes['new_amendments'].items():
+        for amendment in amendments:
+            print(f"    - {fain}: {amendment['date']} {amendment['type']}")
@@ -0,0 +1,134 @@
+import cProfile
+import io
+import json
+import os
+import platform
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+
+REPORT_PATH = os.path.join('.cache', 'build_report.json')
+CPROFILE_PATH = os.path.join('.cache', 'build_profile.prof')
+
+# Stages every build reports, in pipeline order, even when one did no work
+STAGES = ['read', 'clean', 'group', 'serialize', 'write']
+
+PROFILE_MODES = ['cprofile', 'tracemalloc']
+
+# Functions listed in the report when running under cProfile
+TOP_FUNCTIONS = 25
+
+
+class BuildProfile:
+    """Stage timers and counters for one build, written out as a JSON run report.
+
+    Stages are timed with stage(); timing the same stage again (or from
+    several threads) adds to its total. With mode='tracemalloc' each stage
+    also records its peak traced memory, and with mode='cprofile' the whole
+    run is profiled (the main thread only) and its slowest functions are
+    added to the report.
+    """
+
+    def __init__(self, mode=None):
+        if mode is not None and mode not in PROFILE_MODES:
+            raise ValueError(f"Unknown profile mode {mode!r}")
+        self.mode = mode
+        self.started_at = datetime.now()
+        self.stages = {name: {'seconds': 0.0, 'calls': 0} for name in STAGES}
+        self.counters = {}
+        self._lock = threading.Lock()
+        self._started = time.perf_counter()
+        self._profiler = None
+        if mode == 'tracemalloc':
+            tracemalloc.start()
+        elif mode == 'cprofile':
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+
+    @contextmanager
+    def stage(self, name):
+        if self.mode == 'tracemalloc':
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                stage = self.stages.setdefault(name, {'seconds': 0.0, 'calls': 0})
+                stage['seconds'] += elapsed
+                stage['calls'] += 1
+                if self.mode == 'tracemalloc':
+                    stage['peak_bytes'] = max(stage.get('peak_bytes', 0), tracemalloc.get_traced_memory()[1])
+
+    def count(self, name, value=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def finish(self):
+        """Stop profiling and return the run report."""
+        report = {
+            'started_at': self.started_at.isoformat(timespec='seconds'),
+            'total_seconds': round(time.perf_counter() - self._started, 4),
+            'command': [os.path.basename(sys.argv[0])] + sys.argv[1:],
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'profile': self.mode,
+            'stages': {name: {key: round(value, 4) if isinstance(value, float) else value
+                              for key, value in stage.items()}
+                       for name, stage in self.stages.items()},
+            'counters': dict(sorted(self.counters.items())),
+        }
+        if self.mode == 'tracemalloc':
+            report['peak_bytes'] = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        elif self._profiler is not None:
+            self._profiler.disable()
+            report['top_functions'] = top_functions(self._profiler)
+        return report
+
+    def write_report(self, path=REPORT_PATH):
+        """Finish the run, write its report as JSON (and the cProfile stats next to it). Returns the report."""
+        report = self.finish()
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        if self._profiler is not None:
+            stats_path = os.path.join(os.path.dirname(path), os.path.basename(CPROFILE_PATH))
+            self._profiler.dump_stats(stats_path)
+            report['cprofile_stats'] = stats_path
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(report, f, indent=2)
+        os.replace(tmp_path, path)
+        print_summary(report)
+        print(f"Run report written to '{path}'")
+        return report
+
+
+def top_functions(profiler, limit=TOP_FUNCTIONS):
+    """The functions with the most cumulative time, as report rows."""
+    stats = pstats.Stats(profiler, stream=io.StringIO())
+    rows = []
+    for (filename, line, function), (_, calls, own, cumulative, _) in stats.stats.items():
+        rows.append({
+            'function': f'{os.path.basename(filename)}:{line}({function})',
+            'calls': calls,
+            'own_seconds': round(own, 4),
+            'cumulative_seconds': round(cumulative, 4),
+        })
+    rows.sort(key=lambda row: row['cumulative_seconds'], reverse=True)
+    return rows[:limit]
+
+
+def print_summary(report):
+    print(f"\nBuild stages ({report['total_seconds']:.2f}s in total):")
+    for name, stage in report['stages'].items():
+        line = f"  {name:<10} {stage['seconds']:8.3f}s"
+        if 'peak_bytes' in stage:
+            line += f"  peak {stage['peak_bytes'] / 2**20:,.1f} MiB"
+        print(line)
+    if report['counters']:
+        print('  ' + ', '.join(f'{name}={value:,}' for name, value in report['counters'].items()))
@@ -0,0 +1,87 @@
+import re
+
+import pandas as pd
+
+# Explicit construction flags (either column name), and the title words that mark a construction
+# project when neither is set
+CONSTRUCTION_FLAG_FIELDS = ['Construction Project', 'Construction']
+CONSTRUCTION_YES = ['yes', 'true', '1', 'y']
+CONSTRUCTION_NO = ['no', 'false', '0', 'n']
+TITLE_FIELDS = ['Title', 'Project Title']
+CONSTRUCTION_KEYWORDS = ['construction', 'implementation', 'install', 'build', 'rehabilitation', 'upgrade', 'paving',
+                         'restoration']
+
+END_DATE_FIELD = 'Project End Date'
+
+# Fields added to each shared award record
+CONSTRUCTION_FIELD = 'Is Construction'
+FISCAL_YEAR_FIELD = 'Closeout FY'
+QUARTER_FIELD = 'Closeout Quarter'
+
+
+def _first_set(frame, fields):
+    """Per row, the first of fields with a value that is not blank, false or 0 (as `a || b` on the pages)."""
+    result = pd.Series('', index=frame.index, dtype=object)
+    for field in reversed(fields):
+        if field in frame:
+            values = frame[field]
+            result = values.where(values.notna() & ~values.isin(['', False]), result)
+    return result
+
+
+def classify_construction(frame):
+    """True for construction awards: an explicit yes/no flag wins, otherwise a keyword in the title."""
+    flags = _first_set(frame, CONSTRUCTION_FLAG_FIELDS).astype(str).str.strip().str.lower()
+    titles = _first_set(frame, TITLE_FIELDS).astype(str).str.lower()
+    pattern = '|'.join(re.escape(keyword) for keyword in CONSTRUCTION_KEYWORDS)
+    construction = titles.str.contains(pattern, regex=True)
+    construction[flags.isin(CONSTRUCTION_YES)] = True
+    construction[flags.isin(CONSTRUCTION_NO)] = False
+    return construction.astype(bool)
+
+
+def fiscal_quarters(dates):
+    """(fiscal year, quarter) of each date; FY2026 runs 2025-10-01 to 2026-09-30 and Q1 is October-December."""
+    fiscal_years = dates.dt.year + (dates.dt.month >= 10)
+    quarters = (dates.dt.month + 2) % 12 // 3 + 1
+    return fiscal_years.astype('Int64'), quarters.astype('Int64')
+
+
+def add_closeout_fields(records):
+    """Stamp each award record with its construction flag and closeout fiscal year and quarter, in place.
+
+    upcoming_closeouts.html reads these instead of scanning titles and parsing
+    end dates in the browser on every filter change.
+    """
+    if not records:
+        return records
+    frame = pd.DataFrame.from_records(records)
+    construction = classify_construction(frame)
+    end_dates = pd.to_datetime(_first_set(frame, [END_DATE_FIELD]), format='%Y-%m-%d', errors='coerce')
+    fiscal_years, quarters = fiscal_quarters(end_dates)
+    for record, is_construction, fiscal_year, quarter in zip(records, construction.to_numpy(),
+                                                             fiscal_years.to_numpy(), quarters.to_numpy()):
+        record[CONSTRUCTION_FIELD] = bool(is_construction)
+        record[FISCAL_YEAR_FIELD] = None if pd.isna(fiscal_year) else int(fiscal_year)
+        record[QUARTER_FIELD] = None if pd.isna(quarter) else int(quarter)
+    return records
+
+
+def build_closeout_index(records):
+    """Rows closing in each fiscal year, as four quarter lists in end date order.
+
+    Rows are positions in records, i.e. in data/award_data.js; the quarters
+    joined give the whole fiscal year, still in end date order.
+    """
+    frame = pd.DataFrame({
+        'row': range(len(records)),
+        'end': [record.get(END_DATE_FIELD) or '' for record in records],
+        'fy': [record.get(FISCAL_YEAR_FIELD) for record in records],
+        'quarter': [record.get(QUARTER_FIELD) for record in records],
+    }).dropna(subset=['fy', 'quarter'])
+    # ISO dates sort as text
+    frame = frame.sort_values(['end', 'row'], kind='stable')
+    fiscal_years = {}
+    for (fiscal_year, quarter), rows in frame.groupby(['fy', 'quarter'], sort=True)['row']:
+        fiscal_years.setdefault(str(int(fiscal_year)), [[], [], [], []])[int(quarter) - 1] = rows.tolist()
+    return {'fiscalYears': fiscal_years}
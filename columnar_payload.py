@@ -0,0 +1,49 @@
+import pandas as pd
+
+PAYLOAD_FORMAT = 'columnar'
+PAYLOAD_VERSION = 1
+
+# Dates are stored as whole days since this epoch; JS rebuilds them with new Date(days * 86400000)
+EPOCH = pd.Timestamp('1970-01-01')
+
+DATE_FIELDS = ['Project Start Date', 'Project End Date']
+
+# Low-cardinality text columns stored once in a dictionary and referenced by index (-1 = missing)
+DICTIONARY_FIELDS = ['Grant Lead', 'Programs Staff Lead', 'Recipient', 'Grant Program']
+
+# The fields the timeline page actually renders
+TIMELINE_FIELDS = ['FAIN', 'Title', 'Project Start Date', 'Project End Date', 'Award Amount'] + DICTIONARY_FIELDS
+
+
+def encode_columnar(df, fields=TIMELINE_FIELDS):
+    """Encode award rows as one array per field instead of one dict per award.
+
+    Field names appear once instead of once per award, repeated staff and
+    recipient names collapse to small integers, and dates need no string
+    parsing on the page. Fields missing from df are skipped.
+    """
+    columns = {}
+    dictionaries = {}
+    for field in fields:
+        if field not in df.columns:
+            continue
+        values = df[field]
+        if field in DATE_FIELDS:
+            days = (pd.to_datetime(values, errors='coerce') - EPOCH).dt.days
+            columns[field] = [None if pd.isna(day) else int(day) for day in days]
+        elif field in DICTIONARY_FIELDS:
+            codes, uniques = pd.factorize(values)
+            columns[field] = codes.tolist()
+            dictionaries[field] = [str(value) for value in uniques]
+        elif field == 'Award Amount':
+            columns[field] = pd.to_numeric(values, errors='coerce').fillna(0).astype(float).tolist()
+        else:
+            columns[field] = values.astype(object).where(values.notna(), None).tolist()
+    return {
+        'format': PAYLOAD_FORMAT,
+        'version': PAYLOAD_VERSION,
+        'length': len(df),
+        'columns': columns,
+        'dictionaries': dictionaries,
+    }
+
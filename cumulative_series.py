@@ -0,0 +1,92 @@
+import numpy as np
+import pandas as pd
+
+# Buckets the cumulative summary is computed for; fiscal years run October-September
+PERIODS = ['year', 'fiscal_year', 'month']
+
+SUMMARY_COLUMNS = ['totalCount', 'closedCount', 'activeCount', 'totalFunding', 'closedFunding', 'activeFunding']
+
+# Used when no award has a valid start date, as the page did
+DEFAULT_FIRST_DATE = pd.Timestamp('2014-01-01')
+
+
+def closeout_dates(amendment_data):
+    """Date of each FAIN's first closeout amendment, the one the dashboards treat as its closeout."""
+    dates = {}
+    for fain, amendments in amendment_data.items():
+        for amendment in amendments:
+            if amendment and amendment.get('date') and 'closeout' in str(amendment.get('type') or '').strip().lower():
+                dates[str(fain).strip()] = amendment['date']
+                break
+    return dates
+
+
+def _period_codes(dates, period):
+    """Consecutive integer codes per period, so a range of codes covers every period in between."""
+    if period == 'year':
+        return dates.dt.year
+    if period == 'fiscal_year':
+        return dates.dt.year + (dates.dt.month >= 10)
+    return dates.dt.year * 12 + dates.dt.month - 1
+
+
+def _period_label(code, period):
+    if period == 'month':
+        return f'{code // 12:04d}-{code % 12 + 1:02d}'
+    return int(code)
+
+
+def _running_totals(codes, amounts, first, last):
+    """Count and amount of events up to and including each period code in first..last."""
+    index = np.arange(first, last + 1)
+    grouped = amounts.groupby(codes.to_numpy()).agg(['count', 'sum']).reindex(index, fill_value=0)
+    return grouped['count'].cumsum().to_numpy(), grouped['sum'].cumsum().to_numpy()
+
+
+def build_cumulative_summary(records, amendment_data, as_of=None):
+    """Cumulative award counts and funding per year, fiscal year and month.
+
+    One sweep over start and closeout events: every award is bucketed once by
+    the period it starts in and once by the period it is closed out in (never
+    before its start), and running sums give each period's totals. Periods run
+    from the first start through the one containing as_of (default today).
+    Returns {period: {'period': [...], 'totalCount': [...], ...}}.
+    """
+    df = pd.DataFrame(records, columns=['FAIN', 'Project Start Date', 'Award Amount'])
+    start = pd.to_datetime(df['Project Start Date'], errors='coerce', format='%Y-%m-%d')
+    amount = pd.to_numeric(df['Award Amount'], errors='coerce').fillna(0.0)
+    closeout = pd.to_datetime(df['FAIN'].astype(str).str.strip().map(closeout_dates(amendment_data)),
+                              errors='coerce', format='%Y-%m-%d')
+    valid = start.notna()
+    start, amount, closeout = start[valid], amount[valid], closeout[valid]
+    closed = closeout.notna()
+    as_of = pd.Timestamp(as_of) if as_of is not None else pd.Timestamp.today().normalize()
+
+    summary = {}
+    for period in PERIODS:
+        start_codes = _period_codes(start, period)
+        first = int(start_codes.min()) if len(start_codes) else int(_period_codes(pd.Series([DEFAULT_FIRST_DATE]), period)[0])
+        last = int(_period_codes(pd.Series([as_of]), period)[0])
+        close_codes = np.maximum(start_codes[closed], _period_codes(closeout[closed], period))
+
+        total_count, total_funding = _running_totals(start_codes, amount, first, last)
+        closed_count, closed_funding = _running_totals(close_codes, amount[closed], first, last)
+        summary[period] = {
+            'period': [_period_label(code, period) for code in range(first, last + 1)],
+            'totalCount': total_count.tolist(),
+            'closedCount': closed_count.tolist(),
+            'activeCount': (total_count - closed_count).tolist(),
+            'totalFunding': np.round(total_funding, 2).tolist(),
+            'closedFunding': np.round(closed_funding, 2).tolist(),
+            'activeFunding': np.round(total_funding - closed_funding, 2).tolist(),
+        }
+    return summary
+
+
+def write_summary_csv(summary, path):
+    """Write every period table to one CSV, one row per period."""
+    frames = [
+        pd.DataFrame(table).assign(granularity=period)[['granularity', 'period'] + SUMMARY_COLUMNS]
+        for period, table in summary.items()
+    ]
+    pd.concat(frames, ignore_index=True).to_csv(path, index=False)
@@ -0,0 +1,172 @@
+import hashlib
+import os
+import re
+
+# Templates ship with the code, so they are found relative to it rather than the working directory
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'templates')
+
+# The dashboards rendered from TEMPLATE_DIR into the site root
+DASHBOARD_PAGES = ['index.html', 'cumulative_summary.html', 'upcoming_closeouts.html', 'award_details.html']
+
+# {{ name }} placeholders; the pages use no other double braces
+PLACEHOLDER = re.compile(r'\{\{\s*(\w+)\s*\}\}')
+
+# A line holding only {% include 'partials/name' %} is replaced by that file, e.g. JS shared by several pages
+INCLUDE = re.compile(r"^[ \t]*\{%\s*include\s+'([^']+)'\s*%\}[ \t]*\r?\n", re.MULTILINE)
+
+# Rendered output is encoded, hashed and written in chunks of about this many characters
+CHUNK_SIZE = 1 << 16
+
+# path -> (modification stamps of the template and its includes, compiled parts)
+_compiled = {}
+
+
+class TemplateError(ValueError):
+    """A template refers to a value or include the build does not provide."""
+
+
+class StreamWriter:
+    """Text sink for rendering: buffers writes into chunks, then encodes, hashes and writes them.
+
+    Placeholder values that are callables get this writer, so large payloads
+    (e.g. via json.dump) go straight to disk instead of into one big string.
+    """
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.sha256 = hashlib.sha256()
+        self.size = 0
+        self._buffer = []
+        self._buffered = 0
+
+    def write(self, text):
+        self._buffer.append(text)
+        self._buffered += len(text)
+        if self._buffered >= CHUNK_SIZE:
+            self.flush()
+
+    def flush(self):
+        if self._buffer:
+            data = ''.join(self._buffer).encode('utf-8')
+            self._buffer = []
+            self._buffered = 0
+            self.sha256.update(data)
+            self.size += len(data)
+            self.raw.write(data)
+
+    def tell(self):
+        """Bytes written so far."""
+        self.flush()
+        return self.size
+
+
+def version_context(versions):
+    """Template values for data file versions: 'award_data.js' becomes award_data_version."""
+    return {os.path.splitext(name)[0] + '_version': version for name, version in versions.items()}
+
+
+def _read_source(path, template_dir, seen):
+    """Template text with its includes expanded; returns (text, paths read)."""
+    if path in seen:
+        raise TemplateError(f"{path}: circular include")
+    try:
+        # newline='' keeps each template's own line endings (the dashboards use CRLF)
+        with open(path, encoding='utf-8', newline='') as f:
+            text = f.read()
+    except FileNotFoundError:
+        raise TemplateError(f"Template not found: {path}") from None
+    paths = [path]
+    newline = '\r\n' if '\r\n' in text else '\n'
+
+    def include(match):
+        included, included_paths = _read_source(os.path.join(template_dir, match.group(1)), template_dir,
+                                                seen | {path})
+        paths.extend(included_paths)
+        # A partial takes the line endings of the template including it
+        return included.replace('\r\n', '\n').replace('\n', newline)
+    return INCLUDE.sub(include, text), paths
+
+
+def compile_template(text):
+    """Split a template into alternating literal chunks and placeholder names, once."""
+    return PLACEHOLDER.split(text)
+
+
+def load_template(name, template_dir=TEMPLATE_DIR):
+    """The compiled template, recompiled only when it or one of its includes changes on disk."""
+    path = os.path.join(template_dir, name)
+    cached = _compiled.get(path)
+    if cached and all(os.stat(p).st_mtime_ns == mtime for p, mtime in cached[0]):
+        return cached[1]
+    text, paths = _read_source(path, template_dir, frozenset())
+    parts = compile_template(text)
+    _compiled[path] = ([(p, os.stat(p).st_mtime_ns) for p in paths], parts)
+    return parts
+
+
+def stream_template(parts, context, out, name='<template>'):
+    """Write a compiled template to out; callable values write themselves to out."""
+    for i, part in enumerate(parts):
+        if i % 2 == 0:
+            out.write(part)
+            continue
+        if part not in context:
+            raise TemplateError(f"{name}: no value for {{{{ {part} }}}}")
+        value = context[part]
+        if callable(value):
+            value(out)
+        else:
+            out.write(str(value))
+
+
+def file_sha256(path):
+    sha256 = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def render_to_file(name, context, path, template_dir=TEMPLATE_DIR):
+    """Stream a template to path, leaving it untouched when the output is unchanged.
+
+    The page is written to a temporary file next to path and only moved into
+    place if its hash differs, so memory stays flat however large the
+    embedded data is. Returns (sha256, changed).
+    """
+    parts = load_template(name, template_dir)
+    tmp_path = path + '.tmp'
+    try:
+        with open(tmp_path, 'wb') as raw:
+            out = StreamWriter(raw)
+            stream_template(parts, context, out, name)
+            out.flush()
+        output_sha256 = out.sha256.hexdigest()
+        if os.path.exists(path) and file_sha256(path) == output_sha256:
+            return output_sha256, False
+        os.replace(tmp_path, path)
+        return output_sha256, True
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def render_page(page, context, template_dir=TEMPLATE_DIR, out_dir='.'):
+    """Render one dashboard, leaving the output untouched when nothing changed. Returns its path."""
+    path = os.path.join(out_dir, page)
+    render_to_file(page, context, path, template_dir)
+    return path
+
+
+def render_dashboards(versions, executor=None, pages=DASHBOARD_PAGES, template_dir=TEMPLATE_DIR, out_dir='.'):
+    """Render every dashboard against the current data file versions.
+
+    The ?v= query strings change only when the data does, so browsers keep
+    the cached files across pages and rebuilds until they actually change.
+    Pages render concurrently when a concurrent.futures executor is given.
+    """
+    context = version_context(versions)
+    if executor is None:
+        return [render_page(page, context, template_dir, out_dir) for page in pages]
+    futures = [executor.submit(render_page, page, context, template_dir, out_dir) for page in pages]
+    return [future.result() for future in futures]
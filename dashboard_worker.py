@@ -0,0 +1,34 @@
+import os
+import textwrap
+
+from dashboard_templates import TEMPLATE_DIR
+
+WORKER_DATA_FILE = 'dashboard_worker.js'
+
+# The decoding functions; index.html includes the same partial to decode on the main thread
+# when the worker cannot be started
+DECODE_PARTIAL = os.path.join(TEMPLATE_DIR, 'partials', 'award_decode.js')
+
+
+def _read_partial(path):
+    with open(path, encoding='utf-8') as f:
+        return textwrap.dedent(f.read())
+
+
+# Web Worker run by the dashboards. The pages create it from a Blob of this
+# source (window.GCERC_DATA.workerSource), which also works from file:// where
+# new Worker('data/...') is blocked. Results come back as typed arrays whose
+# buffers are transferred rather than copied.
+WORKER_SOURCE = "\n'use strict';\n\n" + _read_partial(DECODE_PARTIAL) + r'''
+self.onmessage = event => {
+    const {awards, amendments} = event.data;
+    const started = performance.now();
+    const result = {decoded: decodeAwards(awards, amendments || {})};
+    result.workerMs = performance.now() - started;
+    const transfer = [];
+    Object.values(result).forEach(part => {
+        if (part && typeof part === 'object') Object.values(part).forEach(array => transfer.push(array.buffer));
+    });
+    self.postMessage(result, transfer);
+};
+'''
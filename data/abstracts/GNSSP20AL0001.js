@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP20AL0001"] = "The State of Alabama, through the Alabama Department of Conservation and Natural Resources (ADCNR), was awarded RESTORE Act Spill Impact Component funds for the Fairhope Area Community-Based Comprehensive Land Use project. The City of Fairhope is a subrecipient. The purpose of this project is to develop a community-based comprehensive land use plan for the City of Fairhope. The project will recognize all community concerns and issues and translate this information into a clear framework, plan, and course of actions supporting community growth in a responsible, sustainable and resilient manner. The project will involve compilation and analysis of geospatial data that will provide baseline information, delineate urban growth boundaries, and determine environmentally sensitive areas. It will also involve community engagement and review of community codes and updates. The comprehensive land use plan will recognize the interconnectivity of all community concerns and issues to guide future land use activities and code updates for the purpose of protecting and preserving the culture, heritage, and natural resources within the planning jurisdiction of the City of Fairhope and broader Mobile Bay watershed.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP20AL0002"] = "The State of Alabama, through the Alabama Department of Conservation and Natural Resources (ADCNR), was awarded RESTORE Act Spill Impact Component funds for the Mobile Area Storm Water Mapping & Resiliency Planning project. The City of Mobile is a subrecipient. The City of Mobile (the City) will plan and implement a comprehensive GPS digital inventory of existing stormwater infrastructure features which conveys flow into Mobile Bay. Completion of the planning activities will result in generation of a comprehensive GIS map database, provide data facilitating further studies and watershed modeling, and provide a clearer understanding of the physical dynamics of the City's stormwater network. Repetitive flood loss properties within the City will be assessed and described and the City's floodplain management plan will be updated through the development of a design manual supplement, describing best management practices.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP20AL0003"] = "The State of Alabama, through the Alabama Department of Conservation and Natural Resources (ADCNR), was awarded RESTORE Act Spill Impact Component funds for the Extension of the Effluent Force Main from Bayou La Batre Wastewater Treatment Facility (WWTF) project. The project will be constructed by the County of Mobile under a subagreement with the Alabama Department of Conservation and Natural Resources. This project will design, permit, and construct an extension of the City of Bayou La Batre, AL WWTF's effluent discharge outfall line from the current location one mile offshore in Portersville Bay, out five miles into the Mississippi Sound. This solution was based on recommendations from studies investigating the flow and mixing of effluent from the WWTF to determine an optimal outfall location. This is to promote better mixing and to reduce temporary and permanent shellfish closures when flow rates exceed levels indicated by studies to impact oyster leases requiring state health officials to close oyster harvesting. Implementation of this project to prevent shellfish closures will benefit water quality in the Mississippi Sound. Activities also include the comprehensive administration of this grant, including, but not limited to, project development and oversight, contracting, and subrecipient monitoring.";
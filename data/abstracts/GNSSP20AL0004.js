@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP20AL0004"] = "The State of Alabama, through the Alabama Department of Conservation and Natural Resources (ADCNR), was awarded RESTORE Act Spill Impact Component funds for the Orange Beach North Sewer Force Main Upgrade project. The project will replace aging and failing infrastructure with new sewer force mainline infrastructure in Orange Beach, AL with modern materials that are properly sized for current and future development. It will also address increased demand for development and reduce the reliance of on-site septic systems in rapidly developing areas. The City of Orange Beach sewer collection system currently serves areas north of the Intracoastal Waterway around the perimeter of Wolf Bay and the Josephine area, as well as communities along the pathway of the mainline in Orange Beach. This project will reduce the likelihood of sewer line failure and the resulting contamination of the Wolf Bay watershed. Wolf Bay has been recognized by the Alabama Department of Environmental Management (ADEM) and the U.S. EPA as an Outstanding Alabama Water. The project will be constructed in three sections by the City of Orange Beach under a sub-agreement with the ADCNR.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP20AL0005"] = "The State of Alabama, through the Alabama Department of Conservation and Natural Resources (ADCNR), was awarded RESTORE Act Spill Impact Component funds for the Fairhope Sewer Upgrade Phase I project. The City of Fairhope is a subrecipient. In an effort to restore and protect the water quality of Mobile Bay, this project will reduce the pollutant loading to Mobile Bay, by reducing the number and frequency of Sanitary Sewer Overflows (SSO's) that occur within the City of Fairhope's public sewer system. Recent engineering studies have pinpointed the most urgent and critical rehabilitation needs within the sewer entire system, including the complete replacement or rehabilitation of nine priority lift stations, the addition of four side stream storage facilities, and the rehabilitation of existing sewer lines with Cured-In-Place-Pipe and sealing of manholes. This work will be completed by the City of Fairhope under a subagreement from Alabama Department of Conservation and Natural Resources. Activities also include the comprehensive administration of this grant, including, but not limited to project development and oversight, contracting, and subrecipient monitoring.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP20AL0006"] = "The State of Alabama, through the Alabama Department of Conservation and Natural Resources (ADCNR), was awarded RESTORE Act Spill Impact Component funds for the Canal Road Improvements E. of SR-161 project. Canal Road east of State Road-161 in Orange Beach, Alabama is an existing two-lane road that is the only access road that serves the residents, businesses, public facilities, and a large, seasonal tourist population, east of the SR-161 intersection. Growth of businesses and the tourism industry in Orange Beach have led to increases in traffic volumes and turning movements on this section of Canal Road, resulting in a need to increase capacity and efficiency by providing an additional dedicated center turn lane or some variation that allows dedicated left turns on Canal Road between SR-161 and Wilson Blvd. This project will provide 7,000 feet of access management features including a roundabout on Canal Road near Nancy Lane, a dedicated center turn lane between Nancy Lane and Wilson Boulevard and improved pedestrian and bicycle path connectivity between Nancy Lane and Wilson Boulevard. Without this project, Orange Beach is faced with continuing to deny economic development on Canal Road immediately east of SR-161. Continuing to deny economic development would hinder economic growth and limit the community's ability to improve economic resilience. The project will be constructed by the City of Orange Beach, Alabama under a subagreement with ADCNR. This award began in 2020 and its anticipated duration is 3 years.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP20AL0007"] = "The State of Alabama, through the Alabama Department of Conservation and Natural Resources (ADCNR), was awarded RESTORE Act Spill Impact Component funds for the Lillian Park Beach Habitat and Shoreline Protection project. Baldwin County is a subrecipient. The project's principal purpose is to improve the shoreline and reduce safety risks to the use of the public boat launch at Lillian Park in Baldwin County, Alabama. This site is currently experiencing impacts due to open, un-attenuated wave action. This project will reduce overall maintenance costs from rapid sand and debris build up on the ramp itself due to unknown patterns of transport and deposit. Project objectives also include creating a more stable and usable public beach and to protect adjacent properties from beach erosion by constructing hybrid headwall breakwater structures and pocket beaches. This project includes the completion of a coastal processes study to better understand local shoreline and coastal processes to support design solutions for construction of shoreline protection elements at Lillian Park Beach. Based on the Coastal Process Study, an engineering plan set will be accomplished, and all permits will be acquired to construct shoreline protection features to restore 500 linear feet of shoreline and provide long-term stability. The project is being completed by the Government of Baldwin County under a subagreement with ADCNR.";
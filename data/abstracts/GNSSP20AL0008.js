@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP20AL0008"] = "The Alabama Department of Conservation and Natural Resources (ADCNR) was awarded RESTORE Act Spill Impact Component funds for the Perch Creek Area Sanitary Sewer Trunk Line Cured In Place Pipe (CIPP) project. The Board of Water and Sewer Commissioners of the City of Mobile is a subrecipient. The Mobile Area Water and Sewer System, under a subagreement from the ADCNR, will conduct engineering and design and implementation for sealing of sanitary sewer leaks in the wastewater system of the \"Dauphin Island Parkway\" Community along Perch Creek in Mobile County, Alabama. The purpose of this project is to improve water quality by preventing sanitary sewer overflows into Dog River and Mobile Bay. This project will address wastewater treatment efficiency by sealing over 20,000 linear feet of original sewer trunk lines that have long outlived their useful life. An assessment of the pipes in this area determined lining the upstream pipe with \u00e2\u20ac\u0153Cured In Place Pipe and seal 55 manholes is necessary to prevent future sanitary sewer overflows.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP20AL0009"] = "The State of Alabama, through the Alabama Department of Conservation and Natural Resources (ADCNR), was awarded RESTORE Act Spill Impact Component funds for the Fort Morgan Parkway Trail Extension project. The project will extend, and ultimately complete, the Fort Morgan Parkway Trail from Fort Morgan Historical Park in the west to the Gulf State Park and the Hugh Branyon Backcountry Trail in the east. Scope of work for this project includes the engineering and construction of a 15-miles segment of trail and \"mid-zone\" trailhead facilities. The \"mid-zone\" trailhead facilities will include parking, restrooms, vending machines, interpretive signage, and kiosks. Completion of the 15-mile segment will enable Alabama's citizens and guests to travel approximately 30 miles, from Fort Morgan Historical Park (the westernmost terminus), continuing eastward into Gulf State Park and connecting with the Back Country Trail, providing trail users with a route all the way to Perdido Bay via the Alabama Coastal Connection, a designated Alabama Scenic Byway. Work will be conducted by the Alabama State Parks Division.";
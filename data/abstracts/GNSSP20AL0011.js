@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP20AL0011"] = "The State of Alabama, through the Alabama Department of Conservation and Natural Resources (ADCNR), was awarded RESTORE Act Spill Impact Component funds for the Three Mile Creek Watershed Restoration project. The City of Mobile is a subrecipient. The City of Mobile will complete the engineering and construction for the restoration and protection of water quality of the Gulf Coast Region's fresh, estuarine, and marine water resources by providing bank and stream stabilization along Twelve Mile Creek and the dredging and restoration of Langan Park Lake, both of which drain into Three Mile Creek and Mobile Bay. The project begins along Twelve Mile Creek at East Drive and ends at the outlet control structure of Langan Park Lake in Langan Municipal Park near Zeigler Boulevard in Mobile, Alabama. Increased velocities due to stormwater conveyance systems have contributed to degradation of the banks, destabilization of the creek, undercutting of sanitary sewer crossings and sedimentation in the creek and Langan Park Lake. The engineering and construction of this project will provide reinforcement of the creek against further erosion and remove existing sedimentation, thereby stabilizing Twelve Mile Creek and increasing the recreational, educational, and cultural activities in Langan Municipal Park.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP20FL0010"] = "The Florida Gulf Consortium was awarded RESTORE Act Spill Impact Component funds for the St. Joseph Peninsula Coastal Erosion Control Project \u2013 E&D and construction project. Under a subaward with the Gulf Consortium, the Gulf County Board of County Commissioners will oversee this project. This project will improve the shoreline conditions along the southern portion of St. Joseph Peninsula, a severely erosive shoreline. These funds are for design, permitting and construction for this shoreline improvement project. When constructed, the project will involve placing a series of segmented, submerged, and emergent breakwater structures that will be placed offshore in support of a beach-nourishment effort located north of Stump Hole. This project will provide ecological restoration with a primary focus on coastal erosion control. The breakwaters and groins will reduce the erosion rate and help to anchor beach fill, reducing the amount of fill needed over time and reduce road wash-outs and storm damage to the only hurricane evacuation route on the Peninsula. A wider beach will provide better habitat for nesting sea turtles and shorebirds, and the offshore structures habitat for fish, shellfish, and coastal birds.";
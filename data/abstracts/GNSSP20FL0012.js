@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP20FL0012"] = "The Florida Gulf Consortium, through its sub-recipient, Hillsborough County, was awarded RESTORE Act Spill Impact Component funds to acquire approximately eighty-five (85) acres on the Little Manatee River adjacent to the Cockroach Bay Aquatic Preserve to preserve natural areas and restore altered/impacted habitats. The County has completed preservation of adjoining lands, and the acquisition of the Riverton Property on Shell Point Road will complete an ecological corridor comprised of several thousand acres of preserved lands to the north and south of the Little Manatee River. This acquisition will also provide for recreational uses including river access. RESTORE funds are requested for property acquisition, habitat restoration efforts (exotic plant removal and restoration of disturbed wetlands and uplands), and construction of public access improvements (parking, information kiosk, loop trail system, and water access such as a pier or scenic outlook, canoe/kayak launch). A long-term management plan for habitat restoration and access improvements will be developed. County funds from the sub-recipient will support acquisition (if needed) and will fund E&D and permitting and construction of access improvements and long term management.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP20FL0013"] = "The Florida Gulf Consortium was awarded RESTORE Act Spill Impact Component funds for the Suwannee Sound / Cedar Key Oyster Restoration project. Under a subaward with the Gulf Consortium, Levy County will implement the Suwannee Sound / Cedar Key Oyster Restoration Project (project 12-2 in the Florida State Expenditure Plan) to restore oyster reef habitat and oyster resources in Suwannee Sound, Cedar Key, and Waccasassa Bay using a combination of proven restoration techniques. The project involves the planning, permitting, and placement of reef building substrate and live oyster seed on depleted oyster reefs, which will provide suitable habitat for oyster recruitment, accelerate oyster resource recovery, support a sustainable oyster fishery, and contribute to the economic revitalization of coastal fishing communities. Additionally, this project supports the long-term monitoring of established oyster reefs. The Gulf Consortium has established internal controls procedures specifically for this project.";
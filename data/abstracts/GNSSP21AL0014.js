@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP21AL0014"] = "The State of Alabama, through the Alabama Department of Conservation and Natural Resources (ADCNR), was awarded RESTORE Act Spill Impact Component funds for the Aloe Bay/Mississippi Sound Water Quality Enhancement Project. Dauphin Island Water & Sewer Authority is a subrecipient. The Dauphin Island Water & Sewer Authority owns and operates a 0.98 MGD wastewater treatment facility. With this funding, a new Biological Nutrient Removal (BNR) water reclamation facility will be designed and constructed, replacing the aging facility. The facility will improve water quality, conserving the health, diversity and resilience of coastal, estuarine and marine habitats. Focusing on long term sustainability, enhanced BNR & solids removal, improved disinfection techniques, removing suspended particulates through filtration and innovation in capacity improvements, this facility will serve the island's needs for wastewater treatment. The facility will reduce existing pollutant loads and prevent an increase in future pollutant loads to Aloe Bay and Mississippi Sound. Monitoring is a requirement of the National Pollutant Discharge Elimination System Permit. Effluent values of the new facility during the first year of operation will be compared to those of the aging facility during its last year of operation to determine level of successful avoidance of pollutant discharge. The project will be implemented at 701 LeMoyne Drive, Dauphin Island, Alabama in the Aloe Bay/Mississippi Sound area along Dauphin Island in Mobile County, Alabama.";
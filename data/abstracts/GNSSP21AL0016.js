@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP21AL0016"] = "With funding provided to the Alabama Department of Conservation and Natural Resources, this project will construct a structurally sound weir at the Bon Secour Dredge Material Disposal Area (DMDA) and is aligned with the Initial Comprehensive Plan Goal to protect water quality in the Gulf Coast region's fresh, estuarine, and marine waters. The purpose of a DMDA is to ensure there are no downstream effects on wetlands or water quality. As dredge material is placed into the DMDA, the sediment settles to the bottom and an outlet structure releases clean water back into the watershed. The Bon Secour DMDA has been in use since the late 1980s, and the outlet structure at the site is significantly eroded. If the existing weir structure fails, the uncontrolled release of water would include massive amounts of sediments and thereby significantly impact water quality in the watershed and downstream wetlands. Currently, the site is releasing approximately 143 cubic yards (418,918 lbs) of sediment annually; however, should there be a catastrophic event, the site could release up to 740,473 cubic yards (2,169,215,653 lbs.). Visual examination by engineers observed significant corrosion of the existing weir, and that inflow to the weir does not match outflow, indicating possible internal leakage, potentially creating conditions towards future catastrophic failure which will endanger downstream wetlands and water quality, as well as nearby properties. The Baldwin County Commission will implement this project at the previously certified location south of County Road 49 in Bon Secour, AL.";
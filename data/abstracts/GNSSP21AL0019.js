@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP21AL0019"] = "The Alabama Department of Conservation and Natural Resources (ADCNR) was awarded RESTORE Act Spill Impact Component funds for the Meaher Park Improvements project. This project will support the planning, design and implementation of 60 full-service campsites, including parking, bath house and utility infrastructure to Meaher State Park. In addition, six RV park model cabins will be installed along with appropriate skirting, decking, steps, and/or ramps. Meaher State Park is very popular and its campground frequently fills to capacity. From October 2007 through September 2017, Meaher State Park's campground occupancy rate averaged 78%, including closures due to severe weather. Not only is the park situated on a major east-west highway corridor, it is also close to several large population centers. These new amenities will provide the opportunity for Alabama's citizens and guests to enjoy the abundant flora and fauna of the area, in addition to offering access to high-demand public outdoor recreation resources. All portions of the new amenities will be handicapped accessible and inclusive. This project will be implemented along U.S. Highway 98 Battleship Parkway at 5200 Battleship Parkway, Spanish Fort, Alabama. It will be carried out by the ADCNR State Parks Division. These improvements will result in the restoration and revitalization of the Gulf economy by increasing public access to recreational resources and enhancing recreational experiences along a major east-west corridor heavily used by citizens and guests of Alabama.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP21AL0021"] = "The State of Alabama, through the Alabama Department of Conservation and Natural Resources (ADCNR), was awarded Spill Impact Component funds for the Alabama Point Seawall Repair project. The City of Orange Beach is a subrecipient. The purpose of the proposed project is to rebuild the existing Alabama Point seawall using a more resilient method of construction for the tidally influenced marine environment and protect the recent improvements on the upland portion of the \u00e2\u20ac\u0153seawall park\u00e2\u20ac\u009d. The seawall and upland park areas have been damaged by storm surge and wave action. In 2016, the City of Orange Beach repaired the damaged parking areas, installed boardwalks, lighting and landscaping and re-opened the park to the public for recreation. Rebuilding the seawall will protect this public investment. The steel sheet pile seawall suffers corrosion due to repeated exposure to air as a result of tidal fluctuations, which has led to the development of holes in the sheets, permitting loss of backfill behind the wall. It has also created voids causing the surface improvements to collapse, creating both hazardous conditions and loss of access. This activity is aligned with the RESTORE Council Comprehensive Plan goal of restoring and revitalizing the economy by enhancing sustainability and resiliency. This project will promote resilience by improving the communities' capacity to adapt to environmental hazards. This project will be implemented by the City of Orange Beach at the Perdido Pass Seawall Park, a unit of Gulf State Park, located on west side of Perdido Pass in Baldwin County, Alabama.";
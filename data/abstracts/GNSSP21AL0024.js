@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP21AL0024"] = "The Alabama Department of Conservation and Natural Resources (ADCNR) was awarded RESTORE Act Spill Impact Component funds for the City of Chickasaw Sewer Rehabilitation Project. The Mobile County Commission is a subrecipient. The City of Chickasaw has identified several areas where the sewer collection lines are failing or have deteriorated due to age, shifting soils, and root intrusion, which results in excessive inflow and infiltration during wet weather events; the work will be performed by Mobile County under a subaward from the ADCNR. The project will include the engineering and design, installation of Cured-In-Place-Pipe (CIPP), and the replacement of infrastructure to reduce the wet weather flow volume requiring treatment at the Wastewater Treatment Facility located on Chickasaw Creek adjacent to the Mobile River. This project will support the restoration and protection of water quality of the Gulf Coast Region's fresh, estuarine, and marine water resources by reducing or treating nutrient and pollutant loading and improving the management of discharges to Chickasaw Creek, and ultimately, Mobile Bay.";
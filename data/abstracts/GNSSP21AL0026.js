@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP21AL0026"] = "The State of Alabama, through the Alabama Department of Conservation and Natural Resources (ADCNR), was awarded RESTORE Act Spill Impact Component funds for the Environmental Restoration of Cotton Bayou & Terry Cove (Phase 1- Planning) project. Auburn University is the subrecipient. The Cotton Bayou/Terry Cove system is located in Orange Beach, AL and is a component of the larger Perdido Bay watershed which is connected to the Gulf of Mexico by Perdido Pass. The canals and other shallow waters of the Cotton Bayou/Terry Cove system have historically served as nursery habitat for aquatic and avian wildlife. Over time, development and re-development has replaced much of the natural shoreline with seawalls and other structures, and sediment has accumulated in ways that disrupt natural hydrodynamic mixing. These and other unknown factors are contributing to water and sediment quality degradation; fluctuating temperature, salinity and dissolved oxygen concentrations; driving algal blooms, fish kills and other indicators of poor ecological health. Auburn University will collect monitoring data and utilize existing information to support the development of a plan and the implementation of a comprehensive environmental study of Cotton Bayou and Terry Cove. The results will be used to prepare a report that identifies potential restoration project concepts for the restoration of the Cotton Bayou/Terry Cove system. While this project supports multiple RESTORE Council Comprehensive Plan goals and objectives, the primary objective is improving science-based decision-making processes.";
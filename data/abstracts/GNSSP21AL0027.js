@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP21AL0027"] = "The State of Alabama, through the Alabama Department of Conservation and Natural Resources (ADCNR), was awarded RESTORE Act Spill Impact Component funds for the Mobile County Dirt Road Paving (Sediment Reduction) Program. Mobile County is a subrecipient. Under a subaward with ADCNR, Mobile County will develop and implement a dirt road paving program to reduce the number of miles of unpaved roads in environmentally sensitive areas of south Mobile County. In addition, this project also includes stabilization of grass shoulders and ditches that erode and carry sediment into sensitive areas. The purpose of this program is to protect water quality and the beneficial functions of the floodplain through these activities. The Mobile County Commission will manage all design, permit compliance and construction elements of this program.";
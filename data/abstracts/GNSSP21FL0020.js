@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP21FL0020"] = "The Florida Gulf Consortium was awarded RESTORE Act Spill Impact Component funds for the Adaptive Planning and Compliance Project. This project supports an Adaptive Planning and Compliance Project in the Florida State Expenditure Plan (SEP). This involves planning and financial accountability for the Gulf Consortium as it amends and implements Florida's SEP. Core activities of this project include developing SEP amendments as needed, conducting annual risk assessments, completing annual audits, and reviewing/improving policies and procedures. The project aligns with all Gulf-wide RESTORE Council Comprehensive Plan goals and objectives, and will impact the success of all projects in the Florida State Expenditure Plan, which are located among the 23 Gulf Coast counties of the State.";
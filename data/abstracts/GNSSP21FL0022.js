@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP21FL0022"] = "The Florida Gulf Consortium was awarded RESTORE Act Spill Impact Component funds for the Portosueno Park Living Shoreline project. Under a subaward with the Gulf Consortium, Manatee County will oversee this project. The Portosueno Park Living Shoreline project involves design, permitting, and construction of a living shoreline along an existing vertical seawall at Portosueno Park, on the east side of Palma Sola Bay; located on the west side of Manatee County, Florida. This project involves modifications to, or replacement of, the existing seawall; backfilling with clean sand and natural lime rock rip-rap; and planting with native species, including both mangroves and salt marsh species. The objectives of the project are to: (1) restore fish and wildlife habitat functions; (2) reduce pollutant loadings to Palma Sola Bay by treating stormwater runoff from adjacent residential areas; and (3) improve fishing and aesthetics for park users. This project will address the RESTORE Council Comprehensive Plan goals to restore and conserve habitat and to restore water quality and quantity. Additionally, this project addresses RESTORE Act Eligible Activity 1: Restoration and protection of the natural resources, ecosystems, fisheries, marine and wildlife habitats, beaches, and coastal wetlands of the Gulf Coast region.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP21FL0023"] = "The Florida Gulf Consortium was awarded RESTORE Act Spill Impact Component funds for the Wastewater Collection System Improvements \u2013 E&D project. Under a subaward with the Gulf Consortium, Pinellas County will oversee this project. This grant funding is only for the final engineering and design stages for new wastewater collection systems in 15 mobile home parks (MHPs) in the unincorporated Lake Seminole and LeaIman areas of Pinellas County. From the Inflow and infiltration (I&I) evaluation study performed using Pinellas County Utilities internal resources, design and construction solutions were determined to cost-effectively reduce the rain-derived I&I and sanitary sewer overflows (SSOs), and thus lessen impacts to local waterbodies. The purpose of this program is to identify the sources of, and reduce, domestic wastewater I&I in the unincorporated Lake Seminole and Lealman areas of Pinellas County. The primary RESTORE Council Comprehensive Plan goal of this project is to restore water quality and quantity; with the secondary goals to restore and conserve habitat, and replenish and protect living coastal and marine resources. Additionally, this project addresses RESTORE Act Eligible Activity 1: Restoration and protection of the natural resources, ecosystems, fisheries, marine and wildlife habitats, beaches, and coastal wetlands of the Gulf Coast region.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP21FL0025"] = "The Florida Gulf Consortium was awarded RESTORE Act Spill Impact Component funds for the Bayou Chico Contaminated Sediment Remediation Project. Under a subaward with the Gulf Consortium, Escambia County will oversee this project. Sediments in the bayou have been degraded by legacy contaminates, including PCBs, PAHs, Dioxins, and heavy metals. Escambia County has received partial funding through the Florida Department of Environmental Protection from the RESTORE Council for planning, design, and permitting costs associated with the Bayou Chico Contaminated Sediment Removal Project. The funding under this award supplements existing funds to support a fully permitted project ready for implementation. The project is anticipated to meet the following objectives: (1) improve sediment and water quality; (2) restore benthic invertebrate habitat and conditions for the recovery of submerged aquatic vegetation; and (3) enhance the economic and recreational opportunities along the working waterfront. This project addresses the RESTORE Council Comprehensive Plan goals to: restore water quality and quantity (primary); and replenish and protect living coastal and marine resources. This planning project is located in Bayou Chico in Escambia County, FL.";
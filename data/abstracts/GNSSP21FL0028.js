@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP21FL0028"] = "The Florida Gulf Consortium was awarded RESTORE Act Spill Impact Component funds for the Applied Research for Shellfish Aquaculture Project. Manatee County will partner with Gulf Shellfish Institute, Inc. (GSI), a non-profit organization and subrecipient to Manatee County, to conduct applied research that will lead to increased production and availability of locally grown, and sustainably produced shellfish (clams, oysters, scallops) for local markets. This research will be pivotal in maximizing the success of environmental restoration efforts in local waters through stock enhancement of local shellfish populations. The research needs being addressed were identified by stakeholders through a planning process undertaken in 2019 and 2020 (with Direct Component funding to Manatee County). This project aims to promote 1) the consumption of seafood harvested from the Gulf Coast region as well as work, and 2) workforce development and job creation (Comprehensive Plan Goals 3 and 5). Additionally, this project addresses RESTORE Act Eligible Activity 11: Promotion of the consumption of seafood harvested from the Gulf Coast region (primary). The benefits of this research will be an increased production of locally produced seafood, bolstering the economies of working waterfronts; improved coastal water quality; and a reduction in the federal seafood trade deficit.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP21FL0029"] = "The Florida Gulf Consortium was awarded RESTORE Act Spill Impact Component funds for the Apalachicola Bay Cooperative Dredging project. Under a subaward with the Gulf Consortium, Franklin County will oversee this project and partnered with the US Army Corps of Engineers (USACE) to provide maintenance dredging of two local channels, Eastpoint and Two Mile under USACE direction. The USACE is a subrecipient to Franklin County. Funding is for project management and construction (dredging) and surveying (only for Two-Mile Channel). While the primary focus of the project is maintenance dredging to restore navigation depths, RESTORE funds will pay for costs associated with beneficial use placement of dredged material to create marsh and provide shoreline protection. The USACE will conduct and hold the permits for the dredging and placement activities. Both channels are federally authorized navigation channels, but the USACE did not receive enough congressionally allocated funds to complete the project. The two local channels, Eastpoint and Two Mile, have been dredged by the USACE before the project. The benefits of this project will be increased economic opportunities to the county, as well as navigation access and safe passage for boaters. This project aims to address the RESTORE Council Comprehensive Plan goals to restore and revitalize the Gulf economy (primary), and enhance community resilience. This project also addresses RESTORE Act Eligible Activity 16: Infrastructure projects benefiting the economy or ecological resources, including port infrastructure.";
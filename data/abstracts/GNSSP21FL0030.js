@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP21FL0030"] = "The Florida Gulf Consortium was awarded RESTORE Act Spill Impact Component funds for the Kingfish Boat Ramp Renovation and Expansion - Construction project. Under a subaward with the Gulf Consortium, Manatee County planned to implement this project, which included the renovation and expansion of the existing Kingfish Boat Ramp facility located on the north side of Manatee Avenue on the western landing of the Anna Maria Bridge in Manatee County. The main construction scope included increasing the number of ramps, replacing the seawall, increasing the dock area, paving parking areas, and other associated property improvements detailed in the award narrative. Kingfish Boat Ramp is the most heavily utilized boat ramp in Manatee County and has served the steadily increasing number of boaters in Manatee County since the 1960s. The construction phase for this project built on the planning phase, which was funded by Manatee County. This project is consistent with the RESTORE Council Comprehensive Plan goal to restore and revitalize the Gulf Economy, and objective to restore, diversity, and revitalize the Gulf economy with economic and environmental restoration projects (Florida specific objective). This project also addresses RESTORE Act Eligible Activity 10: Promotion of tourism in the Gulf Coast region, including recreational Fishing. This project ended ahead of schedule without completing construction.";
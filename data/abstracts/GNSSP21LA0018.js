@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP21LA0018"] = "HOUMA NAVIGATION CANAL LOCK COMPLEX PROJECT (IMPLEMENTATION) --- The State of Louisiana, through the Louisiana Coastal Protection and Restoration Authority (CPRA), was awarded RESTORE Act Spill Impact Component funds for Phase I Construction of the Houma Navigation Canal Lock Complex Project. Under a subaward with CPRA, Terrebonne Levee & Conservation District will oversee this project. The Houma Navigation Canal Lock Complex is contained in the Louisiana Coastal Master Plan and 2021 Annual Plan (Project TE-113) as a hydrologic restoration project and is needed to reduce saltwater intrusion and distribute freshwater within the Terrebonne Basin. This project will help limit the intrusion of salt water into freshwater marsh systems allowing for the maintenance of thousands of acres of wetlands which serve as critical wildlife habitat and nurseries for fisheries. The project will also provide crucial flood protection by blocking storm surge as a key component of the Morganza to the Gulf Hurricane Protection Project. Implementation of this project consists of three construction phases. Phase I, funded here, consists of Civil site work. During this phase, approximately 95% of the dredging for the project will be completed. This amounts to over 1 million cubic yards of earthen materials that will be hydraulically excavated in order to construct the project which will be used to re-establish over 170 acres of brackish marsh habitat. Work will include placement of fill for the East Levee Tie-in and the West Levee Tie-in, as well as placement of fill and wick drains for the Operations Area. The Shoreline Protection and Access Roads will also be completed during this phase.";
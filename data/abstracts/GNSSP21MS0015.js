@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP21MS0015"] = "The State of Mississippi, through the Mississippi Department of Environmental Quality (MDEQ), was awarded RESTORE Act Spill Impact Component funds for the Beneficial Use of Dredge Material for Marsh Creation and Restoration in Mississippi project. The National Fish and Wildlife Foundation Gulf Environmental Benefit Fund (NFWF GEBF) is a leveraging partner. The program is administered by MDEQ. Components of the program may be implemented by MDEQ and/or eligible sub-recipients. The purpose of this project is to support the restoration and protection of natural resources, ecosystems, fisheries, marine and wildlife habitats, beaches, and coastal wetlands of the Gulf Coast region by creating new marsh and restoring and enhancing existing marsh through the beneficial use (BU) of dredge materials. This program supports coastal marsh creation and restoration and dredging needs in the three coastal counties and may utilize accumulated spoil materials and potential borrow areas to facilitate the material necessary for marsh creation and restoration. Activities include the identification of marsh restoration sites and materials; engineering, design and permitting; and marsh construction.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP21MS0017"] = "The State of Mississippi, through the Mississippi Department of Environmental Quality (MDEQ), was awarded RESTORE Act Spill Impact Component funds for the Mississippi Beachfront Resilience program. The program is being administered by MDEQ. Components of the program may be implemented by MDEQ and/or eligible sub-recipients. The purpose of the Mississippi Beachfront Resilience program is to support the restoration and protection of natural resources, ecosystems, fisheries, marine and wildlife habitats, beaches, and coastal wetlands of the Gulf Coast region through the restoration and development of sand dunes and protection of beaches with additional concrete boardwalks on Mississippi Gulf Coast beaches. The Mississippi Gulf Coast beaches are a unique coastal environment providing critical environmental and economic resiliency functions. The program may take place on the beachfront of Hancock, Harrison, and Jackson County, Mississippi. This program mitigates beach erosion and promotes the health and integrity of the beach ecosystem by utilizing methods which accelerate and maximize dune formation, such as planting native plants and installing sand fencing, and providing additional boardwalk to the existing concrete beach boardwalk/seawall system to provide resilience and mitigate sand migration. Activities will include the identification of sites and scopes of work; engineering, design and permitting; and implementation.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP22AL0031"] = "The State of Alabama, through the Alabama Department of Conservation and Natural Resources (ADCNR), was awarded RESTORE Act Spill Impact Component funds for Bayou La Batre Collection System/Lift Station Upgrades. Under a subaward with ADCNR, Mobile County will manage the planning, engineering and design and construction required to rehabilitate the collection system and lift stations in Bayou La Batre, Alabama. Aligned with the RESTORE Council Comprehensive Plan goal to restore water quality, implementation of this project will result in fewer overflows and an overall reduction of contaminants into local soils and waters. The collection system includes 22 lift stations needing upgrades to the structures, pumps, and controls along with the installation of auxiliary backup pumps to eliminate sanitary sewer overflows throughout the collection system. The upgrades will involve installing larger lift station pumps with controls and installing by-pass lift station pumps instead of generators. The collection system rehabilitation is over fifteen miles of collection system that is exhibiting high infiltration and inflow. The collection system is recommended to be slip lined, which was the method used for I&I reduction less than five years ago in other areas of the collection system. The environmental benefit is reduced infiltration and inflow and reduction of sanitary sewer overflows into highly sensitive waters of the State of Alabama. The Mobile County Commission will manage all design, permit compliance and construction elements of this project.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP22AL0032"] = "The State of Alabama, through the Alabama Department of Conservation and Natural Resources (ADCNR), was awarded RESTORE Act Spill Impact Component funds for the Storm Water Management Improvements for Toulmin Springs Branch and Gum Tree Branch project. Mobile County is a subrecipient. Under a subaward agreement with the ADCNR, the Mobile County Commission is overseeing the development of engineering plans, specifications and pre-construction documents to guide future implementation of environmental restoration and drainage improvement projects in Toulmin Springs and Gum Tree Branch. These activities will address stressors affecting water quality, localized flooding and stream/riparian habitats degradation in the sub-watersheds, contributing to healthier and sustainable ecosystem service delivery. Specifically, the planning documents will inform construction projects designed to improve water quality and reduce incidences of urban flooding in parts of Toulmin Springs Branch and Gum Tree Branch in the cities of Mobile and Prichard, Alabama. Toulmin Springs Branch is a sub-watershed of Three Mile Creek watershed, and Gum Tree Branch is a sub-watershed of Eight Mile Creek watershed. This planning activity is consistent with the RESTORE Council Comprehensive Plan goals of restoring and protecting water quality of the Gulf Coast region's fresh, estuarine, and marine water.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP22AL0033"] = "The State of Alabama, through the Alabama Department of Conservation and Natural Resources (ADCNR) was awarded RESTORE Act Spill Impact Component funds for the Planning Grant to Amend the State Expenditure Plan 2021. This funding is supporting ADCNR in the identification and evaluation of projects, programs, and activities and the development of two State Expenditure Plan (SEP) amendments for funding from Alabama's RESTORE Act Spill Impact Component allocation. Planning activities include adding contingency funding for existing projects and identifying and evaluating potential projects, programs, and activities for eligibility; development of project components; review of budget reasonableness and feasibility; and stakeholder and public engagement. Activities also include the development of two SEP amendments, oversight and management, coordination activities with the RESTORE Council, as well as the development, coordination and execution of the grant applications/award/amendments between ADCNR and RESTORE Council and pass-through sub-awards.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP22AL0038"] = "The State of Alabama, through the Alabama Department of Conservation and Natural Resources (ADCNR), was awarded RESTORE Act Spill Impact Component funds for the Little Lagoon Restoration project. ADCNR will be the recipient of this award and have overall responsibility for oversight of the City of Gulf Shores (COGS). The COGS will be the subrecipient and implementing agency, working with Auburn University, the University of South Alabama and Mississippi State University to implement a number of activities that collectively align with comprehensive plan goals to restore and conserve habitat, restore water quality and replenish and protect coastal resources. The project will have secondary beneficial impacts to the region including more resilient and sustainable infrastructure and increased recreational and ecotourism opportunities. Specific activities will result in fish habitat expansion through the construction of living shorelines, improved hydrologic connectivity of the existing canal system, conversion of approximately 200 individual septic systems to municipal sewer, shellfish restoration, marsh and seagrass restoration, hydrodynamic modeling, ecological research and long-term water quality monitoring. This project will be implemented by the COGS in and around Little Lagoon. Little Lagoon is an 8 mile-long, \u00c2\u00be mile wide brackish coastal lake hydrologically connected to the Gulf of Mexico and is part of a system of coastal dune lakes in south Baldwin County. Little Lagoon is located in COGS and is bounded on the west by the Bon Secour Wildlife Refuge and to the east by Gulf State Park.";
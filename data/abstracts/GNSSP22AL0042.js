@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP22AL0042"] = "The State of Alabama, through the Alabama Department of Conservation and Natural Resources (ADCNR), was awarded RESTORE Act Spill Impact Component funds for the Auburn University Gulf Coast Engineering Research Station project. Auburn University (AU) has a mandate to extend access to higher education, advance practical fields like engineering, agriculture and marine sciences through research and outreach and contribute to economic development of Alabama and the United States. This project furthers AU's Land-, Sea-, and Space-Grant mandate by creating a world-class research facility in Orange Beach, AL. This project meets the RESTORE Act primary qualifying eligible activity for infrastructure development benefiting the economy and ecological resources. The project involves the design and construction of the AU Gulf Coast Engineering Research Station (GCERS). The GCERS will be led by the Samuel Ginn College of Engineering at Auburn University in partnership with the coastal community of Orange Beach. Once constructed, GCERS operations will apply to all other RESTORE Act qualifying eligible activities through a focus on coastal engineering and science research of critical importance to coastal Alabama and other Gulf of Mexico communities and ecosystems. Research activities will include water quality protection and restoration; engineering approaches for protection and restoration of coastal estuaries and upland freshwater wetlands; coastal infrastructure and economic resilience and sustainability; coastal emergency management and transportation systems; and STEM education opportunities for K-12 students.";
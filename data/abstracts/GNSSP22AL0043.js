@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP22AL0043"] = "The State of Alabama, through the Alabama Department of Conservation and Natural Resources (ADCNR), was awarded RESTORE Act Spill Impact Component funds for the Expansion of the Orange Beach Wildlife Rehabilitation and Education Center. The project will be implemented by the City of Orange Beach under a subaward from ADCNR. The project will expand the capacity and capabilities of the current Wildlife Rehabilitation Program to improve the ability to care for increased species and total number of birds and mammals without having to turn away or transfer sick or injured animals to other regions. The current facility is regulated and permitted by ADCNR and the US Fish and Wildlife Service and operations follow state and federal regulations as well as the Minimum Standards for Wildlife Rehabilitation. The new facility will be located on City-owned property. Specific activities will include build out of the building interior to support exam room, as well as wildlife shelter and recovery areas and other work space; and construction of outdoor enclosures for mammals and birds. The project meets the RESTORE Council's Comprehensive Plan goal to Replenish and Protect Living Coastal and Marine Resources by expanding the region's capability to rescue and rehabilitate injured wildlife and conduct education and outreach to promote human behavior that minimizes detrimental impact to wildlife and their habitat. The project also supports the RESTORE Council's Comprehensive Plan Objectives to Protect and Restore Living Coastal and Marine Resources.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP22FL0034"] = "The Florida Gulf Consortium was awarded RESTORE Act Spill Impact Component funds for the NW Quadrant Sewer Force Main Project \u2013 Construction project. Under a subaward with The Gulf Consortium, Citrus County will oversee this project. This project will construct a sanitary sewer collection system consisting of two pump stations and a force main extension routed along U.S. Highway 19 in Citrus County that will route collected wastewater to the Meadowcrest Wastewater Treatment Facility. The objectives of the project are to: (1) reduce legacy water pollution from old and failing septic systems; (2) improve local water quality in Crystal River/Kings Bay, with a focus on nutrient and bacterial load reductions; and (3) offset the use of potable water for irrigation with reclaimed water from the treated effluent. This project is important to addressing the restoration and protection of natural resources, ecosystems, fisheries, marine and wildlife habitats, beaches, and coastal wetlands of the Gulf Coast region (RESTORE Act Eligible Activity 1). This activity will be vital to the RESTORE Council Comprehensive Plan Goal to restore water quality and quantity (Primary), and is consistent with the Comprehensive Plan objective to Objective 2: Restore, Improve, and Protect Water Resources (Primary). Citrus County will execute a contract with a consultant to conduct components of the planned scope of work. This project is co-funded by a grant from the Florida Department of Environmental Protection (FDEP) which covers Construction, Engineering, and Inspection (CEI) and construction expenses.";
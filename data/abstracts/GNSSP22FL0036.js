@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP22FL0036"] = "The Florida Gulf Consortium was awarded RESTORE Spill Impact Component funding for the Santa Rosa Sound Water Quality Improvement Program - Monitoring and Construction. Under a subaward with the Gulf Consortium, Santa Rosa County will oversee this award. The first component of the award will establish a Water Quality Monitoring program that collects, interprets, and shares data about water quality characteristics from nine stations in and around Santa Rosa Sound. Consolidated data will be made accessible to city, state and federal resource managers as well as the public through a web-based Geographic Information System application. This activity will be vital to tracking the Comprehensive Plan goal and objective of restoring water quality and quantity and restoring, improving, and protecting water resources preceding and following wastewater system improvement projects in Santa Rosa County. The second component will support residential septic-to-sewer conversion within the Fairpoint Peninsula, including construction of a force main sewer line, installation of low-pressure sewer systems, and upgrades to the Tiger Point Wastewater Treatment facility. This will directly contribute to the restoration of water quality by reducing loads of nutrients, bacteria, and heavy metals delivered to the sound. These program components are important to addressing the restoration and protection of natural resources, ecosystems, fisheries, marine and wildlife habitats, beaches, and coastal wetlands of the Gulf Coast region.";
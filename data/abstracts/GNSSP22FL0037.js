@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP22FL0037"] = "The Florida Gulf Consortium was awarded RESTORE Act Spill Impact Component funds for the Hodges Park Rehabilitation project. Under a subaward with the Gulf Consortium, Taylor County will complete the rehabilitation of Hodges Park at Keaton Beach. Though the County has one of the longest contiguous coastlines in Florida on the Gulf, Hodges Park is the only public beach in the County. Hodges Park is essential to tourism and economic development and recovery. The rehabilitation will include: (1) demolition and new construction of restrooms and picnic pavilions; (2) removal of existing playground and installation of a new one with shade coverings; (3) installation of a sand volleyball court; (4) removal and construction of parking facilities; (5) construction of sidewalk and boardwalk to existing fishing pier; (6) beach re-nourishment and improved beach access; (7) removal of invasive vegetation and planting beach appropriate native vegetation; (8) security lighting; and (9) nature study area. The Hodges Park Rehabilitation Project is consistent with and addresses the following Comprehensive Plan Goals: Goal 5: Restore and Revitalize the Gulf Economy. The rehabilitation project is consistent with, and addresses Objective 8: Restore, Diversify, and Revitalize the Gulf Economy with Economic and Environmental Restoration Projects (Florida-specific objective).";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP22FL0039"] = "The Florida Gulf Consortium was awarded RESTORE Act Spill Impact Component funds for the Wakulla Springshed Water Quality Protection Program - Otter Creek WWTF Construction project. Under a subaward with the Gulf Consortium, Wakulla County will complete the following: sitework (both pre-construction site preparation and post construction paving), and construction of a master influent lift station and equalization basin with screening capabilities, an administration and maintenance building, a 0.6 MGD AeroMod treatment train (Train 3), an effluent pump station and all associated piping / valves. The purpose of this program is to provide wastewater and stormwater infrastructure improvements to reduce discharges of pollutants to the springshed of Wakulla Springs - and to the surface waters of the Wakulla River, St. Marks River, and Apalachee Bay - from existing septic systems and sewer overflows. The objectives of the program are to: (1) reduce nutrient and bacteria loads to the groundwater from septic tanks; and, (2) reduce nutrient, bacteria and sediment loads to surface waters from sanitary sewer overflows and untreated stormwater runoff. This project identifies with the primary RESTORE Act eligible activity of Restoration and protection of the natural resources, ecosystems, fisheries, marine and wildlife habitats, beaches and coastal wetlands of the Gulf Coast region. The program is consistent with Comprehensive Plan Goal 2 \u2013 Restore Water Quality and Quantity (primary) and Comprehensive Plan Objective 2 \u2013 Restore, Improve, and Protect Water Resources (primary).";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP22FL0040"] = "The Florida Gulf Consortium was awarded RESTORE Act Spill Impact Component funds for the Shoal River Headwaters Protection Program (HPP), Bob Sikes Airport Industrial Park Water Reclamation Facility (BSAIP) Phase I Construction project. Under a subaward with the Gulf Consortium, Okaloosa County will complete the first component (Phase I) of the Shoal River HPP. Phase 1 will facilitate the expansion of centralized public sewer facilities near the airport and surrounding industrial park to accommodate anticipated commercial and industrial growth in this area and residential development along US Hwy 90 from the outskirts of Crestview, FL to the Walton County line. The construction scope of the project provides an expanded effluent disposal system to increase the elimination of nutrients from industrial, commercial and residential wastewater by increasing groundwater recharge over a larger area. This project will address Comprehensive Plan Goal 2: Restore Water Quality and Quantity (primary), and Objective 2: Objective 2: Restore, Improve, and Protect Water Resources (primary), and will conduct monitoring for metrics that apply to the primary goal and objective.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP22FL0041"] = "The Florida Gulf Consortium was awarded RESTORE Act Spill Impact Component funds for the Port Richey Watershed Stormwater Management Project - Construction. Under a subaward with the Gulf Consortium, Pasco County will oversee this construction project, which involves major upgrades to old and inadequate drainage infrastructure in the Port Richey watershed. This project is jointly funded by Southwest Florida Water Management District (SWFWMD). Project components for construction include 1) converting the former Magnolia Valley Golf Course to a wetland storage and water quality treatment system, restoring a natural slough conveyance through the abandoned golf course property, and 2) improving drainage conveyances in the upstream Magnolia Valley residential community whose stormwater runoff flows through the defunct golf course parcel. Although this project addresses water quality improvement, the primary focus of the project is on coastal flood protection and related infrastructure (Primary \u2013 RESTORE Eligible Activity 7). For this reason, this project is classified as infrastructure with respect to the 25 percent infrastructure limitation. The pot 3 funding requests for this project are for construction of stormwater management improvements. Additionally, this project aims to enhance community resilience (Primary \u2013 Comprehensive Plan Goal 4), and promote community resilience (Primary Comprehensive Plan Objective 5).";
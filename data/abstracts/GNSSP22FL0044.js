@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP22FL0044"] = "The Florida Gulf Consortium was awarded RESTORE Act Spill Impact Component funds for the Manatee River Oyster Restoration project. Under a subaward with the Gulf Consortium, Manatee County will complete planning, engineering and design, environmental compliance, construction (the placement of cultch (natural shell and/or other suitable material) in estuarine portions of the Manatee River, from Fort Hamer Road Bridge to Tampa Bay, including the Braden River, Wares Creek, and Warner's and McLewis Bayous) and monitoring. The project will restore productive oyster reefs lost or degraded primarily from combined stresses of reduced freshwater flows, water quality declines, historic dredging for construction materials, and associated disease and predation. The project is needed to restore lost and degraded oyster reefs in the estuarine (lower) portions of the Manatee River and its tributaries in lower Tampa Bay.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP22TX0035"] = "The State of Texas, through the Texas Commission on Environmental Quality (TCEQ), was awarded RESTORE Act Spill Impact Component funds for the Shoreline and Beach Restoration Program (SBRP). The TCEQ proposes to work in collaboration with the Texas Governor's Office and the Governor's Commission to Rebuild Texas (CRT) to assist local Texas coastal communities that were severely impacted by Hurricane Harvey in 2017. The selected program and projects will be conducted in counties that are eligible to receive RESTORE funds and are included in the Hurricane Harvey federal Disaster Declaration for Texas. The Shoreline and Beach Restoration Program, and the associated projects implemented under this program, contributes to both the ecological and economic recovery of the Gulf Coast. Texas has hundreds of miles of coastline on the Gulf with significant population and industry. Restoration of shorelines and beaches can increase the health of those ecosystems, promote tourism, and provide important barriers to protect established development.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP23FL0046"] = "The Florida Gulf Consortium, with its sub-recipient Taylor County was awarded RESTORE Act Spill Impact Component funds for a Feasibility Study to determine if it is a viable option to construct by-passes at Keaton Beach Boat Ramp and Steinhatchee Boat Ramp. Both boating facilities currently have congested, often unsafe vehicular traffic conditions due to the high usage and limited roadway access. The Feasibility Study will provide the County critically needed information to address vehicular traffic congestion at the primary, heavily used boating facilities at Keaton Beach and Steinhatchee. The Feasibility Study will include, but not be limited to: (1) environmental studies; (2) land acquisition requirements or needs; (3) cultural resource assessments; (4) permitting requirements; (5) regulatory and possible mitigation measures that may be required to protect the coastal habitat; (6) traffic studies: and, (7) and estimated design, engineering, and construction costs. Taylor County will procure a qualified firm through the competitive bid process to complete the Feasibility Study. It is anticipated the project from grant award execution to completion will take 16 months to complete. The Feasibility Study is consistent with and addresses Comprehensive Plan Goal 5: Restore and Revitalize the Gulf Economy (primary), and addresses Objective 8: Restore, Diversify, and Revitalize the Gulf Economy with Economic and Environmental Restoration Projects (Florida-specific objective). Future Implementation efforts will be undertaken after feasibility is determined.";
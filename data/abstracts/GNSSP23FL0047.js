@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP23FL0047"] = "The Florida Gulf Consortium, with its sub-recipient Citrus County was awarded RESTORE Act Spill Impact Component funds to implement the Florida State Expenditure Plan project 13-3 Artificial Reef Program - Implementation. The program will include improving Citrus County's only permitted reef, Fish Haven #1, center coordinates located at 28 47.4N 83 03.5W. A contractor will be hired to barge and deploy additional reef material consisting of processed concrete construction debris within the already permitted artificial reef boundary. Due to the amount of material to be deployed, the County estimates that deployment alone will take about a month to complete. The County believes this will provide greater recreational and economic opportunities for residents and tourists as well as reduce fishing and diving pressure on natural reefs. Increased artificial reef acreage will allow for recreational fishing opportunities and increased snorkeling, scuba and marine life viewing areas. These objectives are consistent with those of the Florida Fish and Wildlife Conservation Commission's (FWC's) artificial reef program. Additionally, this project addresses RESTORE Act eligible activity 10: Promotion of tourism in the Gulf Coast region, including recreational fishing, as well as Comprehensive Goal 5: Restore and Revitalize the Gulf Economy, and Comprehensive Plan Objective 8: Restore, Diversify, and Revitalize the Gulf Economy with Economic and Environmental Restoration Projects.";
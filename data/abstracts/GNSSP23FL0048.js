@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP23FL0048"] = "The Florida Gulf Consortium, with subrecipient Pinellas County, was awarded RESTORE Act Spill Impact Component funds to acquire properties in flood-zone areas to be maintained in perpetuity for conservation and floodplain storage to support coastal resiliency and environmental sustainability through the Land Acquisition for Floodplain Restoration and Resiliency project located within Pinellas County, Florida. Removing existing residential and commercial infrastructure or preventing additional infrastructure in flood-prone areas will 1) improve coastal resiliency, 2) provide increased coastal floodplain storage, 3) increase wildlife habitat, and 4) improve water quality. Oil Spill Impact Component RESTORE funds are requested solely for property acquisition and activities necessary for due diligence (i.e., appraisals, surveys, environmental site assessments). Pinellas County has developed a priority matrix which scores and ranks coastal floodplain properties of interest. The County will pursue properties in the highest ranked categories initially, with flexibility to respond to the dynamic real estate market over the course of the award period. This project aligns with RESTORE Comprehensive Plan Goal 1-- Restore and Conserve Habitat, and Goal 2 \u2013 Restore Water Quality and Quantity.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP23FL0049"] = "The Florida Gulf Consortium, through the sub-recipient, Taylor County was awarded RESTORE Act Spill Impact Component funds to acquire a 3.95-acre parcel known as Spring Warrior. The site is located on a short navigable channel providing direct access to the Gulf of Mexico. Though the County has a 51-mile coastline, there is currently limited public access to the Gulf. It is critical the County acquires additional public access locations on the Gulf for tourism and economic development. The Spring Warrior site has sufficient uplands for parking facilities for trucks and trailers as well as the development of boater and park amenities such as restrooms. In addition to recreational fishing and motorized boating, the site could potentially accommodate a canoe and kayak launch as the Florida Circumnavigational Trail and the Big Bend Saltwater Paddling Trail are located within the adjacent coastal waters. The site has direct connection to the Spring Creek Unit of the Wildlife Management District, offering additional outdoor recreational and tourism development opportunities. The acquisition of the Spring Warrior parcel is consistent with and addresses the Restore Act eligible activities: Eligible Activity 10: Promotion of Tourism in the Gulf Coast Region, including recreational Fishing (primary); Comprehensive Plan Goal 5: Restore and Revitalize the Gulf Economy. A future application will be submitted to the Council for the engineering and design, permitting, and construction of an onsite recreational boat ramp and other associated amenities.";
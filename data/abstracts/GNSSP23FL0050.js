@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP23FL0050"] = "The Florida Gulf Consortium, in collaboration with subrecipient Gulf County, was awarded RESTORE Spill Impact Component Funding for SEP project 6-1: St. Joseph Bay/Chipola River Sewer Improvement Program including system upgrades and improvements. The project consists of the acquisition an existing system of 23,908 ft of collection lines, 2 manholes, 1,650 feet force mains, and 3 lift stations. Gulf County will establish an interlocal agreement/sub-recipient agreement with the City of Port St. Joe specifically for this project. This program will improve water quality and reduce nutrient and bacterial loads by replacing failing sewer infrastructure directly adjacent to St. Joseph Bay, and by enabling the abandonment of septic systems near public beaches and the portions of the Apalachicola River watershed. This project aligns with the primary RESTORE Act Eligible Activity 1: Restoration and protection of the natural resources, ecosystems, fisheries, marine and wildlife habitats, beaches and coastal wetlands of the Gulf Coast region. Additionally, this program follows Comprehensive Plan Goal 2: Restore Water Quality and Quantity (primary), and it is consistent with Comprehensive Plan Objective 2: Objective 2: Restore, Improve, and Protect Water Resources (primary). The amendment to this award utilizes all of the RESTORE funds for sewer system acquisition and recognizes co-funding to complete the acquisition and leveraged funds for system improvements, consisting of pump, valving, and electrical upgrades at 2 lift stations. Other system improvements in other neighborhoods are planned for future funding under project 6-1.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP23FL0052"] = "The Florida Gulf Consortium, in cooperation with its subrecipient Okaloosa County, was awarded RESTORE Act Spill Impact Component funds for SEP project 3-5, the Veterans Park Living Shoreline Project. The project includes 3 phases of construction with this award involving phase 1 construction of a 2,000-foot-long living shoreline at the Veterans Park site located on the southwest shore of Choctawhatchee Bay in Fort Walton Beach, and monitoring to support all three phases of restoration construction. The objectives for the full project include: (1) shoreline stabilization to protect subtidal, intertidal and upland habitats, as well as public property; (2) restoration of seagrasses in the nearshore subtidal areas; (3) provision of benthic and intertidal hard substrate habitat for encrusting marine organisms (e.g., oysters); (4) provision of wildlife habitat for shorebirds and wading birds; and (5) improved aesthetics for park visitors. Permits have been obtained for this project from the Florida Department of Environmental Protection and the United States Army Corps of Engineers. The project site is very unique and the proposed improvements will help to restore the natural shoreline, while protecting the upland coastal strand. The location will allow for increased public access, public involvement with plantings during construction and future educational opportunities for visitors, schools and non-profit/volunteer groups. This project will address RESTORE Comprehensive Plan Goal 1: Restore Conserve Habitat, and Objective 4: Restore and Enhance Natural Processes and Shorelines.";
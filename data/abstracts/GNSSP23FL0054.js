@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP23FL0054"] = "The Florida Gulf Consortium, in partnership with subrecipient Bay County, was awarded Spill Impact Component funds for SEP project 5-1: North Bay Water Quality Improvement \u2013 Septic-to-Sewer \u2013 Construction. This project will be co-funded in part by Northwest Florida Water Management District and consist of three components. The first component will be used for the construction of a sewer collection system for the residents in the Deer Point Protection Zone and remove failing septic tanks within it to reduce the nutrients entering Deer Point, which is the primary drinking water source for Bay County. A combination of gravity sewer, low pressure sewer, vacuum sewer, pumping stations and force mains will be constructed to remove failing septic tanks and reduce nutrients entering Deer Point, with minimal impacts on the environment and existing infrastructure. Additionally, the northern portion of the project (Phase 1) would be prioritized first with the Facility and Effluent Management Plan. a Facility and Effluent Management Plan will be developed in sufficient detail to permit and manage the increased flow to the North Bay WWTF This project identifies with the primary RESTORE Act eligible activity of Restoration and protection of the natural resources, ecosystems, fisheries, marine and wildlife habitats, beaches and coastal wetlands of the Gulf Coast region. Additionally, this project will address Comprehensive Plan Goal 2: Restore Water Quality and Quantity (primary), and Objective 2: Objective 2: Restore, Improve, and Protect Water Resources (primary).";
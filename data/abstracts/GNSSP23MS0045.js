@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP23MS0045"] = "The State of Mississippi, through the Mississippi Department of Environmental Quality (MDEQ), was awarded RESTORE Act Spill Impact Component funding for the Public / Private Training Partnership (Accelerate MS) project. The project, administered by MDEQ, will support workforce development and job creation in the Gulf Coast Region by enhancing coordination among workforce development partners in Hancock, Harrison, and Jackson Counties. Components of the program may be implemented by MDEQ and subrecipient, Accelerate MS. Accelerate MS is the State's rebranded Mississippi Office of Workforce Development with the goal of creating more jobs and bringing economic development and growth to the State of Mississippi. The project is designed to launch a large-scale project for workforce development in the three coastal counties. Accelerate MS would provide an opportunity for a mix of public, private, and non-governmental organization (NGO) partners to identify labor market needs across targeted industry sectors. This project will include three programs: Accelerate Reentry Program (ARP), Accelerate Business Competitiveness (ABC) and Accelerate Career Coach (ACC). Additionally, Accelerate MS would disseminate information obtained from industry partners to assist a mix of K-12, Community College, Institutes of Higher Learning (IHL), and NGO organizations in developing workforce training programs for careers in high-paying industries. Other activities may also include, but are not limited to, planning, oversight and management, and coordination of sub-award(s) between MDEQ and sub-recipient.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP23MS0051"] = "The State of Mississippi, through the Mississippi Department of Environmental Quality (MDEQ), was awarded RESTORE Act Spill Impact Component funds for the Gulf Coast Center of Security and Emerging Technology (CSET) Program Under a subaward with MDEQ, Mississippi Gulf Coast Community College (MGCCC) will implement this activity. The program would support workforce training efforts in the Gulf Coast Region through the development of training programs in emerging technology industries such as Cybersecurity, Coding/Programming, Data Analytics, Artificial Intelligence (AI), Virtual Reality (VR)/Augmented Reality (AR), and Simulation/Game Design. MGCCC and the Gulf Coast Center for Security and Emerging Technology (CSET) Tech Fusion project would provide no cost requisite training to students in emerging technologies with the goal of meeting the increasing industry demands of the Gulf Coast region. These training programs would develop a trained Information Technology (IT) workforce as well as provide opportunities for businesses and industries to upskill incumbent workers. Programs included in this proposed high-tech IT industry include Computer Networking Technology, Computer Programming Technology, Cybersecurity, Coding Technology, Data Analytics Technology, IT Specialist Technology, Simulation and Game Design Technology, Live Entertainment Technology, and Geographic Information Systems/ Broadband Technology. This project would allow MGCCC to create an advanced workforce development program in Harrison, Jackson, Stone, and George Counties in Mississippi to enhance workforce growth and job creation.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP23TX0053"] = "The State of Texas, through the Texas Commission on Environmental Quality (TCEQ), was awarded RESTORE Act Spill Impact Component funds for the IB Magee Beach Park project, part of the Nature-Based Tourism (NBT) program. The NBT program supports the promotion of nature-based tourism in the Gulf Coast region in the areas where Hurricane Harvey struck in 2017. Under a subaward with TCEQ, Nueces County will manage the IB Magee Beach Park project. The project will provide nature-based tourism benefits to the local community while providing environmental and ecosystem education and recreation opportunities that will encourage action toward a healthier coast. The project purpose is to recover the loss of damaged primitive campsites and affiliated infrastructure in Nueces County, Texas. Restored campsites will provide access for low to moderate income families to experience nature-based tourism on the Texas coast. As nature-based tourism is one of the largest economic drivers for Texas coastal communities, the rebuilding of tourism is imperative to improving the economy while benefiting the environment and ecological systems.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP24FL0055"] = "The Florida Gulf Consortium, with subrecipient Hillsborough County, was awarded RESTORE Act Spill Impact Component funding for the Council approved Hillsborough Delaney Creek/Palm River Septic to Sewer Conversion Program. This phase of the program includes the final design/permitting & construction of a wastewater collection and transmission system to replace aging septic tanks within the Delaney Creek watershed. The existing neighborhood was platted in 1910 and most of the properties do not have access to a municipal sewer system. These existing homes and businesses have aging and potentially failing septic systems that were not designed to today's standards. It is anticipated that these aging septic tanks are allowing nutrient and other contaminants to leach into the Delaney Creek, Palm River, and, ultimately, Tampa Bay waterbodies. All three of these waterbodies are listed as impaired by the State of Florida. This project is consistent with and addresses Eligible Activity 1 (Primary): Restoration and protection of the natural resources, ecosystems, fisheries, marine and wildlife habitats, beaches, and coastal wetlands of the Gulf Coast region. Additionally, this project is consistent with, and addresses Comprehensive Plan Goal 2: Restore Water Quality and Quantity (primary) and Comprehensive Plan Objective 2: Objective 2: Restore, Improve, and Protect Water Resources (primary).";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP24FL0057"] = "The Florida Gulf Consortium was awarded RESTORE Act Spill Impact Component funds for the Coastal Stormwater Improvement \u2013 Calienta Street project. Under a subaward with the Gulf Consortium, Hernando County will complete drainage infrastructure improvements and the construction of a stormwater treatment system along Calienta Street adjacent to the Hernando Beach canal system. This project aims to reduce flooding and improve water quality. The general location of the project is on the Eastern edge of Hernando Beach, an older residential area on the west coast of Hernando County, Florida. Project components may include replacement of failing drainage pipes and outfall structures, widening and realignment of the roadway, stabilization of failing and eroding seawalls, construction of backflow preventers, and construction of roadside swales, underdrains, exfiltration boxes and/or centrifugal treatment systems. Although this project addresses water quality improvement, the primary focus of the project is on coastal flood protection and related infrastructure (Primary \u2013 RESTORE Eligible Activity 7). Additionally, this project aims to enhance community resilience (Comprehensive Plan Goal 4) and restore water quality and quantity (Comprehensive Plan Goal 2), and promote community resilience ((Comprehensive Plan Objective 5) and Objective 2: Restore, Improve, and Protect Water Resources (Comprehensive Plan Objective 2).";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP24MS0056"] = "The State of Mississippi, through the Mississippi Department of Environmental Quality (MDEQ), was awarded Oil Spill Component funding for the D'Iberville Working Waterfront and Commercial Seafood Harbor project. Under a subaward with MDEQ, the City of D'Iberville will conduct planning and implementation activities for infrastructure benefiting the economy in the Gulf Coast Region. The project purpose is to develop a working waterfront and commercial seafood harbor that will boost economic development in downtown D'Iberville by increasing seafood opportunities as well as tourism in this part of the Mississippi Gulf Coast. This project will include engineering and design, environmental permitting, and construction to support the construction of a working waterfront and commercial seafood harbor.";
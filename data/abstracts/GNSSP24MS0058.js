@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP24MS0058"] = "The State of Mississippi, through the Mississippi Department of Environmental Quality (MDEQ), was awarded RESTORE Act Spill Impact Component funds for the Workforce Training - Meeting the Needs of the Supply Chain project. Under a subaward with MDEQ, Mississippi Gulf Coast Community College (MGCCC) will implement this project at multiple MGCCC locations in south Mississippi. This project will support workforce development and job creation in the Gulf Coast Region through the development of training programs to address workforce needs that are vital to meeting the supply chain needs of coastal Mississippi's industries. The project will focus on enhancing MGCCC programs that are vital to meeting the supply chain needs of industry partners. Programs will receive modern equipment and curriculum changes to align them with the rapid adoption of new technology by local companies. As part of this project, the College will upgrade the automotive and heavy equipment maintenance programs to include autotronics (e-vehicles) training. The College will also embed autonomous/electric semi-trucks in Commercial Driver's License (CDL) programs located at three of the MGCCC campuses/centers. Technology for automation programs will be upgraded to include Internet of Things (IoT), Artificial Intelligence, and robots. The heavy equipment maintenance and heavy equipment operator training will be enhanced with autonomous and electric heavy equipment. These changes will position the College with the ability to train students and incumbent workers with the skills necessary for a rapidly changing supply chain ecosystem.";
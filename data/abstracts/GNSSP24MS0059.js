@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP24MS0059"] = "The State of Mississippi, through the Mississippi Department of Environmental Quality (MDEQ), was awarded RESTORE Act Spill Impact Component funds for the Health Professions (HEALP) for Our Community: Health Professions Center of Excellence project. Under a subaward with MDEQ, Mississippi Gulf Coast Community College (MGCCC) will implement this project. The project will support workforce training efforts in the Gulf Coast Region through the development of workforce development programs to address high industry demand for health profession workers in coastal Mississippi. The Gulf Coast healthcare industry faces complex workforce challenges, including worker shortages. The Health Professions (HEALP) for Our Community: Health Professions Center of Excellence project will provide a learning environment where academic partners, healthcare organizations, and corporate innovators come together to anticipate and meet the healthcare workforce needs of the Gulf Coast, with a focus on high demand health professions. This project involves two steps: (1) attract and train students in two high-demand health professions \u2013 Respiratory Therapy and EMT/Emergency Medical Science (EMS) Paramedic \u2013 and (2) renovate an existing MGCCC facility to house the HEALP Center of Excellence. This project will allow MGCCC to support workforce development by funding industry training, staff, and associated administrative support as well as renovating the HEALP Center of Excellence facility which will accommodate the training programs.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP24MS0060"] = "The State of Mississippi, through the Mississippi Department of Environmental Quality (MDEQ), was awarded RESTORE Act Spill Impact Component funds for the Coastal Habitat Management Program. Under a subaward with MDEQ, the Mississippi Department of Marine Resources (MDMR) will implement this project. The program will support the restoration and protection of natural resources, ecosystems, fisheries, marine and wildlife habitats, beaches, and coastal wetlands of the Gulf Coast Region through the development and implementation of management plans for existing and newly acquired tracts within the Coastal Preserves Program in Mississippi. The program will fund the development of management plans, permitting, and implementation of management activities, such as controlled burning, debris removal, trash removal, and herbaceous and nuisance wildlife invasive species control. These activities will promote the health and integrity of Mississippi's coastal ecosystems and provide long-term benefits to the natural resources and economic value of the region.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP25AL0063"] = "The State of Alabama, through the Alabama Department of Conservation and Natural Resources, was awarded RESTORE Act Spill Impact Component funding for the Bring Back Broad Street Infrastructure initiative, Project #28: One Mobile: Reconnecting People, Work and Play through Complete Streets project. The project will include the construction of utility infrastructure improvements along with roadway and pedestrian improvements to Dr. Martin Luther King, Jr. Avenue beginning at Beauregard Street and ending at Butchers Lane in downtown Mobile, Alabama. Existing infrastructure within the Broad/Beauregard/MLK right-of-way are in dire need of repair and enhancement with modern technologies, including drainage, paving, and streetscape facilities. The improvements leverage an existing federal TIGER grant and other local funds from project partners like the Mobile Area Water & Sewer System. Spill Impact Component funds will be used together with co-funding for construction activities such as sidewalks, bike lanes, strategically placed on-street parking, stormwater drainage, utility relocations, and pedestrian safety improvements.";
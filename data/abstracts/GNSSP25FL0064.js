@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP25FL0064"] = "The Florida Gulf Consortium was awarded RESTORE Act Spill Impact Component funds for the Canal Management Master Plan Implementation project. Under a subaward with the Gulf Consortium, Monroe County will oversee this project to implement canal restoration technologies to restore a select group of identified priority canal segments (Canals 293, 295, 297, 299, 300 and 315), improve canal water quality, and preserve the marine environment throughout the Florida Keys. All of these identified canals require an organic muck removal, backfill and air curtain installation at the canal mouth (to keep out floating vegetation and to maintain the integrity of the projects). The County is requesting funding for the construction, oversight, and post monitoring effectiveness of the above six canal restoration projects within the Big Pine Key area of the Avenues which represents some of the worst water quality throughout the Florida Keys. The benefits of this project will be restoring water quality in the area, as well as protecting healthy, diverse, and sustainable living for coastal and marine resources. This project aims to address the RESTORE Council Comprehensive Plan Goal to Restore Water Quality and Quantity (primary), as well as Comprehensive Plan Objective to Objective 2: Restore, Improve, and Protect Water Resources (primary). This project also addresses RESTORE Act Eligible Activity 1: Restoration and protection of the natural resources, ecosystems, fisheries, marine and wildlife habitats, beaches, and coastal wetlands of the Gulf Coast region (primary).";
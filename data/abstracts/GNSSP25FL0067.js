@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP25FL0067"] = "The Florida Gulf Consortium was awarded RESTORE Act Spill Impact Component funds for the Channel Restoration and Water Quality Project. Under a subaward with the Gulf Consortium, Pasco County will oversee this project to implement major channel restoration, as well as water quality and stormwater improvements. The county is requesting funding for 1) the dredging of approximately 30,000 feet of channel (including removal of 52,000 cubic yards of materials) in coastal canals within Pasco County as well as in the Hudson, Gulf Harbors and Signal Cove / Leisure Beach; and 2) Water Quality and Stormwater Improvements in Griffin Park. The goal is to restore the existing channels systems to allowable maintenance depths and to develop a program to maintain these channels in the future. Recreational and commercial boaters should realize improved access to the Gulf of Mexico which will increase tourism and boost the local economy. The primary eligible activities of the project are Infrastructure projects benefiting the economy or ecological resources, including port infrastructure (Primary \u2013 RESTORE Eligible Activity 6) as well as Promotion of tourism in the Gulf Coast region, including recreational fishing (RESTORE Eligible Activity 10). This project also aims to restore and revitalize the Gulf Economy (Comprehensive Plan Goal 5), Restore Water Quality and Quantity (Comprehensive Plan Goal 2). Additionally, this project is consistent with Council Objective 8 - Restore, Diversity, and Revitalize the Gulf Economy (Primary) and Objective 1 - Restore, enhance, and protect habitats.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP25FL0068"] = "The Florida Gulf Consortium, through its sub-recipient Citrus County, was awarded RESTORE Act Spill Impact Component funding for the Florida State Expenditure Plan project 13-5: Inshore Artificial Reef Project. This first planning phase of the project will include site selection and feasibility, review and analysis of reef material, completion of engineering & design, completion of required environmental compliance/permitting, and development of baseline and post-construction monitoring plan(s) for up to ten inshore artificial reef sites along Citrus County's coast. Future construction of the reefs will ultimately provide residents and visitors the opportunity to visit inshore artificial reef sites. Currently, Citrus County only has an offshore artificial reef, so the County believes additional inshore reef sites will help meet the demand of recreational fishing and diving enthusiasts as well as help take pressure off natural reefs. The primary goal of this project is to restore and revitalize the Gulf Economy through adding additional reef acreage to allow for more recreational activity. The local economy benefits greatly from tourism, any increase in tourism will help provide jobs and additional income to residents.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP25FL0074"] = "The Florida Gulf Consortium, with sub-recipient Dixie, was awarded RESTORE Act Spill Impact Component funds for the Council approved \u00e2\u20ac\u0153Horseshoe Beach Working Waterfront Project 11-1.\u00e2\u20ac\u009d The project's scope includes developing strategies to address improvements for rehabilitating the working waterfront for commercial fisherman in Horseshoe Beach. Components include expansion of a commercial dock established for staging vessels and offloading seafood products directly to wholesale trucks and the rehabilitation/construction of a seawall to protect the shoreline as well as parking improvements. The project's activities will occur in Horseshoe Beach, Southern Dixie County, and will support economic growth and development. his project is consistent with and addresses Comprehensive Plan Goal 5: Restore and Revitalize the Gulf Economy (primary) and Consortium Objective 8: Restore, Diversify, and Revitalize the Gulf Economy with Economic and Environmental Restoration Projects (primary).";
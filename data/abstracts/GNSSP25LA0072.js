@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP25LA0072"] = "The State of Louisiana, through the Coastal Protectoin and Restoration Authority (CPRA) of Louisiana, was awarded RESTORE Act Council-Selected Restoration Component funding for the River Reintroduction into Maurepas Swamp project. This project will implement a river reintroduction project through conveyance of Mississippi River water into the Maurepas Swamp to improve the structure, function, and resilience of the coastal forest habitat through reintroduction of fresh oxygenated water, nutrients, and sediment.";
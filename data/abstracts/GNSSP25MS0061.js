@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP25MS0061"] = "The State of Mississippi, through the Mississippi Department of Environmental Quality (MDEQ), was awarded RESTORE Act Spill Impact Component funds for the Institute of Marine Mammal Studies Outreach and Ecotourism project. Under a subaward with MDEQ, the Institute of Marine Mammal Studies will implement this project. This project will support the promotion of tourism in the Gulf Coast Region through two Institute for Marine Mammal Studies' programs: Ecotourism - Enhancement of IMMS Public Outreach and Education Program and Enhancement of Ocean Adventures Public Outreach and Education Programs. The programs will provide eco-tourism benefits and environmental and ecosystem education opportunities that will encourage conservation of the Mississippi Sound and its marine life. The Institute for Marine Mammal Studies' Center for Marine Education and Research (IMMS-CMER) is a marine education and conservation facility that offers a variety of educational programs designed to meet diverse educational and outreach needs. This exposure is critical in fostering an educational foundation for stewardship of students, residents, and visitors to the Mississippi Gulf Coast, and in assisting them in understanding the importance of conserving the Mississippi Sound and its marine life. This project will develop new exhibits, graphics, presentations, and pay for salaries and supplies to conduct education and outreach programs at the Institute of Marine Mammals during tours, camps, hosted field trips, presentations and public meetings.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP25MS0062"] = "The State of Mississippi, through the Mississippi Department of Environmental Quality (MDEQ), was awarded RESTORE Act Spill Impact Component funds for the Walter Anderson Museum of Art Creative Complex project. Under a subaward with MDEQ, Walter Anderson Museum of Art (WAMA) will implement this project. This project will support the promotion of tourism in the Gulf Coast Region through the construction of features within the Creative Complex at the Walter Anderson Museum of Art. The Creative Complex is an expansion of the Museum's campus with a combined 15,000 square feet of indoor and outdoor spaces and gardens connecting to 21st century landscapes and applications such as those in science, recreation, engineering, tourism, and restoration. This project supports the construction of the Education Pavilion and Shoreline Garden features of the Creative Complex.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP25MS0065"] = "The State of Mississippi, through the Mississippi Department of Environmental Quality (MDEQ), was awarded RESTORE Act Spill Impact Component funds for the Compatibility, Coordination and Restoration Planning Round II project. This project provides planning assistance to support MDEQ's coordinated restoration planning effort in the Gulf Coast region and the development of new and/or amended Mississippi State Expenditure Plans (MS SEPs), grant applications, and subawards. The RESTORE Council's Initial Comprehensive Plan outlines commitments to coordination and leveraging. Mississippi has also established leveraging and coordination as core principles to maximize the effectiveness of restoration in Mississippi's coastal landscape. Across the restoration landscape, there are coordination needs to enhance leveraging, integration, and compatibility in the development of new and/or amended MS SEPs. Coordination activities may include participation in RESTORE Council activities directly related to this activity, collaboration of funding efforts to ensure compatibility and coordination of projects being considered for the MS SEP, stakeholder engagement, project identification, evaluation, and development, the identification of the appropriate funding source to implement a project, and planning activities within Mississippi and adjacent states. This project will also enable Mississippi to continue to apply this shared commitment of coordination and leveraging in subsequent MS SEP development.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP25MS0066"] = "The State of Mississippi, through the Mississippi Department of Environmental Quality (MDEQ), was awarded RESTORE Act Spill Impact Component funds for the Coastal Science Program for Mississippi High Schools project. Under a subaward with MDEQ, the Mississippi Department of Marine Resources (MDMR) will implement this project. This project will support workforce development and job creation in the Gulf Coast Region through providing the needed equipment and facilities for enhanced marine and coastal science education at high schools across the Mississippi Gulf Coast. The Coastal Science project is designed to engage high school students in environmental education with hands-on experiences to include, but not limited to, water quality monitoring, raising native wetlands plants in a nursery for use at coastal restoration sites, and growing marine species, including native fish at an aquaculture facility, to be released in local estuarine waters.";
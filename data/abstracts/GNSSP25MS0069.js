@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP25MS0069"] = "The State of Mississippi, through the Mississippi Department of Environmental Quality (MDEQ), was awarded RESTORE Act Spill Impact Component funds for the Pascagoula River Scenic Trail project. Under a subaward with MDEQ, the Jackson County Board of Supervisors will implement this project. This project would support the promotion of tourism in the Gulf Coast Region through the construction of amenities along a scenic trail by the Pascagoula River. Known as the Pascagoula River Blueway Connection, the 65-mile Pascagoula River Scenic Trail will feature mapped and marked waters along the largest free-flowing river in the continental United States. The project will offer nature-based experiences along the Pascagoula River, winding through bottomland hardwood forests, cypress swamps, and coastal marshes. The watershed also contains a network of diverse lakes, bayous, and sandbars, providing habitat to a wide range of wildlife, including over 320 bird species such as the Mississippi sandhill crane and the swallow-tailed kite. The primary purpose of the project is to support construction activities to develop the Pascagoula River Scenic Trail.";
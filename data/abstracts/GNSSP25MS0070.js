@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP25MS0070"] = "The State of Mississippi, through the Mississippi Department of Environmental Quality (MDEQ), was awarded RESTORE Act Spill Impact Component funds for the Harbor Expansion Parking Area (Jones Park) project. Under a subaward with MDEQ, the City of Gulfport will implement this project to concrete sidewalks along the east side of Jones Park that will connect pedestrians to existing parking areas and park amenities, adjust existing drainage structures in the sand beach area, and relocate the existing pedestrian beach ramp at the crosswalk north of the Jones Park roundabout. This project will support infrastructure benefitting the economy in the Gulf Coast Region through the expansion of parking and sidewalks along the eastern edge of Jones Park in Gulfport, MS. Jones Park, located between Highway 90 and the Gulfport Small Craft Harbor, features public amenities including greenspace, a walking trail, playground, pavilions, parking, and access to the beach, fishing piers, and boat launches. It also serves as a venue for year-round events and festivals.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP25MS0071"] = "The State of Mississippi, through the Mississippi Department of Environmental Quality (MDEQ), was awarded RESTORE Act Spill Impact Component funds for the construction of classrooms and dormitories at the Center for Marine Education and Research. Under a subaward with MDEQ, the Institute for Marine Mammal Studies (IMMS) will implement this project. This project would support infrastructure benefiting the economy in the Gulf Coast Region by constructing dormitories and classrooms at IMMS's Center for Marine Education and Research (IMMS-CMER) in Gulfport, MS. This project would provide enhanced opportunities for marine education, research, conservation, and natural resource stewardship for researchers, students, and visitors throughout the Gulf Coast Region. The project would fund the engineering and design, permitting, and construction of classrooms and dormitories at IMMS-CMER. Additional activities may also include, but are not limited to, planning, oversight and management, and coordination of subaward(s) between MDEQ and sub-recipient.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP25MS0073"] = "The State of Mississippi, through the Mississippi Department of Environmental Quality (MDEQ), was awarded RESTORE Act Spill Impact Component funds for the Nonspecific Invasive Species Detection and Treatment project. Under a subaward with MDEQ, Mississippi Department of Marine Resources (MDMR) will develop a geospatial inventory of invasive species across coastal Mississippi, conduct targeted invasive species treatment and removal, and monitor invasive species presence and eradication treatment success. The project will support the restoration and protection of the natural resources, ecosystems, fisheries, marine and wildlife habitats, beaches, and coastal wetlands of the Gulf Coast region by mitigating the environmental and economic challenges posed by non-native invasive species such as Giant Applesnail, Giant Salvinia, Phragmites, Alligatorweed, and feral hogs. Areas currently infested with these species suffer deterioration, leading to a reduction in food supply, nursery grounds, and foraging habitat for native species. Many invasives lack natural predators, allowing them to outcompete native species and disrupt the biological integrity of coastal habitats having far-reaching consequences, affecting the region's economy and environment. Through effective invasive species management, the project aims to improve water quality, enhance species diversity, and promote ecosystem resilience.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP26MS0075"] = "The State of Mississippi, through the Mississippi Department of Environmental Quality (MDEQ), will be the recipient of the RESTORE Act Spill Impact Component funds for the Mississippi Artificial Intelligence Network (MAIN) project. Under a subaward with MDEQ, Mississippi Gulf Coast Community College (MGCCC) will implement this project. The project will support workforce development and job creation with Artificial Intelligence (AI) in the Gulf Coast Region through the MGCCC, which would provide workforce training to students in emerging AI technologies. MAIN is a groundbreaking statewide coalition of Mississippi community colleges and universities, established to position the state\u2019s educational institutions at the forefront of AI awareness, training, and implementation within business and industry. MAIN is the first statewide coalition of educational institutions in the nation dedicated solely to AI. This project will allow MGCCC to support workforce development by funding industry training, staff, and associated administrative support, equipment, software licenses, operational costs, IT infrastructure, and other related expenses.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP26MS0076"] = "The State of Mississippi, through the Mississippi Department of Environmental Quality (MDEQ), will be the recipient of the RESTORE Act Spill Impact Component funds for the Port of Gulfport Expansion project. Under a subaward with MDEQ, the Mississippi State Port Authority will implement this project. This project would support infrastructure benefiting the economy in the Gulf Coast Region through planning activities for expansion efforts at the Port of Gulfport. In recent decades, maritime freight transportation has trended toward larger, deeper-draft vessels to increase efficiency in cargo operations. Due to this trend, the Port of Gulfport faces challenges in attracting new business because many cargo vessels are too large to navigate the channel. Additionally, some vessels that currently call at the Port of Gulfport must unload cargo at other ports to reduce their draft before entering. Even during the recent supply chain challenges, the port remained underutilized because the channel was not deep enough to accommodate diverted vessels. The primary purpose of the project is to support planning activities to develop containment structures to receive beneficial use dredge material from the Port of Gulfport federal navigation channel deepening and widening.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP26MS0077"] = "The State of Mississippi, through the Mississippi Department of Environmental Quality (MDEQ), will be the recipient of the RESTORE Act Spill Impact Component funds for Career Pathway for Hydrographic Technicians project. Under a subaward with MDEQ, the National Ocean Applications Research Center (NOARC) will implement this project. This project would support workforce training efforts in the Gulf Coast Region by providing hydrographic work-based learning opportunities to high school students using hydrographic survey and unmanned systems technologies in coastal Mississippi. NOARC, in collaboration with Pearl River Community College (PRCC), the Hancock County Career Technical Center (HCCTC), and industry partners, is working to address the shortage of technical labor currently affecting the hydrographic surveying industry. HCCTC will introduce hydrographic science to high school students, while NOARC in collaboration with industry partners, will provide work-based learning opportunities that give students hands-on experience with the latest hydrographic science technologies and exposure to potential employers who participate in the project. Training will also be provided for high school instructors. The primary purpose of the project is to provide workforce training that supports the autonomous systems industry along the Mississippi Gulf Coast.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP26MS0078"] = "The State of Mississippi, through the Mississippi Department of Environmental Quality (MDEQ), will be the recipient of the RESTORE Act Spill Impact Component funds for the Stock Enhancements of Spotted Seatrout in Mississippi project. Under a subaward with MDEQ, the Mississippi Department of Marine Resources will implement this project. This project would support the restoration and protection of natural resources, ecosystems, fisheries, marine and wildlife habitats, beaches, and coastal wetlands in the Gulf Coast region through the enhancement of the Spotted Seatrout stock in the Mississippi Sound. The purpose of this project is to support the Spotted Seatrout stock through aquaculture management strategies. It will focus on ensuring the sustainability of the Spotted Seatrout stock as well as the recreational, commercial, and charter fishing industries in Mississippi Sound and adjacent estuaries.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP26MS0079"] = "The State of Mississippi, through the Mississippi Department of Environmental Quality (MDEQ), will be the recipient of the RESTORE Act Spill Impact Component funds for the Living Shorelines Assistance Program project. Under a subaward with MDEQ, Mississippi State University will implement this project. This project would support the restoration and protection of natural resources, ecosystems, fisheries, marine and wildlife habitats, beaches, and coastal wetlands in the Gulf Coast region through the implementation of a strategy designed to encourage waterfront property owners in coastal Mississippi to conserve and restore intertidal habitat. The purpose of this project is to develop and implement a strategy that promotes the use of living shorelines over hardened alternatives for shoreline stabilization. Since most of the shorelines in this region are privately owned, this initiative is essential to foster widespread and impactful shoreline conservation and restoration efforts.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP26MS0080"] = "The State of Mississippi, through the Mississippi Department of Environmental Quality (MDEQ), will be the recipient of the RESTORE Act Spill Impact Component funds for the Mississippi Sound Estuary Program (MSEP). Under a subaward with MDEQ, the Mississippi State University (MSU) will implement this project. This project would support the restoration and protection of natural resources, ecosystems, fisheries, marine and wildlife habitats, beaches, and coastal wetlands along the Gulf Coast region through the facilitation of community-driven conservation, restoration, and stewardship activities. The Mississippi Sound Estuary Program (MSEP, mssoundep.com) is administered by the Mississippi State University Coastal and Marine Extension Program. The mission of MSEP is to facilitate community-driven conservation, restoration, and stewardship of the Mississippi Sound and its connecting watersheds. The program\u2019s workplan is developed through community feedback and engagement with advisory committees. These committees are tasked with providing input to guide updates to the Comprehensive Conservation and Management Plan (CCMP), a community-driven conservation and restoration plan for coastal Mississippi. The core of the CCMP is a prioritized list of project ideas or focal areas (termed \u201caction items\u201d) identified by the committees and the communities they represent as essential to improving the health of the Mississippi Sound and its watersheds. This project is building on the initial establishment of the MSEP and the development of its CCMP which was funded through the RESTORE Council-Selected Restoration Component, this additional funding will be utilized to develop watershed management plans, a State of the Sound report, and a project inventory report and to host multiple committee or subcommittee meetings and expand conservation related education and workforce development programs.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP26MS0081"] = "The State of Mississippi, through the Mississippi Department of Environmental Quality (MDEQ), will be the recipient of the RESTORE Act Spill Impact Component funds for the Recreational Enhancements at Front Beach project. Under a subaward with MDEQ, the City of Ocean Springs will implement this project. This project will support the promotion of tourism in the Gulf Coast region by constructing a pier and other amenities at Front Beach in Ocean Springs, MS. The primary purpose of the project is to provide improvements to the property to enhance public access to the waterfront and increase tourism opportunities.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNSSP26MS0082"] = "The State of Mississippi, through the Mississippi Department of Environmental Quality (MDEQ), will be the recipient of the RESTORE Act Spill Impact Component funds for the Mississippi Aquarium \u2013 Interactive Exhibit project. Under a subaward with MDEQ, the Mississippi Aquarium will implement this project. This project would support the promotion of tourism in the Gulf Coast region through construction of an interactive exhibit to create a habitat for resident African penguins within the Mississippi Aquarium in Gulfport, MS. The primary purpose of the project is to implement improvements to the Mississippi Aquarium to support tourism activities.";
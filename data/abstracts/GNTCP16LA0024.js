@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTCP16LA0024"] = "The State of Louisiana, through the Louisiana Coastal Protection and Restoration Authority (CPRA), was awarded RESTORE Act Council-Selected Restoration Component funds for the West Grand Terre Beach Nourishment and Stabilization (Planning) project. Under the award, CPRA oversaw engineering and design of a project that would restore and enhance the dune and back barrier marsh habitat of West Grand Terre Beach, Louisiana. This would provide storm surge and wave attenuation, thereby addressing the issues of gulf shoreline erosion, diminished storm surge protection, and subsidence of back barrier marshes. It was estimated that the project design would consist of plans for restoring 12,700 feet of beach and dune with an area of 235 acres, as well as up to 66 acres of back barrier marsh, and building a rock revetment to protect the restored area. The goal of the project design is to increase the width of the island and maintain shoreline integrity through the introduction of sediment in order to increase island longevity.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTCP17FL0008"] = "APALACHICOLA WATERSHED AGRICULTURE WATER QUALITY IMPROVEMENTS (IMPLEMENTATION) --- The State of Florida, through the Florida Department of Environmental Protection (FDEP), was awarded RESTORE Act Council-Selected Restoration Component funds for the Apalachicola Watershed Agriculture Water Quality Improvements (Implementation) project. Florida Department of Agriculture and Consumer Services and Jackson Soil and Water Conservation District are subrecipients. FDEP is sponsoring a Florida Department of Agriculture and Consumer Services (FDACS) cost share program for landowners to implement FDACS and U.S. Department of Agriculture (USDA) Natural Resources Conservation Service (NRCS) water quality-focused Best Management Practices (BMPs) which will reduce pollutant loadings by 20-30% per fertilizer application. The objective of this project is to complete participating farm enrollment in the program and implement the BMPs to reduce sediments and pollutants generated from agricultural operations in the focus area. This will also reduce deposition into tributary streams of the Apalachicola River and improve agricultural irrigation efficiency in the Apalachicola River Basin including increased water conservation.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTCP17FL0015"] = "The State of Florida, through the Florida Department of Environmental Protection (FDEP), was awarded RESTORE Act Council-Selected Restoration Component funds for the implementation of the Suwannee River Partnership Irrigation Water Enhancement Program. Florida Department of Agriculture and Consumer Services and Suwannee County Conservation District are subrecipients. Nutrient loading from agricultural activities is a considerable environmental stressor to the Suwannee River and Estuary. With this FDEP-sponsored program, the Florida Department of Agriculture and Consumer Services (FDACS) oversees and works with the Suwannee River Partnership to build on a successful pilot program to improve irrigation system efficiency similar to the U.S. Department of Agriculture (USDA) Natural Resources Conservation Service's (NRCS) Agricultural Water Enhancement Program. These irrigation system improvements will conserve water and energy, as well as reduce nutrient loading to water resources. This program is occurring in Lafayette and Suwannee Counties, within the Suwannee River Watershed.";
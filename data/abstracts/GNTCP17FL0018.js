@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTCP17FL0018"] = "The State of Florida, through the Florida Department of Environmental Protection (FDEP), was awarded RESTORE Act Council-Selected Restoration Component funds for the Bayou Chico Contaminated Sediment Removal- Planning, Design, and Permitting (Planning) project. The Natural Resource Damage Assessment (NRDA) and National Fish and Wildlife Foundation Gulf Environmental Benefit Fund (NFWF GEBF) are leveraging partners. Escambia County is a subrecipient. Bayou Chico, a tributary to Pensacola Bay, has experienced severe environmental degradation due to historic impacts, including industrial and domestic wastewater discharges, shipyard-related pollution and long-term untreated stormwater runoff. Legacy pollutants remain in the Bayou. This project provides funds to Escambia County for planning, design, and acquisition of all federal and state environmental compliance and permits for the dredging and removal of sediments enriched with nutrients and hydrocarbons from approximately 125 acres of Bayou Chico. The activities associated with this component include: (1) surveying; (2) sediment analysis;( 3) development of 30%, 60% and 100% design packages and bid specifications; (4) preparing draft and final design application packages for all applicable federal, state, and local permits; and 5) project administration. The Bayou Chico Contaminated Sediment Removal Project is partially funded through RESTORE Act Council Spill-Impact Component Funding (see,1-1: Bayou Chico Contaminated Sediment Remediation Project, GNSSP21FL0025).";
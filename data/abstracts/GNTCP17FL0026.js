@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTCP17FL0026"] = "The State of Florida, through the Florida Department of Environmental Protection (FDEP), was awarded RESTORE Act Council-Selected Restoration Component funds for implementation of the Beach Haven \u2013 Joint Stormwater &amp; Wastewater Improvement Project Phase II. The National Fish and Wildlife Foundation (NFWF) and the Emerald Coast Utilities Authority are leveraging partners on this project. Escambia County is a subrecipient.Septic tanks and untreated stormwater runoff are still significant sources of pollutants to impaired Bayou Chico, an important habitat area within the Pensacola Bay watershed. With this project the Florida Department of Environmental Protection will provide funds to Escambia County through a sub-recipient agreement to design and permit stormwater treatment facilities and remove septic tanks, and connect properties to a new central sewer infrastructure. The implemented project will reduce sediment and nutrient loadings to Bayou Chico, reduce Biochemical Oxygen Demand (BOD), reduce total suspended solids (TSS), reduce turbidity, increase water clarity, and improve light penetration for photosynthesis to enable expansion of submerged aquatic vegetation (SAV) and emergent marsh habitat.";
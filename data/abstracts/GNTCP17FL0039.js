@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTCP17FL0039"] = "The State of Florida, through the Florida Department of Environmental Protection (FDEP), was awarded RESTORE Act Council-Selected Restoration Component funds for the Apalachicola Bay Oyster Restoration (Implementation) project. The National Fish and Wildlife Foundation (NFWF), National Oceanic and Atmospheric Administration (NOAA), and Natural Resource Damage Assessment (NRDA) were leveraging partners on this project. Florida Department of Agriculture and Consumer Services is a subrecipient. This project, which was an expansion of a NRDA Early Restoration Phase III project, restored more than 300 acres of natural oyster reefs through the addition of approximately 50,000 cubic yards of cultch material to support successful oyster spat settlement and, ultimately, adult oysters. Placing of substrate or \"cultch\" in bays where natural reproduction occurs, is among the most effective techniques used to 1) create reef infrastructure, 2) stimulate spat setting, 3) sustain oyster fisheries, 4) enhance community functions, 5) increase natural productivity and 6) accelerate the recovery process.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTCP17FL0040"] = "The State of Florida, through the Florida Department of Environmental Protection (FDEP), was awarded RESTORE Act Council-Selected Restoration Component funds for the Pensacola Bay Living Shoreline - Phase 1 (Planning) project. Natural Resource Damage Assessment (NRDA) is a leveraging partner on this project. The project will be implemented through a sub agreement with Escambia County. FDEP's Pensacola Living Shoreline Phase I (Planning) project is a multi-phase living shoreline project that totals approximately 24,800 linear feet of rock and oyster reef breakwater and more than 200 acres of emergent marsh and submerged aquatic vegetation (SAV) habitat in Pensacola Bay. An initial award component provided funding for planning, engineering, design, environmental compliance, and permitting for three sites. The three sites include White Island in northwestern Pensacola Bay, southward along the eastern shore of Naval Air Station (NAS) Pensacola, and along the eroded southern shore of NAS Pensacola across from Pensacola Pass. A subsequent award component provides funding for implementation, including construction of approximately 24,800 linear feet of breakwaters and 200 acres of emergent marsh and submerged aquatic vegetation (SAV) habitat. Construction tasks will include sand placement to create saltmarsh habitat, plantings to stabilize the saltmarsh, and the construction of breakwaters, submerged reefs, and rockpiles.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTCP17LA0013"] = "The State of Louisiana, through the Louisiana Coastal Protection and Restoration Authority (CPRA), was awarded RESTORE Act Council-Selected Restoration Component funds for the Golden Triangle Marsh Creation (Planning) project. The CPRA will lead the Golden Triangle Marsh Creation project with the ultimate objective to restore and protect wetland, fish, and wildlife habitat and help maintain landscape integrity and enhance community resilience. This marsh, located east of New Orleans, and between Lake Borgne and the confluence of the Mississippi River Gulf Outlet and the Gulf Intracoastal Waterway, will also help protect vulnerable communities from storm surge. The engineering and design was carried out in this funded phase of project development. It is anticipated that the Golden Triangle Marsh Restoration Project will be constructed by hydraulically dredging and pumping sediment from Lake Borgne approximately 16 miles to the designated fill site. The fill site is approximately 600 acres. The slurry fill may be constructed to an elevation of +2 feet. The borrow area currently has a depth of -10 feet and may be dredged to a depth of -20 to -30 feet. Earthen containment dikes will be constructed to facilitate the construction of the marsh. A cutterhead suction dredge will likely be utilized to construct this project and up to three booster pumps may be required.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTCP17LA0025"] = "The State of Louisiana, through the Louisiana Coastal Protection and Restoration Authority (CPRA), was awarded RESTORE Act Council-Selected Restoration Component funds for the Biloxi Marsh Living Shoreline (Planning) project. The CPRA will lead the Biloxi Marsh Living Shoreline project to protect, enhance, and restore the Biloxi Marshes, and enhance local oyster production through the implementation of marsh-fringing, bioengineered oyster reefs. These marshes will function as an important storm buffer for the city of New Orleans, an important cultural and economic center for the Gulf Coast region, and will provide habitat as well as a variety of ecosystem services. The engineering and design phase of the Biloxi Marsh Living Shoreline project was supported by this award, and will inform the subsequent construction under a different funding request. It is anticipated that the project would be constructed by mechanically placing a manufactured product, or suite of products (including concrete, plastic mesh, steel rebar, limestone, oyster shells, and/or concrete admixtures), just off the shoreline to create a living breakwater structure. It is estimated that the project will create nine to eleven miles of oyster barrier reef along the eastern shore of Biloxi Marsh, which would provide oyster habitat, reduce wave erosion, and prevent further marsh degradation.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTCP17LA0044"] = "The State of Louisiana, through the Louisiana Coastal Protection and Restoration Authority (CPRA), was awarded RESTORE Act Council-Selected Restoration Component funds for the Mississippi River Reintroduction into Maurepas Swamp (Planning) project. The CPRA will lead this project, with the goal of restoring and enhancing the health and sustainability of the Maurepas Swamp through the reintroduction of seasonal Mississippi River inflow. Funding for this portion of the project is for planning only and includes: (1) all required permits necessary to construct the project, (2) a final design package including construction plans and specifications, (3) an Operations, Maintenance, Monitoring, and Adaptive Management Plan, and (4) Land rights surveys, title research, and all related documents necessary to acquire land rights. The Maurepas Swamp is one of the largest areas of forested wetlands along the Gulf Coast, and encompasses approximately 57,000 hectares of bald cypress-tupelo swamp southwest of Lake Maurepas. Historically, the swamp received sediment and nutrient inputs from the Mississippi River during seasonal overbank flooding. However, this process has been interrupted by flood control levees, and consequently elevation has decreased to the point where the swamp is almost constantly flooded. In addition to restoring and enhancing over 18,000 hectares of forested wetland, this project should provide a number of other benefits including increased habitat productivity and water quality by reconnecting the swamp to the Mississippi River.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTCP17MS0020"] = "The State of Mississippi, through the Mississippi Department of Environmental Quality (MDEQ), was awarded RESTORE Act Council-Selected Restoration Component funds for implementation of the Sea Grant Education and Outreach (Planning and Implementation) program. Under a subaward with MDEQ, this project was overseen by Mississippi State University, the Mississippi Wildlife Federation, the Land Trust for the Mississippi Coastal Plain, and the University of Southern Mississippi. This project established and implemented an Extension, Outreach, and Education (EOE) grant program to fund extension, outreach, and education about the benefits of restoration and conservation work, specifically the connection between upstream land conservation and downstream estuarine and marine ecosystem benefits. This project funded a one-time grant period in the State of Mississippi dedicated to using EOE deliverables to highlight how land conservation and restoration results in multiple ecosystem benefits in our marine environment. The EOE grant program leveraged existing education programs in Mississippi, and strongly encouraged public/private partnerships to enhance effectiveness of EOE deliverables. The culmination of this program was the hosting of the \u00e2\u20ac\u0153Connecting Upstream Land Conservation and Restoration to Downstream Systems conference, hosted by the Mississippi Department of Environmental Quality (MDEQ). At the conference, all grantees were required to present the results of their respective EOE projects. The conference was free and open to anyone interested in restoration EOE.";
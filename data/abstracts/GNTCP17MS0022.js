@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTCP17MS0022"] = "The State of Mississippi, through the Mississippi Department of Environmental Quality (MDEQ), was awarded RESTORE Act Council-Selected Restoration Component funds for the Enhancing Opportunities for Beneficial Use (BU) of Dredge Sediments in the Mississippi Sound (Planning) project. This project identifies appropriate sites for BU containment, and procures engineering and design services to develop plans for containment construction. The project also funds the procurement of appropriate permits for future construction of containments. This project purposefully connects and leverages the existing National Fish and Wildlife Foundation Gulf Environmental Benefit Fund (NFWF GEBF) Utilization of Dredge Material for Marsh Restoration in Coastal Mississippi project by spatially separating these two efforts within the estuarine landscape of Mississippi. This award is focused on engineering and design. The goal of this project is to create shovel ready marsh restoration projects in the Mississippi Sound, thus complementing the NFWF GEBF project. This will be accomplished through careful site selection, preparation of engineering and design plans, environmental compliance, and permitting.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTCP17TX0009"] = "The State of Texas, through the Texas Commission on Environmental Quality (TCEQ), was awarded RESTORE Act Council-Selected Restoration Component funds for the Matagorda Bay System Priority Landscape Conservation project. Texas Parks and Wildlife Department is a subrecipient. This project aimed to conserve strategic lands adjacent to the Matagorda Bay/San Antonio Bay complex to help ensure long-term native diversity, productivity and resiliency of the entire bay estuary complex. As a subrecipient of this funding, the State of Texas acquired over 6,000 acres of high-quality coastal habitats including emergent marshes, tidal flats, lagoons and coastal prairie with over 14 miles of frontage on the Matagorda Bay system. These conservation activities will help protect extensive adjacent seagrass and shellfish beds.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTCP17TX0010"] = "The State of Texas, through the Texas Commission on Environmental Quality (TCEQ), was awarded RESTORE Act Council-Selected Restoration Component funds for the Bahia Grande Coastal Corridor (BGCC) (Implementation) project. The Nature Conservancy is a subrecipient. Three properties totaling nearly 2,000 acres were purchased by The Nature Conservancy (TNC) from willing sellers. Two of the properties (1820 acres) were purchased with RESTORE funds. An additional tract (178 acres) was partially funded with RESTORE funds, as well as with private funds from the Knobloch Foundation. This project has connected the Laguna Atascosa NWR, Lower Rio Grande Valley NWR and Boca Chica State Park, as well as over 2 million acres of intact habitat on private ranchland with the 1.3 million acre Rio Bravo Protected Area, managed by the CONANP in Mexico. This connection will provide additional protection for, and could prevent future listing of state threatened species like the reddish egret, Botteri's sparrow, white-tailed hawk, white-faced ibis, Texas tortoise, Texas indigo snake and Texas horned lizard. Properties purchased in this project were subsequently transferred to the U.S. Fish and Wildlife Service (USFWS) as part of the Laguna Atascosa National Wildlife Refuge. The USFWS has owned and managed these properties in accordance with the terms of this project since that time.";
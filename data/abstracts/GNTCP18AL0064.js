@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTCP18AL0064"] = "The State of Alabama, through the Alabama Department of Conservation and Natural Resources (ADCNR), received RESTORE Act Council-Selected Restoration Component funds for the Commitment and Planning Support (CPS) \u2013 Alabama award. The purpose of this award is to enhance collaboration, coordination, public engagement, and the use of best available science to more effectively meet the requirements of the RESTORE Act Council-Selected Restoration Component, the commitments of the RESTORE Council's Comprehensive Plan Update, and address associated planning needs for developing future Funded Priorities Lists (FPLs). Alabama will draw and build upon existing partnerships and collaborative endeavors, including the Management Conference of the Mobile Bay National Estuary Program to develop portfolios of projects for inclusion on future FPLs that will provide significant benefits for the natural resources of Coastal Alabama. Alabama will take a stepwise approach to planning and collaboration activities over the performance period of this award to meet the near-term need to develop strong proposals for future FPLs while setting the foundation for long-term restoration success. Because planning is inherently iterative, CPS funds will be administered in a way that allows the flexibility needed as the planning process proceeds. To that end, more work plans for subsequent years will be developed as part of each year's activities.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTCP18AL0066"] = "The State of Alabama, through the Alabama Department of Conservation and Natural Resources (ADCNR), was awarded RESTORE Act Council-Selected Restoration Component funds for the Coastal Alabama Comprehensive Watershed Restoration Planning Project. Mobile Bay National Estuary Program (MBNEP) is a subrecipient. The State of Alabama will oversee the distribution of RESTORE funds to the Mobile Bay National Estuary Program (MBNEP) to complete comprehensive Watershed Management Plans (WMPs) for watersheds identified as priorities in coastal Alabama by the MBNEP's Science Advisory Committee and Project Implementation Committee. The planning process is designed to build community partnerships; characterize current conditions in each watershed; identify goals and solutions for reducing pollutants entering the bay, sound, and Gulf waters; and establish implementation programs that include a schedule, interim milestones, criteria to measure progress, a monitoring component, information/education programs, and identification of technical and financial assistance needed to implement the plans.";
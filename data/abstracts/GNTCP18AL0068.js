@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTCP18AL0068"] = "The State of Alabama, through the Alabama Department of Conservation and Natural Resources (ADCNR), was awarded RESTORE Act Council-Selected Restoration Component funds for the Alabama Submerged Aquatic Vegetation Restoration and Monitoring Program. Marine Environmental Sciences Consortium (DBA-Dauphin Island Sea Lab) is a subrecipient. The ADCNR will complete a submerged aquatic vegetation (SAV) restoration program in Perdido Bay, upper Mobile Bay, and lower Mobile/Tensaw River Delta; and an SAV comprehensive mapping and monitoring program for coastal Alabama. These programs will speed the recovery of areas that have known losses of SAV beds, either by prop scarring or natural disasters, and provide ADCNR with vital SAV status and trends data, allowing further investigation to the factors that influence historic SAV loss as well as observed fluctuations in SAV coverage. Additionally, mapping will provide critical SAV extent and species composition data for resource managers and regulatory agencies, better informing regulatory decisions, future restoration efforts, and the need for additional long-term SAV monitoring, protection and restoration.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTCP18FL0047"] = "The State of Florida, through the Florida Department of Environmental Protection (FDEP), was awarded RESTORE Act Council-Selected Restoration Component funds for the Palm River Restoration Project Phase II, East McKay Bay (Implementation) project. Tampa Bay Environmental Restoration Fund, Southwest Florida Water Management District (SWFWMD), and Florida Department of Transportation are leveraging partners on this project. Southwest Florida Water Management District is also a subrecipient. FDEP provides funding to the SWFWMD to implement extensive habitat restoration, water quality improvements, and mitigation of erosion along the Palm River at the mouth of McKay Bay. The project focuses on improving water quality and enhancing upland and wetland areas on approximately 50 acres of primarily SWFWMD land. It will remove exotic vegetation on two parcels, create and enhance wetlands, and build three stormwater management areas to provide water quality treatment for 436 acres of residential, commercial and industrial developed land.";
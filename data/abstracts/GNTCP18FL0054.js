@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTCP18FL0054"] = "The State of Florida, through the Florida Department of Environmental Protection (FDEP), was awarded RESTORE Act Council-Selected Restoration Component funds for the Commitment and Planning Support (CPS) \u2013 Florida award. Florida Fish and Wildlife Conservation Commission is a subrecipient. The purpose of this award is to enhance collaboration, coordination, public engagement and the use of best available science to more effectively meet the requirements of the RESTORE Act Council-Selected Restoration Component, meet the commitments of the RESTORE Council's Comprehensive Plan Update, and address associated planning needs for developing future Funded Priorities Lists (FPLs). Early activities focus on identifying priority projects and partners that fit within the broader vision for coastal Florida in order to develop proposals for the next FPL. The State of Florida is taking a stepwise approach to planning and collaboration activities over the performance period of this award to meet the near-term need to develop the strongest proposals possible for the next FPL while setting the foundation for long-term restoration success. Because planning is inherently iterative, these CPS funds are being administered in a way that allows the flexibility needed as the planning process proceeds. To that end, more work plans for subsequent years will be developed as part of each year's activities.";
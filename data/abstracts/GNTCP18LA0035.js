@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTCP18LA0035"] = "The State of Louisiana, through the Louisiana Coastal Protection and Restoration Authority (CPRA), was awarded RESTORE Act Council-Selected Restoration Component funds for the Lowermost Mississippi River Management Program (LMRMP) (Planning) project. CPRA will oversee the LMRMP, which is a large-scale program that will build the technical knowledge base needed to develop and implement a plan that moves the nation toward a holistic management framework for the Lowermost Mississippi River. A fundamental premise for the plan is that a sustainable navigation system requires a sustainable coast, and vice versa. This program will continue to refine our understanding of Mississippi River physical processes to improve navigation, reduce flood risk, and maximize river-based restoration benefits. The program is comprised of five technical elements; 1) Expanded Use and Development of Lowermost Mississippi River Models, 2) Subsidence investigations, 3) Impact of Storm Surge within the Mississippi River, 4) Geomorphology of LMR Lateral Bars, and 5) Dredged Material Management. The LMRMP will build upon and complement the Mississippi River Hydrodynamic and Delta Management Study, which included the development of single and multi-dimensional hydrodynamic and sediment transport models of the main river channel and passes. It will also coordinate a cross-calibration of these numerical models with the new Small Scale Physical Model at LSU. Outreach to key stakeholders, user groups, academia and the general public will be conducted throughout the entire program.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTCP18LA0055"] = "The State of Louisiana, through the Louisiana Coastal Protection and Restoration Authority (CPRA), received RESTORE Act Council-Selected Restoration Component funds for the Commitment and Planning Support (CPS)\u00e2\u20ac\u201dCoastal Protection and Restoration Authority award. CPRA will oversee the implementation of this award, which is intended to enhance collaboration, coordination, public engagement, and the use of best available science to more effectively meet the requirements of the RESTORE Act Council-Selected Restoration Component, meet the commitments of the RESTORE Council's Comprehensive Plan Update, and address associated planning needs for developing future Funded Priorities Lists (FPLs). Initially, CPRA, along with contractors, will identify priority projects, partners, and available sources of funding consistent with the Louisiana Coastal Master Plan and RESTORE Council Comprehensive Plan goals and objectives appropriate for the next FPL. To allow flexibility with the planning funds, workplans will be developed each year for activities in future years.";
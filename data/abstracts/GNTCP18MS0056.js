@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTCP18MS0056"] = "The State of Mississippi, through the Mississippi Department of Environmental Quality (MDEQ), received RESTORE Act Council-Selected Restoration Component funds for the Commitment and Planning Support (CPS)- Mississippi award. The purpose of this award is to enhance collaboration, coordination, public engagement and the use of best available science to effectively meet the requirements of the RESTORE Act Council-Selected Restoration Component, meet the commitments of the RESTORE Council's Comprehensive Plan Update, and address associated planning needs for developing future Funded Priorities Lists (FPLs). The State of Mississippi is building upon existing partnerships and collaboration pathways developed through its existing Deepwater Horizon restoration program, administered by MDEQ. Early activities focused on identifying priority projects and partners in order to develop proposals for the next FPL. The State of Mississippi has taken a stepwise approach to planning and collaboration activities over the performance period of this award to meet the near-term need to develop proposals for the next FPL while setting the foundation for long-term restoration success. Because planning is iterative, these CPS funds are being administered in a way that allows the flexibility needed as the planning process proceeds. To that end, work plans for subsequent years will be developed as part of each year's activities.";
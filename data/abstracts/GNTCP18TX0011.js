@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTCP18TX0011"] = "The State of Texas, through the Texas Commission on Environmental Quality (TCEQ), was awarded RESTORE Act Council-Selected Restoration Component funds for Bayou Greenways Planning & Implementation project. The Houston Parks Board is a subrecipient. Under this project, the Houston Parks Board (HPB), subrecipient for the project, purchased 69.5 acres of land along the Clear Creek Greenway as part of the larger Bayou Greenways initiative to acquire and preserve nearly 4,000 acres of riparian buffer corridors along major waterways, (bayous and creeks) running predominately through Harris County and the City of Houston. The primary RESTORE Council Comprehensive Plan objective of this proposal is to restore and conserve habitat, with secondary goals to restore water quality, replenish and protect living coastal and marine resources, enhance community resilience and restore and revitalize the Gulf economy. The project achieves the goal of habitat protection by purchasing and preserving land in perpetuity as parkland and the goal of habitat restoration through a robust (and already funded) maintenance program. This project has protected existing undeveloped riparian lands along the bayou, and secured their threatened flood retention properties into the future. The HPB conducted due diligence in determining specific tracts of land and the required environmental reporting. The properties were transferred to the City of Houston for long-term operations and management under the Houston Parks and Recreation Department.";
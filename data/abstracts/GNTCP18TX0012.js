@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTCP18TX0012"] = "The State of Texas, through the Texas Commission on Environmental Quality (TCEQ), was awarded RESTORE Act Council-Selected Restoration Component funds for the Texas Beneficial Use/Marsh Restoration project. Under a subaward with TCEQ, the Texas General Land Office will facilitate beneficial use of dredged materials (BUDM) through careful site selection, survey data collection, preparation of engineering and design plans, and environmental compliance and permitting. The primary goal is to create shovel-ready restoration sites that, when fully implemented, will transform areas that have subsided into open waters back to tidally influenced coastal wetlands. This method has proven to be highly effective in restoring and creating habitat for fish and wildlife, improving water quality, and enhancing natural storm buffers. The funding supports planning for three proposed projects: (1) Marsh Restoration in the Salt Bayou Unit of the J.D. Murphree WMA in the Salt Bayou Watershed; (2) Marsh Restoration in Pierce Marsh on West Bay in the Galveston Bay Estuary; and (3) Marsh Restoration in Greens Lake on West Bay in the Galveston Bay Estuary. Texas has a history of successful BUDM projects with cooperative agreements among state and federal natural resource agencies and the United States Army Corps of Engineers (USACE) in place through the Texas Coastal Management Program (CMP). The project proponent will coordinate with USACE and private dredging operations to identify potential source materials and timelines for placement of dredge material.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTCP18TX0061"] = "The State of Texas, through the Texas Commission on Environmental Quality (TCEQ), was awarded RESTORE Act Council-Selected Restoration Component funds for the Commitment and Planning Support (CPS) - Texas award. Texas A&M University-Corpus Christi is a subrecipient. The purpose of this award is to work in coordination with a team of Texas coastal experts, elected officials, representatives for the Natural Resource Damage Assessment (NRDA) and National Fish and Wildlife Foundation (NFWF), the five Gulf states, federal entities and the public, using the best available science, in meeting the requirements of the RESTORE Act Council-Selected Restoration Component and the commitments of the RESTORE Council's Comprehensive Plan Update. The result will address and determine planning needs and identify project proposals for the upcoming Funded Priority Lists (FPLs) and to set up the foundation for successful long-term restoration projects. The State of Texas will hire a contractor to conduct planning and collaboration activities over this performance period of the award to determine the highest level of restoration needs along the Texas coast, as well as the Gulf coast, and to provide the basis for a \u00e2\u20ac\u02dc10-year Strategy' approach for long-term restoration across Texas and the other Gulf of Mexico States.";
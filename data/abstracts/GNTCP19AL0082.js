@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTCP19AL0082"] = "The State of Alabama, through the Alabama Department of Conservation and Natural Resources (ADCNR), was awarded RESTORE Act Council-Selected Restoration Component funds for the Enhancing Opportunities for Beneficial Use of Dredge Sediments (Denton Oyster Reef Restoration Through Beneficial Use of Upriver Sediment; Grand Bay Mississippi Sound Back-Barrier Island Restoration Project Feasibility Study; Lower Perdido Bay/Perdido) project. The City of Orange Beach and United States Geological Survey are subrecipients. ADCNR will complete planning, design, engineering, and feasibility assessments for three project areas where future placement of dredge sediments would achieve habitat restoration: Denton Reef, Grand Bay/Mississippi Sound, and Lower Perdido Bay/Perdido Pass. The Denton Reef Restoration project consists of Phase I planning, engineering, design, and permitting necessary for using available dredge sediments to restore the 75-acre Denton Reef in Mobile Bay. The Grand Bay/Mississippi Sound Back Barrier Island Restoration Project Feasibility Study investigates the use of dredge sediments to restore/recreate several interior headland islands that have experienced significant erosion. The Lower Perdido Bay/Perdido Pass Hydrological Modeling and Sediment Study will collect data to model the hydrology and sediment dynamics in Lower Perdido Bay near the Perdido Pass Navigation Project. These planning activities lay the groundwork for significant restoration activities in coastal Alabama. Once this planning phase is completed, the State of Alabama would have a full understanding of the feasibility of conducting restoration projects in these areas.";
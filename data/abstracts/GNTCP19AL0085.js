@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTCP19AL0085"] = "The State of Alabama, through the Alabama Department of Conservation and Natural Resources (ADCNR), was awarded RESTORE Act Council-Selected Restoration Component funds for the Alabama Living Shorelines Program (Construction Planning Component) project. The ADCNR will conduct all preliminary planning associated with the potential future construction of three proposed living shorelines projects (Coffee Island, Boggy Point, and Point Aux Pins), including engineering and design and permitting. Activities for this planning component will include field investigations, surveys, construction planning, engineering design, and regulatory compliance/permitting. Later phases of the projects would address shoreline and salt marsh loss at each of the selected sites. As the later phases are constructed and mature, it is anticipated that wave energies would be reduced, shoreline and salt marsh loss would be reversed and/or slowed, salt marsh would be restored and estuarine productivity would be increased. The planning and implementation for this project was funded separately (see Comprehensive Living Shoreline Monitoring (Planning and Implementation), GT1CP21AL0001).";
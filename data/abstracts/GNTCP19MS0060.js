@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTCP19MS0060"] = "The State of Mississippi, through the Mississippi Department of Environmental Quality (MDEQ), was awarded RESTORE Act Council-Selected Restoration Component funds for the Strategic Land Protection, Conservation, and Enhancement of Priority Gulf Coast Landscapes in Mississippi (Planning and Implementation) program. Under the program, lands are being acquired from willing sellers, under a land acquisition plan, using fee simple acquisition and/or conservation easements. The lands purchased are being acquired at fair market value, using Uniform Appraisal Standards for Federal Land Acquisitions (UASFLA) standards. The expenditure of funds under the program are occurring based upon availability of potential prioritized acquisition parcels. Further, under this program, MDEQ, as the recipient, is leading and/or assisting a lead federal agency in preparing the requisite National Environmental Policy Act (NEPA) analysis documentation for future land acquisition and related restoration and conservation activities proposed in the Mississippi Gulf Coast region, coordinating with the RESTORE Council as needed.";
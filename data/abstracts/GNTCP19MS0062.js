@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTCP19MS0062"] = "The State of Mississippi, through the Mississippi Department of Environmental Quality (MDEQ), was awarded RESTORE Act Council-Selected Restoration Component funds for The Mississippi Sound Estuarine Program (MEP). MDEQ is working towards establishment of the MEP, which geographically encompasses the Pearl River on the west to the Escatawpa River in the east. It includes the Hydrologic Unit Code (HUC) 8 watersheds of these two major river systems, as well as those in between the two systems, as an area of interest (AOI). The purpose of the MEP is to create a structure to connect restoration and investment efforts of Mississippi state agencies, federal agencies, as well as the restoration and ecosystem-based research of academic institutions. This program is being implemented in two phases. Phase I includes development of a coupled river \u2013 to Mississippi Sound hydrodynamic model as a foundation for sustainable coastal restoration. It also includes a watershed restoration gap analysis to identify and develop watershed-specific restoration plans not currently being addressed through complementary efforts, and the hosting of annual restoration planning discussions that would highlight coastal restoration-specific work in the MEP area of interest and the Mississippi Sound. Phase II will include the establishment of the MEP.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTCP20AP0104"] = "The Alabama State Port Authority was awarded RESTORE Act Council-Selected Restoration Component funds for the Upper Mobile Bay Beneficial Use Wetland Creation (planning) project. The primary goal of this project is to restore and conserve habitat by creating over 1,000 acres of estuarine tidal marsh in the upper Mobile Bay through the placement of readily available sediment into a confined upper bay beneficial use area to create the aforementioned estuarine tidal marsh. The primary objective is to restore and enhance habitats by restoring estuarine marsh through the construction of a semi-submerged containment area and placement of dredged sediment within this containment. Secondary objectives include: improvement to water quality, providing habitat for living coastal and marine resources and enhancing coastal resiliency. This award funds Phase I of this project, which consists of conducting the necessary investigations, studies and engineering design work to meet all NEPA requirements, delineate the exact location of the marsh creation site, identify sources of material for construction of the containment structure, obtain a permit for construction of the project and to prepare the engineering plans and specifications necessary for procurement of the services necessary to construct the project (Phase II). It is anticipated that a second RESTORE funding application will be submitted to obtain the necessary funding for Phase II.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTSP16FL0021"] = "The Florida Gulf Consortium is the designated entity responsible for the development of the Florida State Expenditure Plan as recognized in the RESTORE Act and subsequent rule making. This application is subsequent to the Council's approval of the Consortium's Planning State Expenditure Plan on May 21, 2015. Florida specific goals, objectives and guiding principles were developed in a workshop held on August 26, 2015. The Consortium, with the approval of this grant application, will move into the Project Nomination phase. The project nomination phase will include a gaps analysis, and GIS spatial database development. Projects will be reviewed for cost-effectiveness and leveraging potential. This project also provides for funding for conceptual design and feasibility studies as needed to develop projects. Because of the 15-year settlement pay-out a project sequencing strategy will be developed to expedite and optimize distribution of Spill Component funds. These activities will culminate in the drafting of the Florida State Expenditure Plan.";
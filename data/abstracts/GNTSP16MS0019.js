@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTSP16MS0019"] = "The State of Mississippi, through the Mississippi Department of Environmental Quality (MDEQ), was awarded RESTORE Act Spill Impact Component funds for the implementation of the Mississippi State Expenditure Plan. The planning funds for this project were used to develop projects and programs that best complement the State of Mississippi's restoration needs in accordance with the eligible activities of the Spill Impact Component. This project involves foundation building, project filtering, and project vetting, which resulted in the development of the MSEP. These activities were an iterative process that supported Mississippi's holistic approach to restoration and transparency to stakeholders. The initial MSEP was approved in 2017.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTSP17LA0046"] = "The State of Louisiana, through the Louisiana Coastal Protection and Restoration Authority (CPRA), was awarded RESTORE Act Spill Impact Component funds for the Adaptive Management program. This program is administered by CPRA and is located throughout the coastal zone of Louisiana. RESTORE funds will be used for data collection, its management, assessment, and planning to advance the goals of the Coastal Master Plan. Adaptive Management is a key feature of Louisiana's Coastal Master Plan which allows for flexibility in implementation as conditions change, allows for resolution of uncertainties to improve future decision-making, and enables the modification of constructed projects while informing the development of future projects. By allowing flexibility in implementation as conditions change, CPRA's Adaptive Management program is essential to the long-term performance of these projects and the achievement of the greatest amount of positive ecosystem improvement. Application of Adaptive Management principles to the management of our coast improves decision-making, builds institutional knowledge, memory, and capacity to continually improve our understanding of the system, and facilitates the informed adjustment of management actions to best achieve long-term sustainability of our coast.";
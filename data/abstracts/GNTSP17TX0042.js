@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTSP17TX0042"] = "The State of Texas, through the Texas Commission on Environmental Quality (TCEQ), was awarded RESTORE Act Spill Impact Component funds for the Texas Planning State Expenditure Plan project. Through the Texas Planning State Expenditure Plan project, Texas developed a State Expenditure Plan (SEP) for submission to the RESTORE Council. The SEP is an effort to implement ecosystem restoration, mitigation and protection to reduce the risk of future flooding and/or address other ecosystem needs. These efforts also concentrate on eligible programs and/or projects associated with recovery and resiliency efforts to respond to ecosystem and/or economic damages, including workforce and tourism-related needs as a result of Hurricane Harvey. Texas established a process to identify Texas SEP eligibility requirements, including programs, and/or projects that address the priorities for the state's Gulf Coast region. The identified programs and/or projects complied with the eligibility requirements in the Spill Component of the RESTORE Act and the RESTORE Council's Comprehensive Plan.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTSP18LA0049"] = "HOUMA NAVIGATION CANAL LOCK COMPLEX (Planning) --- The State of Louisiana, through the Louisiana Coastal Protection and Restoration Authority (CPRA), was awarded RESTORE Act Spill Impact Component funds for the Houma Navigation Canal (HNC) Lock Complex (Planning) project. Under a subaward with CPRA, the Terrebonne Levee & Conservation District will oversee this project. The objectives of the planning phase for the HNC Lock Complex are to complete design, engineering and feasibility assessments that will reduce salt water intrusion and distribute freshwater within the Terrebonne Basin. It is estimated that the design will consist of a lock that provides 110\u2019 of clear width and an 800\u2019 long Lock Chamber and a floodgate that provides 250\u2019 of clear width with integral sluice gates and closure walls to connect to existing flood protection features. This project will help to limit the intrusion of salt water into freshwater marsh systems allowing for the maintenance of thousands of acres of wetlands which serve as critical wildlife habitat and nurseries for fisheries. The HNC Lock Complex will also provide crucial flood protection by blocking storm surge as a key component of the Morganza to the Gulf Hurricane Protection Project. This project is being continued with additional funding for subsequent phases of work (see \u201cHouma Navigation Canal Lock Complex Project - Phase I Construction, GNSSP21LA0018\u201d).";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTSP18MS0053"] = "The State of Mississippi, through the Mississippi Department of Environmental Quality (MDEQ), was awarded RESTORE Act Spill Impact Component funds for the Laboratory to Support Mississippi Gulf Coast Water Quality Improvement Program. This project supported increased microbiological sampling efforts through the construction of a microbiology laboratory in Biloxi, MS (via remodeling/retrofitting of existing space) that will be used for bacterial analysis, source tracking analysis, and other bacterial monitoring efforts. This new capacity will enhance and expand bacteriological monitoring capabilities in a number of ways such as rapid detection of bacteria, same-day notification of recreational water quality, as well as provide MDEQ a mechanism to identify pollution sources within a specific watershed, both point and nonpoint sources.";
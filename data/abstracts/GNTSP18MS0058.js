@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTSP18MS0058"] = "MISSISSIPPI GULF COAST WATER QUALITY IMPROVEMENT PROGRAM --- The Gulf Coast Ecosystem Restoration Council (RESTORE Council) has identified restoration of water quality as a restoration goal. Further, as a result of multiple stakeholder engagement forums the State of Mississippi has prioritized the improvement of water quality for promoting ecosystem health and restoring and revitalizing Mississippi's economy. Restoration and improvement of water quality, as a natural resource, will benefit the marine/coastal ecosystems, habitats, and fisheries, as well as the economy of the Mississippi Gulf Coast Region. This program will support the restoration of water quality of Mississippi's coastal water resources by targeting stormwater sources, discharges, and/or wastewater improvements that will result in the improvement of water quality and the restoration and protection of natural resources. Efforts to achieve such improvements will include enhancing the State's understanding of source water quality problems, implementing upgrades, repairs, and/or construction activities associated with stormwater and wastewater systems to restore water quality and promote ecosystem health.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTSP19FL0077"] = "The Florida Gulf Consortium was awarded RESTORE Act Spill Impact Component funds for the Florida Stand-Up State Expenditure Plan. The Gulf Consortium has completed all planning assistance activities associated with the single project of the approved Stand-Up State Expenditure Plan. Completion of these activities has provided the Consortium the administrative capacity to oversee the implementation of all projects contemplated by Florida's State Expenditure Plan (in 23 Gulf Coast counties). The activities included implementing a COSO framework with segregation of duties, procuring technical services, establishing procedures for sub-recipients, and developing a grant management system.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTSP19FL0086"] = "The Florida Gulf Consortium was awarded RESTORE Act Spill Impact Component funds for the Artificial Reef Program - Hudson Reef project. Under a subaward with the Gulf Consortium, Pasco County oversaw this project for deployment of up to 500 tons of material to augment the current reef known as Pasco Reef #4. This reef is located approximately 12 miles west of Hudson Beach, FL. This deployment would have increased the size of the existing artificial reef and benefited users of the artificial reefs offshore for recreational activities such as fishing, diving and spearfishing. However the project was not able to complete artificial reef material deployment due to the presence of seagrass. In compliance with the permit, reef material cannot be placed within 30 feet of seagrass. During the pre-deployment dive to check the site locations, seagrass was identified at the planned deployment location. A subsequent dive to check site conditions at another location within the Hudson Reef boundary, found seagrass also at that location. This left no other options at the current Hudson Reef location. An SEP amendment will be required to add a new project for artificial reef establishment that is not specific to a certain location, allowing for more flexibility in material deployment in the future.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTSP19LA0070"] = "The State of Louisiana, through the Louisiana Coastal Protection and Restoration Authority (CPRA), was awarded RESTORE Act Spill Impact Component funds for the Paradis Canal Gate (CPRA-Parish Matching Opportunities) Project. This is one of six projects selected by CPRA for implementation as part of the Parish Matching Program to contribute to the overall economic and ecological recovery of the Gulf Coast. Under a subaward with CPRA, St. Charles Parish oversaw the construction of the Paradis Canal Gate, part of the St. Charles Parish West Bank Hurricane Protection Levee and the larger Upper Barataria Risk Reduction System. This gate provides flood protection for the residents, businesses, and industries of the west bank of St. Charles Parish. CPRA, as the Grantee of this award, provided general oversight to St. Charles Parish.";
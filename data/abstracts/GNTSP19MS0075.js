@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTSP19MS0075"] = "The State of Mississippi, through the Mississippi Department of Environmental Quality (MDEQ), was awarded RESTORE Act Spill Impact Component funds for the Pascagoula Oyster Reef Complex Relay and Enhancement. The project is administered by MDEQ with collaboration from the Mississippi Department of Marine Resources. Individual components of the project may be implemented by eligible sub-recipients. The purpose of the Pascagoula Oyster Reef Complex Relay and Enhancement project is to enhance productivity of the Pascagoula Oyster Reef Complex (ORC). This project is restoring, improving, and protecting water resources, promoting community resilience, and protecting and restoring coastal and marine living resources like oysters. Enhancing productivity is increasing ecosystem functionality of the reef itself and increasing harvest through sustainable oyster management (i.e., oyster relay project). Improving the understanding of the resource will ultimately bolster sustainable use of the reefs and contribute to economic recovery through the seafood industry sector, enhance local water quality conditions and ecosystem functioning. This project funds benthic habitat mapping, reef monitoring for water quality and disease, and the relay of oysters to increase productivity on harvestable reefs in the Mississippi Sound.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTSP19MS0080"] = "The State of Mississippi, through the Mississippi Department of Environmental Quality (MDEQ), was awarded RESTORE Act Spill Impact Component funds for the Remote Oyster Setting Facility project. Under a subaward with MDEQ, the Mississippi Department of Marine Resources is responsible for project planning and setting facility implementation. The purpose of the Remote Oyster Setting Facility Project is to support the restoration and protection of natural resources, ecosystems, fisheries, marine and wildlife habitats, beaches, and coastal wetlands of the Mississippi Gulf Coast region through the planning, construction, and operations activities associated with an oyster setting facility. Remote setting is the placement of oyster larvae onto cultch (hard material for oysters to attach to; usually shell, crushed concrete, limestone, and the like) at a remote location from the hatchery itself. This facility will enable the Mississippi Department of Marine Resources (MDMR) to place cultch, laden with spat, at high volumes into Mississippi waters which will support increases in oyster populations on Mississippi's harvestable reefs and benefit the oyster fishery economy. This project is phased; Phase I \u2013 Oyster Setting Facility Planning, and Phase II \u2013 Construction and Start-up Operations.";
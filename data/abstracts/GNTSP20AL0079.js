@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTSP20AL0079"] = "The State of Alabama, through the Alabama Department of Conservation and Natural Resources (ADCNR), was awarded RESTORE Act Spill Impact Component funds for the State of Alabama Planning State Expenditure Plan (PSEP). The purpose of the PSEP was to develop a full State Expenditure Plan (SEP) that prioritized eligible activities for the Spill Impact Component (Bucket 3) funds and obtained broad-based participation from individuals, businesses, and organizations in the Gulf Coast region of Alabama. The planning activities included in the Planning SEP are limited to those related to the development of a Full SEP. ADCNR used a website portal to solicit project suggestions from the public and a selection process designed to assure a consistent review of all projects submitted. ADCNR engaged a consultant to serve as technical expert and completed detailed evaluations of each supported project. Finally, using information obtained in the technical review, the Alabama Council approved a slate of projects for inclusion in the SEP, and published the plan for public review and comment for at least 45 days through the website, email distribution, and a public meeting.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTSP20AL0094"] = "The State of Alabama, through the Alabama Department of Conservation and Natural Resources (ADCNR), was awarded RESTORE Act Spill Impact Component funds for the Alabama Gulf Seafood Marketing project. The Alabama Seafood Marketing Commission (ASMC) will work to continue to develop how to best use the Alabama seafood brand, how to best market the Alabama seafood brand utilizing an integrated and comprehensive marketing strategy, work with chefs to encourage the use of Alabama seafood, and work to increase tourism by promoting a coastal experience that includes Alabama seafood. Work completed by the ASMC will be focused at events held throughout the State of Alabama and especially at events held in the coastal counties of Mobile and Baldwin. Completion of this scope of work will continue to show the abundance and confidence of safety of Alabama seafood.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTSP20AL0095"] = "The State of Alabama, through the Alabama Department of Conservation and Natural Resources (ADCNR), was awarded RESTORE Act Spill Impact Component funds for the Replacement of Substandard Facilities at the Alabama Department of Environmental Management (ADEM) Coastal Office and Mobile Field Office project. The purpose of the project is to design and construct a new facility for the ADEM Coastal Office, replacing the old, substandard facilities at the ADEM Coastal Office and Mobile Field Office in the City of Mobile, AL. The building will be approximately 14,500 square feet and contain both office space, to support staff, and laboratory space, to support the laboratory functions that are part of the ADEM water quality monitoring and air quality monitoring efforts. Other constructed amenities will include a parking area and construction of an equipment storage building. The ADEM Mobile Field Office will support water quality, air quality, and biological analysis (fish sampling and analysis) as well as permitting functions related to restoration projects. The ADEM is tasked with the statutory mandate of protecting Alabama's air, land, water, and coastal zone resources and ensuring that today's environmental resources support economic activity and at the same time are protected for all to enjoy. This project will allow ADEM to provide timely and effective environmental regulation and oversight of environmental projects in Coastal Alabama, including all RESTORE Act projects.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTSP20AL0096"] = "The State of Alabama, through the Alabama Department of Conservation and Natural Resources (ADCNR), was awarded RESTORE Act Spill Impact Component funds for the Development of a Regional Strategic Plan for the Coastal Alabama Region project. Coastal Alabama Partnership is a subrecipient. This project will showcase coastal Alabama's ecotourism opportunities in the Mobile Tensaw Delta by developing and implementing a marketing brand supported by an online resource directory for tourists. This project will focus on expanding eco-tourism and reinforcing education opportunities, developing an inventory for \u00e2\u20ac\u0153Place-Based\u00e2\u20ac\u009d tourism, a collaborative branding campaign to foster growth in tourism, promote natural assets through creative economy initiatives, improve regional connectivity and mobility, and foster the food scene through culinary arts initiatives. This project is a result of the 2014 Coastal Alabama Partnership's Regional Strategic Plan. This earlier effort sought to identify opportunities to strengthen and diversify the local economy using input from involved citizens, businesses, and leadership in each community. A key component to this campaign is the development of an inventory and assessment of ecotourism opportunities. The resulting marketing campaign will integrate this inventory to publicize the resulting \u00e2\u20ac\u0153brand\u00e2\u20ac\u009d developed by the project. These actions will not only expand eco-tourism and education opportunities but also assist in combating the negative perceptions created due to the Deepwater Horizon oil spill and help restore and enhance the Gulf Coast economy.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTSP20AL0120"] = "The State of Alabama, through the Alabama Department of Conservation and Natural Resources (ADCNR), was awarded RESTORE Act Spill Impact Component funds for the Characterization and Delineation of Significant Sand Resource Areas Essential for Beach Restoration project. Geological Survey of Alabama is a subrecipient. This project will update the Offshore Alabama Sand Information System (OASIS) platform through collaboration with interested governing and private parties; acquire data and characterization of further offshore sand resource areas; address data gaps; and will disseminate work through the OASIS platform, publication(s), and presentations. Designated as a regional project by the Alabama Council, the results of this research effort intend to inform future restoration efforts and identification and protection of significant offshore sand resource areas.";
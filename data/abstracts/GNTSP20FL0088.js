@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTSP20FL0088"] = "The Florida Gulf Consortium was awarded RESTORE Act Spill Impact Component funds for the Wastewater Improvement \u2013 Combined Project 1 (2-1 Santa Rosa, 3-4 Okaloosa, 13-1 Citrus). The Florida Department of Environmental Protection (FDEP) is a leveraging partner. The Gulf Consortium entered into subawards with Santa Rosa, Citrus, and Okaloosa Counties. The subawards were for the Engineering & Design portions of the counties' Florida State Expenditure Plan (SEP) projects focused on wastewater management improvement to restore and protect water quality. The primary RESTORE Council Comprehensive Plan goals and objectives for all three projects are the same: to restore water quality and quantity (goal 2), and Objective 2: Restore, Improve, and Protect Water Resources (objective 2). Design work for the following projects are combined into a single program: 2-1 Soundside Drive Septic to Sewer Conversion, Phase I (Santa Rosa County); 3-4 Shoal River Headwaters Protection Program (HPP) - Phase I (Bob Sikes Airport Industrial Park Water Reclamation Facility (BSAIP WRF) Effluent Disposal Expansion) (Okaloosa County); and 13-1 NW Quadrant Sewer Force Main Project (Citrus County). Three locations are included in the project for wastewater improvements in Santa Rosa, Okaloosa, and Citrus Counties.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTSP20FL0089"] = "The Florida Gulf Consortium was awarded RESTORE Act Spill Impact Component funds for the Coastal Access Program \u2013 Bayside Marina Feasibility Study project. Under a subaward with the Gulf Consortium, Wakulla County will oversee this project. Bayside Marina is a 2.6-acre private marina located on Ochlockonee Bay, in the Panacea Community, Wakulla County, Florida. The marina is also located at the headwaters of a tidal spring run with exceptional habitat value. Wakulla County wishes to acquire this property and convert it into a County owned and operated public boating facility. The portion of the project funded under this award included a study to assess the feasibility, reasonableness and economics of the acquisition of Bayside Marina and turning it into a County owned and operated public boating facility. The goal of acquiring the private Bayside Marina is to increase public access for outdoor recreational opportunities, provide resting/viewing areas of natural North Florida habitats and limit development from having a negative effect on water quality and habitat.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTSP20FL0090"] = "The Florida Gulf Consortium was awarded RESTORE Act Spill Impact Component funds for the Choctawhatchee Bay Estuary Program. The U.S. Treasury and The Nature Conservancy are leveraging partners of this program. Under a subaward with the Gulf Consortium, Okaloosa County will oversee this program. Choctawhatchee Bay is a critically important estuary to the economy, community, and way of life of Okaloosa County and neighboring counties. It provides fish and wildlife resources, including seagrass habitat, which support numerous fish and invertebrate species. In addition, it is a popular place for recreational activities and tourism. Choctawhatchee Bay and several of its adjacent beaches are listed as impaired for nutrients and/or bacteria by the Florida Department of Environmental Projection (FDEP) under section 303(d) of the Federal Clean Water Act. These impairments negatively impact the health of the Bay's seagrasses and limit its recreational value. It is for these reasons that the Choctawhatchee Bay Estuary Program (CBEP) is being established: to protect this valuable natural resource. The objectives of this program are to establish the CBEP organization, to identify long-term funding sources to maintain the program in order to improve the coordinated restoration and management of the Choctawhatchee Bay Estuary. This award largely supports salary/fringe for a program director and outreach specialist who will work together to establish the CBEP.";
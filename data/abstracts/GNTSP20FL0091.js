@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTSP20FL0091"] = "The Florida Gulf Consortium was awarded RESTORE Act Spill Impact Component funds for the Lake Seminole Sediment Removal project. Under a subaward with the Gulf Consortium, Pinellas County will oversee this project. The project is a joint effort between Pinellas County, the Southwest Florida Water Management District (SWFWMD), and the Florida Department of Environmental Protection (FDEP). Lake Seminole is an impounded coastal lake, located in west central Pinellas County, Florida. The lake has experienced decades of water quality decline and has been the subject of large-scale restoration for nearly ten years. The Lake Seminole Sediment Removal project involves the dredging of approximately 900,000 cubic yards of nutrient-enriched organic sediments (approximately 100,000 funded from Spill Impact Component) from an impounded coastal lake to: (1) improve water quality and ecological conditions in the lake; and (2) reduce downstream nutrient loads to Boca Ciega Bay, a segment of the Tampa Bay estuarine system.";
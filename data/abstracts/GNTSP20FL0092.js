@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTSP20FL0092"] = "The Florida Gulf Consortium was awarded RESTORE Act Spill Impact Component funds for the Sarasota County Dona Bay Hydrologic Restoration Program, Phases III-V \u2013 E&D project. Under a subaward with the Gulf Consortium, Sarasota County will oversee this project. Sarasota County has contracted the planning, design, engineering and permitting of Phases III and V for the Dona Bay Hydrologic Restoration Program. Additionally, the project implements weir control structure repairs to allow for improved flow control to the Dona Bay Estuary. This project will achieve the RESTORE Council Comprehensive Plan goal to restore water quality and quantity by balancing the salinity regime through reduced freshwater volume discharges to the estuary. This project will improve flow control and will increase the freshwater storage within the basin through aquifer storage, increased surface storage, and reclaimed water augmentation.";
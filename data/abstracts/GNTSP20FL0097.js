@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTSP20FL0097"] = "The Florida Gulf Consortium was awarded RESTORE Act Spill Impact Component funds for the Comprehensive Watershed Improvement Program - Monitoring and Master Plan. Under a subaward with The Gulf Consortium, Collier County will oversee this project. The Comprehensive Watershed Improvement Program, once fully designed and built, will be a series of linked surface water management projects on approximately 10,000 acres of eastern Collier County, Florida with the objectives of restoring the hydrology and ecology of both Naples Bay and Rookery Bay, as well as the hydrologic restoration of the southern Belle Meade area of the Picayune Strand State Forest (PSSF). The goal is to divert water from entering Naples Bay, which is impacted by a freshwater surplus during wet season, by creating a flow-way from the Golden Gate Canal structure through the PSSF to Rookery Bay, which has a freshwater deficit. Under this award, Collier County will establish a monitoring program for the Comprehensive Watershed Improvement Program to determine the progress and success of hydrologic restoration, and to monitor water quality of flows entering Naples and Rookery Bays. In addition, a conceptual analysis will be completed for the North Belle Meade area of the Collier County Comprehensive Watershed Improvement Plan (CCCWIP) for potential ecological restoration and re-hydration options.";
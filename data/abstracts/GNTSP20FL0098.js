@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTSP20FL0098"] = "The Florida Gulf Consortium was awarded RESTORE Act Spill Impact Component funds for the St. Andrew Bay Stormwater Improvement Program \u2013 St. Andrew Bay Watch \u2013 Water Quality Monitoring project. Under a subaward with The Gulf Consortium, Bay County will oversee this project. Bay County will provide RESTORE Act Spill Impact Component funds to the St. Andrew Bay Resource Management Association (St. Andrew Bay Watch) to extend and expand their current sampling regimen in the watershed to include nutrients, fecal coliform bacteria, chlorophyll-a, turbidity, temperature, pH, dissolved oxygen, salinity, tide, and precipitation. Annual reports will be provided on water quality trends and their potential impacts to benthic organisms. This program will provide baseline and post-project water quality data to evaluate future project efforts. Amendment 1 adds two additional components from the SEP, component (3): Construction of East Highland Park Regional Stormwater Facility and Component (4) the stabilization of 1.99 miles of existing dirt roads. Component 3 includes the construction of East Highlight Park Regional Stormwater Facility as well as extends the period of performance. Component 4 includes the paving of dirt roads and installation of grassed swales that trap sediments and prevent the nutrients in those sediments from reaching the Bay. The ultimate goal of both projects is to improve the water quality and quantity in St. Andrew's Bay watershed by reducing nutrients loading to St. Andrew's Bay watershed and providing additional stormwater attenuation to assist with basin's flooding.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTSP20FL0105"] = "The Gulf Consortium, through its subrecipient, Walton County was awarded Spill Impact Component funds for the Florida State Expenditure Plan Project 4-1: Choctawhatchee Bay Septic to Sewer Conversion \u2013 Feasibility Study, to complete an environmental feasibility study to assess, prioritize, and provide scientific analysis of water quality improvements projects within the Choctawhatchee River and Bay watershed in Walton County, Florida. Completion of these planning activities will provide the County with a full understanding of the feasibility and priority of projects, complete with environmental impact and benefits metrics. This approach includes three separate assessments: a Nona Point Source Pollution Watershed Assessment \u2013 Stormwater Abatement, a Nona Point Source Pollution Watershed Assessment \u2013 Sediment Abatement, and a Point Source Pollution Watershed Assessment. This information will provide the county with the necessary information to implement the construction phase. Additionally, this project will achieve primary comprehensive plan goal to restore water quality and quantity and the primary comprehensive plan objective to Objective 2: Restore, Improve, and Protect Water Resources.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTSP20FL0106"] = "The Florida Gulf Consortium was awarded RESTORE Act Spill Impact Component funds for the Wacissa River Park Improvement Program \u2013 Planning and Acquisition project. Under a subaward with the Gulf Consortium, Jefferson County oversaw this project. With this project, Jefferson County intended to expand and improve public access to Wacissa River Park. The county completed a feasibility study, and determined appropriate property acquisition and improvements on lands adjacent to the park, east of Wacissa Springs Rd, Jefferson County, FL. However, the County decided not to pursue land acquisition to further expand the Wacissa River Park. Therefore, the property acquisition (land acquisition) was not accomplished as part of this award. The County felt that an expansion of the River Park would put the river over capacity.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTSP20FL0107"] = "The Florida Gulf Consortium was awarded RESTORE Act Spill Impact Component funds for the Cross Florida Barge Canal Boat Ramp - E&D project. Under a subaward with the Gulf Consortium, Citrus County will oversee this project. This project proposes the design and construction of a new public boat ramp on the north side of the Cross Florida Barge Canal (CFBC) in northern Citrus County, Florida. The project will ultimately provide residents and visitors with safe, high-volume, and deep-water boating access to the Gulf of Mexico. Currently there are a limited number of public boat ramps in Citrus County. During the summer scallop season, existing boat ramp facilities on the Homosassa River and Crystal River are well over capacity, and demand is increasing. In addition, the federally protected West Indian manatee uses spring discharges at the headwaters of these rivers extensively for feeding, calving, and winter refuge. Heavy boat traffic in the Homosassa River and Crystal River is incompatible with the protection of this species. Shifting some of this boat traffic to the CFBC will meet growing public demand for Gulf access without putting additional pressure on manatee populations. The phase of the project funded under this award is for engineering and design only (non-construction).";
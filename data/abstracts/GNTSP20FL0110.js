@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTSP20FL0110"] = "The Florida Gulf Consortium, through its subrecipient Hernando County, was awarded RESTORE Act Spill Impact Component funds to complete the planning, design, permitting, monitoring, and construction of twelve artificial reefs which will expand Hernando County's existing permitted artificial reefs, creating a regional network of reefs. Planning assessments (site evaluations) will be completed to identify suitable sites that not only meet permitting requirements but will also provide ecological benefits through their strategic placement as recommended within the County's Marine Area Strategic Plan. Site characteristics (overall size, depth, sediment type, distance offshore, buffer distance to seagrass and/or live bottom) will be used to design reefs tailored to specific objectives for both recreation and fisheries. Recreational objectives will include enhancement of scuba diving, creation of free diving and snorkeling reefs, and enhancement of recreational fishing. Fisheries objectives will focus on either increasing overall diversity or abundance of target species such as gag grouper. Amendment 1 adds construction to the scope of services to include the reef innovations, a permit-required pre-construction benthic survey, and post-construction monitoring. This project period of performance is also being extended to accommodate the amended project components. The overarching goal of the reefs will be to create essential habitat for marine fauna, while also increasing nature-based tourism opportunities within the county.";
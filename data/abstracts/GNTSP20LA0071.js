@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTSP20LA0071"] = "The State of Louisiana, through the Louisiana Coastal Protection and Restoration Authority (CPRA) was awarded RESTORE Act Spill Impact Component funds for the Lake Lery Marsh Creation Project. This is one of six projects selected by CPRA for implementation as part of the Parish Matching Program to contribute to the overall economic and ecological recovery of the Gulf Coast. Under a subaward with CPRA, the St. Bernard Parish Government will oversee this project and implement the restoration. The Lake Lery Marsh Creation Project will use dredged material to restore marsh as part of an ongoing phased approach to restore and protect the Lake Lery area. This project will build upon previously expended CIAP funds by constructing the designed 39 acre marsh creation and marsh nourishment project.";
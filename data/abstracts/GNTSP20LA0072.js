@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTSP20LA0072"] = "The State of Louisiana, through the Louisiana Coastal Protection and Restoration Authority (CPRA), was awarded RESTORE Act Spill Impact Component funds for the Freshwater Bayou Canal Shoreline Protection Project. This is one of six projects selected by CPRA for implementation as part of the Parish Matching Program to contribute to the overall economic and ecological recovery of the Gulf Coast. Under a subaward with CPRA, Vermilion Parish Police Jury will oversee the project. The main purpose of the project is to provide shoreline protection by constructing over 10,000-linear feet of foreshore rock dike along the eastern bank of Freshwater Bayou Canal to prevent further deterioration of shoreline areas and existing adjacent marsh. This project consists of design, permitting, bidding, and construction of a foreshore rock dike to stabilize and protect the Freshwater Bayou.";
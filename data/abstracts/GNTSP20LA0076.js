@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTSP20LA0076"] = "The State of Louisiana, through the Louisiana Coastal Protection and Restoration Authority (CPRA), was awarded RESTORE Act Spill Impact Component funds for the Westward Expansion of the Coastal Wetlands Planning, Protection and Restoration Act (CWPPRA) Rockefeller Refuge Shoreline Stabilization Project. This is one of six projects selected by CPRA for implementation as part of the Parish Matching Program to contribute to the overall economic and ecological recovery of the Gulf Coast. Under a subaward with CPRA, Cameron Parish Police Jury will oversee this project. This project will mitigate erosion at the Rockefeller Wildlife Refuge which averages approximately 70 feet/year with a subsequent direct loss of emergent saline marsh. As a continuation of the authorized CWPPRA ME-18 project, which provides 14,854 linear feet (2.81 miles) of reef breakwater from Joseph Harbor westward, Rockefeller will increase the reef breakwater construction by an additional 6,000 linear feet (1.14 miles).";
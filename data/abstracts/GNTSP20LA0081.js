@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTSP20LA0081"] = "The State of Louisiana, through the Louisiana Coastal Protection and Restoration Authority (CPRA) was awarded RESTORE Act Spill Impact Component funds for the engineering and design activities of the Grand Bayou Freshwater Reintroduction project. This is one of six projects selected by CPRA for implementation as part of the Parish Matching Program to contribute to the overall economic and ecological recovery of the Gulf Coast. Under a subaward with CPRA, Lafourche Parish will oversee this project. The purpose of this project is to complete the hydrologic modeling, engineering, design, and permitting activities to advance Grand Bayou toward implementation. Once constructed, the overall objective for Grand Bayou is to increase the flow of fresh water down Grand Bayou Canal from the Gulf Intercoastal Waterway (GIWW) which would lower salinities and add nutrients to the canal wetlands south of the GIWW along the east and west banks of the Grand Bayou Canal. Completion of the Grand Bayou project will contribute to the overall ecological and economic recovery of the Gulf by increasing freshwater flow to help sustain marsh in an area that is experiencing one of the highest rates of land loss in Louisiana.";
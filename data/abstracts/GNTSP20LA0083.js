@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTSP20LA0083"] = "The State of Louisiana, through the Louisiana Coastal Protection and Restoration Authority (CPRA), was awarded RESTORE Act Spill Impact Component funds for the Manchac Landbridge (Rock Breakwater) Shoreline Protection Project. This is one of six projects selected by CPRA for implementation as part of the Parish Matching Program to contribute to the overall economic and ecological recovery of the Gulf Coast. Under a subaward with CPRA, Tangipahoa Parish will oversee the completion of this project. This project consists of updating engineering and design for the Manchac Landbridge Shoreline Protection project and construction of over 7,000 linear feet of rock breakwater along the Lake Pontchartrain shoreline. This project will preserve shoreline integrity and reduce wetland degradation from wave erosion along the shoreline of Lake Pontchartrain, benefitting surrounding shoreline habitat. It is estimated that this project will prevent the otherwise inevitable degradation of an estimated 250+ acres of marshland.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTSP20MS0084"] = "The State of Mississippi, through the Mississippi Department of Environmental Quality (MDEQ), was awarded RESTORE Act Spill Impact Component funds for the Gulf of Mexico Citizen Led Initiative. Under a subaward with the MDEQ, the University of Mississippi will implement the project in collaboration with the Mississippi Department of Marine Resources. The purpose of the Gulf of Mexico Citizen Led Initiative is to support the restoration and protection of natural resources, ecosystems, fisheries, marine and wildlife habitats, beaches, and coastal wetlands of the Gulf Coast region. Through data collection efforts, the project will yield information that resource management agencies can use to inform decisions regarding water quality, economically viable fish stocks, and ultimately track changes in the overall health of the coastal ecosystem. The project will develop a Mobile Application for Marine Assessment (MAMA) that will be used to recruit citizens to gather coastal ecosystem health assessment data. MAMA will allow Gulf Coast citizens and visitors to (1) upload photos, measurements, GPS locations, and other data regarding specimens they have captured, observed, and identified, (2) submit photos of endangered/unusual specimens of fish and other marine life for identification, and (3) document invasive species in Mississippi Gulf Coast waters.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTSP20MS0103"] = "The State of Mississippi, through the Mississippi Department of Environmental Quality (MDEQ), was awarded RESTORE Act Spill Impact Component funds for the Hancock County Marsh Living Shoreline (HCMLS) project. The purpose of the HCMLS project is to support the restoration and protection of natural resources, ecosystems, fisheries, marine and wildlife habitats, beaches, and coastal wetlands of the Mississippi Gulf Coast region by adding additional components to the current Hancock County Marsh Living Shoreline project. In 2013, the State of Mississippi began implementation of the HCMLS project through early restoration funding under the Natural Resource Damage Assessment (NRDA) process, which has constructed almost 6 miles of living shorelines and 46 acres of oyster reefs and will construct an additional 46 acres of marsh. The project will be implemented by MDEQ and includes engineering and design, permitting and construction of approximately 1.5 miles of additional living shoreline extending the existing HCMLS to the area near Bayou Caddy. This project will allow the MDEQ to increase the acreage of marsh protected in Hancock County and enhance community resilience by mitigating further coastal erosion of one of the largest contiguous marsh complexes in coastal Mississippi, while providing storm surge and wind/wave erosion protection for coastal ecosystems and coastal communities.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTSP20MS0128"] = "The State of Mississippi, through the Mississippi Department of Environmental Quality (MDEQ), was awarded RESTORE Act Spill Impact Component funds for the Mississippi Sound Oyster Shell Recycling Program. Under a subaward with MDEQ, The Nature Conservancy will oversee this program. The purpose of the Mississippi Sound Oyster Shell Recycling Program is to support the restoration and protection of natural resources, ecosystems, fisheries, marine and wildlife habitats, beaches, and coastal wetlands of the Mississippi Gulf Coast region through the collection of discarded oyster shells for cultch placement. This program is enabling the collection of discarded oyster shells from restaurants and other venues to increase the available shell supply for reef maintenance and restoration efforts implemented outside of the scope of this program. The program includes development of an economic sustainability plan and implementation of the pilot oyster shell recycling program. Activities performed under this program (planning activities and pilot program implementation) provide direction for the state's future oyster shell recycling efforts.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GNTSP20TX0100"] = "The State of Texas, through the Texas Commission on Environmental Quality (TCEQ), was awarded RESTORE Act Spill Impact Component funds for the Nature-Based Tourism program. This program supports the promotion of nature-based tourism in the Gulf Coast region. Working with the Texas Governor's office, the program will identify projects that will provide nature-based tourism and restoration benefits to the local community while providing environmental and ecosystem education and recreation that will encourage action toward a healthier coast. Activities within this program will address nature-based tourism needs in the areas where Hurricane Harvey struck in 2017 negatively affecting once thriving nature-based tourism industries in coastal Texas. Projects within this program will focus on providing nature-based tourism enhancement through activities such as restoration of piers, docks, bird viewing towers, nature trails, as well as the development of public marinas, boat ramps and park amenities. These projects will benefit both the environment and economy by protecting natural resources in the affected areas, resulting in a positive impact to nature-based tourism. The counties eligible to receive funds for this program include: Aransas, Brazoria, Calhoun, Chambers, Galveston, Harris, Jackson, Jefferson, Matagorda, Nueces, Orange, Refugio, San Patricio and Victoria.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GT1CP21AL0001"] = "The State of Alabama, through the Alabama Department of Conservation and Natural Resources (ADCNR), was awarded RESTORE Act Council-Selected Restoration Component funding for the Council approved Comprehensive Living Shoreline Monitoring Project (Planning and Implementation). The project will include the development of a plan for monitoring and assessing the performance and efficacy of proposed and existing living shoreline projects in coastal Alabama. This comprehensive monitoring effort will develop a standard set of monitoring parameters and protocols to implement a five-year living shoreline monitoring program. Once implemented, the monitoring program will allow for robust comparisons across all monitored projects, as well as an accurate evaluation of their success relative to specific site conditions, providing valuable information to resource managers, project proponents, homeowners, and others interested in utilizing and promoting living shorelines techniques. The purpose of the resulting comprehensive monitoring activity is to evaluate the effectiveness of specific living shorelines techniques relative to specific site conditions. This will include an assessment of biological benefits as well as physical parameters (such as wave energy, sediment composition, erosion rates, etc.). Ultimately, the goal of this effort is to determine best practices given site-specific physical conditions. This project will serve as a pilot project for the Council to consider expanding Gulf-wide when future funds become available.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GT1CP23AL0003"] = "The State of Alabama, through the Alabama Department of Conservatoin and Natural Resources, (ADCNR), was awarded RESTORE Act Council-Selected Restoration Component funding for the Marsh Restoration in Fish River, Weeks Bay, Oyster Bay & Meadows Tract (Implementation) project. The project will address degraded habitat and hydrological conditions within the Oyster Bay watershed. This site contains approximately 150 acres of estuarine tidal and brackish marsh with a causeway constructed across the northern portion of the bay. The causeway is outfitted with undersized culverts that restrict north to south water flow. The restricted water flow has resulted in considerable impoundment of freshwater and a subsequent conversion of habitat on the north side of the causeway. The culverts have trapped significant amounts of sediment resulting in colonization in the area by giant reed (Phragmites australis). This project will restore and enhance resilience, sustainability, and natural defenses by reestablishing natural hydrology and connectivity between the north and south side of the causeway. Project activities will include replacement of culverts, removal of sediment and nuisance vegetation, road resurfacing, and planting of native species. The project will be implemented by the City of Gulf Shores along County Road 4 in Baldwin County (City of Gulf Shores), Alabama. The Oyster Bay site is located in the Mobile Bay watershed (HUC - 03160205).";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GT1CP23MS0002"] = "The State of Mississippi, through Mississippi Department of Environmental Quality (MDEQ), was awarded Council-Selected Restoration Component funding for implementation of the Deer Island Beneficial Use Site project. Funding will be utilized to create the containment berms for an approximately 70-acre beneficial use site located on the north side of Deer Island adjacent to Biloxi, Mississippi. Material mechanically excavated onsite near Deer Island and dredged during maintenance of the Black Warrior \u2013 Tombigbee (BWT) Federal navigation project in Alabama will be used beneficially to construct linear Chenier berms in the project area, providing approximately 5 acres of habitat. Construction of the containment features and development of a beneficial use monitoring and adaptive management plan will support future filling of the site with dredged material leveraged from local dredging projects to create approximately 70 acres of tidal wetlands over time.";
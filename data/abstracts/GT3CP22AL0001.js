@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GT3CP22AL0001"] = "The State of Alabama, through the Alabama Department of Conservation and Natural Resources (ADCNR), was awarded RESTORE Act Council-Selected Restoration Component funding for the Council-Approved Perdido River Land Conservation and Habitat Enhancements program. This program will acquire and manage approximately 10,000-12,000 acres of habitat in the Perdido Watershed, located in Baldwin County, AL. ADCNR will also conduct habitat management and stewardship activities, which could include prescribed burning, invasive species removal, longleaf pine restoration, and protection and habitat enhancements for species including the gopher tortoise on all acquired project property. Acquired land will become part of the Perdido Wildlife Management Area and be accessible to the public for recreational use.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GT3CP22FL0002"] = "The State of Florida, through the Florida Department of Environmental Protection (FDEP), was awarded RESTORE Act Council-Selected Restoration Component funds for the Florida Strategic Gulf Coast Land Acquisition Program. The program supports the primary RESTORE Comprehensive Plan goal to restore and conserve habitat through a suite of linked activities to increase conserved and protected State owned or managed lands by 10,000 to 20,000 acres. Program activities include implementation of land acquisitions, partnering with the existing Florida Forever Program, Florida's premier conservation and recreation lands acquisition program. The program will utilize the Florida Forever priority list to identify parcels for acquisition; parcels on the Florida Forever priority list are ranked using a thorough scientific review and a comprehensive natural resource analysis. FDEP will target lands draining into the Gulf of Mexico that are in the Florida Forever Critical Natural Lands and Climate Change Lands categories or other Florida Forever parcels with similar attributes. Land acquisitions could include both fee simple acquisition and conservation easements from willing sellers. Program activities are intended to result in environmental benefits to Florida's natural resources and ecosystems by protecting critical habitats, preserving native biodiversity and ecosystem function, mitigating sea level rise, flooding, and other current and future risks to coastal communities.";
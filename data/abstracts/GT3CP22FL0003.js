@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GT3CP22FL0003"] = "The State of Florida, through the Florida Department of Environmental Protection (FDEP), was awarded RESTORE Act Council-Selected Restoration Component funds for the Florida Water Quality Improvement Program (WQIP). The program supports the primary RESTORE Comprehensive Plan goal to restore water quality and quantity throughout the Florida Gulf Coast by underwriting a suite of linked, high-priority water quality improvement projects. Projects may include stormwater treatment, wastewater reuse, septic tank abatement, sediment reduction, and land acquisition. Planning and implementation projects in Florida watersheds that drain to the Gulf of Mexico will be considered. The WQIP activities are intended to result in environmental benefits such as fewer algal blooms, fish kills, beach closures, fish and shellfish consumption restrictions, healthier seagrass as well as other submerged aquatic vegetation and wildlife habitat, and improved recreational opportunities/experiences. The WQIP framework allows for administration of project funding to target projects that deliver cumulative benefits to the Gulf and link environmental benefits between WQIP projects and other restoration projects in a watershed or region. Combining or leveraging projects within a geographic area contributes to large-scale water resource improvements while maximizing each dollar.";
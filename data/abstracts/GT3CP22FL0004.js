@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GT3CP22FL0004"] = "The State of Florida, through the Florida Department of Environmental Protection (FDEP), was awarded RESTORE Act Council-Selected Restoration Component funds for the Florida Gulf Coast Resiliency Program (Planning). This program will support the primary RESTORE Comprehensive Plan goal to enhance community resilience through activities to identify vulnerabilities and implement sustainable solutions to improve coastal resiliency. Activities include vulnerability assessments to identify strategies to improve resiliency; living shorelines to protect against erosion and reduce wave energy; and coastal and submerged lands management and acquisition activities to protect habitats that enhance resiliency. The FDEP will partner with the Florida Forever Program to identify acquisitions with the Office of Resilience and Coastal Protection on vulnerability assessments and submerged lands management activities. Developing strategies to address resiliency is critical to Florida's ability to adapt to a changing coastline. This program will result in environmental benefits such as resiliency improvements, protections against wave energy and storm surge, habitat protection (e.g., marshes, mangroves, seagrass, coral, and oyster reefs), sustaining healthy wildlife populations, water quality benefits, recreation and tourism opportunities, and fisheries benefits.";
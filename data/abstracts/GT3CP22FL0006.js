@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GT3CP22FL0006"] = "The State of Florida, through the Florida Department of Environmental Protection (FDEP), was awarded RESTORE Act Council-Selected Restoration Component funds for the Florida Gulf Coast Tributaries Hydrologic Restoration Program (THRP) (Planning). The THRP supports the primary RESTORE Comprehensive Plan goal to restore water quality and quantity throughout the Florida Gulf Coast by underwriting a comprehensive suite of linked, high-priority hydrologic improvement projects. Examples include canal plugging, restoring natural dimensions of tidal passes/inlets, restoring/reconnecting wetlands, installing erosion control or water control structures, etc. Planning and implementation projects proposed in Florida watersheds that drain to the Gulf of Mexico will be considered under this program. The THRP will improve flow regime dynamics, nutrient cycling, salinity gradients, wildlife habitat and biodiversity, recreational experiences, and may help reduce algal blooms and fish kills. The THRP framework will allow for administration of project funding that targets projects providing cumulative benefits to the Gulf and link environmental benefits between selected projects and other restoration projects in a watershed or region. Combining or leveraging projects within a geographic area contributes to large-scale water resource improvements while maximizing each dollar.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GT3CP22TX0005"] = "The State of Texas, through the Texas Commission on Environmental Quality (TCEQ), was awarded RESTORE Act Council-Selected Restoration Component funds for the Texas Land Acquisition Program for Coastal Conservation. This program supports the primary RESTORE Comprehensive Plan goal to restore and conserve habitat through activities to acquire large, high-quality coastal zone properties in Texas. Locations will be selected based on greatest value to the coastal environment now and in the future considering the pressures of development. Targeted habitats will include urban green corridors, riparian, prairie and other upland, wooded wetlands, or bay and chenier wetlands. Potential partners for the program may include The Nature Conservancy, Texas Parks and Wildlife Department, Galveston Bay Foundation, Coastal Bend Bays & Estuaries Program, as well as other possible state and local governments. The program will utilize specified criteria for selecting projects that were identified earlier through public meetings and as part of a stakeholder process and in discussions between the RESTORE appointee and the Office of the Governor. This program will conserve valuable land as habitat and provide natural buffers to flooding and erosion, decreasing the need for habitat destroying hard engineering projects while providing valuable ecosystem services.";
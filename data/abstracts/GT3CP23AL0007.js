@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GT3CP23AL0007"] = "The State of Alabama, through the Alabama Department of Conservation and Natural Resources (ADCNR), was awrded RESTORE Act Council-Selected Restoration Component funding for the Enhancing Hydrologic Connectivity in Justin's Bay (Mobile Bay) project, The project builds on a previous study of the Mobile Bay Causeway and hydrology conducted in 2015, and supports the primary RESTORE Comprehensive Plan goal to restore and conserve habitat through a planning effort that will: 1) address any data gaps remaining from the 2015 study, 2) evaluate the suggested restoration alternatives with a cost-logistics/feasibility frame of reference, and 3) move identified and prioritized restoration alternatives forward to a 30% preliminary engineering design. The construction of the Mobile Bay Causeway in 1927 resulted in a significant amount of dredge material placement over large portions of the Upper Mobile Bay marsh complex. At the time, filling of marsh was a preferred alternative to elevating the causeway and as a result, restrictions of hydrological interaction and connections between Mobile Bay and its Delta, including faunal migrations and natural food web interactions have been curtailed. Project activities will inform the restoration of the hydrological exchange necessary for coastal marsh and estuarine wetland habitats in the area to maintain ecological integrity and ecosystem health.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GT3CP23MS0008"] = "The State of Mississippi, through the Mississippi Department of Environmental Quality (MDEQ), was awarded RESTORE Act Council-Selected Restoration Component funding for the Water Quality Improvement Program for Coastal Mississippi Waters. This program will support the primary RESTORE Comprehensive Plan goal to restore water quality and quantity in the Mississippi Gulf Coast Region through the identification and implementation of water quality improvement projects. Program activities include planning, engineering and design, septic-to-sewer conversion, implementation of new stormwater and wastewater systems, and repairing/upgrading existing stormwater and wastewater systems. This program will be coordinated with water quality improvement efforts under other funding streams to maximize outcomes. Causes of water quality degradation in coastal systems include nutrient pollution and associated hypoxia and also bacteriological sources. Water quality degradation is often attributed to urban runoff, discharge, and overflow issues associated with aging or insufficient wastewater management. The conversion of septic-to-sewer and implementation of stormwater and wastewater improvement practices under this program is anticipated to reduce non-point source pollutant loads to downstream coastal receiving water bodies, resulting in an improvement in water quality of coastal waters and benefits to living coastal marine resources.";
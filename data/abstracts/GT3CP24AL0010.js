@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GT3CP24AL0010"] = "The State of Alabama, through the Alabama Department of Conservation and Natural Resources (ADCNR), was awarded RESTORE Act Council-Selected Restoration Component funding for the Coastal Alabama Regional Water Quality program. Through this program, ADCNR will work and partner with coastal cities, municipalities and utility associations to implement water quality improvement projects throughout Coastal Alabama. This program will immediately support the restoration and protection of natural resources, ecosystems, fisheries, marine and wildlife habitats, beaches, and coastal wetlands of the Gulf Coast Region. This Program aligns with the planning framework approach to reduce excess nutrients and other pollutants to watersheds and downstream receiving waters. Further, this program will utilize planning framework techniques including storm-water management, erosion and sediment control, and wastewater system improvements. Program activities will include engineering, design, permitting, and construction implementation for multiple projects throughout coastal Alabama.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GT3CP26TX0011"] = "The State of Texas, through the Texas Commission on Environmental Quality (TCEQ), is requesting Council-Selected Restoration Component funding for the Shoreline Protection Through Living Shorelines program. This program will construct large-scale living shorelines that will stabilize estuarine shorelines and protect large tracts of land and coastal resources along the Texas coast. Living shorelines consist of marsh vegetation planting typically combined with rock breakwaters or oyster reefs to protect bay shorelines and marshes from loss due to erosion. The program will target highly eroding shorelines along the Gulf Intracoastal Water Way (GIWW), vulnerable bay shorelines, and locations that have been identified as suitable areas for a living shoreline installation. The program will also address degrading coastal structures that need repair, such as critical seawalls, and add living shoreline elements to enhance their protective capabilities. Living shorelines can reduce damage to shorelines by dampening wave action and trapping sediments, elevating shore profiles to a level that will support marsh vegetation. This program will provide ecosystem services by creating hard structure habitats for fish and oysters, nutrient and sediment removal, seagrass protection, and water quality improvement.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["GT3CP26TX0012"] = "The State of Texas, through the Texas Commission on Environmental Quality (TCEQ), is requesting Council-Selected Restoration Component funding for the Texas Coastal Water Quality Program. The degradation of water quality on the Texas coast has put the environmental health of coastal ecosystems at risk. Water quality in Texas is adversely impacted by diverted freshwater inflows and increased nutrient input from agriculture. This program aims to restore water quality and freshwater inflows on the Texas coast using a variety of proven methods that will enhance the natural environment including: the implementation of best management practices (BMPs) in Texas coastal watersheds to reduce non-point source pollution, the repair and enhancement of drainage channels and outfalls to improve stormwater flow and increase freshwater inflow to adjacent marshes, and the construction of living shoreline features to reduce erosion and improve water quality. This program will address environmental issues focused on stormwater runoff, freshwater inflows, floodplain management, sediment control and water quality for activities related to coastal communities, wetlands, and agriculture.";
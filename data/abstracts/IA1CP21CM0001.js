@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["IA1CP21CM0001"] = "The U.S. Department of the Interior (DOI), through the Bureau of Indian Affairs (BIA) was awarded RESTORE Act Council-Selected Restoration Component funds for the continuation of the Gulf of Mexico Habitat Restoration via Conservation Corps Partnerships/Youth Conservation Corps program. Under a subaward with DOI BIA, the Seminole Tribe of Florida, Miccosukee Corporation, Poarch Band of Creek Indians, Coushatta Tribe of Louisiana, Mississippi Band of Choctaw Indians, and Chitimacha Tribe of Louisiana will promote and create stewardship opportunities for Tribal youth through meaningful training and employment, which includes environmental education. Investing in programs that provide work opportunities for young people has economic and physical benefits, while also enhancing the environmental vitality of the area's natural resources directly tied to the Gulf. Participants will benefit from employment opportunities working on conservation and restoration projects that also incorporate lessons in environmental education, history, and culture. The program will not only help restore the Gulf but also provide meaningful job opportunities for youth, create powerful connections to nature and help prepare the next generation of environmental stewards. This award began in 2021. The original FPL 1 approved award for this project was amended by a Council vote in February 2020 to add an additional funding to this project.";
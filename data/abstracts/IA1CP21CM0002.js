@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["IA1CP21CM0002"] = "The U.S. Environmental Protection Agency (EPA) was awarded RESTORE Act Council-Selected Restoration Component funds for implementation of the Gulf of Mexico Conservation Enhancement Grant Program (GMCEGP). Under subawards with EPA, Atlanta Botanical Garden, Inc., Partnership for Gulf Coast Land Conservation, Inc., Woodlands Conservancy, Mississippi Forestry Commission, The Nature Conservancy, and Galveston Bay Foundation, Inc.will enhance private/public partnerships that support land protection and conservation across the Gulf Coast region. The purpose of the GMCEGP is to: (1) enhance land protection and conservation in priority landscapes, (2) improve habitats and water quality; and (3) enhance the understanding of the benefit of land protection to communities through focused outreach and education. Eight conservation and restoration projects are funded for implementation, including: (1) Planting of Tenet Pond for Habitat Enhancement; (2) Enhancing Conservation though Woody Vegetation Removal and Evaluation of the Impact of Novel Management Methods in Florida's Rare Coastal Wetland Ecosystem; (3) Gulf Coast Land Conservation Assistance; (4) Restoration and Rehabilitating the Ecological Functions in a Major Watershed and Sub-watershed in the Mississippi Gulf Coast region; (5) Restoration and enhancement of habitat for resident and migratory birds in the Barataria Basin, Louisiana; (6) Calcasieu Lake and Sabine National Wildlife Refuge Oyster Reef Restoration Project; (7) Galveston Bay Conservation Program; and (8) the Texas Coastal Prairies Program.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["IA1CP23CM0003"] = "The U.S. Department of Commerce (DOC), through the National Oceanic and Atmospheric Administration (NOAA) National Centers for Coastal Ocean Science, was awarded RESTORE Act Council-Selected Restoration Component funds for The Marsh Restoration in Fish River and Weeks Bay (Implementation) project. The project will complete the 100% engineering and design phase, implement restoration activities, conduct monitoring to assess restoration outcomes, and engage in outreach and educational activities to restore approximately 50 acres of wetlands by back- filling dead-end canals with approximately 20,000 cubic yards of upland-sourced sediment to create both more natural tidal creeks and salt marsh habitat. These canals do not allow adequate water exchange between the tidally influenced portion of Fish River and cause stagnant water in the uppermost portion of the canals. This condition leads to a low dissolved oxygen level, which reduces the value of this habitat for many fish species. Further, the historic tidal flow of the wetland system is disrupted by the canals and adjacent spoil piles. The restoration measures will improve tidal flushing within the canals and improve hydrological connectivity. This project is part of the Connecting Coastal Waters (CCW) initiative NOAA is leading with partners to implement projects that restore the extent, functionality and resiliency of Gulf Coast wetlands. The project area is in Baldwin County, Alabama on Fish River at the Weeks Bay National Estuarine Research Reserve (NERR) property north of US Highway 98. Project partners include the Weeks Bay NERR and the Alabama Department of Conservation and Natural Resources.";
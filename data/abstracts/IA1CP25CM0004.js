@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["IA1CP25CM0004"] = "The U.S. Department of the Interior (DOI), through the Bureau of Indian Affairs (BIA), was awarded RESTORE Act Council-Selected Restoration Component funds for the Tribal Youth Coastal Restoration Program.The program will support the primary RESTORE Comprehensive Plan goal to enhance community resilience through planning and implementation activities that will continue the restoration work begun under the Council's 2015 Initial FPL of the following federally-recognized tribes: Chitimacha Tribe, Mississippi Band of Choctaw Indians, Poarch Band of Creek Indians, Seminole Tribe of Florida, Miccosukee Indian Tribe, Coushatta Tribe of Louisiana, and will add the Alabama-Coushatta Tribe of Texas. Tribes will create projects to protect natural resources and the environment, and maintain a healthy ecosystem, while learning cultural values. These training projects should restore approximately 1,000 acres of habitat on Big Thicket National Preserve.";
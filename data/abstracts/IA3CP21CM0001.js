@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["IA3CP21CM0001"] = "The U.S. Department of Commerce (DOC), through the National Oceanic and Atmospheric Administration (NOAA) National Centers for Coastal Ocean Science, was awarded RESTORE Act Council-Selected Restoration Component funds for the Gulf of Mexico Coast Conservation Corps (GulfCorps) Program. Initially funded under the Council's 2015 Initial FPL, the GulfCorps program supports the primary RESTORE Council Comprehensive Plan goal of restoring and conserving habitat. Under a subaward with NOAA, The Nature Conservancy, The Corps Network, Student Conservation Association, Inc, and the Ember Alliance will work with GulfCorps organizations in each of the five Gulf States will recruit, train, employ and help to inspire hundreds of young adults to produce habitat restoration benefits and become the Gulf of Mexico's future restoration workforce. GulfCorps will continue to collaborate with state, federal, and local agencies, as well as non-profit organizations, to manage natural resources and implement restoration, conservation and resilience projects. Based on project input from RESTORE Council Members and local experts, the GulfCorps will implement habitat restoration, conservation and monitoring activities in a range of Gulf of Mexico habitats including marshes, prairies, forests, oyster reefs and shorelines. GulfCorps crews will also facilitate public access to Gulf habitats by building and maintaining boardwalks and trails. This award began in 2021. The award is a continuation of the Gulf of Mexico Habitat Restoration via Conservation Corps Partnership award, IAACP17DC0030.";
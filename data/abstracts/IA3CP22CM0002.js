@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["IA3CP22CM0002"] = "The U.S. Department of the Interior (DOI), through the U.S. Geological Survey (USGS) Southeast Regional Office, was awarded RESTORE Act Council-Selected Restoration Component funds for the Develop Ecological Flow Decision-Support for Mobile River & Perdido River Basins project. The project will support the primary RESTORE Comprehensive Plan goal to restore water quality and quantity through activities to create a decision support model to provide information on freshwater inflows to streams, bays, and wetlands. The Operational Analysis and Simulation of Integrated Systems (OASIS) model will simulate the routing of water through watersheds in the river basins, providing a tool for resource managers to evaluate questions of concern, such as the influence of water resource alteration on restoring and conserving habitat, water quality, and living coastal resources. New gaging stations will be installed to fill critical freshwater inflow data gaps and support data needs for future monitoring assessments. The Alabama Water Agencies Working Group and other water resource managers have identified a critical need for data on inflows and models to understand how the timing and delivery of flow affects downstream ecological resources. The OASIS model will provide state and local agencies with modeled outcomes on various water-use strategies and supporting information to guide water resource management activities and restoration areas to focus on in the future.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["IA3CP22CM0003"] = "The U.S. Department of the Interior (DOI)- National Park Service (NPS) Southeast Regional Office was awarded RESTORE Act Council-Selected Restoration Component funds for the Wind-Tidal Flat Restoration Pilot (Planning & Implementation) project. Building on investments made in the Council's 2015 Initial FPL, the project will support the primary RESTORE Comprehensive Plan goal to restore and conserve habitat in coastal Texas, including Padre Island National Seashore. The Wind-Tidal Flat Restoration Pilot Project will test various restoration techniques and assess the efficacy and cost effectiveness of those techniques. The wind-tidal flat areas at Padre Island National Seashore are significant in that they protect portions of the largest freshwater wetland in Texas, conserve protected species, and provide wintering habitat for millions of migratory birds. However, impacts from previous energy exploration have impaired these important habitats. This project will lead to the restoration and improved resiliency for 5 acres of Gulf wind-tidal flat habitat and will provide lessons learned that can be applied to other tidal flat sites in need of restoration. Key information will be gained within the first year of field work implementation.";
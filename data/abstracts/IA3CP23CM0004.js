@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["IA3CP23CM0004"] = "The U.S. Department of the Interior, on behalf of the Bureau of Indian Affairs (BIA) was awarded RESTORE Act Council-Selected Restoration Component funding for the Tribal Youth Coastal Restoration Program. This includes planning and implementation funds as FPL Category 1. The program will support the primary RESTORE Comprehensive Plan goal to enhance community resilience through planning and implementation activities that will continue the restoration work begun under the Council's 2015 Initial FPL of the following federally-recognized tribes: Chitimacha Tribe, Mississippi Band of Choctaw Indians, Poarch Band of Creek Indians, Seminole Tribe of Florida, and Miccosukee Indian Tribe, and will add the Coushatta Tribe of Louisiana. Tribes will create projects on their respectively Tribal lands in Gulf Coastal Louisiana, Mississippi, Alabama, and Florida as well as lands that drain into the Gulf to protect natural resources and the environment, and maintain a healthy ecosystem, while learning cultural values. These training projects should restore 1,000 acres of habitat on Tribal lands.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["IA3CP23CM0005"] = "The U.S. Department of Agriculture was awarded RESTORE Act Council-Selected Restoration Component funding for the Enhancing Gulf Waters through Forested Watershed Restoration program This includes planning and implementation funds as FPL Category 1. The program will support the primary RESTORE Comprehensive Plan goal to restore water quality and quantity through activities to restore private and public forests by providing technical and financial assistance to private landowners and communities in watersheds where forest resources are instrumental to the health of the Gulf of Mexico. A coordinated cross-boundary effort will be led by state forestry agencies in Alabama, Florida, and Mississippi, leveraging the funding and activities of other organizations that are well established in the RESTORE zone. Activities include social marketing techniques to effectively reach landowners, implementation of best management practices, and use of science-based decision support tools to inform forest restoration investments and quantify outcomes. A healthy Gulf stems from healthy estuaries, healthy estuaries depend on healthy watersheds, healthy watersheds flow from healthy forests, and healthy forests require engaged landowners. Anticipated environmental benefits from this program include improvements to water quality and quantity and wildlife and threatened and endangered species habitat through professional forest management, avoided land use conversion, and increased forest cover.";
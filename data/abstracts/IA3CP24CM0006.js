@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["IA3CP24CM0006"] = "The U.S. Dept. of Agriculture, through the U.S. Forest Service was awarded RESTORE Act Council-Selected Restoration Component funding for the Apalachicola Regional Restoration Initiative (ARRI). This includes planning and implementation funds as FPL Category 1. The ARRI will support the primary RESTORE Comprehensive Plan goal to restore water quality and quantity through activities implemented as an extension of the Tate's Hell Strategy 1 project funded in the Council's 2015 Initial FPL. ARRI Strategies 2 & 3 are collaborative, landscape-level projects focused on restoring longleaf pine, coastal ecosystems, and hydrology within the Apalachicola Region of Florida. Activities include improvement to water quality & quantity, outreach to public landowners, monitoring, and targeted education for minorities. Under Strategy 2, project partners will implement ecological restoration activities including: region-wide restoration for approximately 137,000 acres of longleaf habitat, targeted silvicultural treatments for about 7,200 acres of dense pine forests, hydrologic restoration for around 1,500 acres, increased regional prescribed fire, invasive species treatments, and imperiled wetland restoration. Under Strategy 3, the Florida Forest Service will lead a partnership to advise private forest landowners in active management and restoration and educate landowners on stewardship and sustainable forest management. The combined ARRI Strategies 2 & 3 restoration efforts will help restore and conserve critical habitat, water quantity and quality, and benefit the economy.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["IA3CP25CM0007"] = "The U.S. Department of Agriculture (USDA), through the Natural Resources Conservation Service (NRCS) was awarded RESTORE Act Council-Selected Restoration Component funding for the Gulf Coast Conservation Reserve Program (GCCRP). This includes planning and implementation funds as FPL Category 1. The GCCRP was established through the Council's 2015 Initial Funded Priorities List. USDA is currently implementing the program in Texas, Mississippi, Alabama, and Florida for the purpose of protecting and restoring critical wildlife habitat and improving water quality through the development of wildlife habitat, conservation, and forest management plans. The GCCRP for FPL 3b will build upon the restoration and conservation progress made through the initial program funding, and will support the primary RESTORE Comprehensive Plan goal to restore water quality and quantity through the implementation of conservation practices and restoration activities to address the priority resource concerns identified in the planning phase. The health of the Gulf of America depends upon the health of its estuaries, and the health of those estuaries is influenced by what happens upstream along tributary rivers including the Mississippi. GCCRP activities will allow for conservation planning on private lands including, but not limited to, ecosystem restoration by conducting soil and water conservation for the benefit of water quality to priority bays and estuaries. Program duration is 4 years.";
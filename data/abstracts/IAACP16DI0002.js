@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["IAACP16DI0002"] = "The U.S. Department of the Interior (DOI), through the Bureau of Indian Affairs- (BIA) was awarded RESTORE Act Council-Selected Restoration Component funds for the Gulf of Mexico Habitat Restoration via Conservation Corps Partnerships/Youth Conservation Corps program. Under a subaward with DOI BIA, Chitimacha Tribe of Louisiana, Miccosukee Corporation, Mississippi Band of Choctaw Indians, Poarch Band of Creek Indians, and the Seminole Tribe of Florida supported, promoted, and created stewardship opportunities for Tribal youth through meaningful training and employment, which includes environmental education. Investing in programs that provide work opportunities for young people has economic and physical benefits while also enhancing the environmental vitality of the area's natural resources directly tied to the Gulf. These camps were extremely popular and beneficial to the Gulf Tribes. The camps were held in 2016-2018, and had a total of 239 participants. The camp programs provided meaningful work-based opportunities in environmental conservation and natural resource management, and strengthened the protection, conservancy, and long-term maintenance of natural resources on tribal lands.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["IAACP17DA0007"] = "The U.S. Department of Agriculture (USDA), through the Natural Resources Conservation Service (USDA NRCS) Louisiana State Office, was awarded RESTORE Act Council-Selected Restoration Component funds for the Bayou DuLarge Ridge, Marsh and Hydrologic Restoration (Planning) project. This project seeks to restore valuable wetlands habitat and help protect Louisiana's coastal communities. Under a subaward with USDA NRCS, Sigma Consulting Group, Inc. will hire a contractor to provide basic services as required to accomplish the Engineering and Design Phase of this project from initial planning to final acceptance of a Final Design Package. The project will first be examined for construction feasibility by completing several types of surveys and geotechnical investigations. Once the initial feasibility is completed, designing of the marsh creation, and ridge restoration components can begin. Once design is complete, contractors will provide NRCS with final construction plans and specifications for the project with an estimate for construction costs. The project components perform synergistically to provide benefits to approximately 233 acres from the hydrologic restoration, approximately 282 acres from the marsh creation and approximately 25 acres of ridge for a total approximately 540 acres of total acres on habitat restoration. The project location in Terrebonne Parish, Louisiana provides a unique opportunity to manage salinity intrusion into a vast area where salinity was historically and naturally moderated through intact land features.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["IAACP17DA0041"] = "The U.S. Department of Agriculture (USDA), through the United States Forest Service (USFS), was awarded RESTORE Act Council-Selected Restoration Component funds for the Tate's Hell Strategy 1 (Planning and Implementation) project. USFS will lead the development of a landscape scale hydrologic assessment, a Regional Restoration Decision Support System, and a Comprehensive Hydrologic Assessment and Restoration (CHAR) Plan. This plan identifies and prioritizes future restoration opportunities throughout the Lower Apalachicola River Basin and Apalachicola Region. Once this decision tool is implemented in Florida, it can be utilized throughout the Gulf by adding region-specific data. Subrecipients will include Florida State University-Florida Natural Areas Inventory, USFS Rocky Mountain Research Station, and USFS Southern Research Station-Center for Aquatic Technology Transfer, Florida A&M University, and Chesapeake Conservancy, Inc. Funding for this project will also be used for planning, engineering, design, environmental compliance, and permitting for the implementation of high-priority hydrologic restoration work identified in the Tate's Hell State Forest Hydrologic Restoration Plan developed by the Northwest Florida Water Management District and the Florida Forest Service. This would include installing low water crossings, ditch blocks, installing/replacing culverts and surface stabilization of 48 miles of roads. Implementation will be led by subrecipient Florida Department of Agriculture and Consumer Services, and will directly impact and support restoration of approximately 202,436 acres of forest.";
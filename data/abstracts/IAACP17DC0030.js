@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["IAACP17DC0030"] = "The U.S. Department of Commerce (DOC), through the National Oceanic and Atmospheric Administration (NOAA) Restoration Center, was awarded RESTORE Act Council-Selected Restoration Component funds for the Gulf of Mexico Habitat Restoration via Conservation Corps (GulfCorps) Partnership program. The GulfCorps developed partnerships among federal, state, academic, and non-profit organizations to provide local labor for restoration projects in all five Gulf Coast States; and works through these partnerships to recruit, train, and employ workers, contributing to a local restoration-based workforce. Under a subaward with NOAA, The Nature Conservancy will coordinate development of the GulfCorps in partnership with the RESTORE Council members, as a means of creating a program that is reflective of Gulf priorities. Restoration projects will be prioritized with State partners that will consider the following - 1) project readiness and implementation logistics, 2) benefit to habitats and communities affected by the Deepwater Horizon oil spill, and 3) opportunity for GulfCorps skillset development. Additional funding has also been issued to continue this work, which is ongoing (see Gulf of Mexico Coast Conservation Corps (GulfCorps) Program, IA3CP21CM0001).";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["IAACP17DC0038"] = "The U.S. Department of Commerce (DOC), through the National Oceanic and Atmospheric Administration (NOAA) was awarded RESTORE Act Council-Selected Restoration Component funds for the Coucil Monitoring and Assessment Program Development. The monitoring and assessment program, administered jointly by NOAA and U.S. Geological Survey (USGS), will build the foundational components for Gulf region-wide monitoring in order to measure impacts of investments in restoration. Through collaboration with the Gulf States, federal and local partners, academia, non-governmental/non-profit organizations, and industry, the program will use a Monitoring Community of Practice coordinated by the Gulf of Mexico Alliance to leverage existing resources, capacities, and expertise and build on existing monitoring programs. These existing programs will be coordinated into a network, to provide efficiency in monitoring and collaborative cross-program review of performance with other Gulf ecosystem recovery efforts. The program will: (1) create an inventory of the existing monitoring programs, data, protocols and standards; (2) determine the minimum monitoring elements needed to evaluate the performance of restoration projects; (3) evaluate monitoring program suitability; (4) combine data from the suitable existing programs into searchable databases for Council use; (5) examine the inventory to determine what data are missing (i.e. identify information gaps) that would be required for the RESTORE Council; (6) document existing baseline assessments of habitat and water quality conditions; and (7) provide recommendations to the Council to supplement and refine the existing monitoring programs to fill-in the information gaps where possible.";
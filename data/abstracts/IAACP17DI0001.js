@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["IAACP17DI0001"] = "The U.S. Department of the Interior (DOI), through the U.S. Geological Survey (USGS) Southeast Regional Office, was awarded RESTORE Act Council-Selected Restoration Component funds for the Baseline Flow, Gage Analysis & On-Line Tool to Support Restoration project. This project will develop regionally consistent streamflow metrics and measures of streamflow alteration, and will develop an online mapping tool to identify areas where streamflow alteration is highest at the regional, state or watershed scale and prioritize restoration efforts. Additionally, a streamflow accounting tool for a large focus-area watershed in Mississippi will be created to enable water resource managers to evaluate a range of potential management scenarios, such as modifying the release curves for selected reservoirs upstream in order to evaluate changes in freshwater delivery to an estuary. Activities will also include the installation and operation of up to 18 new streamgages based on a streamflow alteration gap analysis that will be conducted to create a more robust gauge network and help to minimize flow alteration predictions in future analyses. Targeting new stream gauges in areas and land cover types currently underrepresented in existing networks will improve future streamflow assessments.";
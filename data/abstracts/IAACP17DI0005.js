@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["IAACP17DI0005"] = "The U.S. Department of the Interior (DOI), through the U.S. Fish and Wildlife Service (USFWS) Southeast Regional Office, was awarded RESTORE Act Council-Selected Restoration Component funds for the Strategic Conservation Assessment of Gulf Coast Landscapes project. Under a subaward with USFWS, the Mississippi State University, Gulf Coast Cooperative Ecosystem Studies Unit developed conservation planning tools that RESTORE Council members can use as they identify and evaluate future land conservation strategies, opportunities and projects in the Gulf Coast Region. The final products include: a new Geographic Information System (GIS) of existing plans and other pertinent information; a Conservation Planning Tool (CPT) that reflects the RESTORE Council members' shared goals and priorities; and a Strategic Conservation Assessment (SCA) that identifies land conservation opportunities based upon shared goals and other factors. This project combined the land conservation plans already in existence in the Gulf region into decision support tools\u2013the CPT and SCA\u2013that offer a Gulf-wide perspective on land conservation. These tools and the subsequent modeling and analysis will provide RESTORE Council members information they can use to ensure that the land conservation decisions they make provide the greatest benefit to current and future ecosystem sustainability and resilience within the states and across the Gulf. This award Began in 2017 and was completed 2022.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["IAACP17DI0006"] = "The U.S. Department of the Interior (DOI), through the U.S. Geological Survey (USGS) Southeast Regional Office, in partnership with the National Oceanic and Atmospheric Administration (NOAA), was awarded RESTORE Act Council-Selected Restoration Component funds to develop the Council Monitoring & Assessment Program. This program built the foundational components for Gulf region-wide monitoring to measure impacts of investments in restoration. Through collaboration with the Gulf States, federal and local partners, academia, non-governmental/non-profit organizations, and industry, the program used a Monitoring Community of Practice coordinated by the Gulf of Mexico Alliance to leverage existing resources, capacities, and expertise, and build on existing monitoring programs. These programs were coordinated into a network to provide efficiency in monitoring and collaborative cross-program review of performance with other Gulf ecosystem recovery efforts. The program: (1) created an inventory of existing monitoring programs, data, protocols and standards; (2) determined the minimum monitoring elements needed to evaluate performance of restoration projects; (3) evaluated monitoring program suitability; (4) combined data from suitable existing programs into searchable databases; (5) examined the inventory to identify information gaps; (6) documented existing baseline assessments of habitat and water quality conditions; and (7) provided recommendations to the Council to supplement and refine existing monitoring programs to fill-in information gaps where possible. This award began in 2016 and was completed in 2020.";
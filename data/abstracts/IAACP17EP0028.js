@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["IAACP17EP0028"] = "The U.S. Environmental Protection Agency (EPA) was awarded RESTORE Act Council-Selected Restoration Component funds for planning of the Mobile Bay National Estuary Program. Supporting partners are the City of Mobile and the National Fish and Wildlife Federation. Under a subaward with EPA, the Mobile Bay National Estuary Program (MBNEP) completed the planning phase of the MBNEP RESTORE project. This work included engineering and design of a stream restoration plan for restoring Twelve Mile Creek Watershed, as well as preparation of necessary environmental compliance and regulatory clearances documentation, the development of an invasive species control program focused on aquatic vegetation in Three Mile Creek, and quality assurance and pre-restoration monitoring. The successful completion of the planning phase of the MBNEP RESTORE project has ensured that the implementation phase will proceed in a timely and fully-compliant manner.";
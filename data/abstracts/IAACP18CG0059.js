@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["IAACP18CG0059"] = "The Department of Homeland Security (DHS), through the U.S. Coast Guard (USCG) was awarded RESTORE Act Council-Selected Restoration Component funds for the Commitment and Planning support (CPS) - DHS / U.S. Coast Guard award. The purpose of this award is to enhance collaboration, coordination, public engagement and the use of best available science to meet the requirements of the RESTORE Act Council-Selected Restoration Component, meet the commitments of the RESTORE Council's Comprehensive Plan Update, and address associated planning needs for developing future Funded Priorities Lists (FPLs). The DHS, through the USCG, is building upon existing partnerships to strengthen collaboration between Regional and Area Response Committees and RESTORE Council members to determine the need to better integrate spill resiliency and acute pollution response readiness into restoration planning. The USCG is taking a stepwise approach to planning and collaboration activities over the 5-year period of this award to meet the near-term need to develop the strongest proposals possible for the next FPL while setting the foundation for long-term restoration success. These CPS funds are being administered in a way that allows the flexibility needed as the planning process proceeds. To that end, the collaboration strategies directly connected to processes and engagements of the Restoration Component funding efforts for subsequent years are being developed as part of each year's activities to build upon the progress, success and lessons learned in each year.";
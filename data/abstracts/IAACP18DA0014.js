@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["IAACP18DA0014"] = "The U.S. Department of Agriculture (USDA), through the Natural Resources Conservation Service (NRCS) Alabama State Office was awarded RESTORE Act Council-Selected Restoration Component funds for the planning and implementation of the Gulf Coast Conservation Reserve Program (GCCRP) in Alabama. The Alabama GGCCRP will protect and restore critical habitat and improve water quality through the development and implementation of conservation plans that address erosion, infiltration, and habitat improvement in the Baldwin and Mobile Counties. The USDA will complete site specific conservation planning, engineering design, environmental evaluations, and conservation practice (best management practices, or BMPs) implementation on agricultural and forested lands in two coastal Alabama Counties. This program will reduce the discharge of sediments and pollutants from agricultural operations and associated critically eroding areas that drain to the Mobile Bay, Mississippi Sound, Bon Secour Bay and Perdido Bay. USDA and partners will work with landowners to implement conservation practices that will restore habitat, stabilize eroding areas, improve infiltration and reduce pollutants (primarily sediment) in runoff.";
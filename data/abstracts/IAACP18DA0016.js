@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["IAACP18DA0016"] = "The U.S. Department of Agriculture (USDA), through the Natural Resources Conservation Service (NRCS) Mississippi State Office, was awarded RESTORE Act Council-Selected Restoration Component funds for the planning and implementation of the Gulf Coast Conservation Reserve Program (GCCRP) in Mississippi. The Mississippi GCCRP focuses on restoring terrestrial habitats and improving water quality in waters flowing into the Gulf of Mexico. Restoration activities will take place on both private & eligible public lands in the following MS counties: George, Jackson, Hancock, Harrison, Pearl River, and Stone. Primary RESTORE Council Comprehensive Plan objectives of the program are restoration, enhancement, and protection of habitat, and the secondary objectives include, restoration, improvement and protection of water resources. The program meets RESTORE Act priority criteria by substantially contributing to the restoration and protection of the natural resources and wildlife habitats of Gulf Coast ecosystems. The program will control non-native invasive species, such as Cogongrass, through NRCS practice code 315. It will also improve other habitat conditions by implementing the following practice codes: Brush Management (314); Herbaceous Weed Control (315); Prescribed Burning (338); Firebreak (394); Tree/Shrub Site Preparation (490); Tree/Shrub Establishment (612); and Forest Stand Improvement (666). The USDA NRCS oversees the technical and financial assistance for implementation of these NRCS conservation practices.";
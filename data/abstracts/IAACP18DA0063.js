@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["IAACP18DA0063"] = "The U.S. Department of Agriculture (USDA), through the Natural Resources Conservation Service (NRCS) Gulf Coast Ecosystem Restoration Team, received RESTORE Act Council-Selected Restoration Component funds for the Commitment and Planning Support (CPS)\u2014USDA award. The purpose of this award is to enhance collaboration, coordination, public engagement, and the use of best available science to more effectively meet the requirements of the Council-Selected Restoration Component, the commitments of the RESTORE Council\u2019s Comprehensive Plan and address associated planning needs for developing future Funded Priorities Lists (FPLs). The USDA will build upon existing partnerships and collaboration pathways developed through its existing structure. Early activities will focus on working with other RESTORE Council members to identify priority watersheds, restoration partners, and local stakeholders that fit within the broader vision for improved water quality and wildlife habitat to develop proposals for the next FPL. USDA will work in collaboration with other RESTORE Council members to take a stepwise approach to planning and collaboration activities over the 5-year period of this award. Because planning is inherently iterative, CPS funds will be administered in a way that allows the flexibility needed as the planning process proceeds. To that end, work plans for subsequent years will be developed as part of each year\u2019s activities. USDA will utilize the CPS funds to support a personnel service contract; however, USDA staff will be substantially involved.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["IAACP18DC0033"] = "ROBINSON PRESERVE WETLANDS RESTORATION (IMPLEMENTATION) --- The U.S. Department of Commerce (DOC), through the National Oceanic and Atmospheric Administration (NOAA) Restoration Center, was awarded RESTORE Act Council-Selected Restoration Component funds for the Robinson Preserve Wetlands Restoration (Implementation) project. This project is part of the Connecting Coastal Waters (CCW) initiative that NOAA is leading with partners to restore the extent, functionality, and resiliency of several Gulf Coast wetlands. The CCW projects seek to restore and enhance ecosystem resilience, sustainability, and natural defenses by reestablishing natural hydrology and connectivity between freshwater and marine habitats in priority areas across the Gulf Coast. Under a subaward with NOAA, National Fish and Wildlife Foundation will implement restoration activities, conduct monitoring to assess restoration outcomes, engage in outreach and educational activities, and develop a hydrologic restoration project inventory for the Tampa Bay watershed. The Robinson Preserve Wetlands Restoration project is located on a 150-acre parcel within the Robinson Preserve in Manatee County, FL. When completed, the project will provide approximately 57 acres of coastal upland habitat and approximately 60 acres of wetland, open water sub-tidal, and open freshwater habitats, for a total of approximately 118 acres of restored productive habitat. This award began in 2018.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["IAACP18DC0034"] = "The U.S. Department of Commerce (DOC), through the National Oceanic and Atmospheric Administration (NOAA) Restoration Center, was awarded RESTORE Act Council-Selected Restoration Component funds for the Marsh Restoration in Fish River, Weeks Bay, Oyster Bay & Meadows Tract (Planning) - Fish River and Weeks Bay Marsh project. This project completed the planning, modeling/flow regime analysis, engineering, and design required to restore hydrology and improve water quality to approximately 70 acres of estuarine tidal marsh and tidal creeks at the Weeks Bay National Estuarine Research Reserve (NERR) dead end canal site in Baldwin County, Alabama. Completion of these activities provides the NOAA Restoration Center with a full understanding of the construction alternatives at this site, complete with environmental impact and benefits metrics. This information has provided the NOAA Restoration Center with the necessary information to seek RESTORE Act Council-Selected Restoration Component funds for implementation.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["IAACP18DC0051"] = "The U.S. Department of Commerce (DOC), through the National Oceanic and Atmospheric Administration (NOAA) Restoration Center, was awarded RESTORE Act Council-Selected Restoration Component funds for the Marsh Restoration in Fish River, Weeks Bay, Oyster Bay & Meadows Tract (Planning) - Meadows Tract project. This project completed the planning, modeling/flow regime analysis, engineering, design, and permitting required to restore the hydrology of approximately 250 acres of tidal freshwater and brackish marsh located east of County Road 1 in Baldwin County, Alabama, known as the Meadows Tract. Completion of these activities provides the NOAA Restoration Center with a full understanding of the construction alternatives at this site, complete with environmental impact and benefits metrics. This information provides the NOAA Restoration Center with the necessary information to seek RESTORE Act Council-Selected Restoration Component funds for implementation.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["IAACP18DC0052"] = "The U.S. Department of Commerce (DOC), through the National Oceanic and Atmospheric Administration (NOAA) Restoration Center was awarded RESTORE Act Council-Selected Restoration Component funds for the NOAA Marsh Restoration in Fish River, Weeks Bay, Oyster Bay & Meadows Tract (Planning) - Oyster Bay project. This project completed the planning, design, and engineering required to restore the hydrology of 150 acres of estuarine tidal marsh and brackish marsh that historically drained south through two tidal creeks into Oyster Bay and Bon Secour Bay, located in the City of Gulf Shores, Baldwin County, Alabama. Completion of these activities provides the NOAA Restoration Center with a full understanding of the construction alternatives at this site, environmental impact and benefits metrics; and the necessary information to seek RESTORE Act Council-Selected Restoration Component funds for implementation. Replacing the existing culverts at the site with larger box culverts or bridges will improve flow, maximize tidal exchange, restore aquatic species movement, and improve overall function to approximately 150 acres of adjacent wetlands.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["IAACP18DI0065"] = "The U.S. Department of the Interior (DOI) was awarded RESTORE Act Council-Selected Restoration Component funds for the Commitment and Planning Support (CPS) DOI award. The purpose of this award is to plan for future on-the-ground restoration projects for 2020 and beyond with fellow RESTORE Council members, RESTORE Council staff and the public. Early CPS activities will focus on identifying priority projects and partners that fit within the broader RESTORE Council vision for Gulf restoration in order to develop proposals for the next Funded Priorities List (FPL). Annual work plans will be developed for each year's activities. Progress will be reviewed annually both to ensure effective and efficient use of CPS funds and to provide information to support future FPL projects.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["IAACP18EP0017"] = "The U.S. Environmental Protection Agency (EPA) was awarded RESTORE Act Council-Selected Restoration Component funds to implement the Tampa Bay National Estuary Program (TBEP). Under a subaward with EPA, the Tampa Bay Estuary program will conduct TBEP RESTORE activities, which include five priority water quality and habitat improvement elements located throughout the Tampa Bay watershed. These activities have been vetted by the local government and agency partners participating in TBEP. The five priority elements of this program are: (1) Biosolids to Energy (City of St. Petersburg); (2) Copeland Park Stormwater Enhancements (City of Tampa); (3) Coastal Invasive Plant Removal/Cockroach Bay Aquatic Reserve (Hillsborough County); (4) Robinson Preserve Water Quality and Habitat Restoration (Manatee County); and (5) Ft Desoto Recirculation and Seagrass Recovery (Pinellas County).";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["IAACP18EP0027"] = "The U.S. Environmental Protection Agency (EPA) was awarded RESTORE Act Council-Selected Restoration Component funds for planning of the Gulf of Mexico Estuary Program (GMEP). Under a subaward with EPA, Escambia County will develop a place-based estuary program encompassing the following bays in Florida's northwest panhandle region: Perdido Bay, Pensacola Bay, and Escambia Bay. The Bay Areas Resource Council is assisting with this program. Key components of the program are establishing an independent estuary program office administratively supported by Escambia County; hiring a Program Director and other key staff; developing the Management Conference comprised of a Policy Board as well as Technical, Community, Education, and Economic Advisory Committees; determining stressors; conducting initial outreach activities; and developing and adopting a Comprehensive Conservation and Management Plan (CCMP) supported by both the community and best available science.";
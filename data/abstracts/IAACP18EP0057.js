@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["IAACP18EP0057"] = "The U.S. Environmental Protection Agency (EPA) received RESTORE Act Council-Selected Restoration Component funds for the Commitment and Planning Support (CPS)- EPA award. The purpose of this award is to enhance collaboration, coordination, public engagement and use of best available science to meet the requirements of the Restoration Component, meet the commitments of the RESTORE Council's Comprehensive Plan Update, and address associated planning needs for developing future Funded Priorities Lists (FPLs). The EPA is building upon existing partnerships and collaboration pathways with the RESTORE Council member designees and alternates in the Gulf Coast States (TX; LA; MS; AL; and FL) and the six Federal agencies (Army; DOC; DOI; USCG; and USDA); NGOs in the Gulf Coast region; and estuary programs in the Gulf Coast region. Early activities focused on identifying priority projects and partners that fit within the broader vision for each of the Gulf Coast States in order to collaboratively develop proposals for the next FPL. The EPA is taking a stepwise approach to planning and collaboration activities over the performance period of this award to meet the near-term need to collaborate and support each state in developing the strongest proposals possible for the next FPL while setting the foundation for long-term restoration success. These CPS funds are being administered in a way that allows the flexibility needed as the planning process proceeds. Thus, work plans for subsequent years will be developed as part of each year's activities.";
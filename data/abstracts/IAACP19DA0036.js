@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["IAACP19DA0036"] = "The U.S. Department of Agriculture (USDA), through the Natural Resources Conservation Service (NRCS) Texas State Office, was awarded RESTORE Act Council-Selected Restoration Component funds for the planning and implementation of the Gulf Coast Conservation Reserve Program (GCCRP) in Texas. The Texas GCCRP will address water quality resource concerns in the San Antonio River Watershed. Four hydrologic units in and around the Lower Cibolo in Wilson County will be the focus area for water quality in this watershed. Water Quality Management Plans (WQMP) will be developed and implemented on agricultural lands along water bodies impaired by nutrients and sediments. NRCS and its conservation partners will work with landowners within the watershed to implement conservation practices identified in the WQMP's that reduce sediment and nutrients from leaving farm fields and entering streams. Practices will include, but are not limited to the following, filter strips, riparian forest buffer, crop rotation, conservation cover, conservation tillage, prescribed grazing and nutrient management. After conservation practices are successfully implemented and/or installed as meeting USDA-NRCS standards and specifications that were identified in the WQMP, conservation stewardship payments will be provided to landowners as an incentive payment to maintain the functions of the installed conservation practice(s).";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["IAACP19DC0031"] = "The U.S. Department of Commerce (DOC), through the National Oceanic and Atmospheric Administration (NOAA) Restoration Center, was awarded RESTORE Act Council-Selected Restoration Component funds for the Bahia Grande Wetland System Restoration project. Under a subaward with NOAA, Ducks Unlimited, Inc., will complete planning, design, engineering, and construction for a hydrologic restoration project located at the Bahia Grande Channel F site in the Laguna Atascosa Wildlife Refuge, Cameron County, Texas. Completion of planning activities will provide a full understanding of the construction design alternatives at this site and complete environmental compliance requirements to inform implementation work. Implementation will involve placement of designed box culverts under Highway 100 that will divert water flow into a constructed water conveyance channel south of the highway and ultimately into Laguna Larga to restore freshwater flows to 600 acres of aquatic habitat consisting of wetlands and shallow open water.";
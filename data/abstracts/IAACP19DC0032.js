@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["IAACP19DC0032"] = "The U.S. Department of Commerce (DOC), through the National Oceanic and Atmospheric Administration (NOAA) Restoration Center was awarded RESTORE Act Council-Selected Restoration Component funds for the Money Bayou Wetlands Restoration project. The Money Bayou basin includes over 1,800 acres of estuarine and freshwater marsh interspersed with forested wetlands. It drains directly to the Gulf of Mexico between Cape San Blas and St. Vincent Island. Money Bayou basin is now protected within the St. Joseph Bay State Buffer Preserve; however, extensive ditching, road construction, and fire plow lines were constructed across the basin. These alterations disrupt the area's natural hydrology, resulting in degraded wetlands, the loss of aquatic communities, and invasive plant species. Removing prior disturbances that have altered wetland community structure will promote natural water flow and restore historic wetland function by reconnecting natural drainage pathways. Enhancing wetland hydrology and function would restore a mix of natural ecological communities that have been impacted across the Preserve. This project completes the planning, engineering, design, environmental compliance, and construction and monitoring activities required to restore natural hydrology to approximately 1,000 acres of wetlands in the St. Joseph Bay State Buffer Preserve in Florida. It also involves developing plans for a outreach and education plan to engage the public and transfer best practices to restoration practitioners.";
@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["IAACP19DC0067"] = "The U.S. Department of Commerce (DOC), through the National Oceanic and Atmospheric Administration (NOAA) Fisheries- Southeast Regional Office, was awarded RESTORE Act Council-Selected Restoration Component funds for the Commitment and Planning Support (CPS) - NOAA award. The purpose of this award is to enhance collaboration, public engagement, and use of best available science (BAS) to meet requirements of the RESTORE Act Council-Selected Restoration Component and the RESTORE Council's Comprehensive Plan Update commitments to address planning needs of future Funded Priorities Lists (FPLs). NOAA will create a technical assistance and project coordination team to support development of Council-Selected Restoration Component ecosystem restoration projects for future FPLs, and maximize efficiency of environmental compliance processes. NOAA will combine protected resources and habitat technical and regulatory expertise of the Southeast Regional Office (SERO) with restoration expertise and established regional relationships of the Restoration Center (RC) to build this capability. RC and SERO will take a stepwise approach to collaborating with external partners to develop FPL proposals and coordinate across Gulf restoration programs to identify leveraging opportunities and consolidate environmental compliance efforts.";
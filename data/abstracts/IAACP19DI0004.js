@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["IAACP19DI0004"] = "The U.S. Department of the Interior (DOI), through the National Parks Service (NPS) Southeast Regional Office, was awarded RESTORE Act Council-Selected Restoration Component funds for the Jean Lafitte Canal Backfilling project. Prior to the establishment of Jean Lafitte National Historical Park and Preserve (JELA) and before the imposition of stricter regulatory requirements under the wetland provisions of the Clean Water Act, numerous access canals were dredged by oil and gas companies to reach well drilling locations and construct pipelines. The NPS exhausted all regulatory avenues for these operators to take necessary corrective actions and the operations were determined to be abandoned. This project focuses on the restoration of over 16 miles of canals and their associated spoil deposits within the Barataria Preserve unit of JELA. Construction of access canals results in wetland loss, ground and surface water alteration, saltwater intrusion, and soil compaction, and contributes to the introduction and spread of invasive species. Project area canals will generally be restored by backfilling, degrading spoil banks to meet the level of the surrounding wetlands and partially filling the open water of the canals with the degraded spoil and vegetative material. The canal edges will revert to marsh, swamp, and shallow water habitat through natural processes, thereby recreating freshwater wetlands.";
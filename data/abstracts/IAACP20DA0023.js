@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["IAACP20DA0023"] = "The U.S. Department of Agriculture (USDA), through the Natural Resources Conservation Service (USDA NRCS) Florida State Office, was awarded RESTORE Act Council-Selected Restoration Component funds for the planning and implementation of the Gulf Coast Conservation Reserve Program (GCCRP) in Florida. Under a subaward with USDA NRCS, Sigma Consulting Group, Inc. will establish the Florida GCCRP for the purpose of protecting and restoring critical wildlife habitat and improving water quality through the development of conservation plans. The GCCRP will be operated similarly to and in parallel with the other conservation/restoration programs. The intent of the program is to allow for conservation planning on private lands including, but not limited to ecosystem restoration by conducting soil and water conservation for the benefit of water quality to priority bays and estuaries. The health of the Gulf of Mexico depends upon the health of its estuaries, and the health of those estuaries is influenced by what happens upstream along tributary rivers including the Mississippi. The program will complete site-specific conservation planning, engineering designs, and environmental evaluations on agricultural and forested lands in Santa Rosa County, Florida. A reduction in nutrient and sediment run-off to the Coldwater Creek and Blackwater River will be the result of addressing gullies as a part of this project.";
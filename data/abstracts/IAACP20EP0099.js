@@ -0,0 +1,3 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};
+window.GCERC_DATA.abstracts["IAACP20EP0099"] = "The U.S. Environmental Protection Agency (EPA) was awarded RESTORE Act Council-Selected Restoration Component funds for implementation of the Mobile Bay National Estuary Program. Under a subaward with EPA, The Mobile Bay National Estuary Program (MBNEP) will conduct the RESTORE Mobile Bay National Estuary Program - Implementation component, which includes the implementation of a stream restoration plan for restoring the Twelve Mile Creek Watershed. It also includes the implementation of an invasive species control program focused on aquatic vegetation in Three Mile Creek, as well as quality assurance and restoration monitoring.";
@@ -0,0 +1,2 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.amendments = {"GNSSP20AL0001":[{"date":"2020-04-16","type":""},{"date":"2023-04-25","type":"Monetary Amendment Type"},{"date":"2024-11-12","type":"Monetary Amendment Type"},{"date":"2025-09-10","type":"Grant Closeout"}],"GNSSP20AL0002":[{"date":"2020-04-14","type":""},{"date":"2023-03-07","type":"Monetary Amendment Type"},{"date":"2024-05-20","type":"Monetary Amendment Type"}],"GNSSP20AL0003":[{"date":"2020-04-16","type":""},{"date":"2022-10-19","type":"Monetary Amendment Type"},{"date":"2024-05-20","type":"Monetary Amendment Type"},{"date":"2026-06-12","type":"Monetary Amendment Type"}],"GNSSP20AL0004":[{"date":"2020-04-16","type":""},{"date":"2022-04-08","type":"Non-Monetary Amendment Type"},{"date":"2022-09-08","type":"Monetary Amendment Type"},{"date":"2023-08-02","type":"Non-Monetary Amendment Type"},{"date":"2023-12-13","type":"Non-Monetary Amendment Type"},{"date":"2024-08-08","type":"Grant Closeout"}],"GNSSP20AL0005":[{"date":"2020-04-16","type":""},{"date":"2023-02-15","type":"Monetary Amendment Type"},{"date":"2024-06-04","type":"Non-Monetary Amendment Type"},{"date":"2026-03-23","type":"Non-Monetary Amendment Type"}],"GNSSP20AL0006":[{"date":"2020-04-16","type":""},{"date":"2022-04-08","type":"Non-Monetary Amendment Type"},{"date":"2022-09-08","type":"Monetary Amendment Type"},{"date":"2023-02-15","type":"Monetary Amendment Type"},{"date":"2025-06-12","type":"Grant Closeout"}],"GNSSP20AL0007":[{"date":"2020-04-16","type":""},{"date":"2022-04-25","type":"Non-Monetary Amendment Type"},{"date":"2023-05-22","type":"Monetary Amendment Type"},{"date":"2024-08-05","type":"Monetary Amendment Type"},{"date":"2026-04-06","type":"Monetary Amendment Type"}],"GNSSP20AL0008":[{"date":"2020-04-22","type":""},{"date":"2021-05-10","type":"Non-Monetary Amendment Type"},{"date":"2024-07-25","type":"Monetary Amendment Type"},{"date":"2026-03-30","type":"Non-Monetary Amendment Type"}],"GNSSP20AL0009":[{"date":"2020-06-01","type":""},{"date":"2022-05-25","type":"Non-Monetary Amendment Type"},{"date":"2023-04-20","type":"Monetary Amendment Type"},{"date":"2024-08-07","type":"Non-Monetary Amendment Type"}],"GNSSP20AL0011":[{"date":"2020-07-27","type":""},{"date":"2023-05-15","type":"Monetary Amendment Type"},{"date":"2024-06-11","type":"Monetary Amendment Type"},{"date":"2025-08-13","type":"Monetary Amendment Type"}],"GNSSP20FL0010":[{"date":"2023-09-15","type":"Monetary Amendment Type"},{"date":"2025-06-16","type":"Monetary Amendment Type"},{"date":"2020-06-01","type":""},{"date":"2021-11-12","type":"Non-Monetary Amendment Type"},{"date":"2023-03-23","type":"Non-Monetary Amendment Type"}],"GNSSP20FL0012":[{"date":"2020-09-18","type":""},{"date":"2022-07-13","type":"Monetary Amendment Type"},{"date":"2022-07-13","type":"Non-Monetary Amendment Type"},{"date":"2023-05-02","type":"Monetary Amendment Type"}],"GNSSP20FL0013":[{"date":"2020-09-22","type":""},{"date":"2025-05-01","type":"Non-Monetary Amendment Type"}],"GNSSP21AL0014":[{"date":"2020-12-17","type":""},{"date":"2023-06-22","type":"Monetary Amendment Type"},{"date":"2024-08-05","type":"Monetary Amendment Type"},{"date":"2025-03-17","type":"Non-Monetary Amendment Type"},{"date":"","type":"Monetary Amendment Type"}],"GNSSP21AL0016":[{"date":"2020-12-17","type":""},{"date":"2022-07-12","type":"Non-Monetary Amendment Type"},{"date":"2022-09-08","type":"Monetary Amendment Type"},{"date":"2023-02-07","type":"Non-Monetary Amendment Type"},{"date":"2024-08-12","type":"Grant Closeout"}],"GNSSP21AL0019":[{"date":"2021-03-05","type":""},{"date":"2023-03-02","type":"Monetary Amendment Type"},{"date":"2023-12-07","type":"Non-Monetary Amendment Type"},{"date":"2024-10-17","type":"Non-Monetary Amendment Type"}],"GNSSP21AL0021":[{"date":"2021-04-06","type":""},{"date":"2024-08-08","type":"Grant Closeout"}],"GNSSP21AL0024":[{"date":"2021-04-26","type":""},{"date":"2022-03-23","type":"Non-Monetary Amendment Type"},{"date":"2024-03-21","type":"Non-Monetary Amendment Type"},{"date":"2024-11-12","type":"Monetary Amendment Type"}],"GNSSP21AL0026":[{"date":"2021-05-12","type":""},{"date":"2023-05-22","type":"Monetary Amendment Type"},{"date":"2025-01-24","type":"Grant Closeout"}],"GNSSP21AL0027":[{"date":"2021-09-07","type":""}],"GNSSP21FL0020":[{"date":"2021-03-05","type":""},{"date":"2023-09-06","type":"Monetary Amendment Type"}],"GNSSP21FL0022":[{"date":"2021-04-26","type":""},{"date":"2024-12-19","type":"Monetary Amendment Type"}],"GNSSP21FL0023":[{"date":"2024-12-16","type":"Monetary Amendment Type"},{"date":"2021-04-26","type":""},{"date":"2022-12-15","type":"Non-Monetary Amendment Type"}],"GNSSP21FL0025":[{"date":"2021-05-12","type":""},{"date":"2024-03-11","type":"Non-Monetary Amendment Type"},{"date":"2026-02-24","type":"Non-Monetary Amendment Type"}],"GNSSP21FL0028":[{"date":"2022-03-23","type":""}],"GNSSP21FL0029":[{"date":"2021-08-05","type":""},{"date":"2022-12-02","type":"Monetary Amendment Type"},{"date":"2024-11-12","type":"Grant Closeout"}],"GNSSP21FL0030":[{"date":"2021-09-07","type":""},{"date":"2024-11-12","type":"Grant Closeout"}],"GNSSP21LA0018":[{"date":"2021-02-05","type":""},{"date":"2023-02-21","type":"Monetary Amendment Type"},{"date":"2026-08-13","type":"Monetary Amendment Type"}],"GNSSP21MS0015":[{"date":"2020-12-17","type":""},{"date":"2025-06-05","type":"Non-Monetary Amendment Type"}],"GNSSP21MS0017":[{"date":"2021-02-05","type":""},{"date":"2022-07-25","type":"Non-Monetary Amendment Type"},{"date":"2024-10-21","type":"Non-Monetary Amendment Type"},{"date":"2025-08-13","type":"Monetary Amendment Type"}],"GNSSP22AL0031":[{"date":"2021-12-17","type":""},{"date":"2023-08-08","type":"Monetary Amendment Type"},{"date":"2024-11-12","type":"Monetary Amendment Type"}],"GNSSP22AL0032":[{"date":"2022-02-08","type":""},{"date":"2024-01-09","type":"Non-Monetary Amendment Type"},{"date":"2025-08-12","type":"Non-Monetary Amendment Type"}],"GNSSP22AL0033":[{"date":"2022-01-13","type":""},{"date":"2025-05-09","type":"Monetary Amendment Type"}],"GNSSP22AL0038":[{"date":"2022-05-10","type":""},{"date":"","type":"Monetary Amendment Type"}],"GNSSP22AL0042":[{"date":"2022-05-13","type":""},{"date":"2023-05-21","type":"Monetary Amendment Type"},{"date":"2025-08-13","type":"Monetary Amendment Type"}],"GNSSP22AL0043":[{"date":"2022-05-13","type":""},{"date":"2022-09-01","type":"Monetary Amendment Type"},{"date":"2023-11-08","type":"Non-Monetary Amendment Type"},{"date":"2024-06-11","type":"Monetary Amendment Type"},{"date":"2024-11-12","type":"Non-Monetary Amendment Type"},{"date":"2025-05-29","type":"Non-Monetary Amendment Type"},{"date":"2026-08-12","type":"Grant Closeout"}],"GNSSP22FL0034":[{"date":"2022-03-11","type":""},{"date":"2023-08-17","type":"Monetary Amendment Type"},{"date":"2026-03-03","type":"Non-Monetary Amendment Type"}],"GNSSP22FL0036":[{"date":"2022-05-11","type":""},{"date":"2023-02-16","type":"Monetary Amendment Type"},{"date":"2024-11-12","type":"Monetary Amendment Type"}],"GNSSP22FL0037":[{"date":"2022-05-10","type":""},{"date":"2024-03-21","type":"Non-Monetary Amendment Type"},{"date":"2025-11-07","type":"Monetary Amendment Type"}],"GNSSP22FL0039":[{"date":"2022-05-11","type":""},{"date":"2023-07-17","type":"Monetary Amendment Type"},{"date":"2025-05-08","type":"Monetary Amendment Type"}],"GNSSP22FL0040":[{"date":"2022-05-12","type":""},{"date":"2024-06-04","type":"Non-Monetary Amendment Type"},{"date":"2026-08-10","type":"Monetary Amendment Type"},{"date":"2026-01-20","type":"Non-Monetary Amendment Type"}],"GNSSP22FL0041":[{"date":"2022-05-12","type":""},{"date":"2024-10-21","type":"Non-Monetary Amendment Type"},{"date":"2025-01-24","type":"Grant Closeout"}],"GNSSP22FL0044":[{"date":"2022-09-09","type":""}],"GNSSP22TX0035":[{"date":"2022-04-20","type":""},{"date":"2023-05-22","type":"Non-Monetary Amendment Type"},{"date":"2024-06-20","type":"Monetary Amendment Type"},{"date":"2025-09-03","type":"Non-Monetary Amendment Type"},{"date":"2025-12-04","type":"Non-Monetary Amendment Type"},{"date":"2026-08-06","type":"Monetary Amendment Type"}],"GNSSP23FL0046":[{"date":"2023-02-22","type":""},{"date":"2024-11-18","type":"Non-Monetary Amendment Type"}],"GNSSP23FL0047":[{"date":"2023-03-08","type":""},{"date":"2025-04-03","type":"Non-Monetary Amendment Type"}],"GNSSP23FL0048":[{"date":"2023-05-25","type":""},{"date":"2026-01-12","type":"Non-Monetary Amendment Type"}],"GNSSP23FL0049":[{"date":"2023-05-25","type":""},{"date":"2024-08-02","type":"Non-Monetary Amendment Type"},{"date":"2026-05-08","type":"Non-Monetary Amendment Type"}],"GNSSP23FL0050":[{"date":"2023-06-26","type":""},{"date":"2025-04-17","type":"Non-Monetary Amendment Type"},{"date":"2026-03-04","type":"Non-Monetary Amendment Type"},{"date":"2026-07-06","type":"Grant Closeout"}],"GNSSP23FL0052":[{"date":"2023-08-21","type":""}],"GNSSP23FL0054":[{"date":"2024-01-16","type":""}],"GNSSP23MS0045":[{"date":"2023-02-16","type":""},{"date":"2025-02-20","type":"Non-Monetary Amendment Type"},{"date":"2026-07-08","type":"Non-Monetary Amendment Type"}],"GNSSP23MS0051":[{"date":"2023-07-07","type":""},{"date":"2026-06-04","type":"Non-Monetary Amendment Type"}],"GNSSP23TX0053":[{"date":"2023-08-21","type":""},{"date":"2025-06-23","type":"Monetary Amendment Type"},{"date":"2026-07-09","type":"Non-Monetary Amendment Type"}],"GNSSP24FL0055":[{"date":"2024-05-20","type":""},{"date":"","type":"Monetary Amendment Type"}],"GNSSP24FL0057":[{"date":"2024-06-24","type":""}],"GNSSP24MS0056":[{"date":"2024-03-13","type":""},{"date":"2025-09-02","type":"Monetary Amendment Type"}],"GNSSP24MS0058":[{"date":"2024-07-02","type":""}],"GNSSP24MS0059":[{"date":"2024-07-08","type":""}],"GNSSP24MS0060":[{"date":"2024-08-22","type":""}],"GNSSP25AL0063":[{"date":"2025-01-23","type":""},{"date":"2025-10-29","type":"Non-Monetary Amendment Type"},{"date":"2026-07-06","type":"Monetary Amendment Type"}],"GNSSP25FL0064":[{"date":"2025-03-03","type":""}],"GNSSP25FL0067":[{"date":"2025-04-01","type":""}],"GNSSP25FL0068":[{"date":"2025-04-01","type":""}],"GNSSP25FL0074":[{"date":"2025-07-14","type":""}],"GNSSP25LA0072":[{"date":"2025-06-12","type":""}],"GNSSP25MS0061":[{"date":"2024-12-19","type":""}],"GNSSP25MS0062":[{"date":"2024-12-19","type":""}],"GNSSP25MS0065":[{"date":"2025-07-01","type":""},{"date":"","type":"Monetary Amendment Type"}],"GNSSP25MS0066":[{"date":"2025-06-02","type":""}],"GNSSP25MS0069":[{"date":"2025-05-22","type":""}],"GNSSP25MS0070":[{"date":"2025-05-22","type":""}],"GNSSP25MS0071":[{"date":"2025-04-18","type":""}],"GNSSP25MS0073":[{"date":"2025-05-22","type":""}],"GNSSP26MS0075":[{"date":"2025-11-12","type":""}],"GNSSP26MS0076":[{"date":"2025-11-13","type":""}],"GNSSP26MS0077":[{"date":"2025-12-03","type":""}],"GNSSP26MS0078":[{"date":"2026-04-01","type":""}],"GNSSP26MS0079":[{"date":"2026-04-16","type":""}],"GNSSP26MS0080":[{"date":"2026-04-16","type":""}],"GNSSP26MS0081":[{"date":"2026-07-23","type":""}],"GNSSP26MS0082":[{"date":"2026-08-10","type":""}],"GNTCP16LA0024":[{"date":"2016-09-28","type":""},{"date":"2019-01-25","type":""},{"date":"2020-07-24","type":"Non-Monetary Amendment Type"},{"date":"2023-09-14","type":"Grant Closeout"}],"GNTCP17FL0008":[{"date":"2017-07-10","type":""},{"date":"2022-06-17","type":"Non-Monetary Amendment Type"},{"date":"2024-05-14","type":"Non-Monetary Amendment Type"},{"date":"2026-05-21","type":"Non-Monetary Amendment Type"},{"date":"2026-08-12","type":"Grant Closeout"}],"GNTCP17FL0015":[{"date":"2017-08-22","type":""},{"date":"2022-06-17","type":"Non-Monetary Amendment Type"},{"date":"2024-05-15","type":"Non-Monetary Amendment Type"}],"GNTCP17FL0018":[{"date":"2017-04-13","type":""},{"date":"2020-01-06","type":""},{"date":"2021-01-11","type":"Non-Monetary Amendment Type"},{"date":"2021-05-12","type":"Non-Monetary Amendment Type"},{"date":"2024-03-11","type":"Non-Monetary Amendment Type"},{"date":"2026-02-24","type":"Non-Monetary Amendment Type"}],"GNTCP17FL0026":[{"date":"2017-06-14","type":""},{"date":"2020-07-24","type":"Non-Monetary Amendment Type"},{"date":"2022-12-19","type":"Non-Monetary Amendment Type"},{"date":"2023-07-21","type":"Non-Monetary Amendment Type"}],"GNTCP17FL0039":[{"date":"2017-03-30","type":""},{"date":"2020-06-26","type":"Non-Monetary Amendment Type"},{"date":"2020-12-17","type":"Non-Monetary Amendment Type"},{"date":"2023-09-14","type":"Grant Closeout"}],"GNTCP17FL0040":[{"date":"2025-01-14","type":"Monetary Amendment Type"},{"date":"","type":"Monetary Amendment Type"},{"date":"2016-12-15","type":""},{"date":"2019-01-26","type":""},{"date":"2020-07-24","type":"Non-Monetary Amendment Type"},{"date":"2021-09-09","type":"Non-Monetary Amendment Type"},{"date":"2022-12-08","type":"Non-Monetary Amendment Type"},{"date":"2024-11-04","type":"Non-Monetary Amendment Type"}],"GNTCP17LA0013":[{"date":"2016-10-26","type":""},{"date":"2017-11-14","type":""},{"date":"2020-04-28","type":"Non-Monetary Amendment Type"},{"date":"2023-09-14","type":"Grant Closeout"}],"GNTCP17LA0025":[{"date":"2016-10-31","type":""},{"date":"2019-01-29","type":""},{"date":"2020-12-17","type":"Non-Monetary Amendment Type"},{"date":"2023-09-14","type":"Grant Closeout"}],"GNTCP17LA0044":[{"date":"2017-09-13","type":""},{"date":"2020-09-14","type":"Non-Monetary Amendment Type"},{"date":"2022-09-13","type":"Non-Monetary Amendment Type"},{"date":"2023-03-23","type":"Non-Monetary Amendment Type"},{"date":"2025-09-02","type":"Non-Monetary Amendment Type"}],"GNTCP17MS0020":[{"date":"2016-11-16","type":""},{"date":"2019-01-25","type":""},{"date":"2023-09-14","type":"Grant Closeout"}],"GNTCP17MS0022":[{"date":"2016-11-16","type":""},{"date":"2019-01-25","type":""},{"date":"2019-12-20","type":""},{"date":"2020-08-24","type":"Non-Monetary Amendment Type"},{"date":"2021-11-12","type":"Non-Monetary Amendment Type"},{"date":"2023-04-10","type":"Non-Monetary Amendment Type"},{"date":"2026-07-07","type":"Grant Closeout"}],"GNTCP17TX0009":[{"date":"2020-07-24","type":"Non-Monetary Amendment Type"},{"date":"2020-11-19","type":"Non-Monetary Amendment Type"},{"date":"2023-09-11","type":"Grant Closeout"},{"date":"2016-12-27","type":""},{"date":"2017-04-12","type":""},{"date":"2017-09-11","type":""},{"date":"2018-06-12","type":""},{"date":"2019-01-15","type":""},{"date":"2019-02-28","type":""},{"date":"2019-07-01","type":""}],"GNTCP17TX0010":[{"date":"2023-09-11","type":"Grant Closeout"},{"date":"2016-11-28","type":""},{"date":"2017-02-28","type":""},{"date":"2017-04-13","type":""}],"GNTCP18AL0064":[{"date":"2023-04-04","type":"Non-Monetary Amendment Type"},{"date":"2025-01-21","type":"Monetary Amendment Type"},{"date":"2018-05-15","type":""}],"GNTCP18AL0066":[{"date":"2018-09-10","type":""},{"date":"2020-07-24","type":"Non-Monetary Amendment Type"},{"date":"2022-08-29","type":"Non-Monetary Amendment Type"},{"date":"2023-06-07","type":"Non-Monetary Amendment Type"},{"date":"2024-12-04","type":"Non-Monetary Amendment Type"},{"date":"2025-09-03","type":"Non-Monetary Amendment Type"}],"GNTCP18AL0068":[{"date":"2018-09-21","type":""},{"date":"2023-06-15","type":"Non-Monetary Amendment Type"},{"date":"2025-02-24","type":"Non-Monetary Amendment Type"}],"GNTCP18FL0047":[{"date":"2018-04-02","type":""},{"date":"2020-01-27","type":""},{"date":"2020-07-24","type":"Non-Monetary Amendment Type"},{"date":"2024-11-04","type":"Grant Closeout"}],"GNTCP18FL0054":[{"date":"2023-02-09","type":"Non-Monetary Amendment Type"},{"date":"2026-03-25","type":"Monetary Amendment Type"},{"date":"2018-04-18","type":""}],"GNTCP18LA0035":[{"date":"2018-04-18","type":""},{"date":"2021-09-20","type":"Non-Monetary Amendment Type"},{"date":"2023-02-14","type":"Non-Monetary Amendment Type"},{"date":"2024-11-04","type":"Non-Monetary Amendment Type"}],"GNTCP18LA0055":[{"date":"2020-10-28","type":"Non-Monetary Amendment Type"},{"date":"2023-02-09","type":"Non-Monetary Amendment Type"},{"date":"2024-12-16","type":"Monetary Amendment Type"},{"date":"2018-05-15","type":""}],"GNTCP18MS0056":[{"date":"2023-03-14","type":"Non-Monetary Amendment Type"},{"date":"2024-11-25","type":"Non-Monetary Amendment Type"},{"date":"2026-05-21","type":"Non-Monetary Amendment Type"},{"date":"2018-06-07","type":""}],"GNTCP18TX0011":[{"date":"2017-10-24","type":""},{"date":"2018-06-12","type":""},{"date":"2019-05-29","type":""},{"date":"2023-09-15","type":"Grant Closeout"}],"GNTCP18TX0012":[{"date":"2018-07-27","type":""},{"date":"2019-11-19","type":""},{"date":"2021-05-18","type":"Non-Monetary Amendment Type"},{"date":"2025-07-15","type":"Grant Closeout"}],"GNTCP18TX0061":[{"date":"2018-05-15","type":""},{"date":"2023-04-04","type":"Non-Monetary Amendment Type"},{"date":"2025-04-01","type":"Monetary Amendment Type"}],"GNTCP19AL0082":[{"date":"2022-02-01","type":"Non-Monetary Amendment Type"},{"date":"2024-02-08","type":"Non-Monetary Amendment Type"},{"date":"2026-07-06","type":"Grant Closeout"},{"date":"2019-04-01","type":""}],"GNTCP19AL0085":[{"date":"2019-04-15","type":""},{"date":"2021-04-21","type":"Non-Monetary Amendment Type"},{"date":"2024-01-09","type":"Non-Monetary Amendment Type"},{"date":"2025-07-02","type":"Non-Monetary Amendment Type"}],"GNTCP19MS0060":[{"date":"2018-10-24","type":""},{"date":"2019-02-25","type":""},{"date":"2023-02-08","type":"Non-Monetary Amendment Type"},{"date":"2024-11-12","type":"Non-Monetary Amendment Type"},{"date":"2025-02-26","type":"Non-Monetary Amendment Type"}],"GNTCP19MS0062":[{"date":"2019-06-04","type":""},{"date":"2022-06-17","type":"Non-Monetary Amendment Type"},{"date":"2023-06-13","type":"Non-Monetary Amendment Type"},{"date":"2024-08-16","type":"Monetary Amendment Type"}],"GNTCP20AP0104":[{"date":"2020-01-27","type":""},{"date":"2021-07-26","type":"Non-Monetary Amendment Type"},{"date":"2022-04-01","type":"Non-Monetary Amendment Type"},{"date":"2023-04-04","type":"Non-Monetary Amendment Type"},{"date":"2024-12-18","type":"Non-Monetary Amendment Type"}],"GNTSP16FL0021":[{"date":"2016-06-23","type":""},{"date":"2018-12-05","type":""},{"date":"2019-05-20","type":""},{"date":"2019-11-19","type":""},{"date":"2021-04-21","type":"Grant Closeout"}],"GNTSP16MS0019":[{"date":"2016-05-10","type":""},{"date":"2016-06-29","type":""},{"date":"2018-09-07","type":""},{"date":"2020-02-18","type":"Grant Closeout"}],"GNTSP17LA0046":[{"date":"2017-08-31","type":""},{"date":"2020-09-14","type":"Monetary Amendment Type"},{"date":"2020-06-25","type":"Non-Monetary Amendment Type"},{"date":"2023-02-08","type":"Non-Monetary Amendment Type"},{"date":"2024-06-24","type":"Monetary Amendment Type"}],"GNTSP17TX0042":[{"date":"2017-04-06","type":""},{"date":"2018-01-19","type":""},{"date":"2018-07-03","type":""},{"date":"2020-02-12","type":""},{"date":"2023-09-11","type":"Grant Closeout"}],"GNTSP18LA0049":[{"date":"2018-04-13","type":""},{"date":"2018-05-17","type":""},{"date":"2019-11-19","type":""},{"date":"2021-10-19","type":"Non-Monetary Amendment Type"},{"date":"2022-10-27","type":"Non-Monetary Amendment Type"},{"date":"2023-10-12","type":"Non-Monetary Amendment Type"},{"date":"2026-08-12","type":"Grant Closeout"}],"GNTSP18MS0048":[{"date":"2018-09-04","type":""},{"date":"2022-05-02","type":"Monetary Amendment Type"},{"date":"2023-06-26","type":"Monetary Amendment Type"},{"date":"2024-06-27","type":"Monetary Amendment Type"},{"date":"2026-07-07","type":"Grant Closeout"}],"GNTSP18MS0053":[{"date":"2018-09-07","type":""},{"date":"2020-07-23","type":"Non-Monetary Amendment Type"},{"date":"2023-09-15","type":"Grant Closeout"}],"GNTSP18MS0058":[{"date":"2018-09-21","type":""},{"date":"2019-10-29","type":""},{"date":"2020-01-22","type":""},{"date":"2021-02-10","type":"Non-Monetary Amendment Type"},{"date":"2021-11-12","type":"Non-Monetary Amendment Type"},{"date":"2022-09-22","type":"Non-Monetary Amendment Type"},{"date":"2023-12-17","type":"Non-Monetary Amendment Type"},{"date":"2025-09-02","type":"Monetary Amendment Type"},{"date":"2026-08-12","type":"Monetary Amendment Type"}],"GNTSP19FL0077":[{"date":"2019-03-11","type":""},{"date":"2020-02-12","type":"Grant Closeout"}],"GNTSP19FL0086":[{"date":"2019-09-17","type":""},{"date":"2020-09-03","type":"Non-Monetary Amendment Type"},{"date":"2023-09-14","type":"Grant Closeout"}],"GNTSP19LA0070":[{"date":"2019-06-18","type":""},{"date":"2020-07-24","type":"Non-Monetary Amendment Type"},{"date":"2021-10-19","type":"Non-Monetary Amendment Type"},{"date":"2022-06-16","type":"Non-Monetary Amendment Type"},{"date":"2025-06-12","type":"Grant Closeout"}],"GNTSP19MS0075":[{"date":"2019-04-16","type":""},{"date":"2024-04-16","type":"Non-Monetary Amendment Type"}],"GNTSP19MS0080":[{"date":"2019-08-01","type":""},{"date":"2024-07-26","type":"Non-Monetary Amendment Type"}],"GNTSP20AL0079":[{"date":"2020-01-27","type":""},{"date":"2023-09-11","type":"Grant Closeout"}],"GNTSP20AL0094":[{"date":"2019-12-18","type":""},{"date":"2023-06-22","type":"Monetary Amendment Type"},{"date":"2024-08-05","type":"Monetary Amendment Type"},{"date":"2025-07-15","type":"Grant Closeout"}],"GNTSP20AL0095":[{"date":"2020-01-27","type":""},{"date":"2022-09-09","type":"Monetary Amendment Type"},{"date":"2023-02-09","type":"Non-Monetary Amendment Type"},{"date":"2024-01-24","type":"Non-Monetary Amendment Type"},{"date":"2024-05-16","type":"Non-Monetary Amendment Type"},{"date":"2024-12-04","type":"Non-Monetary Amendment Type"},{"date":"2026-07-06","type":"Grant Closeout"}],"GNTSP20AL0096":[{"date":"2020-02-04","type":""},{"date":"2020-07-24","type":"Non-Monetary Amendment Type"},{"date":"2023-06-13","type":"Monetary Amendment Type"},{"date":"2024-08-08","type":"Monetary Amendment Type"},{"date":"2026-07-06","type":"Grant Closeout"}],"GNTSP20AL0120":[{"date":"2020-02-13","type":""},{"date":"2023-05-22","type":"Monetary Amendment Type"},{"date":"2024-08-08","type":"Monetary Amendment Type"}],"GNTSP20FL0088":[{"date":"2021-06-24","type":"Non-Monetary Amendment Type"},{"date":"2024-08-08","type":"Grant Closeout"},{"date":"2019-10-29","type":""}],"GNTSP20FL0089":[{"date":"2020-09-24","type":"Non-Monetary Amendment Type"},{"date":"2024-08-08","type":"Grant Closeout"},{"date":"2019-10-29","type":""}],"GNTSP20FL0090":[{"date":"2020-02-08","type":""},{"date":"2020-07-24","type":"Non-Monetary Amendment Type"},{"date":"2024-08-02","type":"Non-Monetary Amendment Type"}],"GNTSP20FL0091":[{"date":"2019-11-12","type":""},{"date":"2026-01-12","type":"Non-Monetary Amendment Type"}],"GNTSP20FL0092":[{"date":"2024-05-20","type":"Monetary Amendment Type"},{"date":"2020-01-27","type":""},{"date":"2021-02-12","type":"Non-Monetary Amendment Type"},{"date":"2023-09-18","type":"Non-Monetary Amendment Type"}],"GNTSP20FL0097":[{"date":"2020-01-27","type":""},{"date":"2026-01-26","type":"Grant Closeout"}],"GNTSP20FL0098":[{"date":"2025-04-09","type":"Monetary Amendment Type"},{"date":"2020-02-03","type":""}],"GNTSP20FL0105":[{"date":"2020-02-03","type":""},{"date":"2022-02-02","type":"Non-Monetary Amendment Type"},{"date":"2022-09-01","type":"Monetary Amendment Type"},{"date":"2026-07-06","type":"Grant Closeout"}],"GNTSP20FL0106":[{"date":"2020-02-04","type":""},{"date":"2020-10-28","type":"Non-Monetary Amendment Type"},{"date":"2024-08-08","type":"Grant Closeout"}],"GNTSP20FL0107":[{"date":"2024-10-17","type":"Non-Monetary Amendment Type"},{"date":"2020-02-03","type":""},{"date":"2020-07-24","type":"Non-Monetary Amendment Type"},{"date":"2022-12-15","type":"Non-Monetary Amendment Type"}],"GNTSP20FL0110":[{"date":"2025-02-24","type":"Non-Monetary Amendment Type"},{"date":"2025-11-07","type":"Monetary Amendment Type"},{"date":"2020-02-04","type":""},{"date":"2021-11-15","type":"Monetary Amendment Type"}],"GNTSP20LA0071":[{"date":"2019-12-20","type":""},{"date":"2020-07-24","type":"Non-Monetary Amendment Type"},{"date":"2024-04-22","type":"Non-Monetary Amendment Type"}],"GNTSP20LA0072":[{"date":"2020-02-03","type":""},{"date":"2020-07-24","type":"Non-Monetary Amendment Type"},{"date":"2022-08-31","type":"Non-Monetary Amendment Type"},{"date":"2024-12-17","type":"Non-Monetary Amendment Type"}],"GNTSP20LA0076":[{"date":"2020-01-27","type":""},{"date":"2020-07-24","type":"Non-Monetary Amendment Type"},{"date":"2022-04-12","type":"Non-Monetary Amendment Type"},{"date":"2024-11-04","type":"Non-Monetary Amendment Type"}],"GNTSP20LA0081":[{"date":"2020-02-17","type":""},{"date":"2020-07-24","type":"Non-Monetary Amendment Type"},{"date":"2021-08-25","type":"Non-Monetary Amendment Type"},{"date":"2023-08-01","type":"Non-Monetary Amendment Type"},{"date":"2025-09-02","type":"Non-Monetary Amendment Type"}],"GNTSP20LA0083":[{"date":"2020-02-08","type":""},{"date":"2020-07-24","type":"Non-Monetary Amendment Type"},{"date":"2022-06-16","type":"Non-Monetary Amendment Type"},{"date":"2024-03-06","type":"Non-Monetary Amendment Type"}],"GNTSP20MS0084":[{"date":"2019-11-07","type":""},{"date":"2024-01-23","type":"Non-Monetary Amendment Type"},{"date":"2024-07-26","type":"Non-Monetary Amendment Type"}],"GNTSP20MS0087":[{"date":"2019-10-29","type":""},{"date":"2022-10-24","type":"Non-Monetary Amendment Type"},{"date":"2024-10-17","type":"Non-Monetary Amendment Type"}],"GNTSP20MS0103":[{"date":"2020-01-28","type":""},{"date":"2024-02-26","type":"Monetary Amendment Type"}],"GNTSP20MS0128":[{"date":"2020-01-27","type":""},{"date":"2023-02-09","type":"Non-Monetary Amendment Type"},{"date":"2025-05-20","type":"Non-Monetary Amendment Type"},{"date":"","type":"Monetary Amendment Type"}],"GNTSP20TX0100":[{"date":"2020-01-27","type":""},{"date":"2021-12-16","type":"Non-Monetary Amendment Type"},{"date":"2023-07-17","type":"Monetary Amendment Type"},{"date":"2025-06-23","type":"Monetary Amendment Type"},{"date":"2026-07-23","type":"Monetary Amendment Type"}],"GT1CP21AL0001":[{"date":"2021-01-22","type":""},{"date":"2025-12-19","type":"Non-Monetary Amendment Type"}],"GT1CP23AL0003":[{"date":"2023-06-22","type":""},{"date":"2025-05-08","type":"Non-Monetary Amendment Type"},{"date":"2026-04-02","type":"Non-Monetary Amendment Type"}],"GT1CP23MS0002":[{"date":"2023-04-11","type":""},{"date":"2025-02-24","type":"Non-Monetary Amendment Type"},{"date":"2026-02-25","type":"Non-Monetary Amendment Type"}],"GT3CP22AL0001":[{"date":"2021-12-01","type":""},{"date":"2024-05-23","type":"Monetary Amendment Type"}],"GT3CP22FL0002":[{"date":"2022-03-01","type":""},{"date":"2026-02-11","type":"Grant Closeout"}],"GT3CP22FL0003":[{"date":"2022-06-16","type":""},{"date":"2024-04-22","type":"Non-Monetary Amendment Type"},{"date":"2025-06-16","type":"Monetary Amendment Type"},{"date":"","type":"Monetary Amendment Type"}],"GT3CP22FL0004":[{"date":"2022-06-16","type":""},{"date":"2023-11-09","type":"Non-Monetary Amendment Type"},{"date":"","type":"Monetary Amendment Type"}],"GT3CP22FL0006":[{"date":"2022-09-09","type":""},{"date":"2024-05-06","type":"Non-Monetary Amendment Type"},{"date":"","type":"Monetary Amendment Type"}],"GT3CP22TX0005":[{"date":"2022-09-09","type":""},{"date":"2024-11-08","type":"Non-Monetary Amendment Type"},{"date":"2025-09-02","type":"Non-Monetary Amendment Type"},{"date":"2026-07-13","type":"Monetary Amendment Type"}],"GT3CP23AL0007":[{"date":"2023-03-06","type":""},{"date":"2025-11-17","type":"Non-Monetary Amendment Type"}],"GT3CP23MS0008":[{"date":"2023-09-07","type":""}],"GT3CP24AL0010":[{"date":"2024-03-13","type":""},{"date":"2024-11-12","type":"Monetary Amendment Type"},{"date":"2026-03-19","type":"Monetary Amendment Type"}],"GT3CP24LA0009":[{"date":"2024-03-13","type":""}],"GT3CP26TX0011":[{"date":"2026-03-13","type":""}],"GT3CP26TX0012":[{"date":"2026-07-06","type":""}],"IA1CP21CM0001":[{"date":"2021-04-02","type":""},{"date":"2022-09-07","type":"Non-Monetary Amendment Type"},{"date":"2023-09-19","type":"Non-Monetary Amendment Type"},{"date":"2025-09-11","type":"Grant Closeout"}],"IA1CP21CM0002":[{"date":"2021-08-25","type":""}],"IA1CP23CM0003":[{"date":"2023-05-23","type":""},{"date":"2025-03-20","type":"Non-Monetary Amendment Type"}],"IA1CP25CM0004":[{"date":"2025-06-26","type":""}],"IA3CP21CM0001":[{"date":"2021-07-26","type":""},{"date":"2021-08-05","type":"Non-Monetary Amendment Type"}],"IA3CP22CM0002":[{"date":"2022-05-05","type":""},{"date":"2026-04-20","type":"Non-Monetary Amendment Type"}],"IA3CP22CM0003":[{"date":"2022-06-01","type":""},{"date":"2024-06-20","type":"Non-Monetary Amendment Type"}],"IA3CP23CM0004":[{"date":"2023-05-10","type":""},{"date":"2026-07-13","type":"Non-Monetary Amendment Type"}],"IA3CP23CM0005":[{"date":"2023-09-18","type":""},{"date":"2023-09-20","type":"Non-Monetary Amendment Type"}],"IA3CP24CM0006":[{"date":"2024-02-09","type":""}],"IA3CP25CM0007":[{"date":"2025-07-16","type":""}],"IAACP16DI0002":[{"date":"2016-05-10","type":""},{"date":"2016-07-20","type":""},{"date":"2017-12-06","type":""},{"date":"2020-02-07","type":"Grant Closeout"}],"IAACP17DA0007":[{"date":"2017-02-23","type":""},{"date":"2019-10-10","type":""},{"date":"2022-02-01","type":"Non-Monetary Amendment Type"},{"date":"2024-09-24","type":"Grant Closeout"}],"IAACP17DA0041":[{"date":"2017-06-20","type":""},{"date":"2022-10-21","type":"Non-Monetary Amendment Type"},{"date":"","type":"Grant Closeout"}],"IAACP17DC0030":[{"date":"2017-06-14","type":""},{"date":"2020-06-12","type":"Monetary Amendment Type"},{"date":"2024-09-24","type":"Grant Closeout"}],"IAACP17DC0038":[{"date":"2017-06-14","type":""},{"date":"2020-01-16","type":""},{"date":"2020-07-24","type":"Non-Monetary Amendment Type"},{"date":"2021-06-29","type":"Non-Monetary Amendment Type"},{"date":"2024-09-24","type":"Grant Closeout"}],"IAACP17DI0001":[{"date":"2016-11-21","type":""},{"date":"2017-10-24","type":""},{"date":"2025-11-20","type":"Grant Closeout"}],"IAACP17DI0005":[{"date":"2017-06-20","type":""},{"date":"2020-05-13","type":"Non-Monetary Amendment Type"},{"date":"2021-06-22","type":"Non-Monetary Amendment Type"},{"date":"2024-09-24","type":"Grant Closeout"}],"IAACP17DI0006":[{"date":"2017-03-08","type":""},{"date":"2018-09-07","type":""},{"date":"2020-01-16","type":""},{"date":"2024-02-06","type":"Grant Closeout"}],"IAACP17EP0028":[{"date":"2017-05-23","type":""},{"date":"2018-06-14","type":""},{"date":"2019-09-25","type":""},{"date":"2024-02-06","type":"Grant Closeout"}],"IAACP18CG0059":[{"date":"2021-12-15","type":"Non-Monetary Amendment Type"},{"date":"2025-04-01","type":"Grant Closeout"},{"date":"2018-05-29","type":""}],"IAACP18DA0014":[{"date":"2018-02-15","type":""}],"IAACP18DA0016":[{"date":"2018-01-05","type":""},{"date":"2023-02-06","type":"Non-Monetary Amendment Type"},{"date":"2025-11-20","type":"Grant Closeout"}],"IAACP18DA0063":[{"date":"2023-08-02","type":"Non-Monetary Amendment Type"},{"date":"2026-07-13","type":"Non-Monetary Amendment Type"},{"date":"2018-08-08","type":""}],"IAACP18DC0033":[{"date":"2018-08-17","type":""},{"date":"2023-08-22","type":"Non-Monetary Amendment Type"},{"date":"2026-08-14","type":"Grant Closeout"}],"IAACP18DC0034":[{"date":"2018-08-17","type":""},{"date":"2020-07-20","type":"Non-Monetary Amendment Type"},{"date":"2024-02-06","type":"Grant Closeout"}],"IAACP18DC0051":[{"date":"2018-08-17","type":""},{"date":"2020-07-20","type":"Non-Monetary Amendment Type"},{"date":"2024-02-06","type":"Grant Closeout"}],"IAACP18DC0052":[{"date":"2018-08-17","type":""},{"date":"2020-02-03","type":""},{"date":"2020-12-08","type":"Non-Monetary Amendment Type"},{"date":"2024-02-06","type":"Grant Closeout"}],"IAACP18DI0003":[{"date":"2018-04-25","type":""},{"date":"2019-03-15","type":""},{"date":"2020-04-02","type":"Non-Monetary Amendment Type"},{"date":"2021-03-18","type":"Non-Monetary Amendment Type"},{"date":"2022-03-29","type":"Non-Monetary Amendment Type"},{"date":"2023-08-04","type":"Non-Monetary Amendment Type"}],"IAACP18DI0065":[{"date":"2018-07-18","type":""},{"date":"2023-08-28","type":"Non-Monetary Amendment Type"},{"date":"2026-07-07","type":"Non-Monetary Amendment Type"}],"IAACP18EP0017":[{"date":"2018-02-22","type":""},{"date":"2023-02-06","type":"Non-Monetary Amendment Type"},{"date":"2025-04-01","type":"Grant Closeout"}],"IAACP18EP0027":[{"date":"2018-06-25","type":""},{"date":"2023-06-21","type":"Non-Monetary Amendment Type"},{"date":"2025-04-01","type":"Grant Closeout"}],"IAACP18EP0057":[{"date":"2018-08-15","type":""},{"date":"2023-08-22","type":"Non-Monetary Amendment Type"}],"IAACP19DA0036":[{"date":"2019-09-18","type":""}],"IAACP19DC0031":[{"date":"2024-08-20","type":"Monetary Amendment Type"},{"date":"2019-03-04","type":""},{"date":"2020-12-08","type":"Non-Monetary Amendment Type"},{"date":"2021-08-06","type":"Non-Monetary Amendment Type"},{"date":"2022-04-01","type":"Non-Monetary Amendment Type"},{"date":"2023-01-19","type":"Non-Monetary Amendment Type"}],"IAACP19DC0032":[{"date":"2024-06-11","type":"Monetary Amendment Type"},{"date":"2018-12-21","type":""},{"date":"2020-12-08","type":"Non-Monetary Amendment Type"},{"date":"2021-10-25","type":"Non-Monetary Amendment Type"},{"date":"2022-08-09","type":"Non-Monetary Amendment Type"},{"date":"2023-01-19","type":"Non-Monetary Amendment Type"}],"IAACP19DC0067":[{"date":"2019-05-01","type":""},{"date":"2023-10-05","type":"Non-Monetary Amendment Type"}],"IAACP19DI0004":[{"date":"2019-08-07","type":""},{"date":"2025-01-14","type":"Monetary Amendment Type"}],"IAACP20DA0023":[{"date":"2020-01-10","type":""},{"date":"2025-11-20","type":"Grant Closeout"}],"IAACP20EP0099":[{"date":"2020-02-14","type":""},{"date":"2026-02-03","type":"Non-Monetary Amendment Type"}]};
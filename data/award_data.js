@@ -0,0 +1,2 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.awards = [{"Abstract Version":"4d758cc1","Award Amount":720694.21,"Closeout FY":2025,"Closeout Quarter":2,"Construction Project":"False","FAIN":"GNSSP20AL0001","Grant Lead":"Katy Baxter","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"Matt Love","Project End Date":"2025-03-31","Project Start Date":"2019-09-01","Recipient":"ADCNR","States":"AL;#1","Title":"SEP #17: Fairhope Area Community-Based Comprehensive Land Use"},{"Abstract Version":"f842bc98","Award Amount":3899593.0,"Closeout FY":2028,"Closeout Quarter":2,"Construction Project":"False","FAIN":"GNSSP20AL0002","Grant Lead":"Katy Baxter","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"Matt Love","Project End Date":"2028-01-31","Project Start Date":"2019-10-01","Recipient":"ADCNR","States":"AL;#1","Title":"SEP #15: Mobile Area Storm Water Mapping & Resiliency Planning"},{"Abstract Version":"b503e986","Award Amount":21131315.1,"Closeout FY":2027,"Closeout Quarter":4,"Construction Project":"True","FAIN":"GNSSP20AL0003","Grant Lead":"Katy Baxter","Grant Program":"SEP","Is Construction":true,"Programs Staff Lead":"Matt Love","Project End Date":"2027-07-31","Project Start Date":"2019-11-01","Recipient":"ADCNR","States":"AL;#1","Title":"SEP #9: Extension of Effluent Force Main from Bayou La Batre WWTF"},{"Abstract Version":"b0b6e859","Award Amount":5998795.33,"Closeout FY":2023,"Closeout Quarter":4,"Construction Project":"True","FAIN":"GNSSP20AL0004","Grant Lead":"Katy Baxter","Grant Program":"SEP","Is Construction":true,"Programs Staff Lead":"Matt Love","Project End Date":"2023-09-30","Project Start Date":"2019-10-01","Recipient":"ADCNR","States":"AL;#1","Title":"SEP #23: Orange Beach North Sewer Force Main Upgrade"},{"Abstract Version":"e9790392","Award Amount":13515000.0,"Closeout FY":2026,"Closeout Quarter":4,"Construction Project":"True","FAIN":"GNSSP20AL0005","Grant Lead":"Katy Baxter","Grant Program":"SEP","Is Construction":true,"Programs Staff Lead":"Matt Love","Project End Date":"2026-07-31","Project Start Date":"2019-10-01","Recipient":"ADCNR","States":"AL;#1","Title":"SEP #25: Fairhope Sewer Upgrade Phase I"},{"Abstract Version":"9d343ce9","Award Amount":5670037.0,"Closeout FY":2024,"Closeout Quarter":4,"Construction Project":"True","FAIN":"GNSSP20AL0006","Grant Lead":"Katy Baxter","Grant Program":"SEP","Is Construction":true,"Programs Staff Lead":"Matt Love","Project End Date":"2024-09-30","Project Start Date":"2019-10-01","Recipient":"ADCNR","States":"AL;#1","Title":"SEP #22: Canal Road Improvements E. of SR-161"},{"Abstract Version":"c9ff3365","Award Amount":2520383.0,"Closeout FY":2029,"Closeout Quarter":1,"Construction Project":"True","FAIN":"GNSSP20AL0007","Grant Lead":"Katy Baxter","Grant Program":"SEP","Is Construction":true,"Programs Staff Lead":"Matt Love","Project End Date":"2028-12-31","Project Start Date":"2020-05-01","Recipient":"ADCNR","States":"AL;#1","Title":"SEP #11: Lillian Park Beach Habitat and Shoreline Protection"},{"Abstract Version":"a3118d45","Award Amount":8670394.0,"Closeout FY":2027,"Closeout Quarter":4,"Construction Project":"False","FAIN":"GNSSP20AL0008","Grant Lead":"Katy Baxter","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"Matt Love","Project End Date":"2027-09-30","Project Start Date":"2019-10-01","Recipient":"ADCNR","States":"AL;#1","Title":"SEP #12: Perch Creek Area Sanitary Sewer Trunk Line CIPP"},{"Abstract Version":"16453085","Award Amount":7591608.0,"Closeout FY":2027,"Closeout Quarter":4,"Construction Project":"False","FAIN":"GNSSP20AL0009","Grant Lead":"Katy Baxter","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"Matt Love","Project End Date":"2027-09-30","Project Start Date":"2019-08-01","Recipient":"ADCNR","States":"AL;#1","Title":"SEP #18: Fort Morgan Parkway Trail Extension"},{"Abstract Version":"ed9772ca","Award Amount":23981437.0,"Closeout FY":2027,"Closeout Quarter":4,"Construction Project":"True","FAIN":"GNSSP20AL0011","Grant Lead":"Katy Baxter","Grant Program":"SEP","Is Construction":true,"Programs Staff Lead":"Matt Love","Project End Date":"2027-07-31","Project Start Date":"2020-08-01","Recipient":"ADCNR","States":"AL;#1","Title":"SEP #16: Three Mile Creek Watershed Restoration"},{"Abstract Version":"ceae05f4","Award Amount":5822014.0,"Closeout FY":2028,"Closeout Quarter":1,"Construction Project":"True","FAIN":"GNSSP20FL0010","Grant Lead":"Sheri Land","Grant Program":"SEP","Is Construction":true,"Programs Staff Lead":"Matt Love","Project End Date":"2027-12-15","Project Start Date":"2019-10-01","Recipient":"Gulf Consortium","States":"FL;#9","Title":"6-2: St. Joseph Peninsula Coastal Erosion Control Project \u2013 E&D"},{"Abstract Version":"b45a4287","Award Amount":5132239.0,"Closeout FY":2028,"Closeout Quarter":2,"Construction Project":"True","FAIN":"GNSSP20FL0012","Grant Lead":"Sheri Land","Grant Program":"SEP","Is Construction":true,"Programs Staff Lead":"Heather Young","Project End Date":"2028-03-31","Project Start Date":"2019-09-01","Recipient":"Gulf Consortium","States":"FL;#9","Title":"17-1: Cockroach Bay Aquatic Preserve Land Acquisition and Ecosystem Restoration"},{"Abstract Version":"2410ed93","Award Amount":2080054.0,"Closeout FY":2028,"Closeout Quarter":2,"Construction Project":"False","FAIN":"GNSSP20FL0013","Grant Lead":"Sheri Land","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"Matt Love","Project End Date":"2028-03-31","Project Start Date":"2019-09-01","Recipient":"Gulf Consortium","States":"FL;#9","Title":"12-2: Suwannee Sound / Cedar Key Oyster Restoration"},{"Abstract Version":"f451a76b","Award Amount":26829000.0,"Closeout FY":2028,"Closeout Quarter":1,"Construction Project":"True","FAIN":"GNSSP21AL0014","Grant Lead":"Katy Baxter","Grant Program":"SEP","Is Construction":true,"Programs Staff Lead":"Matt Love","Project End Date":"2027-12-31","Project Start Date":"2019-10-01","Recipient":"ADCNR","States":"AL;#1","Title":"SEP #8: Aloe Bay/Mississippi Sound Water Quality Enhancement Project"},{"Abstract Version":"04dd5f7c","Award Amount":585159.73,"Closeout FY":2023,"Closeout Quarter":2,"Construction Project":"True","FAIN":"GNSSP21AL0016","Grant Lead":"Katy Baxter","Grant Program":"SEP","Is Construction":true,"Programs Staff Lead":"Matt Love","Project End Date":"2023-02-07","Project Start Date":"2019-10-01","Recipient":"ADCNR","States":"AL;#1","Title":"SEP #13: Longevity, Stability & Water Quality Improvements, Bon Secour DMDA"},{"Abstract Version":"7ec56353","Award Amount":4583500.0,"Closeout FY":2026,"Closeout Quarter":1,"Construction Project":"True","FAIN":"GNSSP21AL0019","Grant Lead":"Katy Baxter","Grant Program":"SEP","Is Construction":true,"Programs Staff Lead":"Matt Love","Project End Date":"2025-12-15","Project Start Date":"2019-11-01","Recipient":"ADCNR","States":"AL;#1","Title":"SEP #19: Meaher Park Improvements"},{"Abstract Version":"8064f21e","Award Amount":112323.39,"Closeout FY":2024,"Closeout Quarter":2,"Construction Project":"True","FAIN":"GNSSP21AL0021","Grant Lead":"Katy Baxter","Grant Program":"SEP","Is Construction":true,"Programs Staff Lead":"Matt Love","Project End Date":"2024-01-31","Project Start Date":"2019-11-01","Recipient":"ADCNR","States":"AL;#1","Title":"SEP #21: Alabama Point Seawall Repair"},{"Abstract Version":"bd0fad69","Award Amount":2887476.0,"Closeout FY":2028,"Closeout Quarter":1,"Construction Project":"True","FAIN":"GNSSP21AL0024","Grant Lead":"Katy Baxter","Grant Program":"SEP","Is Construction":true,"Programs Staff Lead":"Matt Love","Project End Date":"2027-12-15","Project Start Date":"2019-11-01","Recipient":"ADCNR","States":"AL;#1","Title":"SEP #6: City of Chickasaw Sewer Rehabilitation Project"},{"Abstract Version":"8021e0d1","Award Amount":539025.7,"Closeout FY":2024,"Closeout Quarter":3,"Construction Project":"False","FAIN":"GNSSP21AL0026","Grant Lead":"Katy Baxter","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"Matt Love","Project End Date":"2024-05-31","Project Start Date":"2019-11-01","Recipient":"ADCNR","States":"AL;#1","Title":"SEP #1-Environmental Restoration of Cotton Bayou & Terry Cove (Phase 1-Planning)"},{"Abstract Version":"c35f26c4","Award Amount":10395914.0,"Closeout FY":2026,"Closeout Quarter":4,"Construction Project":"True","FAIN":"GNSSP21AL0027","Grant Lead":"Katy Baxter","Grant Program":"SEP","Is Construction":true,"Programs Staff Lead":"Matt Love","Project End Date":"2026-09-11","Project Start Date":"2021-06-01","Recipient":"ADCNR","States":"AL;#1","Title":"SEP #20 Mobile County Dirt Road Paving (Sediment Reduction) Program"},{"Abstract Version":"2b173d17","Award Amount":604602.0,"Closeout FY":2029,"Closeout Quarter":2,"Construction Project":"False","FAIN":"GNSSP21FL0020","Grant Lead":"Sheri Land","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"Matt Love","Project End Date":"2029-02-28","Project Start Date":"2021-03-08","Recipient":"Gulf Consortium","States":"FL;#9","Title":"24-1: Adaptive Planning and Compliance Project"},{"Abstract Version":"572451a9","Award Amount":1256624.0,"Closeout FY":2027,"Closeout Quarter":3,"Construction Project":"True","FAIN":"GNSSP21FL0022","Grant Lead":"Sheri Land","Grant Program":"SEP","Is Construction":true,"Programs Staff Lead":"Matt Love","Project End Date":"2027-04-30","Project Start Date":"2020-05-11","Recipient":"Gulf Consortium","States":"FL;#9","Title":"18-2: Portosueno Park Living Shoreline"},{"Abstract Version":"88a09ac5","Award Amount":5620106.0,"Closeout FY":2027,"Closeout Quarter":1,"Construction Project":"False","FAIN":"GNSSP21FL0023","Grant Lead":"Sheri Land","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"Matt Love","Project End Date":"2026-12-31","Project Start Date":"2020-05-11","Recipient":"Gulf Consortium","States":"FL;#9","Title":"16-2: Wastewater Collection System Improvements \u2013 E&D"},{"Abstract Version":"6c0aa344","Award Amount":1121773.0,"Closeout FY":2029,"Closeout Quarter":2,"Construction Project":"False","FAIN":"GNSSP21FL0025","Grant Lead":"Bjorn Johnson","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"Heather Young","Project End Date":"2029-03-31","Project Start Date":"2019-09-16","Recipient":"Gulf Consortium","States":"FL;#9","Title":"1-1: Bayou Chico Contaminated Sediment Remediation Project"},{"Abstract Version":"0c17db13","Award Amount":349885.0,"Closeout FY":2027,"Closeout Quarter":3,"Construction Project":"False","FAIN":"GNSSP21FL0028","Grant Lead":"Sheri Land","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"Matt Love","Project End Date":"2027-06-30","Project Start Date":"2022-03-17","Recipient":"Gulf Consortium","States":"FL;#9","Title":"18-6: Gulf Shellfish Institute: Applied Research for Shellfish Aquaculture"},{"Abstract Version":"eb13138d","Award Amount":6028150.41,"Closeout FY":2024,"Closeout Quarter":1,"Construction Project":"True","FAIN":"GNSSP21FL0029","Grant Lead":"Sheri Land","Grant Program":"SEP","Is Construction":true,"Programs Staff Lead":"Kathryn Keating","Project End Date":"2023-12-31","Project Start Date":"2020-04-06","Recipient":"Gulf Consortium","States":"FL;#9","Title":"7-3: Apalachicola Bay Cooperative Dredging"},{"Abstract Version":"9a89a31c","Award Amount":21473.94,"Closeout FY":2023,"Closeout Quarter":2,"Construction Project":"True","FAIN":"GNSSP21FL0030","Grant Lead":"Sheri Land","Grant Program":"SEP","Is Construction":true,"Programs Staff Lead":"Kathryn Keating","Project End Date":"2023-03-31","Project Start Date":"2020-08-28","Recipient":"Gulf Consortium","States":"FL;#9","Title":"18-10: Kingfish Boat Ramp Renovation and Expansion - Construction"},{"Abstract Version":"e1594151","Award Amount":235623723.0,"Closeout FY":2031,"Closeout Quarter":2,"Construction Project":"True","FAIN":"GNSSP21LA0018","Grant Lead":"Bjorn Johnson","Grant Program":"SEP","Is Construction":true,"Programs Staff Lead":"John Ettinger","Project End Date":"2031-03-01","Project Start Date":"2021-02-05","Recipient":"LA CPRA","States":"LA;#18","Title":"Houma Navigation Canal Lock Complex Project (Implementation)"},{"Abstract Version":"7f79d10b","Award Amount":18970873.0,"Closeout FY":2027,"Closeout Quarter":1,"Construction Project":"True","FAIN":"GNSSP21MS0015","Grant Lead":"Bjorn Johnson","Grant Program":"SEP","Is Construction":true,"Programs Staff Lead":"Heather Young","Project End Date":"2026-11-30","Project Start Date":"2020-12-18","Recipient":"MDEQ","States":"MS;#24","Title":"Activity #9: Beneficial Use of Dredge Material for Marsh Creation and Restoration in Mississippi"},{"Abstract Version":"0b1555b1","Award Amount":9948347.0,"Closeout FY":2028,"Closeout Quarter":1,"Construction Project":"True","FAIN":"GNSSP21MS0017","Grant Lead":"Bjorn Johnson","Grant Program":"SEP","Is Construction":true,"Programs Staff Lead":"Heather Young","Project End Date":"2027-10-31","Project Start Date":"2021-02-05","Recipient":"MDEQ","States":"MS;#24","Title":"Mississippi Beachfront Resilience"},{"Abstract Version":"14b4b6bc","Award Amount":15701150.0,"Closeout FY":2028,"Closeout Quarter":1,"Construction Project":"True","FAIN":"GNSSP22AL0031","Grant Lead":"Katy Baxter","Grant Program":"SEP","Is Construction":true,"Programs Staff Lead":"Matt Love","Project End Date":"2027-12-15","Project Start Date":"2021-12-17","Recipient":"ADCNR","States":"AL;#1","Title":"SEP #10: Bayou La Batre Collection System/Lift Station Upgrades"},{"Abstract Version":"b3e47153","Award Amount":1222744.0,"Closeout FY":2028,"Closeout Quarter":3,"Construction Project":"False","FAIN":"GNSSP22AL0032","Grant Lead":"Katy Baxter","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"Matt Love","Project End Date":"2028-06-30","Project Start Date":"2022-02-07","Recipient":"ADCNR","States":"AL;#1","Title":"SEP #24: Storm Water Management Improvements for Toulmin Springs Branch and Gum Tree Branch"},{"Abstract Version":"52bf5e34","Award Amount":514043.0,"Closeout FY":2028,"Closeout Quarter":3,"Construction Project":"False","FAIN":"GNSSP22AL0033","Grant Lead":"Katy Baxter","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"Matt Love","Project End Date":"2028-06-30","Project Start Date":"2022-01-14","Recipient":"ADCNR","States":"AL;#1","Title":"SEP #29 - Planning Grant to Amend State Expenditure Plan 2021"},{"Abstract Version":"088176ab","Award Amount":6175557.0,"Closeout FY":2027,"Closeout Quarter":1,"Construction Project":"True","FAIN":"GNSSP22AL0038","Grant Lead":"Katy Baxter","Grant Program":"SEP","Is Construction":true,"Programs Staff Lead":"Matt Love","Project End Date":"2026-11-30","Project Start Date":"2022-05-13","Recipient":"ADCNR","States":"AL;#1","Title":"SEP #26: Little Lagoon Restoration Project"},{"Abstract Version":"70f4ae2b","Award Amount":14395000.0,"Closeout FY":2029,"Closeout Quarter":3,"Construction Project":"True","FAIN":"GNSSP22AL0042","Grant Lead":"Katy Baxter","Grant Program":"SEP","Is Construction":true,"Programs Staff Lead":"Matt Love","Project End Date":"2029-05-31","Project Start Date":"2022-05-13","Recipient":"ADCNR","States":"AL;#1","Title":"SEP #4: Auburn University Gulf Coast Engineering Research Station"},{"Abstract Version":"cb82465b","Award Amount":1190280.31,"Closeout FY":2026,"Closeout Quarter":1,"Construction Project":"True","FAIN":"GNSSP22AL0043","Grant Lead":"Katy Baxter","Grant Program":"SEP","Is Construction":true,"Programs Staff Lead":"Matt Love","Project End Date":"2025-12-31","Project Start Date":"2022-05-13","Recipient":"ADCNR","States":"AL;#1","Title":"SEP #3: Expansion of the Orange Beach Wildlife Rehabilitation and Education Program"},{"Abstract Version":"f389cfd6","Award Amount":5997571.0,"Closeout FY":2026,"Closeout Quarter":4,"Construction Project":"True","FAIN":"GNSSP22FL0034","Grant Lead":"Sheri Land","Grant Program":"SEP","Is Construction":true,"Programs Staff Lead":"Matt Love","Project End Date":"2026-09-30","Project Start Date":"2022-03-09","Recipient":"Gulf Consortium","States":"FL;#9","Title":"13-1: NW Quadrant Sewer Force Main Project \u2013 Construction"},{"Abstract Version":"48e188cb","Award Amount":12266475.0,"Closeout FY":2027,"Closeout Quarter":3,"Construction Project":"True","FAIN":"GNSSP22FL0036","Grant Lead":"Sheri Land","Grant Program":"SEP","Is Construction":true,"Programs Staff Lead":"Matt Love","Project End Date":"2027-06-30","Project Start Date":"2022-05-13","Recipient":"Gulf Consortium","States":"FL;#9","Title":"2-1: Santa Rosa Sound Water Quality Improvement Program - Monitoring"},{"Abstract Version":"e70153d0","Award Amount":1855529.0,"Closeout FY":2028,"Closeout Quarter":2,"Construction Project":"True","FAIN":"GNSSP22FL0037","Grant Lead":"Sheri Land","Grant Program":"SEP","Is Construction":true,"Programs Staff Lead":"Matt Love","Project End Date":"2028-03-31","Project Start Date":"2022-05-13","Recipient":"Gulf Consortium","States":"FL;#9","Title":"10-2: Hodges Park Rehabilitation"},{"Abstract Version":"67329990","Award Amount":12493439.0,"Closeout FY":2027,"Closeout Quarter":3,"Construction Project":"True","FAIN":"GNSSP22FL0039","Grant Lead":"Sheri Land","Grant Program":"SEP","Is Construction":true,"Programs Staff Lead":"Matt Love","Project End Date":"2027-06-30","Project Start Date":"2022-05-13","Recipient":"Gulf Consortium","States":"FL;#9","Title":"8-1: Wakulla Springshed Water Quality Protection Program - Otter Creek WWTF Construction"},{"Abstract Version":"66f651ae","Award Amount":2281801.22,"Closeout FY":2027,"Closeout Quarter":3,"Construction Project":"True","FAIN":"GNSSP22FL0040","Grant Lead":"Sheri Land","Grant Program":"SEP","Is Construction":true,"Programs Staff Lead":"Matt Love","Project End Date":"2027-06-30","Project Start Date":"2022-05-13","Recipient":"Gulf Consortium","States":"FL;#9","Title":"3-4: Shoal River Headwaters Protection Program-Phase I Construction"},{"Abstract Version":"a2a3ed4c","Award Amount":14375.56,"Closeout FY":2025,"Closeout Quarter":1,"Construction Project":"True","FAIN":"GNSSP22FL0041","Grant Lead":"Sheri Land","Grant Program":"SEP","Is Construction":true,"Programs Staff Lead":"Kathryn Keating","Project End Date":"2024-10-17","Project Start Date":"2022-05-13","Recipient":"Gulf Consortium","States":"FL;#9","Title":"15-1: Port Richey Watershed Stormwater Management Project-Construction"},{"Abstract Version":"aa131e06","Award Amount":2039612.0,"Closeout FY":2035,"Closeout Quarter":3,"Construction Project":"True","FAIN":"GNSSP22FL0044","Grant Lead":"Sheri Land","Grant Program":"SEP","Is Construction":true,"Programs Staff Lead":"Matt Love","Project End Date":"2035-06-30","Project Start Date":"2022-09-09","Recipient":"Gulf Consortium","States":"FL;#9","Title":"18:1-Manatee River Oyster Restoration"},{"Abstract Version":"8b02bc40","Award Amount":6077365.0,"Closeout FY":2026,"Closeout Quarter":4,"Construction Project":"True","FAIN":"GNSSP22TX0035","Grant Lead":"Bridget Zachary","Grant Program":"SEP","Is Construction":true,"Programs Staff Lead":"Heather Young","Project End Date":"2026-08-31","Project Start Date":"2022-04-20","Recipient":"TCEQ","States":"TX;#43","Title":"FY22 RESTORE Shoreline & Beach Restoration (BKT 3)"},{"Abstract Version":"60a4f7fe","Award Amount":383665.0,"Closeout FY":2027,"Closeout Quarter":1,"Construction Project":"False","FAIN":"GNSSP23FL0046","Grant Lead":"Sheri Land","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"Matt Love","Project End Date":"2026-12-31","Project Start Date":"2023-02-22","Recipient":"Gulf Consortium","States":"FL;#9","Title":"10-3: Keaton Beach and Steinhatchee Boat Ramps By-Pass"},{"Abstract Version":"9aaffdcc","Award Amount":1246249.0,"Closeout FY":2027,"Closeout Quarter":1,"Construction Project":"True","FAIN":"GNSSP23FL0047","Grant Lead":"Sheri Land","Grant Program":"SEP","Is Construction":true,"Programs Staff Lead":"Matt Love","Project End Date":"2026-12-31","Project Start Date":"2023-03-08","Recipient":"Gulf Consortium","States":"FL;#9","Title":"13-3: Artificial Reef Program (Implementation)"},{"Abstract Version":"4bbffdc7","Award Amount":3374518.0,"Closeout FY":2028,"Closeout Quarter":2,"Construction Project":"False","FAIN":"GNSSP23FL0048","Grant Lead":"Sheri Land","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"Heather Young","Project End Date":"2028-03-31","Project Start Date":"2023-05-25","Recipient":"Gulf Consortium","States":"FL;#9","Title":"16-3: Land Acquisition for Floodplain Restoration & Resiliency"},{"Abstract Version":"4d24e44f","Award Amount":621686.0,"Closeout FY":2028,"Closeout Quarter":4,"Construction Project":"False","FAIN":"GNSSP23FL0049","Grant Lead":"Sheri Land","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"Heather Young","Project End Date":"2028-09-30","Project Start Date":"2023-05-25","Recipient":"Gulf Consortium","States":"FL;#9","Title":"10-1: Spring Warrior-Acquisition"},{"Abstract Version":"2c51cca5","Award Amount":803192.68,"Closeout FY":2026,"Closeout Quarter":2,"Construction Project":"True","FAIN":"GNSSP23FL0050","Grant Lead":"Sheri Land","Grant Program":"SEP","Is Construction":true,"Programs Staff Lead":"Matt Love","Project End Date":"2026-03-06","Project Start Date":"2023-06-26","Recipient":"Gulf Consortium","States":"FL;#9","Title":"6-1: St. Joseph Bay-Chipola River Sewer Improvement Program"},{"Abstract Version":"967766c5","Award Amount":1620624.0,"Closeout FY":2027,"Closeout Quarter":2,"Construction Project":"True","FAIN":"GNSSP23FL0052","Grant Lead":"Sheri Land","Grant Program":"SEP","Is Construction":true,"Programs Staff Lead":"Matt Love","Project End Date":"2027-02-28","Project Start Date":"2023-08-21","Recipient":"Gulf Consortium","States":"FL;#9","Title":"3-5: Veterans Park Living Shoreline Construction"},{"Abstract Version":"b715b9a6","Award Amount":6563518.0,"Closeout FY":2027,"Closeout Quarter":3,"Construction Project":"True","FAIN":"GNSSP23FL0054","Grant Lead":"Sheri Land","Grant Program":"SEP","Is Construction":true,"Programs Staff Lead":"Matt Love","Project End Date":"2027-05-01","Project Start Date":"2024-01-16","Recipient":"Gulf Consortium","States":"FL;#9","Title":"5-1: North Bay Water Quality Improvement Program (Septic-to-Sewer Conversion)"},{"Abstract Version":"d2cc6861","Award Amount":2199550.0,"Closeout FY":2026,"Closeout Quarter":4,"Construction Project":"False","FAIN":"GNSSP23MS0045","Grant Lead":"Bjorn Johnson","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"Heather Young","Project End Date":"2026-09-30","Project Start Date":"2023-02-16","Recipient":"MDEQ","States":"MS;#24","Title":"Public/Private Partnership (Accelerate MS)"},{"Abstract Version":"99a4b72f","Award Amount":5237010.0,"Closeout FY":2028,"Closeout Quarter":1,"Construction Project":"False","FAIN":"GNSSP23MS0051","Grant Lead":"Bjorn Johnson","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"Heather Young","Project End Date":"2027-12-31","Project Start Date":"2023-07-07","Recipient":"MDEQ","States":"MS;#24","Title":"Activity #14: Gulf Coast Center of Security and Emerging Technology (CSET) Program"},{"Abstract Version":"32f9f324","Award Amount":1050000.0,"Closeout FY":2029,"Closeout Quarter":3,"Construction Project":"True","FAIN":"GNSSP23TX0053","Grant Lead":"Bridget Zachary","Grant Program":"SEP","Is Construction":true,"Programs Staff Lead":"Heather Young","Project End Date":"2029-06-30","Project Start Date":"2023-08-21","Recipient":"TCEQ","States":"TX;#43","Title":"FY22 RESTORE NBT-IB Magee Beach Park (BKT 3)"},{"Abstract Version":"b0a0eb88","Award Amount":7485976.0,"Closeout FY":2028,"Closeout Quarter":4,"Construction Project":"True","FAIN":"GNSSP24FL0055","Grant Lead":"Sheri Land","Grant Program":"SEP","Is Construction":true,"Programs Staff Lead":"Matt Love","Project End Date":"2028-08-31","Project Start Date":"2024-05-30","Recipient":"Gulf Consortium","States":"FL;#9","Title":"17-2: Delaney Creek-Palm River Heights Septic to Sewer Hillsborough County"},{"Abstract Version":"777d7661","Award Amount":3052661.0,"Closeout FY":2027,"Closeout Quarter":1,"Construction Project":"True","FAIN":"GNSSP24FL0057","Grant Lead":"Sheri Land","Grant Program":"SEP","Is Construction":true,"Programs Staff Lead":"Matt Love","Project End Date":"2026-12-31","Project Start Date":"2024-06-25","Recipient":"Gulf Consortium","States":"FL;#9","Title":"14-5: Coastal Stormwater Improvement-Calienta Street"},{"Abstract Version":"4d721f1a","Award Amount":8462523.0,"Closeout FY":2029,"Closeout Quarter":2,"Construction Project":"True","FAIN":"GNSSP24MS0056","Grant Lead":"Bjorn Johnson","Grant Program":"SEP","Is Construction":true,"Programs Staff Lead":"Heather Young","Project End Date":"2029-03-31","Project Start Date":"2024-03-12","Recipient":"MDEQ","States":"MS;#24","Title":"Activity #16: D\u2019Iberville Working Waterfront and Commercial Seafood Harbor"},{"Abstract Version":"554decc9","Award Amount":5294686.0,"Closeout FY":2029,"Closeout Quarter":1,"Construction Project":"False","FAIN":"GNSSP24MS0058","Grant Lead":"Bjorn Johnson","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"Heather Young","Project End Date":"2028-12-31","Project Start Date":"2024-07-02","Recipient":"MDEQ","States":"MS;#24","Title":"Activity #19: Workforce Training - Meeting the Needs of the Supply Chain"},{"Abstract Version":"5b218c9c","Award Amount":6284685.0,"Closeout FY":2029,"Closeout Quarter":1,"Construction Project":"False","FAIN":"GNSSP24MS0059","Grant Lead":"Bjorn Johnson","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"Heather Young","Project End Date":"2028-12-31","Project Start Date":"2024-07-08","Recipient":"MDEQ","States":"MS;#24","Title":"Activity #20: Health Professions (HEALP) for Our Community: Health Professions Center of Excellence"},{"Abstract Version":"8b845149","Award Amount":3264176.0,"Closeout FY":2029,"Closeout Quarter":4,"Construction Project":"False","FAIN":"GNSSP24MS0060","Grant Lead":"Bjorn Johnson","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"Heather Young","Project End Date":"2029-07-31","Project Start Date":"2024-08-22","Recipient":"MDEQ","States":"MS;#24","Title":"Activity #13: Coastal Habitat Management Program"},{"Abstract Version":"9ac5e09d","Award Amount":2287500.0,"Closeout FY":2028,"Closeout Quarter":1,"Construction Project":"True","FAIN":"GNSSP25AL0063","Grant Lead":"Katy Baxter","Grant Program":"SEP","Is Construction":true,"Programs Staff Lead":"Matt Love","Project End Date":"2027-10-31","Project Start Date":"2025-01-23","Recipient":"ADCNR","States":"AL;#1","Title":"Project #28: One Mobile: Reconnecting People, Work and Play through Complete Streets"},{"Abstract Version":"a0b6a143","Award Amount":12516999.0,"Closeout FY":2030,"Closeout Quarter":1,"Construction Project":"True","FAIN":"GNSSP25FL0064","Grant Lead":"Sheri Land","Grant Program":"SEP","Is Construction":true,"Programs Staff Lead":"Matt Love","Project End Date":"2029-12-01","Project Start Date":"2025-03-03","Recipient":"Gulf Consortium","States":"FL;#9","Title":"23-1: Canal Management Master Plan Implementation"},{"Abstract Version":"82453840","Award Amount":12399456.0,"Closeout FY":2030,"Closeout Quarter":2,"Construction Project":"True","FAIN":"GNSSP25FL0067","Grant Lead":"Sheri Land","Grant Program":"SEP","Is Construction":true,"Programs Staff Lead":"Matt Love","Project End Date":"2030-03-31","Project Start Date":"2025-04-01","Recipient":"Gulf Consortium","States":"FL;#9","Title":"15-9: Channel Restoration and Water Quality Project"},{"Abstract Version":"487c0946","Award Amount":139822.0,"Closeout FY":2028,"Closeout Quarter":2,"Construction Project":"False","FAIN":"GNSSP25FL0068","Grant Lead":"Sheri Land","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"Matt Love","Project End Date":"2028-02-01","Project Start Date":"2025-04-01","Recipient":"Gulf Consortium","States":"FL;#9","Title":"13-5: Inshore Artificial Reef"},{"Abstract Version":"b89957bd","Award Amount":1092632.0,"Closeout FY":2030,"Closeout Quarter":4,"Construction Project":"True","FAIN":"GNSSP25FL0074","Grant Lead":"Sheri Land","Grant Program":"SEP","Is Construction":true,"Programs Staff Lead":"Matt Love","Project End Date":"2030-09-30","Project Start Date":"2025-07-14","Recipient":"Gulf Consortium","States":"FL;#9","Title":"11-1: Horseshoe Beach Working Waterfront"},{"Abstract Version":"58e9036a","Award Amount":60000000.0,"Closeout FY":2030,"Closeout Quarter":1,"Construction Project":"True","FAIN":"GNSSP25LA0072","Grant Lead":"Bridget Zachary","Grant Program":"SEP","Is Construction":true,"Programs Staff Lead":"John Ettinger","Project End Date":"2029-12-31","Project Start Date":"2025-06-12","Recipient":"LA CPRA","States":"LA;#18","Title":"River Reintroduction into Muarepas Swamp (Construction)"},{"Abstract Version":"be9b8724","Award Amount":824078.0,"Closeout FY":2027,"Closeout Quarter":4,"Construction Project":"False","FAIN":"GNSSP25MS0061","Grant Lead":"Bjorn Johnson","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"Heather Young","Project End Date":"2027-07-15","Project Start Date":"2024-12-19","Recipient":"MDEQ","States":"MS;#24","Title":"Activity #22: Institute of Marine Mammal Studies Outreach and Ecotourism"},{"Abstract Version":"f1551cfc","Award Amount":1208561.0,"Closeout FY":2027,"Closeout Quarter":1,"Construction Project":"True","FAIN":"GNSSP25MS0062","Grant Lead":"Bjorn Johnson","Grant Program":"SEP","Is Construction":true,"Programs Staff Lead":"Heather Young","Project End Date":"2026-12-15","Project Start Date":"2024-12-19","Recipient":"MDEQ","States":"MS;#24","Title":"Activity #18: Walter Anderson Museum of Art Creative Complex"},{"Abstract Version":"8f4f59e4","Award Amount":498845.0,"Closeout FY":2030,"Closeout Quarter":3,"Construction Project":"False","FAIN":"GNSSP25MS0065","Grant Lead":"Bjorn Johnson","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"Heather Young","Project End Date":"2030-06-30","Project Start Date":"2025-07-01","Recipient":"MDEQ","States":"MS;#24","Title":"Activity #3: Compatibility, Coordination and Restoration Planning Round II"},{"Abstract Version":"df0501ac","Award Amount":1862230.0,"Closeout FY":2030,"Closeout Quarter":3,"Construction Project":"False","FAIN":"GNSSP25MS0066","Grant Lead":"Bjorn Johnson","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"Matt Love","Project End Date":"2030-05-31","Project Start Date":"2025-06-02","Recipient":"MDEQ","States":"MS;#24","Title":"Activity #23: Coastal Science Program for MS High Schools"},{"Abstract Version":"a3ef6612","Award Amount":2667583.0,"Closeout FY":2028,"Closeout Quarter":3,"Construction Project":"True","FAIN":"GNSSP25MS0069","Grant Lead":"Bjorn Johnson","Grant Program":"SEP","Is Construction":true,"Programs Staff Lead":"Heather Young","Project End Date":"2028-05-31","Project Start Date":"2025-05-22","Recipient":"MDEQ","States":"MS;#24","Title":"Activity #25: Pascagoula River Scenic Trail"},{"Abstract Version":"eed13911","Award Amount":1616673.0,"Closeout FY":2028,"Closeout Quarter":1,"Construction Project":"True","FAIN":"GNSSP25MS0070","Grant Lead":"Bjorn Johnson","Grant Program":"SEP","Is Construction":true,"Programs Staff Lead":"Heather Young","Project End Date":"2027-12-31","Project Start Date":"2025-05-22","Recipient":"MDEQ","States":"MS;#24","Title":"Activity #17: Harbor Expansion Parking Area (Jones Park)"},{"Abstract Version":"62e491ba","Award Amount":2654084.08,"Closeout FY":2027,"Closeout Quarter":4,"Construction Project":"True","FAIN":"GNSSP25MS0071","Grant Lead":"Bjorn Johnson","Grant Program":"SEP","Is Construction":true,"Programs Staff Lead":"Matt Love","Project End Date":"2027-09-30","Project Start Date":"2025-04-18","Recipient":"MDEQ","States":"MS;#24","Title":"Activity #30: Classrooms and Dormitories for the Center for Marine Education and Research"},{"Abstract Version":"234329cb","Award Amount":1097550.88,"Closeout FY":2028,"Closeout Quarter":2,"Construction Project":"False","FAIN":"GNSSP25MS0073","Grant Lead":"Bjorn Johnson","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"Heather Young","Project End Date":"2028-03-31","Project Start Date":"2025-05-22","Recipient":"MDEQ","States":"MS;#24","Title":"Activity #24: Nonspecific Invasive Species Detection and Treatment"},{"Abstract Version":"b769853c","Award Amount":3608221.93,"Closeout FY":2020,"Closeout Quarter":4,"Construction Project":"False","FAIN":"GNTCP16LA0024","Grant Lead":"Bridget Zachary","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Brie Bernik","Project End Date":"2020-09-30","Project Start Date":"2016-10-03","Recipient":"LA CPRA","States":"LA;#18","Title":"West Grand Terre Beach Nourishment and Stabilization (Planning)"},{"Abstract Version":"5da07ebb","Award Amount":1910714.21,"Closeout FY":2026,"Closeout Quarter":3,"Construction Project":"False","FAIN":"GNTCP17FL0008","Grant Lead":"Bjorn Johnson","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"John Ettinger","Project End Date":"2026-05-31","Project Start Date":"2017-07-10","Recipient":"FDEP","States":"AL;#1;#FL;#9","Title":"Apalachicola Watershed Agriculture Water Quality Improvements (Implementation)"},{"Abstract Version":"e1cfa348","Award Amount":2884000.0,"Closeout FY":2027,"Closeout Quarter":4,"Construction Project":"False","FAIN":"GNTCP17FL0015","Grant Lead":"Bjorn Johnson","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Matt Love","Project End Date":"2027-08-25","Project Start Date":"2017-08-25","Recipient":"FDEP","States":"FL;#9","Title":"Suwannee River Partnership Irrigation Water Enhancement Program (Implementation)"},{"Abstract Version":"17a36bc9","Award Amount":356850.0,"Closeout FY":2029,"Closeout Quarter":2,"Construction Project":"False","FAIN":"GNTCP17FL0018","Grant Lead":"Bjorn Johnson","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Heather Young","Project End Date":"2029-03-31","Project Start Date":"2017-04-14","Recipient":"FDEP","States":"FL;#9","Title":"Bayou Chico Contaminated Sediment Removal- Planning, Design, and Permitting (Planning)"},{"Abstract Version":"2915e522","Award Amount":5967000.0,"Closeout FY":2030,"Closeout Quarter":1,"Construction Project":"False","FAIN":"GNTCP17FL0026","Grant Lead":"Bjorn Johnson","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Matt Love","Project End Date":"2029-12-31","Project Start Date":"2017-06-15","Recipient":"FDEP","States":"FL;#9","Title":"Beach Haven \u2013 Joint Stormwater & Wastewater Improvement Project Phase II (Implementation)"},{"Abstract Version":"96ec035e","Award Amount":4679877.73,"Closeout FY":2021,"Closeout Quarter":4,"Construction Project":"False","FAIN":"GNTCP17FL0039","Grant Lead":"Bjorn Johnson","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"John Ettinger","Project End Date":"2021-09-30","Project Start Date":"2017-04-01","Recipient":"FDEP","States":"FL;#9","Title":"Apalachicola Bay Oyster Restoration (Implementation)"},{"Abstract Version":"43829641","Award Amount":1795950.0,"Closeout FY":2029,"Closeout Quarter":2,"Construction Project":"True","FAIN":"GNTCP17FL0040","Grant Lead":"Bjorn Johnson","Grant Program":"FPL","Is Construction":true,"Programs Staff Lead":"John Ettinger","Project End Date":"2029-03-31","Project Start Date":"2017-01-01","Recipient":"FDEP","States":"FL;#9","Title":"Pensacola Bay Living Shoreline - Phase 1 (Planning)"},{"Abstract Version":"9c9256b8","Award Amount":2778769.62,"Closeout FY":2021,"Closeout Quarter":2,"Construction Project":"False","FAIN":"GNTCP17LA0013","Grant Lead":"Bridget Zachary","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"John Ettinger","Project End Date":"2021-01-29","Project Start Date":"2016-11-01","Recipient":"LA CPRA","States":"LA;#18","Title":"Golden Triangle Marsh Creation (Planning)"},{"Abstract Version":"a22248a6","Award Amount":2568167.29,"Closeout FY":2021,"Closeout Quarter":3,"Construction Project":"False","FAIN":"GNTCP17LA0025","Grant Lead":"Bridget Zachary","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"John Ettinger","Project End Date":"2021-06-30","Project Start Date":"2016-11-01","Recipient":"LA CPRA","States":"LA;#18","Title":"Biloxi Marsh Living Shoreline (Planning)"},{"Abstract Version":"d0cb73d9","Award Amount":14190000.0,"Closeout FY":2029,"Closeout Quarter":1,"Construction Project":"False","FAIN":"GNTCP17LA0044","Grant Lead":"Bridget Zachary","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"John Ettinger","Project End Date":"2028-12-31","Project Start Date":"2017-09-22","Recipient":"LA CPRA","States":"LA;#18","Title":"Mississippi River Reintroduction into Maurepas Swamp (Planning)"},{"Abstract Version":"01c9d151","Award Amount":592485.48,"Closeout FY":2021,"Closeout Quarter":1,"Construction Project":"False","FAIN":"GNTCP17MS0020","Grant Lead":"Bjorn Johnson","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"John Ettinger","Project End Date":"2020-11-30","Project Start Date":"2016-07-01","Recipient":"MDEQ","States":"MS;#24","Title":"Sea Grant Education and Outreach (Planning & Implementation)"},{"Abstract Version":"ce051fda","Award Amount":1743003.73,"Closeout FY":2025,"Closeout Quarter":3,"Construction Project":"False","FAIN":"GNTCP17MS0022","Grant Lead":"Bjorn Johnson","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Heather Young","Project End Date":"2025-05-31","Project Start Date":"2016-05-01","Recipient":"MDEQ","States":"MS;#24","Title":"Enhancing Opportunities for Beneficial Use (BU) of Dredge Sediments in the Mississippi Sound (Planning)"},{"Abstract Version":"5c9e73de","Award Amount":5987350.05,"Closeout FY":2021,"Closeout Quarter":1,"Construction Project":"False","FAIN":"GNTCP17TX0009","Grant Lead":"Bridget Zachary","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Heather Young","Project End Date":"2020-11-30","Project Start Date":"2016-04-28","Recipient":"TCEQ","States":"TX;#43","Title":"Matagorda Bay System Priority Landscape Conservation FY16 RESTORE-Matagorda Bay BKT 2"},{"Abstract Version":"80d1aaa5","Award Amount":4308461.84,"Closeout FY":2019,"Closeout Quarter":4,"Construction Project":"False","FAIN":"GNTCP17TX0010","Grant Lead":"Bridget Zachary","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Heather Young","Project End Date":"2019-08-31","Project Start Date":"2016-04-28","Recipient":"TCEQ","States":"TX;#43","Title":"Bahia Grande Coastal Corridor (BGCC) (Implementation): FY16 RESTORE-Bahia Grande BKT 2"},{"Abstract Version":"e8112a47","Award Amount":3850000.0,"Closeout FY":2030,"Closeout Quarter":1,"Construction Project":"False","FAIN":"GNTCP18AL0064","Grant Lead":"Katy Baxter","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Amy Newbold","Project End Date":"2029-12-31","Project Start Date":"2018-05-16","Recipient":"ADCNR","States":"","Title":"Commitment and Planning Support \u2013 Alabama"},{"Abstract Version":"11198bab","Award Amount":4342500.0,"Closeout FY":2026,"Closeout Quarter":4,"Construction Project":"False","FAIN":"GNTCP18AL0066","Grant Lead":"Katy Baxter","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Matt Love","Project End Date":"2026-07-15","Project Start Date":"2018-09-14","Recipient":"ADCNR","States":"AL;#1","Title":"Coastal Alabama Comprehensive Watershed Restoration Planning Project"},{"Abstract Version":"12b4172f","Award Amount":875000.0,"Closeout FY":2026,"Closeout Quarter":2,"Construction Project":"False","FAIN":"GNTCP18AL0068","Grant Lead":"Katy Baxter","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Matt Love","Project End Date":"2026-03-30","Project Start Date":"2018-07-30","Recipient":"ADCNR","States":"AL;#1","Title":"Alabama Submerged Aquatic Vegetation Restoration and Monitoring Program (Implementation)"},{"Abstract Version":"ee7b942c","Award Amount":832493.69,"Closeout FY":2023,"Closeout Quarter":3,"Construction Project":"False","FAIN":"GNTCP18FL0047","Grant Lead":"Bjorn Johnson","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Heather Young","Project End Date":"2023-05-31","Project Start Date":"2018-04-02","Recipient":"FDEP","States":"FL;#9","Title":"Palm River Restoration Project Phase II, East McKay Bay (Implementation)"},{"Abstract Version":"4dff5f5d","Award Amount":3843880.0,"Closeout FY":2031,"Closeout Quarter":2,"Construction Project":"False","FAIN":"GNTCP18FL0054","Grant Lead":"Bjorn Johnson","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Amy Newbold","Project End Date":"2031-03-31","Project Start Date":"2018-04-23","Recipient":"FDEP","States":"FL;#9","Title":"Commitment and Planning Support \u2013 Florida"},{"Abstract Version":"5f859390","Award Amount":9300000.0,"Closeout FY":2026,"Closeout Quarter":1,"Construction Project":"False","FAIN":"GNTCP18LA0035","Grant Lead":"Bridget Zachary","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"John Ettinger","Project End Date":"2025-12-31","Project Start Date":"2018-03-06","Recipient":"LA CPRA","States":"LA;#18","Title":"Lowermost Mississippi River Management Program (Planning)"},{"Abstract Version":"61073959","Award Amount":3850000.0,"Closeout FY":2031,"Closeout Quarter":3,"Construction Project":"False","FAIN":"GNTCP18LA0055","Grant Lead":"Bridget Zachary","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Amy Newbold","Project End Date":"2031-05-15","Project Start Date":"2018-05-16","Recipient":"LA CPRA","States":"","Title":"Commitment and Planning Support\u2014Coastal Protection and Restoration Authority"},{"Abstract Version":"6ab43755","Award Amount":2100000.0,"Closeout FY":2027,"Closeout Quarter":1,"Construction Project":"False","FAIN":"GNTCP18MS0056","Grant Lead":"Bjorn Johnson","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Amy Newbold","Project End Date":"2026-12-31","Project Start Date":"2018-06-08","Recipient":"MDEQ","States":"","Title":"Commitment and Planning Support\u2014Mississippi"},{"Abstract Version":"b05312ab","Award Amount":5692731.91,"Closeout FY":2021,"Closeout Quarter":1,"Construction Project":"False","FAIN":"GNTCP18TX0011","Grant Lead":"Bridget Zachary","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Heather Young","Project End Date":"2020-11-30","Project Start Date":"2016-04-28","Recipient":"TCEQ","States":"TX;#43","Title":"Bayou Greenways Planning & Implementation: FY16 RESTORE BKT 2"},{"Abstract Version":"e8319262","Award Amount":636665.03,"Closeout FY":2023,"Closeout Quarter":2,"Construction Project":"False","FAIN":"GNTCP18TX0012","Grant Lead":"Bridget Zachary","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Heather Young","Project End Date":"2023-02-28","Project Start Date":"2018-07-31","Recipient":"TCEQ","States":"TX;#43","Title":"Texas Beneficial Use/Marsh Restoration FY16 RESTORE-Beneficial Use BKT 2"},{"Abstract Version":"3b2a1d1c","Award Amount":3850000.0,"Closeout FY":2028,"Closeout Quarter":3,"Construction Project":"False","FAIN":"GNTCP18TX0061","Grant Lead":"Bridget Zachary","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Amy Newbold","Project End Date":"2028-05-31","Project Start Date":"2018-06-01","Recipient":"TCEQ","States":"","Title":"Commitment and Planning Support - Texas"},{"Abstract Version":"aff474d6","Award Amount":1046662.36,"Closeout FY":2026,"Closeout Quarter":2,"Construction Project":"False","FAIN":"GNTCP19AL0082","Grant Lead":"Katy Baxter","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Matt Love","Project End Date":"2026-03-31","Project Start Date":"2019-04-01","Recipient":"ADCNR","States":"AL;#1","Title":"Enhancing Opportunities for Beneficial Use of Dredge Sediments (Denton Oyster Reef Restoration Through Beneficial Use of Upriver Sediment; Grand Bay Mississippi Sound Back-Barrier Island Restoration Project Feasibility Study; Lower Perdido Bay/Perdido"},{"Abstract Version":"9d172a0f","Award Amount":908500.0,"Closeout FY":2027,"Closeout Quarter":1,"Construction Project":"True","FAIN":"GNTCP19AL0085","Grant Lead":"Katy Baxter","Grant Program":"FPL","Is Construction":true,"Programs Staff Lead":"Matt Love","Project End Date":"2026-11-30","Project Start Date":"2019-05-01","Recipient":"ADCNR","States":"AL;#1","Title":"Alabama Living Shorelines Program (Construction Planning Component)"},{"Abstract Version":"28da9ba6","Award Amount":15500000.0,"Closeout FY":2032,"Closeout Quarter":2,"Construction Project":"False","FAIN":"GNTCP19MS0060","Grant Lead":"Bridget Zachary","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Heather Young","Project End Date":"2032-02-28","Project Start Date":"2016-07-01","Recipient":"MDEQ","States":"MS;#24","Title":"Strategic Land Protection, Conservation, and Enhancement of Priority Gulf Coast Landscapes in MS (Planning & Implementation)"},{"Abstract Version":"a3c874b4","Award Amount":2270000.0,"Closeout FY":2027,"Closeout Quarter":3,"Construction Project":"False","FAIN":"GNTCP19MS0062","Grant Lead":"Bjorn Johnson","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Heather Young","Project End Date":"2027-06-30","Project Start Date":"2019-07-01","Recipient":"MDEQ","States":"MS;#24","Title":"The Mississippi Sound Estuarine Program"},{"Abstract Version":"e4ac0c95","Award Amount":2500000.0,"Closeout FY":2027,"Closeout Quarter":1,"Construction Project":"False","FAIN":"GNTCP20AP0104","Grant Lead":"Joshua Easton","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Heather Young","Project End Date":"2026-12-31","Project Start Date":"2020-01-27","Recipient":"AL Port Authority","States":"AL;#1","Title":"Upper Mobile Bay Beneficial Use Wetland Creation Site (Planning)"},{"Abstract Version":"049292bb","Award Amount":2931659.45,"Closeout FY":2020,"Closeout Quarter":3,"Construction Project":"False","FAIN":"GNTSP16FL0021","Grant Lead":"Joshua Easton","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"Not Applicable","Project End Date":"2020-04-30","Project Start Date":"2014-08-23","Recipient":"Gulf Consortium","States":"","Title":"Gulf Consortium Preparation of Full State Expenditure Plan"},{"Abstract Version":"d749fec2","Award Amount":852766.66,"Closeout FY":2019,"Closeout Quarter":3,"Construction Project":"False","FAIN":"GNTSP16MS0019","Grant Lead":"Joshua Easton","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"Not Applicable","Project End Date":"2019-04-30","Project Start Date":"2016-05-13","Recipient":"MDEQ","States":"","Title":"Mississippi State Expenditure Plan"},{"Abstract Version":"6cfdc157","Award Amount":60124929.0,"Closeout FY":2028,"Closeout Quarter":3,"Construction Project":"False","FAIN":"GNTSP17LA0046","Grant Lead":"Bridget Zachary","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"John Ettinger","Project End Date":"2028-06-30","Project Start Date":"2017-03-23","Recipient":"LA CPRA","States":"LA;#18","Title":"Adaptive Management"},{"Abstract Version":"417d8541","Award Amount":93718.82,"Closeout FY":2021,"Closeout Quarter":1,"Construction Project":"False","FAIN":"GNTSP17TX0042","Grant Lead":"Bridget Zachary","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"Not Applicable","Project End Date":"2020-12-31","Project Start Date":"2017-04-06","Recipient":"TCEQ","States":"","Title":"Texas Planning State Expenditure Plan (Texas PSEP) (FY17 RESTORE Texas Planning SEP)"},{"Abstract Version":"e7dabab4","Award Amount":14579980.02,"Closeout FY":2026,"Closeout Quarter":1,"Construction Project":"False","FAIN":"GNTSP18LA0049","Grant Lead":"Bjorn Johnson","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"John Ettinger","Project End Date":"2025-12-31","Project Start Date":"2018-03-19","Recipient":"LA CPRA","States":"LA;#18","Title":"Houma Navigation Canal Lock Complex (Planning)"},{"Abstract Version":"647bd804","Award Amount":2530068.97,"Closeout FY":2025,"Closeout Quarter":3,"Construction Project":"False","FAIN":"GNTSP18MS0048","Grant Lead":"Bjorn Johnson","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"Heather Young","Project End Date":"2025-06-30","Project Start Date":"2017-04-13","Recipient":"MDEQ","States":"MS;#24","Title":"Compatibility, Coordination and Restoration Planning"},{"Abstract Version":"c422babe","Award Amount":1133224.29,"Closeout FY":2021,"Closeout Quarter":1,"Construction Project":"False","FAIN":"GNTSP18MS0053","Grant Lead":"Bjorn Johnson","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"Brie Bernik","Project End Date":"2020-12-31","Project Start Date":"2018-09-07","Recipient":"MDEQ","States":"MS;#24","Title":"Laboratory to Support Mississippi Gulf Coast Water Quality Improvement Program"},{"Abstract Version":"74157bfc","Award Amount":34326789.0,"Closeout FY":2030,"Closeout Quarter":4,"Construction Project":"False","FAIN":"GNTSP18MS0058","Grant Lead":"Bjorn Johnson","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"Heather Young","Project End Date":"2030-07-31","Project Start Date":"2018-03-15","Recipient":"MDEQ","States":"MS;#24","Title":"Mississippi Gulf Coast Water Quality Improvement Program"},{"Abstract Version":"42acec6a","Award Amount":215412.35,"Closeout FY":2019,"Closeout Quarter":4,"Construction Project":"False","FAIN":"GNTSP19FL0077","Grant Lead":"Bjorn Johnson","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"Not Applicable","Project End Date":"2019-09-30","Project Start Date":"2017-07-01","Recipient":"Gulf Consortium","States":"","Title":"Florida Stand-Up State Expenditure Plan"},{"Abstract Version":"5a5b6d19","Award Amount":10768.75,"Closeout FY":2021,"Closeout Quarter":3,"Construction Project":"False","FAIN":"GNTSP19FL0086","Grant Lead":"Barbara Shumar","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"Matt Love","Project End Date":"2021-06-30","Project Start Date":"2019-02-19","Recipient":"Gulf Consortium","States":"FL;#9","Title":"15-5: Artificial Reef Program - Hudson Reef"},{"Abstract Version":"ae55e7d9","Award Amount":2576343.98,"Closeout FY":2023,"Closeout Quarter":2,"Construction Project":"False","FAIN":"GNTSP19LA0070","Grant Lead":"Bridget Zachary","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"John Ettinger","Project End Date":"2023-03-15","Project Start Date":"2019-06-25","Recipient":"LA CPRA","States":"LA;#18","Title":"Paradis Canal Gate (CPRA-Parish Matching Opportunities Project)"},{"Abstract Version":"cd637256","Award Amount":4100000.0,"Closeout FY":2029,"Closeout Quarter":3,"Construction Project":"False","FAIN":"GNTSP19MS0075","Grant Lead":"Bjorn Johnson","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"Heather Young","Project End Date":"2029-04-30","Project Start Date":"2019-04-19","Recipient":"MDEQ","States":"MS;#24","Title":"Pascagoula Oyster Reef Complex Relay and Enhancement"},{"Abstract Version":"11b82fc7","Award Amount":9298031.0,"Closeout FY":2026,"Closeout Quarter":4,"Construction Project":"False","FAIN":"GNTSP19MS0080","Grant Lead":"Bjorn Johnson","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"Heather Young","Project End Date":"2026-07-31","Project Start Date":"2019-08-01","Recipient":"MDEQ","States":"MS;#24","Title":"Remote Oyster Setting Facility"},{"Abstract Version":"68c5900e","Award Amount":180776.13,"Closeout FY":2020,"Closeout Quarter":2,"Construction Project":"False","FAIN":"GNTSP20AL0079","Grant Lead":"Katy Baxter","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"Not Applicable","Project End Date":"2020-03-30","Project Start Date":"2017-07-01","Recipient":"ADCNR","States":"","Title":"State of Alabama Planning State Expenditure Plan (PSEP)"},{"Abstract Version":"c9478023","Award Amount":2979886.42,"Closeout FY":2025,"Closeout Quarter":1,"Construction Project":"False","FAIN":"GNTSP20AL0094","Grant Lead":"Katy Baxter","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"Matt Love","Project End Date":"2024-12-31","Project Start Date":"2019-04-08","Recipient":"ADCNR","States":"AL;#1","Title":"SEP #7 Alabama Gulf Seafood Marketing"},{"Abstract Version":"532a6794","Award Amount":8002448.13,"Closeout FY":2025,"Closeout Quarter":4,"Construction Project":"False","FAIN":"GNTSP20AL0095","Grant Lead":"Katy Baxter","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"Matt Love","Project End Date":"2025-08-31","Project Start Date":"2020-04-01","Recipient":"ADCNR","States":"AL;#1","Title":"SEP #14 Replacement of Substandard Facilities at the ADEM Coastal Office and Mobile Field Office"},{"Abstract Version":"3daf539f","Award Amount":569809.05,"Closeout FY":2025,"Closeout Quarter":1,"Construction Project":"False","FAIN":"GNTSP20AL0096","Grant Lead":"Katy Baxter","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"Matt Love","Project End Date":"2024-12-31","Project Start Date":"2019-12-01","Recipient":"ADCNR","States":"AL;#1","Title":"SEP #2: Development of a Regional Strategic Plan for the Coastal Alabama Region"},{"Abstract Version":"e8f68373","Award Amount":1234074.0,"Closeout FY":2027,"Closeout Quarter":2,"Construction Project":"False","FAIN":"GNTSP20AL0120","Grant Lead":"Katy Baxter","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"Matt Love","Project End Date":"2027-01-31","Project Start Date":"2019-11-01","Recipient":"ADCNR","States":"AL;#1","Title":"SEP #5: Characterization and Delineation of Significant Sand Resource Areas Essential for Beach Restoration"},{"Abstract Version":"aaae1d31","Award Amount":709196.56,"Closeout FY":2022,"Closeout Quarter":2,"Construction Project":"False","FAIN":"GNTSP20FL0088","Grant Lead":"Sheri Land","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"Matt Love","Project End Date":"2022-03-31","Project Start Date":"2018-10-08","Recipient":"Gulf Consortium","States":"FL;#9","Title":"Wastewater Improvement \u2013 Combined Project 1 (2-1 Santa Rosa, 3-4 Okaloosa, 13-1 Citrus, 20-1 Charlotte)"},{"Abstract Version":"2f698016","Award Amount":52784.79,"Closeout FY":2022,"Closeout Quarter":1,"Construction Project":"False","FAIN":"GNTSP20FL0089","Grant Lead":"Sheri Land","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"Heather Young","Project End Date":"2021-12-31","Project Start Date":"2019-01-07","Recipient":"Gulf Consortium","States":"FL;#9","Title":"8-2: Coastal Access Program \u2013 Bayside Marina Feasibility Study"},{"Abstract Version":"fe9cec20","Award Amount":1066139.0,"Closeout FY":2028,"Closeout Quarter":2,"Construction Project":"False","FAIN":"GNTSP20FL0090","Grant Lead":"Sheri Land","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"Matt Love","Project End Date":"2028-02-28","Project Start Date":"2020-02-14","Recipient":"Gulf Consortium","States":"FL;#9","Title":"3-3: Choctawhatchee Bay Estuary Program"},{"Abstract Version":"c5ed7472","Award Amount":1237121.0,"Closeout FY":2026,"Closeout Quarter":2,"Construction Project":"False","FAIN":"GNTSP20FL0091","Grant Lead":"Sheri Land","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"Matt Love","Project End Date":"2026-03-01","Project Start Date":"2019-02-19","Recipient":"Gulf Consortium","States":"FL;#9","Title":"16-1: Lake Seminole Sediment Removal"},{"Abstract Version":"5faae2dd","Award Amount":2973261.0,"Closeout FY":2030,"Closeout Quarter":2,"Construction Project":"False","FAIN":"GNTSP20FL0092","Grant Lead":"Sheri Land","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"Matt Love","Project End Date":"2030-03-01","Project Start Date":"2018-10-01","Recipient":"Gulf Consortium","States":"FL;#9","Title":"19-1: Sarasota County Dona Bay Hydrologic Restoration Program, Phases III-V \u2013 E&D"},{"Abstract Version":"92c116a4","Award Amount":338039.19,"Closeout FY":2025,"Closeout Quarter":1,"Construction Project":"False","FAIN":"GNTSP20FL0097","Grant Lead":"Sheri Land","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"Kathryn Keating","Project End Date":"2024-12-31","Project Start Date":"2018-10-01","Recipient":"Gulf Consortium","States":"FL;#9","Title":"22-1: Comprehensive Watershed Improvement Program - Monitoring and Master Plan"},{"Abstract Version":"bd8c28f1","Award Amount":5460910.0,"Closeout FY":2028,"Closeout Quarter":1,"Construction Project":"True","FAIN":"GNTSP20FL0098","Grant Lead":"Sheri Land","Grant Program":"SEP","Is Construction":true,"Programs Staff Lead":"Matt Love","Project End Date":"2027-12-01","Project Start Date":"2019-05-01","Recipient":"Gulf Consortium","States":"FL;#9","Title":"5-2: St. Andrew Bay Stormwater Improvement Program \u2013 St. Andrew Bay Watch \u2013 Water Quality Monitoring"},{"Abstract Version":"a5131c3c","Award Amount":631303.45,"Closeout FY":2026,"Closeout Quarter":1,"Construction Project":"False","FAIN":"GNTSP20FL0105","Grant Lead":"Sheri Land","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"Matt Love","Project End Date":"2025-12-31","Project Start Date":"2018-10-01","Recipient":"Gulf Consortium","States":"FL;#9","Title":"4-1: Choctawhatchee Bay Septic to Sewer Conversion \u2013 Feasibility Study"},{"Abstract Version":"103e4fc7","Award Amount":62979.55,"Closeout FY":2022,"Closeout Quarter":1,"Construction Project":"False","FAIN":"GNTSP20FL0106","Grant Lead":"Sheri Land","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"Matt Love","Project End Date":"2021-10-29","Project Start Date":"2018-10-01","Recipient":"Gulf Consortium","States":"FL;#9","Title":"9-2: Wacissa River Park Improvement Program \u2013 Planning and Acquisition"},{"Abstract Version":"ad20690c","Award Amount":695024.0,"Closeout FY":2027,"Closeout Quarter":2,"Construction Project":"False","FAIN":"GNTSP20FL0107","Grant Lead":"Sheri Land","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"Matt Love","Project End Date":"2027-03-30","Project Start Date":"2020-02-07","Recipient":"Gulf Consortium","States":"FL;#9","Title":"13-2: Cross Florida Barge Canal Boat Ramp - E&D"},{"Abstract Version":"8f3b885b","Award Amount":2143443.93,"Closeout FY":2027,"Closeout Quarter":4,"Construction Project":"True","FAIN":"GNTSP20FL0110","Grant Lead":"Sheri Land","Grant Program":"SEP","Is Construction":true,"Programs Staff Lead":"Matt Love","Project End Date":"2027-09-30","Project Start Date":"2018-10-01","Recipient":"Gulf Consortium","States":"FL;#9","Title":"14-1: Artificial Reef Program"},{"Abstract Version":"9584ee05","Award Amount":2997844.0,"Closeout FY":2027,"Closeout Quarter":1,"Construction Project":"False","FAIN":"GNTSP20LA0071","Grant Lead":"Bridget Zachary","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"John Ettinger","Project End Date":"2026-12-31","Project Start Date":"2019-08-09","Recipient":"LA CPRA","States":"LA;#18","Title":"Lake Lery Marsh Creation Project"},{"Abstract Version":"21b10326","Award Amount":4832624.0,"Closeout FY":2025,"Closeout Quarter":4,"Construction Project":"True","FAIN":"GNTSP20LA0072","Grant Lead":"Bridget Zachary","Grant Program":"SEP","Is Construction":true,"Programs Staff Lead":"John Ettinger","Project End Date":"2025-08-31","Project Start Date":"2020-05-01","Recipient":"LA CPRA","States":"LA;#18","Title":"Freshwater Bayou Canal Shoreline Protection"},{"Abstract Version":"44df21ba","Award Amount":6848575.0,"Closeout FY":2026,"Closeout Quarter":1,"Construction Project":"False","FAIN":"GNTSP20LA0076","Grant Lead":"Bridget Zachary","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"John Ettinger","Project End Date":"2025-12-31","Project Start Date":"2019-08-09","Recipient":"LA CPRA","States":"LA;#18","Title":"Westward Expansion of the CWPPRA Rockefeller Refuge Shoreline Stabilization Project"},{"Abstract Version":"dbc0af78","Award Amount":599386.0,"Closeout FY":2027,"Closeout Quarter":4,"Construction Project":"False","FAIN":"GNTSP20LA0081","Grant Lead":"Bridget Zachary","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"John Ettinger","Project End Date":"2027-09-30","Project Start Date":"2019-08-01","Recipient":"LA CPRA","States":"LA;#18","Title":"Grand Bayou Freshwater Reintroduction (Engineering and Design)"},{"Abstract Version":"c7817c19","Award Amount":3179266.0,"Closeout FY":2026,"Closeout Quarter":1,"Construction Project":"True","FAIN":"GNTSP20LA0083","Grant Lead":"Bridget Zachary","Grant Program":"SEP","Is Construction":true,"Programs Staff Lead":"John Ettinger","Project End Date":"2025-12-31","Project Start Date":"2019-05-08","Recipient":"LA CPRA","States":"LA;#18","Title":"Manchac Landbridge (Rock Breakwater) Shoreline Protection Project"},{"Abstract Version":"d7b5b610","Award Amount":1899702.0,"Closeout FY":2027,"Closeout Quarter":2,"Construction Project":"False","FAIN":"GNTSP20MS0084","Grant Lead":"Bjorn Johnson","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"Heather Young","Project End Date":"2027-01-31","Project Start Date":"2019-11-08","Recipient":"MDEQ","States":"MS;#24","Title":"Gulf of Mexico Citizen Led Initiative"},{"Abstract Version":"8f3e66fe","Award Amount":5992526.0,"Closeout FY":2026,"Closeout Quarter":2,"Construction Project":"False","FAIN":"GNTSP20MS0103","Grant Lead":"Bjorn Johnson","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"Heather Young","Project End Date":"2026-02-28","Project Start Date":"2020-03-01","Recipient":"MDEQ","States":"MS;#24","Title":"Hancock County Marsh Living Shoreline"},{"Abstract Version":"657a815c","Award Amount":649722.0,"Closeout FY":2027,"Closeout Quarter":2,"Construction Project":"False","FAIN":"GNTSP20MS0128","Grant Lead":"Bjorn Johnson","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"Heather Young","Project End Date":"2027-02-28","Project Start Date":"2020-03-01","Recipient":"MDEQ","States":"MS;#24","Title":"Mississippi Sound Oyster Shell Recycling Program"},{"Abstract Version":"b49476e7","Award Amount":12724970.0,"Closeout FY":2027,"Closeout Quarter":1,"Construction Project":"True","FAIN":"GNTSP20TX0100","Grant Lead":"Bridget Zachary","Grant Program":"SEP","Is Construction":true,"Programs Staff Lead":"Heather Young","Project End Date":"2026-12-31","Project Start Date":"2020-02-01","Recipient":"TCEQ","States":"TX;#43","Title":"FY20 RESTORE Nature Based Tourism"},{"Abstract Version":"78ceed1c","Award Amount":4000000.0,"Closeout FY":2028,"Closeout Quarter":1,"Construction Project":"False","FAIN":"GT1CP21AL0001","Grant Lead":"Katy Baxter","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Matt Love","Project End Date":"2027-12-31","Project Start Date":"2021-01-22","Recipient":"ADCNR","States":"AL;#1","Title":"Comprehensive Living Shoreline Monitoring (Planning and Implementation)"},{"Abstract Version":"dbce1c4e","Award Amount":690708.0,"Closeout FY":2028,"Closeout Quarter":1,"Construction Project":"True","FAIN":"GT1CP23AL0003","Grant Lead":"Katy Baxter","Grant Program":"FPL","Is Construction":true,"Programs Staff Lead":"Matt Love","Project End Date":"2027-12-30","Project Start Date":"2023-06-22","Recipient":"ADCNR","States":"AL;#1","Title":"Marsh Restoration in Oyster Bay"},{"Abstract Version":"8440af65","Award Amount":2998626.0,"Closeout FY":2026,"Closeout Quarter":4,"Construction Project":"True","FAIN":"GT1CP23MS0002","Grant Lead":"Bjorn Johnson","Grant Program":"FPL","Is Construction":true,"Programs Staff Lead":"Heather Young","Project End Date":"2026-09-30","Project Start Date":"2023-04-11","Recipient":"MDEQ","States":"MS;#24","Title":"Deer Island Beneficial Use Site Implementation"},{"Abstract Version":"375c1249","Award Amount":26880000.0,"Closeout FY":2027,"Closeout Quarter":1,"Construction Project":"True","FAIN":"GT3CP22AL0001","Grant Lead":"Katy Baxter","Grant Program":"FPL","Is Construction":true,"Programs Staff Lead":"Heather Young","Project End Date":"2026-11-30","Project Start Date":"2021-12-02","Recipient":"ADCNR","States":"AL;#1","Title":"Perdido River Land Conservation and Habitat Enhancements"},{"Abstract Version":"1e2984cd","Award Amount":0.0,"Closeout FY":2026,"Closeout Quarter":1,"Construction Project":"False","FAIN":"GT3CP22FL0002","Grant Lead":"Bridget Zachary","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Heather Young","Project End Date":"2025-11-30","Project Start Date":"2022-03-01","Recipient":"FDEP","States":"FL;#9","Title":"Florida Strategic Gulf Coast Land Acquisition Program (Planning & Implementation)"},{"Abstract Version":"5ff87efd","Award Amount":12523660.0,"Closeout FY":2032,"Closeout Quarter":3,"Construction Project":"False","FAIN":"GT3CP22FL0003","Grant Lead":"Bjorn Johnson","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Matt Love","Project End Date":"2032-06-30","Project Start Date":"2022-06-16","Recipient":"FDEP","States":"FL;#9","Title":"Florida Water Quality Improvement Program (Planning)"},{"Abstract Version":"dde3263e","Award Amount":5600000.0,"Closeout FY":2031,"Closeout Quarter":4,"Construction Project":"False","FAIN":"GT3CP22FL0004","Grant Lead":"Bjorn Johnson","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Matt Love","Project End Date":"2031-09-30","Project Start Date":"2022-06-16","Recipient":"FDEP","States":"FL;#9","Title":"Florida Gulf Coast Resiliency Program (Planning)"},{"Abstract Version":"bd763696","Award Amount":3437500.0,"Closeout FY":2032,"Closeout Quarter":4,"Construction Project":"False","FAIN":"GT3CP22FL0006","Grant Lead":"Bjorn Johnson","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Matt Love","Project End Date":"2032-08-31","Project Start Date":"2022-09-09","Recipient":"FDEP","States":"FL;#9","Title":"Florida Gulf Coast Tributaries Hydrologic Restoration Program (Planning)"},{"Abstract Version":"27f51d00","Award Amount":24300000.0,"Closeout FY":2027,"Closeout Quarter":4,"Construction Project":"False","FAIN":"GT3CP22TX0005","Grant Lead":"Bridget Zachary","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Heather Young","Project End Date":"2027-08-31","Project Start Date":"2022-09-09","Recipient":"TCEQ","States":"TX;#43","Title":"Texas Land Acquisition Program for Coastal Conservation (Planning and Implementation)"},{"Abstract Version":"727bcf4a","Award Amount":1000000.0,"Closeout FY":2028,"Closeout Quarter":2,"Construction Project":"False","FAIN":"GT3CP23AL0007","Grant Lead":"Katy Baxter","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Matt Love","Project End Date":"2028-01-31","Project Start Date":"2023-03-06","Recipient":"ADCNR","States":"AL;#1","Title":"Enhancing Hydrologic Connectivity in Justin\u2019s Bay (Mobile Bay) (Planning)"},{"Abstract Version":"5055fc51","Award Amount":6849784.0,"Closeout FY":2028,"Closeout Quarter":4,"Construction Project":"True","FAIN":"GT3CP23MS0008","Grant Lead":"Bjorn Johnson","Grant Program":"FPL","Is Construction":true,"Programs Staff Lead":"Heather Young","Project End Date":"2028-09-07","Project Start Date":"2023-09-07","Recipient":"MDEQ","States":"MS;#24","Title":"Water Quality Improvement Program for Coastal Mississippi Waters (Planning)"},{"Abstract Version":"92d46e43","Award Amount":26573850.0,"Closeout FY":2029,"Closeout Quarter":1,"Construction Project":"True","FAIN":"GT3CP24AL0010","Grant Lead":"Katy Baxter","Grant Program":"FPL","Is Construction":true,"Programs Staff Lead":"Matt Love","Project End Date":"2028-12-31","Project Start Date":"2024-03-12","Recipient":"ADCNR","States":"AL;#1","Title":"Coastal Alabama Regional Water Quality Program (Planning)"},{"Abstract Version":"63c77878","Award Amount":130000000.0,"Closeout FY":2028,"Closeout Quarter":2,"Construction Project":"True","FAIN":"GT3CP24LA0009","Grant Lead":"Bridget Zachary","Grant Program":"FPL","Is Construction":true,"Programs Staff Lead":"John Ettinger","Project End Date":"2028-03-08","Project Start Date":"2024-03-12","Recipient":"LA CPRA","States":"LA;#18","Title":"River Reintroduction into Maurepas Swamp (Construction)"},{"Abstract Version":"5c25b1c7","Award Amount":229233.4,"Closeout FY":2024,"Closeout Quarter":4,"Construction Project":"False","FAIN":"IA1CP21CM0001","Grant Lead":"Joshua Easton","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Amy Newbold","Project End Date":"2024-09-01","Project Start Date":"2021-04-01","Recipient":"DOI-BIA","States":"AL;#1;#MS;#24;#LA;#18;#FL;#9","Title":"Gulf of Mexico Habitat Restoration via Conservation Corps Partnerships/Youth Conservation Corps (BIA)"},{"Abstract Version":"d446957d","Award Amount":2472917.0,"Closeout FY":2026,"Closeout Quarter":4,"Construction Project":"False","FAIN":"IA1CP21CM0002","Grant Lead":"Victoria Schenk","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Amy Newbold","Project End Date":"2026-07-31","Project Start Date":"2021-08-24","Recipient":"EPA","States":"TX;#43;#AL;#1;#MS;#24;#LA;#18;#FL;#9","Title":"Gulf of Mexico Conservation Enhancement Grant Program"},{"Abstract Version":"3b8c6ace","Award Amount":1553089.0,"Closeout FY":2027,"Closeout Quarter":2,"Construction Project":"True","FAIN":"IA1CP23CM0003","Grant Lead":"Victoria Schenk","Grant Program":"FPL","Is Construction":true,"Programs Staff Lead":"Amy Newbold","Project End Date":"2027-02-26","Project Start Date":"2023-05-23","Recipient":"DOC-NOAA NCCOS","States":"AL;#1","Title":"Marsh Restoration in Fish River and Weeks Bay (Implementation)"},{"Abstract Version":"29b74fbd","Award Amount":70766.0,"Closeout FY":2028,"Closeout Quarter":3,"Construction Project":"False","FAIN":"IA1CP25CM0004","Grant Lead":"Victoria Schenk","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Amy Newbold","Project End Date":"2028-06-01","Project Start Date":"2025-06-10","Recipient":"DOI-BIA","States":"TX;#43","Title":"Tribal Youth Restoration Program - Alabama - Coushatta Tribe of Texas"},{"Abstract Version":"6365635b","Award Amount":11971250.0,"Closeout FY":2026,"Closeout Quarter":1,"Construction Project":"False","FAIN":"IA3CP21CM0001","Grant Lead":"Victoria Schenk","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Amy Newbold","Project End Date":"2025-12-31","Project Start Date":"2021-07-19","Recipient":"DOC-NOAA NCCOS","States":"TX;#43;#AL;#1;#MS;#24;#LA;#18;#FL;#9","Title":"Gulf of Mexico Coast Conservation Corps (GulfCorps) Program"},{"Abstract Version":"da52fa01","Award Amount":3400000.0,"Closeout FY":2026,"Closeout Quarter":4,"Construction Project":"False","FAIN":"IA3CP22CM0002","Grant Lead":"Victoria Schenk","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Amy Newbold","Project End Date":"2026-09-30","Project Start Date":"2022-05-05","Recipient":"DOI-USGS","States":"AL;#1;#MS;#24;#FL;#9","Title":"Develop Ecological Flow Decision-Support for Mobile River & Perdido River Basins"},{"Abstract Version":"15e43ffc","Award Amount":321000.0,"Closeout FY":2025,"Closeout Quarter":4,"Construction Project":"False","FAIN":"IA3CP22CM0003","Grant Lead":"Victoria Schenk","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Amy Newbold","Project End Date":"2025-09-30","Project Start Date":"2022-06-01","Recipient":"DOI-NPS","States":"TX;#43","Title":"Wind-Tidal Flat Restoration Pilot (Planning & Implementation)"},{"Abstract Version":"320bee01","Award Amount":927000.0,"Closeout FY":2027,"Closeout Quarter":1,"Construction Project":"False","FAIN":"IA3CP23CM0004","Grant Lead":"Victoria Schenk","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Amy Newbold","Project End Date":"2026-11-30","Project Start Date":"2023-02-15","Recipient":"DOI-BIA","States":"AL;#1;#MS;#24;#LA;#18;#FL;#9","Title":"Gulf Coast Tribal Youth Conservation Program (Planning & Implementation)"},{"Abstract Version":"d367da9b","Award Amount":23000000.0,"Closeout FY":2030,"Closeout Quarter":4,"Construction Project":"False","FAIN":"IA3CP23CM0005","Grant Lead":"Victoria Schenk","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"John Ettinger","Project End Date":"2030-08-31","Project Start Date":"2023-09-18","Recipient":"USDA-USFS","States":"AL;#1;#MS;#24;#FL;#9","Title":"Enhancing Gulf Waters through Forested Watershed Restoration (Planning & Implementation)"},{"Abstract Version":"2d7a8238","Award Amount":5000000.0,"Closeout FY":2029,"Closeout Quarter":1,"Construction Project":"False","FAIN":"IA3CP24CM0006","Grant Lead":"Victoria Schenk","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Amy Newbold","Project End Date":"2028-12-31","Project Start Date":"2024-02-05","Recipient":"USDA-USFS","States":"FL;#9","Title":"Apalachicola Regional Restoration Initiative: Strategies 2 & 3 (Planning & Implementation)"},{"Abstract Version":"23324fda","Award Amount":3100000.0,"Closeout FY":2029,"Closeout Quarter":4,"Construction Project":"False","FAIN":"IA3CP25CM0007","Grant Lead":"Victoria Schenk","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Amy Newbold","Project End Date":"2029-09-30","Project Start Date":"2025-07-15","Recipient":"USDA-NRCS","States":"AL;#1;#MS;#24;#FL;#9","Title":"Gulf Coast Conservation Reserve Program"},{"Abstract Version":"2f5742e4","Award Amount":447944.45,"Closeout FY":2019,"Closeout Quarter":1,"Construction Project":"False","FAIN":"IAACP16DI0002","Grant Lead":"Kristin Smith","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Not Applicable","Project End Date":"2018-12-30","Project Start Date":"2016-06-01","Recipient":"DOI-BIA","States":"TX;#43;#AL;#1;#MS;#24;#LA;#18;#FL;#9","Title":"Gulf of Mexico Habitat Restoration via Conservation Corps Partnerships/Youth Conservation Corps"},{"Abstract Version":"9bef014d","Award Amount":4260677.89,"Closeout FY":2022,"Closeout Quarter":3,"Construction Project":"False","FAIN":"IAACP17DA0007","Grant Lead":"Joshua Easton","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"John Ettinger","Project End Date":"2022-06-30","Project Start Date":"2017-02-23","Recipient":"USDA-NRCS Louisiana","States":"LA;#18","Title":"Bayou DuLarge Ridge, Marsh and Hydrologic Restoration (Planning)"},{"Abstract Version":"f2ee9d09","Award Amount":7000000.0,"Closeout FY":2024,"Closeout Quarter":1,"Construction Project":"False","FAIN":"IAACP17DA0041","Grant Lead":"Victoria Schenk","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Amy Newbold","Project End Date":"2023-10-31","Project Start Date":"2017-06-20","Recipient":"USDA-USFS","States":"FL;#9","Title":"Tate's Hell Strategy 1 (Planning and Implementation)"},{"Abstract Version":"822c3b43","Award Amount":8677184.32,"Closeout FY":2022,"Closeout Quarter":2,"Construction Project":"False","FAIN":"IAACP17DC0030","Grant Lead":"Joshua Easton","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Kathryn Keating","Project End Date":"2022-01-31","Project Start Date":"2017-06-15","Recipient":"DOC-NOAA Restoration Center","States":"TX;#43;#AL;#1;#MS;#24;#LA;#18;#FL;#9","Title":"Gulf of Mexico Habitat Restoration via Conservation Corps Partnership"},{"Abstract Version":"aa4e391b","Award Amount":1630228.84,"Closeout FY":2022,"Closeout Quarter":1,"Construction Project":"False","FAIN":"IAACP17DC0038","Grant Lead":"Joshua Easton","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Amy Newbold","Project End Date":"2021-12-31","Project Start Date":"2017-06-15","Recipient":"DOC-NOAA NCCOS","States":"TX;#43;#AL;#1;#MS;#24;#LA;#18;#FL;#9","Title":"Council Monitoring & Assessment Program Development"},{"Abstract Version":"4fd17638","Award Amount":5549800.0,"Closeout FY":2024,"Closeout Quarter":1,"Construction Project":"False","FAIN":"IAACP17DI0001","Grant Lead":"Joshua Easton","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Amy Newbold","Project End Date":"2023-11-30","Project Start Date":"2016-12-01","Recipient":"DOI-USGS","States":"TX;#43;#AL;#1;#MS;#24;#LA;#18;#FL;#9","Title":"Baseline Flow, Gage Analysis & On-Line Tool to Support Restoration"},{"Abstract Version":"6f4731d6","Award Amount":1841808.51,"Closeout FY":2022,"Closeout Quarter":4,"Construction Project":"False","FAIN":"IAACP17DI0005","Grant Lead":"Joshua Easton","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Kathryn Keating","Project End Date":"2022-07-31","Project Start Date":"2017-06-20","Recipient":"DOI-USFWS","States":"TX;#43;#AL;#1;#MS;#24;#LA;#18;#FL;#9","Title":"Strategic Conservation Assessment of Gulf Coast Landscapes"},{"Abstract Version":"d47f0322","Award Amount":1174999.98,"Closeout FY":2021,"Closeout Quarter":1,"Construction Project":"False","FAIN":"IAACP17DI0006","Grant Lead":"Joshua Easton","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Amy Newbold","Project End Date":"2020-12-31","Project Start Date":"2017-03-08","Recipient":"DOI-USGS","States":"TX;#43;#AL;#1;#MS;#24;#LA;#18;#FL;#9","Title":"Council Monitoring & Assessment Program Development (USGS)"},{"Abstract Version":"c796b952","Award Amount":350268.41,"Closeout FY":2020,"Closeout Quarter":2,"Construction Project":"False","FAIN":"IAACP17EP0028","Grant Lead":"Joshua Easton","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Brie Bernik","Project End Date":"2020-03-30","Project Start Date":"2017-06-01","Recipient":"EPA","States":"AL;#1","Title":"Mobile Bay National Estuary Program-Planning"},{"Abstract Version":"48679a51","Award Amount":1316057.1,"Closeout FY":2023,"Closeout Quarter":3,"Construction Project":"False","FAIN":"IAACP18CG0059","Grant Lead":"Joshua Easton","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Kathryn Keating","Project End Date":"2023-05-31","Project Start Date":"2018-06-01","Recipient":"USCG","States":"","Title":"Commitment and Planning Support \u2013 DHS / U.S. Coast Guard"},{"Abstract Version":"7df0d122","Award Amount":1500000.0,"Closeout FY":2026,"Closeout Quarter":4,"Construction Project":"False","FAIN":"IAACP18DA0014","Grant Lead":"Victoria Schenk","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Amy Newbold","Project End Date":"2026-09-30","Project Start Date":"2018-02-15","Recipient":"USDA-NRCS Alabama","States":"AL;#1","Title":"Gulf Coast Conservation Reserve Program (GCCRP) (Planning & Implementation) - Alabama"},{"Abstract Version":"34ebc3ed","Award Amount":1499916.74,"Closeout FY":2024,"Closeout Quarter":2,"Construction Project":"False","FAIN":"IAACP18DA0016","Grant Lead":"Joshua Easton","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Amy Newbold","Project End Date":"2024-02-03","Project Start Date":"2018-01-05","Recipient":"USDA-NRCS Mississippi","States":"MS;#24","Title":"Gulf Coast Conservation Reserve Program (GCCRP) (Planning & Implementation) - Mississippi"},{"Abstract Version":"a9303de9","Award Amount":2100000.0,"Closeout FY":2026,"Closeout Quarter":4,"Construction Project":"False","FAIN":"IAACP18DA0063","Grant Lead":"Victoria Schenk","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Amy Newbold","Project End Date":"2026-09-30","Project Start Date":"2018-08-08","Recipient":"USDA-NRCS GCERT","States":"","Title":"Commitment and Planning Support\u2014United States Department of Agriculture"},{"Abstract Version":"ad6ca7f5","Award Amount":1789759.33,"Closeout FY":2025,"Closeout Quarter":4,"Construction Project":"False","FAIN":"IAACP18DC0033","Grant Lead":"Victoria Schenk","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Heather Young","Project End Date":"2025-09-30","Project Start Date":"2018-08-17","Recipient":"DOC-NOAA Restoration Center","States":"FL;#9","Title":"Robinson Preserve Wetlands Restoration (Implementation)"},{"Abstract Version":"00d1feef","Award Amount":318756.42,"Closeout FY":2021,"Closeout Quarter":1,"Construction Project":"False","FAIN":"IAACP18DC0034","Grant Lead":"Joshua Easton","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Kathryn Keating","Project End Date":"2020-11-30","Project Start Date":"2018-08-17","Recipient":"DOC-NOAA Restoration Center","States":"AL;#1","Title":"Marsh Restoration in Fish River, Weeks Bay, Oyster Bay & Meadows Tract (Planning) - Fish River and Weeks Bay Marsh"},{"Abstract Version":"ed4d19a1","Award Amount":295279.16,"Closeout FY":2021,"Closeout Quarter":1,"Construction Project":"False","FAIN":"IAACP18DC0051","Grant Lead":"Joshua Easton","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Kathryn Keating","Project End Date":"2020-11-30","Project Start Date":"2018-08-17","Recipient":"DOC-NOAA Restoration Center","States":"AL;#1","Title":"Marsh Restoration in Fish River, Weeks Bay, Oyster Bay & Meadows Tract (Planning) - Meadows Tract"},{"Abstract Version":"ea785f45","Award Amount":264370.41,"Closeout FY":2021,"Closeout Quarter":2,"Construction Project":"False","FAIN":"IAACP18DC0052","Grant Lead":"Joshua Easton","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Kathryn Keating","Project End Date":"2021-02-28","Project Start Date":"2018-08-17","Recipient":"DOC-NOAA Restoration Center","States":"AL;#1","Title":"NOAA Marsh Restoration in Fish River, Weeks Bay, Oyster Bay & Meadows Tract (Planning) - Oyster Bay"},{"Award Amount":1317567.0,"Closeout FY":2024,"Closeout Quarter":4,"Construction Project":"False","FAIN":"IAACP18DI0003","Grant Lead":"Victoria Schenk","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Amy Newbold","Project End Date":"2024-07-01","Project Start Date":"2018-04-25","Recipient":"DOI-NPS","States":"TX;#43","Title":"Plug Abandoned Oil and Gas Wells (Implementation)"},{"Abstract Version":"af9075ed","Award Amount":2100000.0,"Closeout FY":2027,"Closeout Quarter":2,"Construction Project":"False","FAIN":"IAACP18DI0065","Grant Lead":"Victoria Schenk","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Amy Newbold","Project End Date":"2027-01-31","Project Start Date":"2018-07-18","Recipient":"DOI","States":"","Title":"Commitment and Planning Support \u2013 DOI"},{"Abstract Version":"9ded3355","Award Amount":1362428.98,"Closeout FY":2024,"Closeout Quarter":2,"Construction Project":"False","FAIN":"IAACP18EP0017","Grant Lead":"Joshua Easton","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Amy Newbold","Project End Date":"2024-01-31","Project Start Date":"2018-02-22","Recipient":"EPA","States":"FL;#9","Title":"Tampa Bay National Estuary Program (Implementation)"},{"Abstract Version":"3ed29720","Award Amount":2030009.43,"Closeout FY":2024,"Closeout Quarter":1,"Construction Project":"False","FAIN":"IAACP18EP0027","Grant Lead":"Joshua Easton","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Amy Newbold","Project End Date":"2023-12-31","Project Start Date":"2018-06-25","Recipient":"EPA","States":"AL;#1;#FL;#9","Title":"Gulf of Mexico Estuary Program (GMEP) (Planning)"},{"Abstract Version":"7d05ce65","Award Amount":2068820.0,"Closeout FY":2025,"Closeout Quarter":4,"Construction Project":"False","FAIN":"IAACP18EP0057","Grant Lead":"Victoria Schenk","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Amy Newbold","Project End Date":"2025-08-14","Project Start Date":"2018-08-15","Recipient":"EPA","States":"","Title":"Commitment and Planning Support - EPA"},{"Abstract Version":"a97aaaa0","Award Amount":1500000.0,"Closeout FY":2024,"Closeout Quarter":4,"Construction Project":"False","FAIN":"IAACP19DA0036","Grant Lead":"Victoria Schenk","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Amy Newbold","Project End Date":"2024-09-30","Project Start Date":"2019-10-17","Recipient":"USDA-NRCS Texas","States":"TX;#43","Title":"Gulf Coast Conservation Reserve Program (GCCRP) (Planning & Implementation) - Texas"},{"Abstract Version":"a7288aae","Award Amount":1373181.0,"Closeout FY":2030,"Closeout Quarter":1,"Construction Project":"True","FAIN":"IAACP19DC0031","Grant Lead":"Victoria Schenk","Grant Program":"FPL","Is Construction":true,"Programs Staff Lead":"Heather Young","Project End Date":"2029-12-31","Project Start Date":"2019-03-04","Recipient":"DOC-NOAA Restoration Center","States":"TX;#43","Title":"Bahia Grande Wetland System Restoration (Planning)"},{"Abstract Version":"5e02709d","Award Amount":1240379.0,"Closeout FY":2027,"Closeout Quarter":1,"Construction Project":"True","FAIN":"IAACP19DC0032","Grant Lead":"Victoria Schenk","Grant Program":"FPL","Is Construction":true,"Programs Staff Lead":"Amy Newbold","Project End Date":"2026-12-31","Project Start Date":"2018-12-21","Recipient":"DOC-NOAA Restoration Center","States":"FL;#9","Title":"Money Bayou Wetlands Restoration (Planning)"},{"Abstract Version":"846e0544","Award Amount":2100000.0,"Closeout FY":2026,"Closeout Quarter":4,"Construction Project":"False","FAIN":"IAACP19DC0067","Grant Lead":"Victoria Schenk","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Amy Newbold","Project End Date":"2026-09-30","Project Start Date":"2019-05-01","Recipient":"DOC-NOAA Fisheries","States":"","Title":"Commitment and Planning Support - US Department of Commerce, National Oceanic and Atmospheric Administration"},{"Abstract Version":"cbcb3ab4","Award Amount":8768660.34,"Closeout FY":2027,"Closeout Quarter":1,"Construction Project":"False","FAIN":"IAACP19DI0004","Grant Lead":"Victoria Schenk","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Amy Newbold","Project End Date":"2026-12-31","Project Start Date":"2019-08-08","Recipient":"DOI-NPS","States":"LA;#18","Title":"Jean Lafitte Canal Backfilling (Implementation)"},{"Abstract Version":"de766de5","Award Amount":1248679.92,"Closeout FY":2024,"Closeout Quarter":2,"Construction Project":"False","FAIN":"IAACP20DA0023","Grant Lead":"Joshua Easton","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Amy Newbold","Project End Date":"2024-01-15","Project Start Date":"2020-01-10","Recipient":"USDA-NRCS Florida","States":"FL;#9","Title":"Gulf Coast Conservation Reserve Program (GCCRP) (Planning & Implementation) - Florida"},{"Abstract Version":"a68639fc","Award Amount":1742000.0,"Closeout FY":2027,"Closeout Quarter":2,"Construction Project":"False","FAIN":"IAACP20EP0099","Grant Lead":"Victoria Schenk","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Amy Newbold","Project End Date":"2027-01-31","Project Start Date":"2020-02-01","Recipient":"EPA","States":"AL;#1","Title":"Mobile Bay National Estuary Program - Implementation"},{"Award Amount":2160747.0,"Closeout FY":2028,"Closeout Quarter":1,"Construction Project":"False","FAIN":"GNTSP20MS0087","Grant Lead":"Bjorn Johnson","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"Heather Young","Project End Date":"2027-10-31","Project Start Date":"2019-11-01","Recipient":"MDEQ","States":"MS;#24","Title":"Round Island Living Shoreline Demonstration and Protection Project (Planning)"},{"Abstract Version":"474b4ef7","Award Amount":6783094.0,"Closeout FY":2030,"Closeout Quarter":3,"Construction Project":"False","FAIN":"GNSSP26MS0075","Grant Lead":"Bjorn Johnson","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"Heather Young","Project End Date":"2030-04-30","Project Start Date":"2025-11-12","Recipient":"MDEQ","States":"MS;#24","Title":"Activity #35: Mississippi Artificial Intelligence Network (MAIN)"},{"Abstract Version":"2a714a8d","Award Amount":1173243.0,"Closeout FY":2027,"Closeout Quarter":3,"Construction Project":"False","FAIN":"GNSSP26MS0076","Grant Lead":"Bjorn Johnson","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"Heather Young","Project End Date":"2027-05-31","Project Start Date":"2025-11-13","Recipient":"MDEQ","States":"MS;#24","Title":"Activity #36: Port of Gulfport Expansion"},{"Abstract Version":"56fc8ea9","Award Amount":1901107.0,"Closeout FY":2029,"Closeout Quarter":3,"Construction Project":"False","FAIN":"GNSSP26MS0077","Grant Lead":"Bjorn Johnson","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"Heather Young","Project End Date":"2029-06-30","Project Start Date":"2025-12-03","Recipient":"MDEQ","States":"MS;#24","Title":"Activity #34: Career Pathways for Hydrographic Technicians"},{"Abstract Version":"1e4f6125","Award Amount":14899851.0,"Closeout FY":2032,"Closeout Quarter":1,"Construction Project":"False","FAIN":"GT3CP26TX0011","Grant Lead":"Bridget Zachary","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Heather Young","Project End Date":"2031-11-30","Project Start Date":"2026-03-13","Recipient":"TCEQ","States":"TX;#43","Title":"FY26 RESTORE Living Shoreline Protection (BKT 2)"},{"Abstract Version":"42edf51f","Award Amount":1099528.0,"Closeout FY":2030,"Closeout Quarter":4,"Construction Project":"False","FAIN":"GNSSP26MS0078","Grant Lead":"Bjorn Johnson","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"Heather Young","Project End Date":"2030-09-30","Project Start Date":"2026-04-01","Recipient":"MDEQ","States":"MS;#24","Title":" Stock Enhancements of Spotted Seatrout in Mississippi"},{"Abstract Version":"3d19324a","Award Amount":1099974.0,"Closeout FY":2031,"Closeout Quarter":4,"Construction Project":"False","FAIN":"GNSSP26MS0079","Grant Lead":"Bjorn Johnson","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"Heather Young","Project End Date":"2031-09-30","Project Start Date":"2026-04-16","Recipient":"MDEQ","States":"MS;#24","Title":"Living Shorelines Assistance Program"},{"Abstract Version":"2cb94224","Award Amount":1099577.0,"Closeout FY":2029,"Closeout Quarter":4,"Construction Project":"False","FAIN":"GNSSP26MS0080","Grant Lead":"Bjorn Johnson","Grant Program":"SEP","Is Construction":false,"Programs Staff Lead":"Heather Young","Project End Date":"2029-09-30","Project Start Date":"2026-04-16","Recipient":"MDEQ","States":"MS;#24","Title":" Mississippi Sound Estuary Program"},{"Abstract Version":"698e7b23","Award Amount":4955743.0,"Closeout FY":2032,"Closeout Quarter":3,"Construction Project":"False","FAIN":"GT3CP26TX0012","Grant Lead":"Bridget Zachary","Grant Program":"FPL","Is Construction":false,"Programs Staff Lead":"Heather Young","Project End Date":"2032-05-31","Project Start Date":"2026-07-06","Recipient":"TCEQ","States":"TX;#43","Title":" FY26 RESTORE FPL3B WTR QTY B2"},{"Abstract Version":"4f90c186","Award Amount":5292026.0,"Closeout FY":2030,"Closeout Quarter":1,"Construction Project":"True","FAIN":"GNSSP26MS0081","Grant Lead":"Bjorn Johnson","Grant Program":"SEP","Is Construction":true,"Programs Staff Lead":"Heather Young","Project End Date":"2029-12-31","Project Start Date":"2026-07-23","Recipient":"MDEQ","States":"MS;#24","Title":"Activity #21: Recreational Enhancements at Front Beach"},{"Abstract Version":"da62b00e","Award Amount":5258333.82,"Closeout FY":2030,"Closeout Quarter":4,"Construction Project":"True","FAIN":"GNSSP26MS0082","Grant Lead":"Bjorn Johnson","Grant Program":"SEP","Is Construction":true,"Programs Staff Lead":"Heather Young","Project End Date":"2030-08-31","Project Start Date":"2026-08-10","Recipient":"MDEQ","States":"MS;#24","Title":"Mississippi Aquarium \u2013 Interactive Exhibit"}];
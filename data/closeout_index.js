@@ -0,0 +1,2 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.closeouts = {"fiscalYears":{"2019":[[166],[],[105],[87,112]],"2020":[[],[117,174],[104],[74]],"2021":[[84,86,96,180,181,107,110,173],[81,182],[82,113],[79]],"2022":[[130,123,170],[169,122],[167],[172]],"2023":[[],[14,97,114,26],[91,175],[3]],"2024":[[168,171,25,186],[193,16,185,177],[18],[183,155,5,188]],"2025":[[41,118,120,127],[0],[85,109],[187,119,134,161,179]],"2026":[[146,15,35,93,108,129,135,137,159],[139,125,48,90,99],[75],[89,4,116,156,43,19,36,51,144,160,176,178,191]],"2027":[[28,33,100,145,162,67,22,44,45,55,95,103,133,141,190,192],[121,138,184,194,157,49,140,131],[21,50,197,24,37,39,40,102],[66,2,9,76,150,7,8,72,132,136]],"2028":[[29,60,195,128,10,17,30,143,13,52,71,142],[1,151,63,124,154,11,12,38,46,73],[70,98,158,31,32,106],[54,152,47]],"2029":[[6,57,58,83,153,164],[20,23,56,77,80],[115,34,53,198],[59,165,202]],"2030":[[61,65,78,88,189,204],[126,62],[196,69,68],[111,163,205,64,200]],"2031":[[],[27,92],[94],[148,201]],"2032":[[199],[101],[203,147],[149]],"2035":[[],[],[42],[]]}};
@@ -0,0 +1,2 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.cumulativeSummary = {"fiscal_year":{"activeCount":[1,1,9,32,58,88,119,127,150,154,149,151,145,145],"activeFunding":[2931659.45,2931659.45,38056403.57,172425827.57,273909324.17,354462215.7,539436364.94,830721564.89,989758551.98,1011679699.82,1187326961.53,1266406866.64,1266535685.37,1266535685.37],"closedCount":[0,0,0,0,0,0,3,4,4,16,31,45,61,61],"closedFunding":[0.0,0.0,0.0,0.0,0.0,0.0,1516123.46,4447782.91,4447782.91,36082336.75,62417150.04,87374024.89,130807682.98,130807682.98],"period":[2014,2015,2016,2017,2018,2019,2020,2021,2022,2023,2024,2025,2026,2027],"totalCount":[1,1,9,32,58,88,122,131,154,170,180,196,206,206],"totalFunding":[2931659.45,2931659.45,38056403.57,172425827.57,273909324.17,354462215.7,540952488.4,835169347.8,994206334.89,1047762036.57,1249744111.57,1353780891.53,1397343368.35,1397343368.35]},"month":{"activeCount":[1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,6,7,9,9,9,10,12,13,14,15,17,21,21,27,30,31,32,32,32,32,33,35,38,41,43,47,50,56,58,64,64,65,66,68,69,72,76,77,78,84,88,97,105,106,108,109,111,113,117,117,117,119,119,119,119,120,121,123,124,124,124,125,126,127,127,127,127,129,130,131,134,135,144,147,147,147,150,150,150,150,150,153,155,156,159,161,162,164,154,154,154,154,155,151,154,154,155,156,158,153,149,149,146,148,147,147,148,148,151,152,153,153,151,151,150,151,150,149,150,153,153,153,148,145,145,145],"activeFunding":[2931659.45,2931659.45,2931659.45,2931659.45,2931659.45,2931659.45,2931659.45,2931659.45,2931659.45,2931659.45,2931659.45,2931659.45,2931659.45,2931659.45,2931659.45,2931659.45,2931659.45,2931659.45,2931659.45,2931659.45,18920203.25,21515973.64,21963918.09,38056403.57,38056403.57,38056403.57,41664625.5,47011562.41,52561362.41,54357312.41,58617990.3,119917919.28,127578434.8,127578434.8,153044924.88,155351827.57,158235827.57,172425827.57,172425827.57,172425827.57,172425827.57,173925744.31,176788173.29,234994942.31,240988883.0,248688883.0,257984949.53,261596614.56,268433599.88,273909324.17,280767547.85,280767547.85,282007926.85,282060711.64,283308601.39,284681782.39,292808331.17,304457007.17,307033351.15,309303351.15,345407455.49,354462215.7,426952208.76,461500371.95,462070181.0,465818860.92,480530870.46,487173118.46,501203717.0,515433454.0,515433454.0,515433454.0,539436364.94,539436364.94,539436364.94,539436364.94,558407237.94,562407237.94,807979307.94,808583909.94,805881483.89,805881483.89,816277397.89,828248647.89,830721564.89,830721564.89,830721564.89,830721564.89,873302714.89,873816757.89,875039501.89,881386957.89,887464322.89,941536779.98,959981439.98,959981439.98,959981439.98,989758551.98,989758551.98,989758551.98,989758551.98,989758551.98,993268766.98,995515015.98,998513641.98,1004062934.98,1005556835.66,1010793845.66,1013464469.66,1011679699.82,1011679699.82,1011679699.82,1011679699.82,1018243217.82,1020839543.44,1185875916.44,1185875916.44,1193361892.44,1196414553.44,1207993924.44,1203736861.09,1187326961.53,1187326961.53,1180444843.49,1182477482.49,1184211581.23,1184211581.23,1196728580.23,1207213446.8,1212595253.68,1266281868.7,1267356794.25,1267356794.25,1266406866.64,1266406866.64,1266064806.98,1267965913.98,1267627874.79,1267627874.79,1282527725.79,1285826804.79,1285826804.79,1285826804.79,1280748085.42,1266535685.37,1266535685.37,1266535685.37],"closedCount":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,3,3,3,3,3,3,3,3,3,3,3,3,3,3,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,16,16,16,16,16,21,21,21,21,21,21,27,31,31,34,34,36,36,36,39,39,41,43,43,45,45,48,48,49,50,50,50,50,50,57,61,61,61],"closedFunding":[0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,1516123.46,1516123.46,1516123.46,1516123.46,1516123.46,1516123.46,1516123.46,1516123.46,1516123.46,1516123.46,1516123.46,1516123.46,1516123.46,1516123.46,4447782.91,4447782.91,4447782.91,4447782.91,4447782.91,4447782.91,4447782.91,4447782.91,4447782.91,4447782.91,4447782.91,4447782.91,4447782.91,4447782.91,4447782.91,4447782.91,4447782.91,4447782.91,4447782.91,4447782.91,4447782.91,4447782.91,4447782.91,4447782.91,4447782.91,4447782.91,4447782.91,4447782.91,4447782.91,36082336.75,36082336.75,36082336.75,36082336.75,36082336.75,38486011.13,38486011.13,38486011.13,38486011.13,38486011.13,38486011.13,46007250.48,62417150.04,62417150.04,69299268.08,69299268.08,69852669.34,69852669.34,69852669.34,74561164.85,74561164.85,82807545.83,86424097.28,86424097.28,87374024.89,87374024.89,95672421.55,95672421.55,96010460.74,96010460.74,96010460.74,96010460.74,96010460.74,96010460.74,111336949.11,130807682.98,130807682.98,130807682.98],"period":["2014-08","2014-09","2014-10","2014-11","2014-12","2015-01","2015-02","2015-03","2015-04","2015-05","2015-06","2015-07","2015-08","2015-09","2015-10","2015-11","2015-12","2016-01","2016-02","2016-03","2016-04","2016-05","2016-06","2016-07","2016-08","2016-09","2016-10","2016-11","2016-12","2017-01","2017-02","2017-03","2017-04","2017-05","2017-06","2017-07","2017-08","2017-09","2017-10","2017-11","2017-12","2018-01","2018-02","2018-03","2018-04","2018-05","2018-06","2018-07","2018-08","2018-09","2018-10","2018-11","2018-12","2019-01","2019-02","2019-03","2019-04","2019-05","2019-06","2019-07","2019-08","2019-09","2019-10","2019-11","2019-12","2020-01","2020-02","2020-03","2020-04","2020-05","2020-06","2020-07","2020-08","2020-09","2020-10","2020-11","2020-12","2021-01","2021-02","2021-03","2021-04","2021-05","2021-06","2021-07","2021-08","2021-09","2021-10","2021-11","2021-12","2022-01","2022-02","2022-03","2022-04","2022-05","2022-06","2022-07","2022-08","2022-09","2022-10","2022-11","2022-12","2023-01","2023-02","2023-03","2023-04","2023-05","2023-06","2023-07","2023-08","2023-09","2023-10","2023-11","2023-12","2024-01","2024-02","2024-03","2024-04","2024-05","2024-06","2024-07","2024-08","2024-09","2024-10","2024-11","2024-12","2025-01","2025-02","2025-03","2025-04","2025-05","2025-06","2025-07","2025-08","2025-09","2025-10","2025-11","2025-12","2026-01","2026-02","2026-03","2026-04","2026-05","2026-06","2026-07","2026-08","2026-09","2026-10"],"totalCount":[1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,6,7,9,9,9,10,12,13,14,15,17,21,21,27,30,31,32,32,32,32,33,35,38,41,43,47,50,56,58,64,64,65,66,68,69,72,76,77,78,84,88,97,105,106,108,112,114,116,120,120,120,122,122,122,122,123,124,126,127,128,128,129,130,131,131,131,131,133,134,135,138,139,148,151,151,151,154,154,154,154,154,157,159,160,163,165,166,168,170,170,170,170,171,172,175,175,176,177,179,180,180,180,180,182,183,183,184,187,190,193,196,196,196,196,198,199,199,199,200,203,203,203,205,206,206,206],"totalFunding":[2931659.45,2931659.45,2931659.45,2931659.45,2931659.45,2931659.45,2931659.45,2931659.45,2931659.45,2931659.45,2931659.45,2931659.45,2931659.45,2931659.45,2931659.45,2931659.45,2931659.45,2931659.45,2931659.45,2931659.45,18920203.25,21515973.64,21963918.09,38056403.57,38056403.57,38056403.57,41664625.5,47011562.41,52561362.41,54357312.41,58617990.3,119917919.28,127578434.8,127578434.8,153044924.88,155351827.57,158235827.57,172425827.57,172425827.57,172425827.57,172425827.57,173925744.31,176788173.29,234994942.31,240988883.0,248688883.0,257984949.53,261596614.56,268433599.88,273909324.17,280767547.85,280767547.85,282007926.85,282060711.64,283308601.39,284681782.39,292808331.17,304457007.17,307033351.15,309303351.15,345407455.49,354462215.7,426952208.76,461500371.95,462070181.0,465818860.92,482046993.92,488689241.92,502719840.46,516949577.46,516949577.46,516949577.46,540952488.4,540952488.4,540952488.4,540952488.4,559923361.4,563923361.4,809495431.4,810100033.4,810329266.8,810329266.8,820725180.8,832696430.8,835169347.8,835169347.8,835169347.8,835169347.8,877750497.8,878264540.8,879487284.8,885834740.8,891912105.8,945984562.89,964429222.89,964429222.89,964429222.89,994206334.89,994206334.89,994206334.89,994206334.89,994206334.89,997716549.89,999962798.89,1002961424.89,1008510717.89,1010004618.57,1015241628.57,1017912252.57,1047762036.57,1047762036.57,1047762036.57,1047762036.57,1054325554.57,1059325554.57,1224361927.57,1224361927.57,1231847903.57,1234900564.57,1246479935.57,1249744111.57,1249744111.57,1249744111.57,1249744111.57,1251776750.57,1254064250.57,1254064250.57,1266581249.57,1281774611.65,1287156418.53,1349089414.53,1353780891.53,1353780891.53,1353780891.53,1353780891.53,1361737228.53,1363638335.53,1363638335.53,1363638335.53,1378538186.53,1381837265.53,1381837265.53,1381837265.53,1392085034.53,1397343368.35,1397343368.35,1397343368.35]},"year":{"activeCount":[1,1,13,32,65,106,120,129,150,154,148,151,145],"activeFunding":[2931659.45,2931659.45,52561362.41,172425827.57,282007926.85,462070181.0,558407237.94,873302714.89,989758551.98,1011679699.82,1182477482.49,1267965913.98,1266535685.37],"closedCount":[0,0,0,0,0,0,3,4,4,16,34,48,61],"closedFunding":[0.0,0.0,0.0,0.0,0.0,0.0,1516123.46,4447782.91,4447782.91,36082336.75,69299268.08,95672421.55,130807682.98],"period":[2014,2015,2016,2017,2018,2019,2020,2021,2022,2023,2024,2025,2026],"totalCount":[1,1,13,32,65,106,123,133,154,170,182,199,206],"totalFunding":[2931659.45,2931659.45,52561362.41,172425827.57,282007926.85,462070181.0,559923361.4,877750497.8,994206334.89,1047762036.57,1251776750.57,1363638335.53,1397343368.35]}};
@@ -0,0 +1,2 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.workerSource = "\n'use strict';\n\nfunction isCloseout(amendment) {\n    if (!amendment || !amendment.date) return false;\n    return String(amendment.type || '').trim().toLowerCase().includes('closeout');\n}\n\n// Per award (in jsonData order): start and end dates as ms (NaN when missing or\n// invalid), the award amount, and whether it has a closeout amendment.\nfunction decodeAwards(awards, amendments) {\n    const n = awards.length;\n    const start = new Float64Array(n);\n    const end = new Float64Array(n);\n    const amount = new Float64Array(n);\n    const hasCloseout = new Uint8Array(n);\n    for (let i = 0; i < n; i++) {\n        const d = awards[i];\n        start[i] = new Date(d['Project Start Date']).getTime();\n        end[i] = new Date(d['Project End Date']).getTime();\n        const rawAmt = d['Award Amount'];\n        amount[i] = typeof rawAmt === 'number' ? rawAmt : (parseFloat(rawAmt) || 0.0);\n        const fain = String(d['FAIN'] || '').trim();\n        hasCloseout[i] = (amendments[fain] || []).some(isCloseout) ? 1 : 0;\n    }\n    return {start, end, amount, hasCloseout};\n}\n\nself.onmessage = event => {\n    const {awards, amendments} = event.data;\n    const started = performance.now();\n    const result = {decoded: decodeAwards(awards, amendments || {})};\n    result.workerMs = performance.now() - started;\n    const transfer = [];\n    Object.values(result).forEach(part => {\n        if (part && typeof part === 'object') Object.values(part).forEach(array => transfer.push(array.buffer));\n    });\n    self.postMessage(result, transfer);\n};\n";
@@ -0,0 +1,2 @@
+window.GCERC_DATA = window.GCERC_DATA || {};
+window.GCERC_DATA.facets = {"facets":{"Grant Lead":{"Barbara Shumar":[0,0,0,131072,0,0,0],"Bjorn Johnson":[947912704,253231104,2553412604,1699904,20519936,0,14200],"Bridget Zachary":[0,2099200,1624114178,265255,71574496,0,2176],"Joshua Easton":[0,0,0,896,134217728,108199552,2],"Katy Baxter":[3222266879,268435471,117440512,65011736,42123264,0,0],"Kristin Smith":[0,0,0,0,0,64,0],"Sheri Land":[124787712,3771201520,1,4227858432,31,0,0],"Victoria Schenk":[0,0,0,0,4026531840,4186767679,5]},"Grant Program":{"FPL":[0,0,4294966272,255,4294950912,4294967295,2183],"SEP":[4294967295,4294967295,1023,4294967040,16383,0,14200]},"Programs Staff Lead":{"Amy Newbold":[0,0,3506438144,4,4160749568,3750178103,7],"Brie Bernik":[0,0,1024,16384,0,16384,0],"Heather Young":[813697024,255379456,148906716,135831779,21445632,537395200,16376],"John Ettinger":[134217728,0,538937346,267264,67109856,136,0],"Kathryn Keating":[100663296,512,0,2147483648,0,7377408,0],"Matt Love":[3246389247,4039587327,100684065,2009202712,45662239,0,0],"Not Applicable":[0,0,0,2165504,0,64,0]},"Recipient":{"ADCNR":[3222266879,268435471,117440512,65011736,42123264,0,0],"AL Port Authority":[0,0,0,128,0,0,0],"DOC-NOAA Fisheries":[0,0,0,0,0,2147483648,0],"DOC-NOAA NCCOS":[0,0,0,0,2684354560,1024,0],"DOC-NOAA Restoration Center":[0,0,0,0,0,1618477568,0],"DOI":[0,0,0,0,0,16777216,0],"DOI-BIA":[0,0,0,0,1207959552,68,0],"DOI-NPS":[0,0,0,0,0,8388610,1],"DOI-USFWS":[0,0,0,0,0,4096,0],"DOI-USGS":[0,0,0,0,0,10241,0],"EPA":[0,0,0,0,268435456,234897408,4],"FDEP":[0,0,402782208,0,3932160,0,0],"Gulf Consortium":[133176320,3771201520,1,4228055296,31,0,0],"LA CPRA":[134217728,0,1611531266,267264,67109856,0,0],"MDEQ":[805306368,253231104,2150630396,1630816,16849920,0,14200],"TCEQ":[0,2099200,12582912,2055,4202496,0,2176],"USCG":[0,0,0,0,0,32768,0],"USDA-NRCS":[0,0,0,0,0,32,0],"USDA-NRCS Alabama":[0,0,0,0,0,65536,0],"USDA-NRCS Florida":[0,0,0,0,0,0,2],"USDA-NRCS GCERT":[0,0,0,0,0,262144,0],"USDA-NRCS Louisiana":[0,0,0,0,0,128,0],"USDA-NRCS Mississippi":[0,0,0,0,0,131072,0],"USDA-NRCS Texas":[0,0,0,0,0,268435456,0],"USDA-USFS":[0,0,0,0,0,280,0]},"States":{"AL":[3222266879,268435471,100665344,62914712,3129131008,74546797,4],"FL":[133176320,3771201520,402782209,4227989504,2554069023,1174945661,2],"LA":[134217728,0,537789442,267264,2617246688,16068,1],"MS":[805306368,253231104,3146748,1630304,2566986752,147053,14200],"TX":[0,2099200,12582912,3,3493863424,813710914,2176]}},"length":206,"words":7};
@@ -0,0 +1,175 @@
+import gzip
+import hashlib
+import json
+import os
+import re
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+from closeout_buckets import build_closeout_index
+from cumulative_series import build_cumulative_summary, write_summary_csv
+from dashboard_worker import WORKER_DATA_FILE, WORKER_SOURCE
+from facet_index import build_facet_index
+
+DATA_DIR = 'data'
+AWARD_DATA_FILE = 'award_data.js'
+AMENDMENT_DATA_FILE = 'amendment_data.js'
+FACET_INDEX_FILE = 'facet_index.js'
+CLOSEOUT_INDEX_FILE = 'closeout_index.js'
+CUMULATIVE_SUMMARY_FILE = 'cumulative_summary.js'
+CUMULATIVE_SUMMARY_CSV = 'cumulative_summary.csv'
+ABSTRACT_DIR = 'abstracts'
+
+# Long free-text fields only award_details.html shows, served per award on demand
+ABSTRACT_FIELD = 'Abstract'
+ABSTRACT_VERSION_FIELD = 'Abstract Version'
+# Only set when a FAIN's abstract file is not named after the FAIN itself (see abstract_file_names)
+ABSTRACT_FILE_FIELD = 'Abstract File'
+
+
+def _compact_json(payload):
+    # Sorted keys and no whitespace keep the file small and stable between builds
+    return json.dumps(payload, separators=(',', ':'), sort_keys=True)
+
+
+def write_data_file(name, key, payload, out_dir=DATA_DIR):
+    """Write payload as a script that sets window.GCERC_DATA[key].
+
+    A script (rather than a .json file fetched at runtime) keeps the pages
+    working when opened straight from the filesystem. Precompressed .gz (and
+    .br when the brotli package is installed) copies are written alongside
+    for servers that can serve them. A file whose content is unchanged is
+    left alone, so it is not compressed again. Returns the content version.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    content = (
+        'window.GCERC_DATA = window.GCERC_DATA || {};\n'
+        f'window.GCERC_DATA.{key} = {_compact_json(payload)};\n'
+    ).encode('utf-8')
+    version = hashlib.sha256(content).hexdigest()[:12]
+
+    path = os.path.join(out_dir, name)
+    compressed = [path + '.gz'] + ([path + '.br'] if brotli is not None else [])
+    if os.path.exists(path) and all(os.path.exists(copy) for copy in compressed):
+        with open(path, 'rb') as f:
+            if f.read() == content:
+                return version
+    with open(path, 'wb') as f:
+        f.write(content)
+    with open(path + '.gz', 'wb') as f:
+        f.write(gzip.compress(content, compresslevel=9, mtime=0))
+    if brotli is not None:
+        with open(path + '.br', 'wb') as f:
+            f.write(brotli.compress(content))
+    return version
+
+
+def _abstract_file_name(fain):
+    # award_details.html derives the same name when a record has no 'Abstract File'
+    return re.sub(r'[^A-Za-z0-9_-]', '_', fain)
+
+
+def abstract_file_names(fains):
+    """{FAIN: file name under data/abstracts/, without .js}.
+
+    FAINs that sanitize to the same name (compared case-insensitively, as on
+    Windows) each get a suffix from a hash of the FAIN, rather than
+    overwriting one another's file.
+    """
+    groups = {}
+    for fain in fains:
+        groups.setdefault(_abstract_file_name(fain).lower(), []).append(fain)
+    names = {}
+    for group in groups.values():
+        for fain in group:
+            name = _abstract_file_name(fain)
+            if len(group) > 1:
+                name += '-' + hashlib.sha256(fain.encode('utf-8')).hexdigest()[:10]
+            names[fain] = name
+    return names
+
+
+def write_abstract_store(abstracts, out_dir=DATA_DIR):
+    """Write one small script per award under data/abstracts/, keyed by FAIN.
+
+    award_details.html injects the script for the selected award only, so no
+    page downloads the full set of abstracts. Files are only rewritten when
+    their text changed, and files for awards no longer in the data are
+    removed. Returns {FAIN: version} for the awards that have an abstract.
+    """
+    abstract_dir = os.path.join(out_dir, ABSTRACT_DIR)
+    os.makedirs(abstract_dir, exist_ok=True)
+    versions = {}
+    current_files = set()
+    file_names = abstract_file_names(abstracts)
+    for fain, text in abstracts.items():
+        name = file_names[fain] + '.js'
+        content = (
+            'window.GCERC_DATA = window.GCERC_DATA || {};\n'
+            'window.GCERC_DATA.abstracts = window.GCERC_DATA.abstracts || {};\n'
+            f'window.GCERC_DATA.abstracts[{json.dumps(fain)}] = {json.dumps(text)};\n'
+        ).encode('utf-8')
+        path = os.path.join(abstract_dir, name)
+        current_files.add(name)
+        versions[fain] = hashlib.sha256(content).hexdigest()[:8]
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                if f.read() == content:
+                    continue
+        with open(path, 'wb') as f:
+            f.write(content)
+    for name in os.listdir(abstract_dir):
+        if name.endswith('.js') and name not in current_files:
+            os.remove(os.path.join(abstract_dir, name))
+    return versions
+
+
+def split_abstracts(records):
+    """Move non-empty abstracts out of the records, leaving a version stamp in their place."""
+    abstracts = {}
+    slim_records = []
+    for record in records:
+        record = dict(record)
+        text = record.pop(ABSTRACT_FIELD, None)
+        if isinstance(text, str) and text.strip():
+            abstracts[str(record.get('FAIN', '')).strip()] = text.strip()
+        slim_records.append(record)
+    return slim_records, abstracts
+
+
+def write_shared_data(records, amendment_data, out_dir=DATA_DIR, executor=None):
+    """Write the shared award, amendment, facet and closeout index, summary, worker and abstract files.
+
+    The files are independent, so with a concurrent.futures executor they are
+    written concurrently. Returns {file name: version} for the dashboards'
+    ?v= query strings.
+    """
+    records, abstracts = split_abstracts(records)
+    abstract_versions = write_abstract_store(abstracts, out_dir)
+    file_names = abstract_file_names(abstracts)
+    for record in records:
+        fain = str(record.get('FAIN', '')).strip()
+        version = abstract_versions.get(fain)
+        if version:
+            record[ABSTRACT_VERSION_FIELD] = version
+            if file_names[fain] != _abstract_file_name(fain):
+                record[ABSTRACT_FILE_FIELD] = file_names[fain]
+
+    summary = build_cumulative_summary(records, amendment_data)
+    write_summary_csv(summary, os.path.join(out_dir, CUMULATIVE_SUMMARY_CSV))
+
+    files = [
+        (AWARD_DATA_FILE, 'awards', records),
+        (AMENDMENT_DATA_FILE, 'amendments', amendment_data),
+        (FACET_INDEX_FILE, 'facets', build_facet_index(records)),
+        (CLOSEOUT_INDEX_FILE, 'closeouts', build_closeout_index(records)),
+        (CUMULATIVE_SUMMARY_FILE, 'cumulativeSummary', summary),
+        (WORKER_DATA_FILE, 'workerSource', WORKER_SOURCE),
+    ]
+    if executor is None:
+        return {name: write_data_file(name, key, payload, out_dir) for name, key, payload in files}
+    futures = {name: executor.submit(write_data_file, name, key, payload, out_dir) for name, key, payload in files}
+    return {name: future.result() for name, future in futures.items()}
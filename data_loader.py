@@ -0,0 +1,202 @@
+import os
+from itertools import islice
+
+import pandas as pd
+from pandas.io.parsers import TextParser
+
+from normalize import format_iso_dates, parse_currency, parse_dates
+from source_cache import SourceCache
+
+MASTER_TRACKER_PATH = 'Master Tracker 04162025.csv'
+AWARD_DETAILS_PATH = 'Award_Details_20250505.xlsx'
+AWARD_DETAILS_SHEET = 'Award Details'
+
+AWARD_DATE_COLUMNS = ['Project Start Date', 'Project End Date']
+AMENDMENT_DATE_COLUMN = 'Day of Award Issue Date'
+AMENDMENT_TYPE_COLUMN = 'Amendment Type'
+# Stands in for a blank Amendment Type in the grouped amendments
+MISSING_AMENDMENT_TYPE = 'Unknown'
+
+# Columns the dashboards cannot be built without
+MASTER_TRACKER_COLUMNS = ['FAIN', 'Title', 'Award Amount', 'Grant Lead', 'Programs Staff Lead'] + AWARD_DATE_COLUMNS
+AWARD_DETAILS_COLUMNS = ['FAIN', AMENDMENT_DATE_COLUMN, AMENDMENT_TYPE_COLUMN]
+
+# Columns the pages read when present, including the alternate names some exports use.
+# Every other column of an export is skipped while reading.
+MASTER_TRACKER_OPTIONAL_COLUMNS = [
+    'Recipient', 'Grant Program', 'States', 'Abstract', 'Construction Project',
+    'Project Title', 'AwardID', 'Grants Lead', 'Programs Lead', 'Construction',
+    'Award Close Date', 'End Date', 'Path',
+]
+
+# TRUE/FALSE columns, left for pandas to read as booleans; every other Master Tracker column is read as text
+MASTER_TRACKER_FLAG_COLUMNS = ['Construction Project', 'Construction']
+
+# Rows parsed per chunk, so only one chunk of raw cells is held at a time
+CHUNK_ROWS = 50_000
+
+
+class SchemaError(ValueError):
+    """A source file is missing columns the dashboards need."""
+
+# Parsed sources, keyed by (kind, absolute path), so each file is read once per process
+_parsed = {}
+
+
+def _load_once(kind, path, parse, use_cache):
+    key = (kind, os.path.abspath(path))
+    if key not in _parsed:
+        # Unchanged sources come back from the on-disk cache instead of being re-parsed
+        _parsed[key] = SourceCache().load(kind, path, parse) if use_cache else parse(path)
+    # Hand out copies so one caller's new columns don't leak into another's
+    return _parsed[key].copy()
+
+
+def require_columns(columns, required, path):
+    missing = [column for column in required if column not in columns]
+    if missing:
+        raise SchemaError(f"'{path}' is missing required column(s): {', '.join(missing)}")
+
+
+def select_columns(header, required, optional, path):
+    """Positions and stripped names of the header columns to read, in file order."""
+    names = [str(column).strip() if column is not None else '' for column in header]
+    require_columns(names, required, path)
+    wanted = set(required) | set(optional)
+    return [(i, name) for i, name in enumerate(names) if name in wanted]
+
+
+def read_csv_chunks(path, required, optional=(), text_columns=(), chunk_rows=CHUNK_ROWS, encoding='windows-1252'):
+    """Read only the wanted columns of a CSV, CHUNK_ROWS rows at a time.
+
+    The header is checked before any data is read and text_columns are read
+    as strings; yields DataFrames with stripped column names.
+    """
+    header = pd.read_csv(path, encoding=encoding, nrows=0).columns
+    columns = select_columns(header, required, optional, path)
+    positions = [i for i, _ in columns]
+    names = {header[i]: name for i, name in columns}
+    dtype = {header[i]: 'str' for i, name in columns if name in text_columns}
+    chunks = pd.read_csv(path, encoding=encoding, usecols=positions, dtype=dtype, chunksize=chunk_rows)
+    for chunk in chunks:
+        yield chunk.rename(columns=names)
+
+
+def _excel_value(value):
+    # As pd.read_excel: blank cells become '' (read as missing) and whole floats become ints
+    if value is None:
+        return ''
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def read_sheet_chunks(path, sheet, required, optional=(), text_columns=(), chunk_rows=CHUNK_ROWS):
+    """Stream the wanted columns of one worksheet, CHUNK_ROWS rows at a time.
+
+    The workbook is opened read-only, so openpyxl parses rows as they are
+    iterated instead of loading the whole sheet. Each chunk goes through the
+    same parser pd.read_excel uses, so missing values and type inference
+    match it; text_columns are read as strings. Yields DataFrames with
+    stripped column names.
+    """
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        if sheet not in workbook.sheetnames:
+            raise SchemaError(f"'{path}' has no '{sheet}' sheet")
+        rows = workbook[sheet].iter_rows(values_only=True)
+        columns = select_columns(next(rows, ()), required, optional, path)
+        names = [name for _, name in columns]
+        dtype = {name: 'str' for name in names if name in text_columns}
+        while True:
+            chunk = [
+                [_excel_value(row[i] if i < len(row) else None) for i, _ in columns]
+                for row in islice(rows, chunk_rows)
+            ]
+            if not chunk:
+                break
+            yield TextParser(chunk, header=None, names=names, dtype=dtype).read()
+    finally:
+        workbook.close()
+
+
+def _concat_chunks(chunks, columns):
+    chunks = list(chunks)
+    if not chunks:
+        return pd.DataFrame(columns=columns)
+    return pd.concat(chunks, ignore_index=True)
+
+
+def _parse_master_tracker(path):
+    def cleaned(chunks):
+        # Award Amount is cleaned per chunk, so its raw text never exists for the whole file
+        for chunk in chunks:
+            chunk['Award Amount'] = parse_currency(chunk['Award Amount'], 'Award Amount', path)
+            yield chunk
+
+    columns = MASTER_TRACKER_COLUMNS + MASTER_TRACKER_OPTIONAL_COLUMNS
+    text_columns = [column for column in columns if column not in MASTER_TRACKER_FLAG_COLUMNS]
+    chunks = read_csv_chunks(path, MASTER_TRACKER_COLUMNS, MASTER_TRACKER_OPTIONAL_COLUMNS, text_columns)
+    df = _concat_chunks(cleaned(chunks), MASTER_TRACKER_COLUMNS)
+    for column in AWARD_DATE_COLUMNS:
+        df[column] = parse_dates(df[column], column, path)
+    return df
+
+
+def _parse_award_details(path):
+    chunks = read_sheet_chunks(path, AWARD_DETAILS_SHEET, AWARD_DETAILS_COLUMNS,
+                               text_columns=['FAIN', AMENDMENT_TYPE_COLUMN])
+    df = _concat_chunks(chunks, AWARD_DETAILS_COLUMNS)
+    df[AMENDMENT_DATE_COLUMN] = parse_dates(df[AMENDMENT_DATE_COLUMN], AMENDMENT_DATE_COLUMN, path)
+    return df
+
+
+def load_master_tracker(path=MASTER_TRACKER_PATH, use_cache=True):
+    """Master Tracker awards with parsed project dates and a float Award Amount."""
+    return _load_once('master_tracker', path, _parse_master_tracker, use_cache)
+
+
+def load_award_details(path=AWARD_DETAILS_PATH, use_cache=True):
+    """'Award Details' amendment rows with a parsed issue date."""
+    return _load_once('award_details', path, _parse_award_details, use_cache)
+
+
+def group_amendments(df, require_type=False):
+    """Group the 'Award Details' rows into {FAIN: [{'date', 'type'}, ...]}.
+
+    Filtering, date parsing and formatting all run on whole columns; the only
+    per-row Python work left is building the output dicts themselves.
+
+    With require_type=False (the shared dashboard data and
+    process_amendments.py) rows need a FAIN and a valid date, and a missing
+    type becomes MISSING_AMENDMENT_TYPE. With require_type=True rows also need
+    a non-blank Amendment Type, which is stripped, as the original timeline
+    loop did; the timeline's amendment index is built from that grouping.
+    """
+    fains = df['FAIN']
+    dates = parse_dates(df[AMENDMENT_DATE_COLUMN], AMENDMENT_DATE_COLUMN)
+    types = df[AMENDMENT_TYPE_COLUMN]
+
+    mask = fains.notna() & dates.notna()
+    if require_type:
+        types = types.astype(str).str.strip().where(types.notna())
+        mask &= types.notna() & (types != '')
+    else:
+        types = types.where(types.notna(), MISSING_AMENDMENT_TYPE)
+
+    fains = fains[mask].reset_index(drop=True)
+    records = [
+        {'date': date, 'type': amendment_type}
+        for date, amendment_type in zip(
+            format_iso_dates(dates[mask]).to_numpy(),
+            types[mask].to_numpy(),
+        )
+    ]
+
+    # groupby(sort=False) keeps FAINs in first-seen order and rows in file order
+    return {
+        fain: [records[i] for i in positions]
+        for fain, positions in fains.groupby(fains, sort=False).indices.items()
+    }
@@ -0,0 +1,249 @@
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import re
+from functools import partial
+from http import HTTPStatus
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from award_store import FACETS, STORE_PATH, AwardStore, award_filters, fiscal_year_bounds
+from cumulative_series import PERIODS, build_cumulative_summary
+from data_files import ABSTRACT_FIELD
+
+# Page size when a request gives no limit, and the largest one allowed
+DEFAULT_LIMIT = 500
+MAX_LIMIT = 5000
+
+# Smaller responses are sent as is; gzip would save little
+GZIP_MIN_BYTES = 1024
+
+ISO_DATE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
+
+class BadRequest(ValueError):
+    """A query parameter the API cannot use."""
+
+
+def _one(query, name):
+    values = query.get(name)
+    return values[-1] if values else None
+
+
+def _int(query, name, default, maximum=None):
+    value = _one(query, name)
+    if value is None:
+        return default
+    try:
+        number = int(value)
+    except ValueError:
+        raise BadRequest(f"{name} must be a whole number") from None
+    if number < 0:
+        raise BadRequest(f"{name} cannot be negative")
+    return min(number, maximum) if maximum is not None else number
+
+
+def _flag(query, name):
+    value = _one(query, name)
+    if value is None or value == '':
+        return None
+    if value.lower() in ('1', 'true', 'yes'):
+        return True
+    if value.lower() in ('0', 'false', 'no'):
+        return False
+    raise BadRequest(f"{name} must be true or false")
+
+
+def _date_range(query, prefix):
+    """Inclusive (from, to) dates from <prefix>_from/<prefix>_to, or a fiscal year from fy; None if neither."""
+    fiscal_year = _one(query, 'fy')
+    if fiscal_year:
+        if not fiscal_year.isdigit():
+            raise BadRequest('fy must be a year, e.g. 2026')
+        return fiscal_year_bounds(int(fiscal_year))
+    start, end = _one(query, f'{prefix}_from'), _one(query, f'{prefix}_to')
+    if start is None and end is None:
+        return None
+    for name, value in ((f'{prefix}_from', start), (f'{prefix}_to', end)):
+        if value is not None and not ISO_DATE.match(value):
+            raise BadRequest(f"{name} must be a YYYY-MM-DD date")
+    return start or '0000-01-01', end or '9999-12-31'
+
+
+def query_filters(query):
+    """Keyword filters for AwardStore from the dropdown parameters (named as in award_store.FACETS)."""
+    filters = {facet: _one(query, facet) for facet in FACETS if _one(query, facet)}
+    filters['ending_between'] = _date_range(query, 'ending')
+    filters['with_closeout'] = _flag(query, 'closeout')
+    return filters
+
+
+def _list_record(record):
+    # As in data/award_data.js, the abstract is left to the single-award endpoint
+    record.pop(ABSTRACT_FIELD, None)
+    return record
+
+
+def get_awards(store, query):
+    filters = query_filters(query)
+    limit = _int(query, 'limit', DEFAULT_LIMIT, MAX_LIMIT)
+    offset = _int(query, 'offset', 0)
+    order_by = _one(query, 'order_by') or 'end_date'
+    try:
+        awards = store.awards(limit=limit, offset=offset, order_by=order_by, **filters)
+    except ValueError as e:
+        raise BadRequest(str(e)) from None
+    return {
+        'total': store.count_awards(**filters),
+        'offset': offset,
+        'limit': limit,
+        'awards': [_list_record(record) for record in awards],
+    }
+
+
+def get_award(store, query, fain):
+    award = store.award(fain)
+    if award is None:
+        return None
+    return {'award': award, 'amendments': store.amendments(fain)}
+
+
+def get_amendments(store, query):
+    limit = _int(query, 'limit', DEFAULT_LIMIT, MAX_LIMIT)
+    offset = _int(query, 'offset', 0)
+    amendments, total = store.amendment_rows(fain=_one(query, 'fain'), date_between=_date_range(query, 'date'),
+                                             closeout=_flag(query, 'closeout'), limit=limit, offset=offset)
+    return {'total': total, 'offset': offset, 'limit': limit, 'amendments': amendments}
+
+
+def get_facets(store, query):
+    """{facet: {value: count}}, each dropdown counted under the other filters, as the pages' bitsets do."""
+    filters = query_filters(query)
+    fields = (_one(query, 'fields') or ','.join(FACETS)).split(',')
+    unknown = [field for field in fields if field not in FACETS]
+    if unknown:
+        raise BadRequest(f"Unknown facet(s): {', '.join(unknown)}")
+    return {field: store.facet_counts(field, **filters) for field in fields}
+
+
+def get_summary(store, query):
+    """Cumulative summary tables (as in data/cumulative_summary.js) for the filtered awards only."""
+    period = _one(query, 'period')
+    if period is not None and period not in PERIODS:
+        raise BadRequest(f"period must be one of {', '.join(PERIODS)}")
+    filters = query_filters(query)
+    where, params = award_filters(**filters)
+    rows = store.query(f'SELECT fain, start_date, award_amount, closeout_date FROM awards{where}', params)
+    records = [{'FAIN': row['fain'], 'Project Start Date': row['start_date'], 'Award Amount': row['award_amount']}
+               for row in rows]
+    closeouts = {row['fain']: [{'date': row['closeout_date'], 'type': 'Closeout'}]
+                 for row in rows if row['closeout_date']}
+    summary = build_cumulative_summary(records, closeouts)
+    return {period: summary[period]} if period else summary
+
+
+# /api/<name> -> handler(store, query); /api/awards/<FAIN> is routed separately
+ENDPOINTS = {
+    'awards': get_awards,
+    'amendments': get_amendments,
+    'facets': get_facets,
+    'summary': get_summary,
+}
+
+
+class DataRequestHandler(SimpleHTTPRequestHandler):
+    """Serves the JSON API under /api/ and the built pages and data files from the site directory."""
+
+    store_path = STORE_PATH
+
+    def end_headers(self):
+        if self.path.startswith('/api/'):
+            # Pages opened from disk (origin "null") may use the API too
+            self.send_header('Access-Control-Allow-Origin', '*')
+        super().end_headers()
+
+    def do_GET(self):
+        if self.path.startswith('/api/'):
+            self.send_api_response()
+        else:
+            super().do_GET()
+
+    def etag(self, url):
+        """Changes whenever the store is rebuilt, and differs per path and query."""
+        stat = os.stat(self.store_path)
+        key = f'{stat.st_mtime_ns}:{stat.st_size}:{url.path}?{"&".join(sorted(url.query.split("&")))}'
+        # Weak, since the same JSON may go out plain or gzipped
+        return 'W/"' + hashlib.sha1(key.encode('utf-8')).hexdigest() + '"'
+
+    def send_api_response(self):
+        url = urlsplit(self.path)
+        if not os.path.exists(self.store_path):
+            return self.send_json({'error': f"No award store at '{self.store_path}'; run build_dashboards.py first"},
+                                  HTTPStatus.SERVICE_UNAVAILABLE)
+        etag = self.etag(url)
+        # The store only changes on a rebuild, so a matching ETag is answered without querying it
+        if etag in [tag.strip() for tag in self.headers.get('If-None-Match', '').split(',')]:
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+
+        parts = [unquote(part) for part in url.path.split('/')[2:]]
+        query = parse_qs(url.query)
+        try:
+            with AwardStore(self.store_path) as store:
+                if len(parts) == 2 and parts[0] == 'awards':
+                    payload = get_award(store, query, parts[1])
+                elif len(parts) == 1 and parts[0] in ENDPOINTS:
+                    payload = ENDPOINTS[parts[0]](store, query)
+                else:
+                    payload = None
+        except BadRequest as e:
+            return self.send_json({'error': str(e)}, HTTPStatus.BAD_REQUEST)
+        if payload is None:
+            return self.send_json({'error': f"Not found: {url.path}"}, HTTPStatus.NOT_FOUND)
+        self.send_json(payload, etag=etag)
+
+    def send_json(self, payload, status=HTTPStatus.OK, etag=None):
+        body = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Vary', 'Accept-Encoding')
+        if etag:
+            # Browsers revalidate every time, which costs one 304 while the data is unchanged
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', 'no-cache')
+        if len(body) >= GZIP_MIN_BYTES and 'gzip' in self.headers.get('Accept-Encoding', ''):
+            body = gzip.compress(body, compresslevel=6)
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Serve the dashboards and a JSON API over the award store written by build_dashboards.py.')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--bind', default='127.0.0.1', help='Address to listen on (default: this machine only)')
+    parser.add_argument('--store', default=STORE_PATH, help='Award store to serve')
+    parser.add_argument('--directory', default='.', help='Folder with the built pages and data/ files')
+    args = parser.parse_args()
+
+    directory = os.path.abspath(args.directory)
+    handler = type('Handler', (DataRequestHandler,), {'store_path': os.path.join(directory, args.store)})
+    server = ThreadingHTTPServer((args.bind, args.port), partial(handler, directory=directory))
+    print(f"Serving {directory} on http://{args.bind}:{args.port}/ "
+          f"(open upcoming_closeouts.html?api to load only the selected fiscal year)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
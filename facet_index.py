@@ -0,0 +1,49 @@
+import math
+
+# The dashboard dropdowns; each gets one bitset per value
+FACET_FIELDS = ['Grant Lead', 'Programs Staff Lead', 'Recipient', 'Grant Program', 'States']
+
+# Bits per bitset word; the pages read the words into a Uint32Array
+WORD_BITS = 32
+
+# SharePoint multi-lookup separator, e.g. 'TX;#43;#AL;#1' is TX (id 43) and AL (id 1)
+LOOKUP_SEPARATOR = ';#'
+
+
+def parse_states(value):
+    """State codes from a SharePoint lookup value, dropping the lookup ids."""
+    if not isinstance(value, str) or not value.strip():
+        return []
+    parts = value.split(LOOKUP_SEPARATOR)
+    return list(dict.fromkeys(part.strip() for part in parts[::2] if part.strip()))
+
+
+def facet_values(record, field):
+    """The values a record is filed under for one facet."""
+    value = record.get(field)
+    if field == 'States':
+        return parse_states(value)
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return []
+    value = str(value).strip()
+    return [value] if value else []
+
+
+def build_facet_index(records, fields=FACET_FIELDS):
+    """Inverted index of the award records: per facet value, a bitset of row ids.
+
+    Row ids are positions in records, i.e. in data/award_data.js. Each bitset
+    is a list of 32-bit words (bit r % 32 of word r // 32 is row r), so a
+    combination of dropdown selections is a word-wise AND and an option's
+    count is the popcount of its bitset ANDed with the other selections.
+    """
+    n_words = (len(records) + WORD_BITS - 1) // WORD_BITS
+    facets = {}
+    for field in fields:
+        bitsets = {}
+        for row, record in enumerate(records):
+            for value in facet_values(record, field):
+                words = bitsets.setdefault(value, [0] * n_words)
+                words[row // WORD_BITS] |= 1 << (row % WORD_BITS)
+        facets[field] = dict(sorted(bitsets.items()))
+    return {'length': len(records), 'words': n_words, 'facets': facets}
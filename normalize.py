@@ -0,0 +1,101 @@
+import warnings
+
+import pandas as pd
+
+# Explicit date formats tried in order, each as one vectorized pass, before pandas' per-value inference
+DATE_FORMATS = ['%Y-%m-%d', '%m/%d/%Y', '%m/%d/%y', '%Y-%m-%d %H:%M:%S', '%m/%d/%Y %H:%M', '%d-%b-%Y', '%B %d, %Y']
+
+ISO_DATE_FORMAT = '%Y-%m-%d'
+
+# Values a date format is checked against before it is run on the whole column
+FORMAT_SAMPLE_SIZE = 100
+
+# Rejected values quoted per warning
+MAX_EXAMPLES = 5
+
+# Column name -> the date format that parsed most of it last time, tried first on the next file or chunk
+_column_formats = {}
+
+
+def _blank(values):
+    return values.isna() | (values.astype(str).str.strip() == '')
+
+
+def report_rejected(raw, parsed, column, source=None):
+    """Print the non-blank values that did not parse and were left missing; returns how many."""
+    rejected = raw[parsed.isna() & ~_blank(raw)]
+    if len(rejected):
+        # Rows as numbered in the spreadsheet, with the header on row 1
+        examples = ', '.join(f"{value!r} (row {row + 2})" for row, value in rejected.head(MAX_EXAMPLES).items())
+        where = f" in '{source}'" if source else ''
+        print(f"Warning: {len(rejected)} {column} value(s){where} could not be parsed and were left blank: {examples}")
+    return len(rejected)
+
+
+def _guess_format(sample, formats):
+    """The first format that parses every sampled value, or None."""
+    for fmt in formats:
+        if pd.to_datetime(sample, format=fmt, errors='coerce').notna().all():
+            return fmt
+    return None
+
+
+def parse_dates(values, column, source=None):
+    """Parse a column of dates with explicit formats instead of per-value inference where possible.
+
+    The format cached for this column is tried first, then the first of
+    DATE_FORMATS that fits a small sample, then the rest, each as one
+    vectorized pass over the values still unparsed. Anything left goes
+    through pandas' inference; values that still fail are reported and
+    become NaT.
+    """
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+    present = ~_blank(values)
+    cached = _column_formats.get(column)
+    formats = [cached] + [fmt for fmt in DATE_FORMATS if fmt != cached] if cached else list(DATE_FORMATS)
+    guess = _guess_format(values[present].head(FORMAT_SAMPLE_SIZE), formats)
+    if guess:
+        formats.remove(guess)
+        formats.insert(0, guess)
+
+    parsed = None
+    hits = {}
+    for fmt in formats:
+        todo = present if parsed is None else present & parsed.isna()
+        if not todo.any():
+            break
+        attempt = pd.to_datetime(values if todo.all() else values[todo], format=fmt, errors='coerce')
+        hits[fmt] = int(attempt.notna().sum())
+        parsed = attempt.reindex(values.index) if parsed is None else parsed.fillna(attempt)
+    if hits and max(hits.values()):
+        _column_formats[column] = max(hits, key=hits.get)
+
+    if parsed is None:
+        return pd.to_datetime(values, errors='coerce')
+    todo = present & parsed.isna()
+    if todo.any():
+        with warnings.catch_warnings():
+            # Values that still fail are reported below, so pandas' format warning adds nothing
+            warnings.simplefilter('ignore', UserWarning)
+            parsed = parsed.fillna(pd.to_datetime(values[todo], errors='coerce'))
+        report_rejected(values, parsed, column, source)
+    return parsed
+
+
+def parse_currency(values, column, source=None):
+    """Dollar amounts to floats: '$1,234.50' is 1234.5 and '(1,234.50)' is -1234.5.
+
+    Values that are not amounts are reported and become NaN.
+    """
+    # Literal replacements run as native kernels on pandas' Arrow-backed strings,
+    # which measured faster than one str.translate or regex pass
+    text = values.astype(str).str.replace('$', '').str.replace(',', '').str.replace('(', '-').str.replace(')', '')
+    parsed = pd.to_numeric(text, errors='coerce')
+    report_rejected(values, parsed, column, source)
+    return parsed
+
+
+def format_iso_dates(values):
+    """Dates as 'YYYY-MM-DD' strings for the whole column at once; missing dates stay missing."""
+    return pd.to_datetime(values, errors='coerce').dt.strftime(ISO_DATE_FORMAT)
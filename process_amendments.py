@@ -1,37 +1,27 @@
-import pandas as pd
 import json
-from datetime import datetime
 
-# Read the Excel file from the 'Award Details' sheet
-df = pd.read_excel('Award_Details_20250505.xlsx', sheet_name='Award Details')
+from data_loader import group_amendments, load_award_details
 
-# Convert date column to datetime
-df['Day of Award Issue Date'] = pd.to_datetime(df['Day of Award Issue Date'], errors='coerce')
 
-# Create a dictionary of amendments by FAIN
-amendments = {}
-for _, row in df.iterrows():
-    fain = row['FAIN']
-    issue_date = row['Day of Award Issue Date']
-    
-    # Only process rows with valid FAIN and date
-    if pd.notna(fain) and pd.notna(issue_date):
-        if fain not in amendments:
-            amendments[fain] = []
-        amendments[fain].append({
-            'date': issue_date.strftime('%Y-%m-%d'),
-            'type': row['Amendment Type'] if pd.notna(row['Amendment Type']) else 'Unknown'
-        })
+def write_amendment_json(amendment_df, path='amendment_data.json'):
+    # Create a dictionary of amendments by FAIN
+    amendments = group_amendments(amendment_df)
 
-# Save to JSON
-with open('amendment_data.json', 'w') as f:
-    json.dump(amendments, f, indent=2)
+    # Save to JSON
+    with open(path, 'w') as f:
+        json.dump(amendments, f, indent=2)
 
-print(f"Amendment data has been processed and saved to amendment_data.json")
-print(f"Number of FAINs with amendments: {len(amendments)}")
-print("Sample of the data:")
-sample_fains = list(amendments.keys())[:3]
-for fain in sample_fains:
-    print(f"\nFAIN: {fain}")
-    print(f"Number of amendments: {len(amendments[fain])}")
-    print("First amendment:", amendments[fain][0]) 
\ No newline at end of file
+    print(f"Amendment data has been processed and saved to {path}")
+    print(f"Number of FAINs with amendments: {len(amendments)}")
+    print("Sample of the data:")
+    sample_fains = list(amendments.keys())[:3]
+    for fain in sample_fains:
+        print(f"\nFAIN: {fain}")
+        print(f"Number of amendments: {len(amendments[fain])}")
+        print("First amendment:", amendments[fain][0])
+    return amendments
+
+
+if __name__ == '__main__':
+    # Read the Excel file from the 'Award Details' sheet
+    write_amendment_json(load_award_details())
@@ -0,0 +1,131 @@
+import hashlib
+import json
+import os
+
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401  (enables the Parquet format)
+    HAVE_PYARROW = True
+except ImportError:
+    HAVE_PYARROW = False
+
+CACHE_DIR = os.path.join('.cache', 'sources')
+INDEX_FILE = 'index.json'
+
+# Bump when the cleaning in data_loader changes so stale frames are not reused
+CACHE_VERSION = 4
+
+# Number of cached generations kept per source kind
+KEEP_GENERATIONS = 3
+
+
+def _file_sha256(path, block_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class SourceCache:
+    """Cleaned source DataFrames stored on disk, keyed by the source file's content hash.
+
+    Hashing a large export costs a full read, so the hash is remembered per
+    path together with the file's mtime and size and only recomputed when
+    either changes. Frames are written as Parquet when pyarrow is installed
+    and as pickles otherwise.
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR, keep=KEEP_GENERATIONS):
+        self.cache_dir = cache_dir
+        self.keep = keep
+        self._index_path = os.path.join(cache_dir, INDEX_FILE)
+        self._index = self._read_index()
+
+    def _read_index(self):
+        try:
+            with open(self._index_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_index(self):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = self._index_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(self._index, f, indent=2)
+        os.replace(tmp_path, self._index_path)
+
+    def content_hash(self, path):
+        """SHA-256 of the file, reusing the recorded hash while mtime and size are unchanged."""
+        stat = os.stat(path)
+        key = os.path.abspath(path)
+        entry = self._index.get(key)
+        if entry and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+            return entry['sha256']
+        sha256 = _file_sha256(path)
+        self._index[key] = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'sha256': sha256}
+        self._write_index()
+        return sha256
+
+    def _entry_stem(self, kind, sha256):
+        return os.path.join(self.cache_dir, f'{kind}-v{CACHE_VERSION}-{sha256[:20]}')
+
+    def get(self, kind, path):
+        """Return the cached frame for this source file, or None on a miss."""
+        stem = self._entry_stem(kind, self.content_hash(path))
+        for ext, read in (('.parquet', pd.read_parquet), ('.pkl', pd.read_pickle)):
+            entry_path = stem + ext
+            if os.path.exists(entry_path):
+                if ext == '.parquet' and not HAVE_PYARROW:
+                    continue
+                try:
+                    df = read(entry_path)
+                except Exception:
+                    # A truncated or unreadable entry is just a miss
+                    continue
+                # Mark as recently used so eviction keeps it
+                os.utime(entry_path)
+                return df
+        return None
+
+    def put(self, kind, path, df):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        stem = self._entry_stem(kind, self.content_hash(path))
+        written = None
+        if HAVE_PYARROW:
+            try:
+                df.to_parquet(stem + '.parquet.tmp', index=False)
+                written = stem + '.parquet'
+                os.replace(stem + '.parquet.tmp', written)
+            except Exception:
+                # Mixed-type object columns can't always be stored as Parquet
+                if os.path.exists(stem + '.parquet.tmp'):
+                    os.remove(stem + '.parquet.tmp')
+        if written is None:
+            df.to_pickle(stem + '.pkl.tmp')
+            written = stem + '.pkl'
+            os.replace(stem + '.pkl.tmp', written)
+        self.evict(kind)
+        return written
+
+    def evict(self, kind):
+        """Delete all but the `keep` most recently used generations of this source kind."""
+        prefix = f'{kind}-'
+        entries = [
+            os.path.join(self.cache_dir, name)
+            for name in os.listdir(self.cache_dir)
+            if name.startswith(prefix) and name.endswith(('.parquet', '.pkl'))
+        ]
+        entries.sort(key=os.path.getmtime, reverse=True)
+        for stale in entries[self.keep:]:
+            os.remove(stale)
+
+    def load(self, kind, path, parse):
+        """Return the cleaned frame for path, parsing and storing it on a miss."""
+        df = self.get(kind, path)
+        if df is None:
+            df = parse(path)
+            self.put(kind, path, df)
+        return df
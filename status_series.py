@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+
+EPOCH = pd.Timestamp('1970-01-01')
+
+# The timeline's dropdown filters; a series is built for every combination present in the data
+FILTER_FIELDS = ['Grant Lead', 'Programs Staff Lead']
+
+# Joins filter values into a series key; '' stands for "All"
+KEY_SEPARATOR = '|'
+
+
+def _timestamps_ms(dates):
+    return ((pd.to_datetime(dates, errors='coerce') - EPOCH) // pd.Timedelta(milliseconds=1)).to_numpy()
+
+
+def _prefix_series(times, amounts):
+    """Distinct event times with running amount and count totals up to and including each."""
+    order = np.argsort(times, kind='stable')
+    times, amounts = times[order], amounts[order]
+    distinct, first = np.unique(times, return_index=True)
+    last = np.append(first[1:], len(times)) - 1
+    return {
+        't': distinct.tolist(),
+        'amount': np.round(np.cumsum(amounts)[last], 2).tolist(),
+        'count': (last + 1).tolist(),
+    }
+
+
+def _filter_keys(values):
+    """Every filter combination a row belongs to: each field either its own value or ''."""
+    keys = ['']
+    for value in values:
+        value = value if isinstance(value, str) and value else ''
+        keys = [key + KEY_SEPARATOR + option for key in keys for option in dict.fromkeys(['', value])]
+    return [key[len(KEY_SEPARATOR):] for key in keys]
+
+
+def build_status_series(df, filter_fields=FILTER_FIELDS):
+    """Prefix sums of award starts and end dates per filter combination.
+
+    For a slider date X and the selected filters, the page then needs only
+    binary searches:
+      started by X  (grand total)  -> start series up to X
+      closed by X   (end date < X) -> end series before X
+      active at X                  -> total minus closed
+    Keys are the filter values joined with '|', with '' meaning "All".
+    """
+    start_ms = _timestamps_ms(df['Project Start Date'])
+    end_ms = _timestamps_ms(df['Project End Date'])
+    amounts = pd.to_numeric(df['Award Amount'], errors='coerce').fillna(0).to_numpy(dtype=float)
+
+    members = {}
+    filter_values = zip(*(df[field].to_numpy() for field in filter_fields)) if filter_fields else ((),) * len(df)
+    for row, values in enumerate(filter_values):
+        for key in _filter_keys(values):
+            members.setdefault(key, []).append(row)
+
+    series = {}
+    for key, rows in members.items():
+        rows = np.asarray(rows)
+        series[key] = {
+            'start': _prefix_series(start_ms[rows], amounts[rows]),
+            'end': _prefix_series(end_ms[rows], amounts[rows]),
+            'total': round(float(amounts[rows].sum()), 2),
+            'n': len(rows),
+        }
+    return {'fields': list(filter_fields), 'series': series}
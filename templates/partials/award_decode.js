@@ -0,0 +1,24 @@
+        function isCloseout(amendment) {
+            if (!amendment || !amendment.date) return false;
+            return String(amendment.type || '').trim().toLowerCase().includes('closeout');
+        }
+
+        // Per award (in jsonData order): start and end dates as ms (NaN when missing or
+        // invalid), the award amount, and whether it has a closeout amendment.
+        function decodeAwards(awards, amendments) {
+            const n = awards.length;
+            const start = new Float64Array(n);
+            const end = new Float64Array(n);
+            const amount = new Float64Array(n);
+            const hasCloseout = new Uint8Array(n);
+            for (let i = 0; i < n; i++) {
+                const d = awards[i];
+                start[i] = new Date(d['Project Start Date']).getTime();
+                end[i] = new Date(d['Project End Date']).getTime();
+                const rawAmt = d['Award Amount'];
+                amount[i] = typeof rawAmt === 'number' ? rawAmt : (parseFloat(rawAmt) || 0.0);
+                const fain = String(d['FAIN'] || '').trim();
+                hasCloseout[i] = (amendments[fain] || []).some(isCloseout) ? 1 : 0;
+            }
+            return {start, end, amount, hasCloseout};
+        }
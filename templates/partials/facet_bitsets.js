@@ -0,0 +1,31 @@
+        function facetBits(field, value) {
+            return (facetIndex.facets[field] || {})[value] || emptyBits;
+        }
+
+        function bitsetOf(rows) {
+            const bits = new Uint32Array(facetIndex.words);
+            rows.forEach(row => { bits[row >>> 5] |= 1 << (row & 31); });
+            return bits;
+        }
+
+        function andBits(a, b) {
+            const out = new Uint32Array(a.length);
+            for (let i = 0; i < a.length; i++) out[i] = a[i] & b[i];
+            return out;
+        }
+
+        function popCount(word) {
+            word -= (word >>> 1) & 0x55555555;
+            word = (word & 0x33333333) + ((word >>> 2) & 0x33333333);
+            return Math.imul((word + (word >>> 4)) & 0x0F0F0F0F, 0x01010101) >>> 24;
+        }
+
+        function andCount(a, b) {
+            let count = 0;
+            for (let i = 0; i < a.length; i++) count += popCount(a[i] & b[i]);
+            return count;
+        }
+
+        function hasBit(bits, row) {
+            return (bits[row >>> 5] >>> (row & 31)) & 1;
+        }
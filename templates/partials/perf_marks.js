@@ -0,0 +1,36 @@
+        // Page stages are bracketed with performance.mark/measure, so they show up as gcerc:<stage>
+        // in the browser's Performance panel; gcercPerformance() logs a summary of every stage so far
+        let perfMarkCount = 0;
+
+        function measured(stage, fn) {
+            const start = `gcerc:${stage}:${++perfMarkCount}`;
+            const end = () => {
+                performance.measure(`gcerc:${stage}`, start);
+                performance.clearMarks(start);
+            };
+            performance.mark(start);
+            let result;
+            try {
+                result = fn();
+            } catch (error) {
+                end();
+                throw error;
+            }
+            // Async stages are measured until they settle
+            if (result && typeof result.then === 'function') return result.finally(end);
+            end();
+            return result;
+        }
+
+        window.gcercPerformance = function () {
+            const stages = {};
+            performance.getEntriesByType('measure').forEach(entry => {
+                if (!entry.name.startsWith('gcerc:')) return;
+                const stage = stages[entry.name.slice(6)] || (stages[entry.name.slice(6)] = { calls: 0, totalMs: 0, maxMs: 0 });
+                stage.calls++;
+                stage.totalMs += entry.duration;
+                stage.maxMs = Math.max(stage.maxMs, entry.duration);
+            });
+            console.table(stages);
+            return stages;
+        };
@@ -0,0 +1,29 @@
+import pandas as pd
+
+from amendment_index import build_amendment_index
+
+
+def ms(date):
+    return int(pd.Timestamp(date).timestamp() * 1000)
+
+
+def test_build_amendment_index():
+    index = build_amendment_index({
+        'F1': [{'date': '2024-03-01', 'type': 'Closeout'}, {'date': '2024-01-01', 'type': 'Unknown'}],
+        'F2': [{'date': '2024-01-01', 'type': 'Budget'}, {'date': 'not a date', 'type': 'Budget'}],
+    })
+    assert index['t'] == [ms('2024-01-01'), ms('2024-03-01')]
+    assert index['cumulative'] == [2, 3]
+    assert index['total'] == 3
+    assert index['byFain']['F1'] == {
+        't': [ms('2024-01-01'), ms('2024-03-01')],
+        'date': ['2024-01-01', '2024-03-01'],
+        'type': ['Unknown', 'Closeout'],
+    }
+    assert index['byFain']['F2']['type'] == ['Budget']
+
+
+def test_build_amendment_index_keeps_same_day_amendments_in_order():
+    index = build_amendment_index({7: [{'date': '2024-01-01', 'type': 'A'}, {'date': '2024-01-01', 'type': 'B'}]})
+    assert index['cumulative'] == [2]
+    assert index['byFain']['7']['type'] == ['A', 'B']
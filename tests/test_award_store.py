@@ -0,0 +1,44 @@
+import os
+
+from award_store import AwardStore, fiscal_year_bounds, write_award_store
+
+RECORDS = [
+    {'FAIN': 'F1', 'Title': 'One', 'Project End Date': '2026-03-01', 'Grant Lead': 'Lee', 'States': 'TX;#1;#AL;#2',
+     'Award Amount': 100.0},
+    {'FAIN': 'F2', 'Title': 'Two', 'Project End Date': '2025-11-01', 'Grant Lead': 'Kim', 'States': 'TX;#1',
+     'Award Amount': float('nan')},
+    {'FAIN': 'F3', 'Title': 'Three', 'Project End Date': '2027-01-01', 'Grant Lead': 'Lee', 'States': '',
+     'Award Amount': 5.0},
+]
+AMENDMENTS = {'F1': [{'date': '2025-01-01', 'type': 'Budget'}, {'date': '2025-12-01', 'type': 'Closeout'}]}
+
+
+def test_award_store_queries(tmp_path):
+    path = str(tmp_path / 'awards.db')
+    write_award_store(RECORDS, AMENDMENTS, path)
+    with AwardStore(path) as store:
+        assert store.award(' F2 ')['Award Amount'] is None
+        assert store.amendments('F1') == AMENDMENTS['F1']
+        start, end = fiscal_year_bounds(2026)
+        assert (start, end) == ('2025-10-01', '2026-09-30')
+        assert [award['FAIN'] for award in store.awards(ending_between=(start, end))] == ['F2', 'F1']
+        assert [award['FAIN'] for award in store.awards(with_closeout=True)] == ['F1']
+        assert store.count_awards(grant_lead='Lee', state='TX') == 1
+        assert store.facet_counts('state') == {'TX': 2, 'AL': 1}
+        # A dropdown's own selection does not narrow its counts
+        assert store.facet_counts('grant_lead', grant_lead='Kim', state='AL') == {'Lee': 1}
+        rows, total = store.amendment_rows(closeout=True)
+        assert (rows, total) == ([{'fain': 'F1', 'date': '2025-12-01', 'type': 'Closeout'}], 1)
+
+
+def test_unchanged_store_is_not_rebuilt(tmp_path, capsys):
+    path = str(tmp_path / 'awards.db')
+    write_award_store(RECORDS, AMENDMENTS, path)
+    os.utime(path, ns=(0, 0))
+    write_award_store(RECORDS, AMENDMENTS, path)
+    assert os.stat(path).st_mtime_ns == 0
+    assert "is already up to date" in capsys.readouterr().out
+    write_award_store(RECORDS[:2], AMENDMENTS, path)
+    assert os.stat(path).st_mtime_ns != 0
+    with AwardStore(path) as store:
+        assert store.count_awards() == 2
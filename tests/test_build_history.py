@@ -0,0 +1,82 @@
+import datetime
+
+import pytest
+
+from build_history import BuildHistory, HistoryError, check_week, record_build
+
+WEEK_1 = [{'FAIN': 'A', 'Title': 'One', 'Award Amount': 100.0}, {'FAIN': 'B', 'Title': 'Two', 'Award Amount': 5.0}]
+AMENDMENTS_1 = {'A': [{'date': '2025-01-01', 'type': 'Budget'}]}
+WEEK_2 = [{'FAIN': 'A', 'Title': 'One', 'Award Amount': 150.0}, {'FAIN': 'C', 'Title': 'Three', 'Award Amount': 1.0}]
+AMENDMENTS_2 = {'A': [{'date': '2025-01-01', 'type': 'Budget'}, {'date': '2025-02-01', 'type': 'Closeout'}],
+                'C': [{'date': '2025-02-02', 'type': 'Budget'}]}
+
+
+@pytest.fixture
+def history(tmp_path):
+    with BuildHistory(str(tmp_path / 'history.db')) as history:
+        history.record('2025-05-05', WEEK_1, AMENDMENTS_1)
+        history.record('2025-05-12', WEEK_2, AMENDMENTS_2)
+        yield history
+
+
+def test_each_week_round_trips(history):
+    assert history.state('2025-05-05') == (WEEK_1, AMENDMENTS_1)
+    assert history.state('2025-05-12') == (WEEK_2, AMENDMENTS_2)
+    # Any date finds the snapshot in force on it
+    assert history.state('2025-05-08') == (WEEK_1, AMENDMENTS_1)
+    with pytest.raises(KeyError):
+        history.state('2025-01-01')
+
+
+def test_only_changes_are_stored(history):
+    assert [week['changes'] for week in history.weeks()] == [3, 5]
+    assert history.record('2025-05-19', WEEK_2, AMENDMENTS_2) == 0
+    assert history.state('2025-05-19') == (WEEK_2, AMENDMENTS_2)
+
+
+def test_diff(history):
+    diff = history.diff('2025-05-12', '2025-05-05')
+    assert (diff['from'], diff['to']) == ('2025-05-05', '2025-05-12')
+    assert diff['awards'] == {
+        'added': ['C'],
+        'removed': ['B'],
+        'modified': {'A': {'Award Amount': [100.0, 150.0]}},
+    }
+    assert diff['new_amendments'] == {'A': [{'date': '2025-02-01', 'type': 'Closeout'}],
+                                      'C': [{'date': '2025-02-02', 'type': 'Budget'}]}
+    assert diff['removed_amendments'] == {}
+
+
+def test_award(history):
+    assert history.award(' A ', '2025-05-05') == {'awards': WEEK_1[:1], 'amendments': AMENDMENTS_1['A']}
+    assert history.award('B', '2025-05-12') == {'awards': [], 'amendments': []}
+
+
+def test_nan_is_stored_as_null(tmp_path):
+    with BuildHistory(str(tmp_path / 'history.db')) as history:
+        history.record('2025-05-05', [{'FAIN': 'A', 'Award Amount': float('nan')}], {})
+        assert history.state('2025-05-05') == ([{'FAIN': 'A', 'Award Amount': None}], {})
+
+
+def test_recording_the_latest_week_again_replaces_it(history):
+    history.record('2025-05-12', WEEK_1, AMENDMENTS_1)
+    assert [week['week'] for week in history.weeks()] == ['2025-05-05', '2025-05-12']
+    assert history.state('2025-05-12') == (WEEK_1, AMENDMENTS_1)
+
+
+def test_weeks_must_be_recorded_in_order(history):
+    with pytest.raises(HistoryError, match='already runs to 2025-05-12'):
+        history.record('2025-05-01', WEEK_1, AMENDMENTS_1)
+
+
+def test_check_week(tmp_path, capsys):
+    path = str(tmp_path / 'history.db')
+    assert check_week(path=path) == datetime.date.today().strftime('%Y-%m-%d')
+    assert check_week(datetime.date(2025, 5, 5), path) == '2025-05-05'
+    with pytest.raises(HistoryError, match='Not a YYYY-MM-DD date'):
+        check_week('05/05/2025', path)
+    record_build(WEEK_1, AMENDMENTS_1, '2025-05-12', path)
+    assert 'History snapshot 2025-05-12 recorded' in capsys.readouterr().out
+    assert check_week('2025-05-12', path) == '2025-05-12'
+    with pytest.raises(HistoryError):
+        check_week('2025-05-05', path)
@@ -0,0 +1,47 @@
+import pandas as pd
+
+from build_manifest import (MANIFEST_VERSION, diff_hashes, fain_record_hashes, load_manifest, new_amendments,
+                            save_manifest, schema_hash)
+
+
+def test_diff_hashes():
+    assert diff_hashes({'A': '1', 'B': '2', 'C': '3'}, {'B': '2', 'C': '4', 'D': '5'}) == {
+        'added': ['D'], 'removed': ['A'], 'modified': ['C'],
+    }
+
+
+def test_fain_record_hashes_change_only_for_edited_fains():
+    df = pd.DataFrame({'FAIN': ['A', 'B', 'B'], 'Title': ['One', 'Two', 'Two again']})
+    before = fain_record_hashes(df)
+    df.loc[2, 'Title'] = 'Edited'
+    after = fain_record_hashes(df)
+    assert before['A'] == after['A']
+    assert before['B'] != after['B']
+
+
+def test_schema_hash_follows_dtypes():
+    df = pd.DataFrame({'FAIN': ['A'], 'Award Amount': [1]})
+    assert schema_hash(df) == schema_hash(df.copy())
+    assert schema_hash(df) != schema_hash(df.astype({'Award Amount': float}))
+
+
+def test_new_amendments_counts_repeats_once_per_occurrence():
+    closeout = {'date': '2024-01-01', 'type': 'Closeout'}
+    budget = {'date': '2024-02-01', 'type': 'Budget'}
+    old = {'F1': [closeout]}
+    new = {'F1': [closeout, closeout, budget], 'F2': [budget]}
+    assert new_amendments(old, new) == {'F1': [closeout, budget], 'F2': [budget]}
+    assert new_amendments(new, new) == {}
+
+
+def test_manifest_round_trip(tmp_path):
+    path = str(tmp_path / 'cache' / 'manifest.json')
+    assert load_manifest(path) == {}
+    save_manifest({'fains': {'A': '1'}}, path)
+    assert load_manifest(path) == {'fains': {'A': '1'}, 'version': MANIFEST_VERSION}
+
+
+def test_manifest_from_another_version_is_ignored(tmp_path):
+    path = str(tmp_path / 'manifest.json')
+    (tmp_path / 'manifest.json').write_text('{"version": -1, "fains": {}}')
+    assert load_manifest(path) == {}
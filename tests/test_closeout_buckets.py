@@ -0,0 +1,33 @@
+import pandas as pd
+
+from closeout_buckets import add_closeout_fields, build_closeout_index, classify_construction, fiscal_quarters
+
+
+def test_classify_construction():
+    frame = pd.DataFrame({
+        'Title': ['Road paving', 'Planning study', 'Construction of a dock', 'Planning study', 'Monitoring'],
+        'Construction Project': [None, 'Yes', 'no', False, None],
+        'Construction': [None, None, None, 'TRUE', None],
+    })
+    assert classify_construction(frame).tolist() == [True, True, False, True, False]
+
+
+def test_fiscal_quarters():
+    dates = pd.to_datetime(pd.Series(['2025-09-30', '2025-10-01', '2026-01-15', '2026-07-01', None]))
+    fiscal_years, quarters = fiscal_quarters(dates)
+    assert fiscal_years.tolist()[:4] == [2025, 2026, 2026, 2026]
+    assert quarters.tolist()[:4] == [4, 1, 2, 4]
+    assert pd.isna(fiscal_years[4]) and pd.isna(quarters[4])
+
+
+def test_closeout_index_groups_rows_by_fiscal_quarter_in_end_date_order():
+    records = add_closeout_fields([
+        {'Title': 'Dock build', 'Project End Date': '2026-03-01'},
+        {'Title': 'Study', 'Project End Date': '2025-12-15'},
+        {'Title': 'Study', 'Project End Date': '2025-11-01'},
+        {'Title': 'Study', 'Project End Date': None},
+    ])
+    assert [record['Is Construction'] for record in records] == [True, False, False, False]
+    assert records[0]['Closeout FY'] == 2026 and records[0]['Closeout Quarter'] == 2
+    assert records[3]['Closeout FY'] is None
+    assert build_closeout_index(records) == {'fiscalYears': {'2026': [[2, 1], [0], [], []]}}
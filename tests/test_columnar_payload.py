@@ -0,0 +1,24 @@
+import pandas as pd
+
+from columnar_payload import encode_columnar
+
+
+def test_encode_columnar():
+    df = pd.DataFrame({
+        'FAIN': ['F1', 'F2', 'F3'],
+        'Title': ['One', None, 'Three'],
+        'Project Start Date': ['1970-01-02', None, '2024-01-01'],
+        'Award Amount': ['100', None, 2.5],
+        'Grant Lead': ['Lee', 'Kim', 'Lee'],
+        'Programs Staff Lead': ['Ray', None, 'Ray'],
+    })
+    payload = encode_columnar(df)
+    assert payload['length'] == 3
+    columns = payload['columns']
+    assert 'Recipient' not in columns
+    assert columns['Title'] == ['One', None, 'Three']
+    assert columns['Project Start Date'] == [1, None, 19723]
+    assert columns['Award Amount'] == [100.0, 0.0, 2.5]
+    assert columns['Grant Lead'] == [0, 1, 0]
+    assert payload['dictionaries']['Grant Lead'] == ['Lee', 'Kim']
+    assert columns['Programs Staff Lead'] == [0, -1, 0]
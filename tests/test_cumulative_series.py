@@ -0,0 +1,41 @@
+from cumulative_series import build_cumulative_summary, closeout_dates
+
+
+def test_closeout_dates_use_the_first_closeout():
+    assert closeout_dates({
+        'F1': [{'date': '2024-01-01', 'type': 'Budget'}, {'date': '2024-02-01', 'type': ' Final CLOSEOUT'},
+               {'date': '2024-03-01', 'type': 'Closeout'}],
+        'F2': [{'date': '2024-01-01', 'type': None}],
+    }) == {'F1': '2024-02-01'}
+
+
+def test_build_cumulative_summary():
+    records = [
+        {'FAIN': 'F1', 'Project Start Date': '2023-01-15', 'Award Amount': 100},
+        {'FAIN': 'F2', 'Project Start Date': '2024-03-01', 'Award Amount': 50.25},
+        {'FAIN': 'F3', 'Project Start Date': None, 'Award Amount': 999},
+    ]
+    amendments = {'F1': [{'date': '2024-02-01', 'type': 'Closeout'}]}
+    summary = build_cumulative_summary(records, amendments, as_of='2024-12-31')
+    assert summary['year'] == {
+        'period': [2023, 2024],
+        'totalCount': [1, 2],
+        'closedCount': [0, 1],
+        'activeCount': [1, 1],
+        'totalFunding': [100.0, 150.25],
+        'closedFunding': [0.0, 100.0],
+        'activeFunding': [100.0, 50.25],
+    }
+    assert summary['fiscal_year']['period'] == [2023, 2024, 2025]
+    assert summary['month']['period'][0] == '2023-01'
+    assert summary['month']['period'][-1] == '2024-12'
+    assert summary['month']['closedCount'][12:14] == [0, 1]
+
+
+def test_closeout_before_start_counts_from_the_start_period():
+    records = [{'FAIN': 'F1', 'Project Start Date': '2024-05-01', 'Award Amount': 10}]
+    amendments = {'F1': [{'date': '2023-01-01', 'type': 'Closeout'}]}
+    summary = build_cumulative_summary(records, amendments, as_of='2024-06-30')
+    assert summary['year']['period'] == [2024]
+    assert summary['year']['closedCount'] == [1]
+    assert summary['year']['activeCount'] == [0]
@@ -0,0 +1,86 @@
+import json
+import os
+
+import pytest
+
+from dashboard_templates import TemplateError, render_dashboards, render_to_file, version_context
+
+
+def write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        f.write(text)
+
+
+def read(path):
+    with open(path, encoding='utf-8', newline='') as f:
+        return f.read()
+
+
+def test_placeholders_and_streamed_values(tmp_path):
+    write(tmp_path / 'page.html', '<p>{{ title }}</p><script>const data = {{data}};</script>')
+    out = tmp_path / 'out.html'
+    context = {'title': 'Awards', 'data': lambda stream: json.dump({'n': 1}, stream)}
+    sha256, changed = render_to_file('page.html', context, str(out), str(tmp_path))
+    assert changed
+    assert read(out) == '<p>Awards</p><script>const data = {"n": 1};</script>'
+
+
+def test_unchanged_output_is_left_alone(tmp_path):
+    write(tmp_path / 'page.html', '{{ x }}')
+    out = str(tmp_path / 'out.html')
+    first, _ = render_to_file('page.html', {'x': 1}, out, str(tmp_path))
+    os.utime(out, ns=(0, 0))
+    second, changed = render_to_file('page.html', {'x': 1}, out, str(tmp_path))
+    assert (second, changed) == (first, False)
+    assert os.stat(out).st_mtime_ns == 0
+    assert not os.path.exists(out + '.tmp')
+
+
+def test_include_takes_the_including_templates_line_endings(tmp_path):
+    write(tmp_path / 'page.html', '<script>\r\n    {% include \'partials/shared.js\' %}\r\n</script>\r\n')
+    write(tmp_path / 'partials' / 'shared.js', 'const a = {{ a }};\nconst b = 2;\n')
+    out = tmp_path / 'out.html'
+    render_to_file('page.html', {'a': 1}, str(out), str(tmp_path))
+    assert read(out) == '<script>\r\nconst a = 1;\r\nconst b = 2;\r\n</script>\r\n'
+
+
+def test_edited_include_is_picked_up(tmp_path):
+    write(tmp_path / 'page.html', "{% include 'part.txt' %}\n")
+    write(tmp_path / 'part.txt', 'old\n')
+    out = tmp_path / 'out.html'
+    render_to_file('page.html', {}, str(out), str(tmp_path))
+    write(tmp_path / 'part.txt', 'new\n')
+    os.utime(tmp_path / 'part.txt', ns=(1, 1))
+    render_to_file('page.html', {}, str(out), str(tmp_path))
+    assert read(out) == 'new\n'
+
+
+def test_missing_value_is_an_error(tmp_path):
+    write(tmp_path / 'page.html', '{{ missing }}')
+    out = tmp_path / 'out.html'
+    with pytest.raises(TemplateError, match='no value for'):
+        render_to_file('page.html', {}, str(out), str(tmp_path))
+    assert not os.path.exists(out)
+
+
+@pytest.mark.parametrize('templates, message', [
+    ({'page.html': "{% include 'nope.js' %}\n"}, 'Template not found'),
+    ({'page.html': "{% include 'a.js' %}\n", 'a.js': "{% include 'page.html' %}\n"}, 'circular include'),
+])
+def test_bad_includes(tmp_path, templates, message):
+    for name, text in templates.items():
+        write(tmp_path / name, text)
+    with pytest.raises(TemplateError, match=message):
+        render_to_file('page.html', {}, str(tmp_path / 'out.html'), str(tmp_path))
+
+
+def test_render_dashboards_uses_data_versions(tmp_path):
+    write(tmp_path / 'templates' / 'a.html', 'data/award_data.js?v={{ award_data_version }}')
+    out_dir = tmp_path / 'site'
+    out_dir.mkdir()
+    assert version_context({'award_data.js': 'abc'}) == {'award_data_version': 'abc'}
+    paths = render_dashboards({'award_data.js': 'abc'}, pages=['a.html'], template_dir=str(tmp_path / 'templates'),
+                              out_dir=str(out_dir))
+    assert paths == [os.path.join(str(out_dir), 'a.html')]
+    assert read(out_dir / 'a.html') == 'data/award_data.js?v=abc'
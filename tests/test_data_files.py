@@ -0,0 +1,50 @@
+import json
+import os
+
+from data_files import abstract_file_names, write_abstract_store, write_data_file, write_shared_data
+
+
+def test_abstract_file_names():
+    names = abstract_file_names(['A/B', 'A?B', 'ab', 'AB', 'X-1'])
+    assert names['X-1'] == 'X-1'
+    assert names['A/B'].startswith('A_B-') and names['A?B'].startswith('A_B-')
+    assert names['ab'].startswith('ab-') and names['AB'].startswith('AB-')
+    assert len({name.lower() for name in names.values()}) == 5
+    assert abstract_file_names(['A?B', 'A/B']) == {fain: names[fain] for fain in ['A?B', 'A/B']}
+
+
+def test_write_abstract_store(tmp_path):
+    versions = write_abstract_store({'A/B': 'first', 'A?B': 'second', 'C': 'third'}, str(tmp_path))
+    abstract_dir = tmp_path / 'abstracts'
+    assert len(os.listdir(abstract_dir)) == 3
+    assert len(set(versions.values())) == 3
+    os.utime(abstract_dir / 'C.js', ns=(0, 0))
+
+    write_abstract_store({'C': 'third'}, str(tmp_path))
+    assert os.listdir(abstract_dir) == ['C.js']
+    assert os.stat(abstract_dir / 'C.js').st_mtime_ns == 0
+
+
+def test_write_data_file_leaves_unchanged_files_alone(tmp_path):
+    version = write_data_file('x.js', 'x', {'b': 1, 'a': [1, 2]}, str(tmp_path))
+    path = tmp_path / 'x.js'
+    assert path.read_text() == 'window.GCERC_DATA = window.GCERC_DATA || {};\nwindow.GCERC_DATA.x = {"a":[1,2],"b":1};\n'
+    assert os.path.exists(str(path) + '.gz')
+    os.utime(path, ns=(0, 0))
+    assert write_data_file('x.js', 'x', {'a': [1, 2], 'b': 1}, str(tmp_path)) == version
+    assert os.stat(path).st_mtime_ns == 0
+    assert write_data_file('x.js', 'x', {'a': 1}, str(tmp_path)) != version
+
+
+def test_write_shared_data_names_only_disambiguated_abstract_files(tmp_path):
+    records = [{'FAIN': 'A/B', 'Abstract': 'first'}, {'FAIN': 'A?B', 'Abstract': 'second'},
+               {'FAIN': 'C', 'Abstract': ' third '}, {'FAIN': 'D', 'Abstract': '  '}]
+    versions = write_shared_data(records, {}, str(tmp_path))
+    assert 'award_data.js' in versions
+    text = (tmp_path / 'award_data.js').read_text()
+    awards = json.loads(text[text.index('['):text.rindex(']') + 1])
+    names = abstract_file_names(['A/B', 'A?B'])
+    assert [award.get('Abstract File') for award in awards] == [names['A/B'], names['A?B'], None, None]
+    assert ['Abstract Version' in award for award in awards] == [True, True, True, False]
+    assert not any('Abstract' in award for award in awards)
+    assert sorted(os.listdir(tmp_path / 'abstracts')) == sorted(name + '.js' for name in list(names.values()) + ['C'])
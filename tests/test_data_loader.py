@@ -0,0 +1,51 @@
+import pandas as pd
+import pytest
+
+from data_loader import (AMENDMENT_DATE_COLUMN, AMENDMENT_TYPE_COLUMN, MISSING_AMENDMENT_TYPE, SchemaError,
+                         group_amendments, load_master_tracker)
+
+
+def award_details():
+    return pd.DataFrame({
+        'FAIN': ['F1', 'F1', None, 'F2', 'F2', 'F1'],
+        AMENDMENT_DATE_COLUMN: ['2024-01-05', '2024-01-02', '2024-01-01', 'never', '2024-02-01', '2024-03-01'],
+        AMENDMENT_TYPE_COLUMN: ['Closeout', None, 'Budget', 'Budget', ' Unknown ', '  '],
+    })
+
+
+def test_group_amendments_keeps_untyped_rows_for_the_shared_data():
+    assert group_amendments(award_details()) == {
+        'F1': [{'date': '2024-01-05', 'type': 'Closeout'}, {'date': '2024-01-02', 'type': MISSING_AMENDMENT_TYPE},
+               {'date': '2024-03-01', 'type': '  '}],
+        'F2': [{'date': '2024-02-01', 'type': ' Unknown '}],
+    }
+
+
+def test_group_amendments_require_type():
+    assert group_amendments(award_details(), require_type=True) == {
+        'F1': [{'date': '2024-01-05', 'type': 'Closeout'}],
+        'F2': [{'date': '2024-02-01', 'type': 'Unknown'}],
+    }
+
+
+def test_load_master_tracker(tmp_path):
+    path = tmp_path / 'tracker.csv'
+    path.write_text(
+        ' FAIN ,Title,Award Amount,Grant Lead,Programs Staff Lead,Project Start Date,Project End Date,Path,Notes\n'
+        'F1,One,"$1,000.50",Lee,Ray,2024-01-05,12/31/2025,https://example.org/f1,skip me\n',
+        encoding='windows-1252',
+    )
+    df = load_master_tracker(str(path), use_cache=False)
+    assert list(df.columns) == ['FAIN', 'Title', 'Award Amount', 'Grant Lead', 'Programs Staff Lead',
+                                'Project Start Date', 'Project End Date', 'Path']
+    row = df.iloc[0]
+    assert row['Award Amount'] == 1000.5
+    assert row['Project End Date'] == pd.Timestamp('2025-12-31')
+    assert row['Path'] == 'https://example.org/f1'
+
+
+def test_load_master_tracker_checks_the_header(tmp_path):
+    path = tmp_path / 'tracker.csv'
+    path.write_text('FAIN,Title\nF1,One\n')
+    with pytest.raises(SchemaError, match='missing required column'):
+        load_master_tracker(str(path), use_cache=False)
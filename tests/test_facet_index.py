@@ -0,0 +1,27 @@
+from facet_index import build_facet_index, facet_values, parse_states
+
+
+def test_parse_states_drops_lookup_ids_and_repeats():
+    assert parse_states('TX;#43;#AL;#1;#TX;#43') == ['TX', 'AL']
+    assert parse_states('FL') == ['FL']
+    assert parse_states('  ') == []
+    assert parse_states(float('nan')) == []
+
+
+def test_facet_values():
+    assert facet_values({'Grant Lead': ' Lee '}, 'Grant Lead') == ['Lee']
+    assert facet_values({'Grant Lead': float('nan')}, 'Grant Lead') == []
+    assert facet_values({'Grant Lead': ''}, 'Grant Lead') == []
+    assert facet_values({}, 'Grant Lead') == []
+
+
+def test_build_facet_index_bitsets():
+    records = [{'Grant Lead': 'Lee' if row % 2 == 0 else 'Kim', 'States': 'TX;#1'} for row in range(33)]
+    records[1]['States'] = 'TX;#1;#AL;#2'
+    index = build_facet_index(records, ['Grant Lead', 'States'])
+    assert index['length'] == 33
+    assert index['words'] == 2
+    assert list(index['facets']['Grant Lead']) == ['Kim', 'Lee']
+    assert index['facets']['Grant Lead']['Lee'] == [0x55555555, 1]
+    assert index['facets']['Grant Lead']['Kim'] == [0xAAAAAAAA, 0]
+    assert index['facets']['States'] == {'AL': [0b10, 0], 'TX': [0xFFFFFFFF, 1]}
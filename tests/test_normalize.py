@@ -0,0 +1,38 @@
+import math
+
+import pandas as pd
+
+from normalize import format_iso_dates, parse_currency, parse_dates
+
+
+def test_parse_dates_mixed_formats():
+    values = pd.Series(['2024-01-05', '01/06/2024', '', None, 'March 4, 2024'])
+    parsed = parse_dates(values, 'Mixed Test Date')
+    assert parsed.tolist()[:2] == [pd.Timestamp('2024-01-05'), pd.Timestamp('2024-01-06')]
+    assert parsed[2:4].isna().all()
+    assert parsed[4] == pd.Timestamp('2024-03-04')
+
+
+def test_parse_dates_reports_rejected_values(capsys):
+    parsed = parse_dates(pd.Series(['2024-01-05', 'soon', '']), 'Rejected Test Date', 'tracker.csv')
+    assert parsed.isna().tolist() == [False, True, True]
+    out = capsys.readouterr().out
+    assert "1 Rejected Test Date value(s) in 'tracker.csv'" in out
+    assert "'soon' (row 3)" in out
+
+
+def test_parse_dates_passes_datetimes_through():
+    values = pd.Series(pd.to_datetime(['2024-01-05']))
+    assert parse_dates(values, 'Parsed Test Date') is values
+
+
+def test_parse_currency():
+    parsed = parse_currency(pd.Series(['$1,234.50', '(1,234.50)', '100', 'n/a']), 'Award Amount')
+    assert parsed.tolist()[:3] == [1234.5, -1234.5, 100.0]
+    assert math.isnan(parsed[3])
+
+
+def test_format_iso_dates_keeps_missing_dates_missing():
+    formatted = format_iso_dates(pd.Series([pd.Timestamp('2024-01-05 13:30'), pd.NaT]))
+    assert formatted[0] == '2024-01-05'
+    assert pd.isna(formatted[1])
@@ -0,0 +1,35 @@
+import pandas as pd
+
+from status_series import build_status_series
+
+
+def ms(date):
+    return int(pd.Timestamp(date).timestamp() * 1000)
+
+
+def awards():
+    return pd.DataFrame({
+        'Grant Lead': ['Lee', 'Lee', 'Kim'],
+        'Programs Staff Lead': ['Ray', 'Sam', 'Ray'],
+        'Project Start Date': ['2024-01-01', '2024-01-01', '2024-02-01'],
+        'Project End Date': ['2025-01-01', '2024-06-01', '2025-01-01'],
+        'Award Amount': [100, 50.5, 25],
+    })
+
+
+def test_all_awards_series():
+    result = build_status_series(awards())
+    assert result['fields'] == ['Grant Lead', 'Programs Staff Lead']
+    everything = result['series']['|']
+    assert everything['n'] == 3
+    assert everything['total'] == 175.5
+    assert everything['start'] == {'t': [ms('2024-01-01'), ms('2024-02-01')], 'amount': [150.5, 175.5], 'count': [2, 3]}
+    assert everything['end'] == {'t': [ms('2024-06-01'), ms('2025-01-01')], 'amount': [50.5, 175.5], 'count': [1, 3]}
+
+
+def test_series_per_filter_combination():
+    series = build_status_series(awards())['series']
+    assert set(series) == {'|', '|Ray', '|Sam', 'Kim|', 'Kim|Ray', 'Lee|', 'Lee|Ray', 'Lee|Sam'}
+    assert series['Lee|']['n'] == 2
+    assert series['|Ray']['total'] == 125.0
+    assert series['Lee|Sam']['end']['t'] == [ms('2024-06-01')]
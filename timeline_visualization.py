@@ -1,685 +1,309 @@
-import pandas as pd
+import argparse
 import json
+import os
 from datetime import datetime
 
-# Read and prepare the data
-df = pd.read_csv('Master Tracker 04162025.csv', encoding='windows-1252')
-df.columns = df.columns.str.strip()
-
-# Convert dates and clean data
-df['Project Start Date'] = pd.to_datetime(df['Project Start Date'], errors='coerce')
-df['Project End Date'] = pd.to_datetime(df['Project End Date'], errors='coerce')
-
-# Clean and convert Award Amount - remove any currency symbols and commas, then convert to float
-df['Award Amount'] = df['Award Amount'].astype(str).str.replace('$', '').str.replace(',', '').str.replace('(', '-').str.replace(')', '')
-df['Award Amount'] = pd.to_numeric(df['Award Amount'], errors='coerce')
-
-# Remove rows with invalid dates
-df = df.dropna(subset=['Project Start Date', 'Project End Date'])
-
-# Sort by end date
-df = df.sort_values('Project End Date', ascending=True)
-
-# Create color coding
-today = datetime.now()
-df['Status'] = df['Project End Date'].apply(lambda x: 'Closed' if x < today else 'Active')
-df['Color'] = df['Status'].map({'Closed': 'grey', 'Active': 'rgb(30, 144, 255)'})
-
-# Convert DataFrame to list of dictionaries for JSON, converting dates to strings
-json_data = []
-for _, row in df.iterrows():
-    data_dict = row.to_dict()
-    # Convert datetime objects to strings
-    if isinstance(data_dict['Project Start Date'], pd.Timestamp):
-        data_dict['Project Start Date'] = data_dict['Project Start Date'].strftime('%Y-%m-%d')
-    if isinstance(data_dict['Project End Date'], pd.Timestamp):
-        data_dict['Project End Date'] = data_dict['Project End Date'].strftime('%Y-%m-%d')
-    # Ensure Award Amount is a number
-    if pd.isna(data_dict['Award Amount']):
-        data_dict['Award Amount'] = 0
-    else:
-        data_dict['Award Amount'] = float(data_dict['Award Amount'])
-    json_data.append(data_dict)
-
-# Print some debug information
-print(f"Total number of awards: {len(df)}")
-print(f"Total award amount: ${df['Award Amount'].sum():,.2f}")
-print(f"Number of awards with non-zero amount: {(df['Award Amount'] > 0).sum()}")
-
-# Read amendment data
-amendment_data = {}
-try:
-    amendment_df = pd.read_excel('Award_Details_20250505.xlsx', sheet_name='Award Details')
-    print(f"\nReading amendment data from Award_Details_20250505.xlsx")
-    print(f"Number of records: {len(amendment_df)}")
-    
-    # Group amendments by FAIN
-    for _, row in amendment_df.iterrows():
-        fain = row['FAIN']
-        amendment_type = row['Amendment Type']
+from amendment_index import build_amendment_index
+from award_store import STORE_PATH, write_award_store
+from build_history import HISTORY_PATH, HistoryError, check_week, record_build
+from build_manifest import (diff_hashes, fain_record_hashes, load_manifest, new_amendments,
+                            print_change_report, save_manifest, schema_hash)
+from build_profile import PROFILE_MODES, REPORT_PATH, BuildProfile
+from closeout_buckets import add_closeout_fields
+from columnar_payload import TIMELINE_FIELDS, encode_columnar
+from dashboard_templates import render_dashboards, render_to_file
+from data_files import DATA_DIR, write_shared_data
+from data_loader import (AWARD_DATE_COLUMNS, AWARD_DETAILS_PATH, SchemaError, group_amendments, load_award_details,
+                         load_master_tracker)
+from normalize import format_iso_dates
+from process_amendments import write_amendment_json
+from status_series import build_status_series
+
+OUTPUT_PATH = 'project_timeline_d3_filtered.html'
+
+# The page template in templates/; its {{ name }} placeholders are filled in by render_timeline
+TIMELINE_TEMPLATE = 'project_timeline_d3_filtered.html'
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description='Generate the GCERC award timeline visualization.')
+    parser.add_argument('--amendment-json', action='store_true',
+                        help='Also write amendment_data.json from the same parse of the Award Details workbook')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Re-parse the source files instead of using the cache in .cache/sources')
+    parser.add_argument('--payload', choices=['rows', 'columnar'], default='rows',
+                        help='Embed awards as one object per award (rows) or as compact per-field arrays (columnar)')
+    parser.add_argument('--renderer', choices=['svg', 'canvas'], default='svg',
+                        help='Draw award bars and amendment markers as SVG elements or on a single canvas')
+    parser.add_argument('--full-rebuild', action='store_true',
+                        help='Ignore the previous build manifest and re-serialize every award')
+    parser.add_argument('--no-history', action='store_true',
+                        help=f'Do not add this build to the weekly history in {HISTORY_PATH}')
+    parser.add_argument('--week', help='Date to file the history snapshot under (YYYY-MM-DD, default: today)')
+    parser.add_argument('--profile', choices=PROFILE_MODES,
+                        help='Also profile the run with cProfile, or record peak memory per stage with tracemalloc')
+    parser.add_argument('--report', default=REPORT_PATH,
+                        help=f'Where to write the JSON run report with stage timings and counters (default: {REPORT_PATH})')
+    return parser
+
+
+def award_records_json(df):
+    """JSON for each award row; dates become ISO strings and a missing Award Amount becomes 0."""
+    records = df.copy()
+    for column in AWARD_DATE_COLUMNS:
+        records[column] = format_iso_dates(records[column])
+    amounts = records['Award Amount'].astype(float)
+    records['Award Amount'] = amounts.astype(object).where(amounts.notna(), 0)
+    return [json.dumps(record) for record in records.to_dict('records')]
+
+
+def timeline_records_json(df):
+    """award_records_json() of only the fields the timeline draws, so abstracts and the like stay out of the page."""
+    return award_records_json(df[[field for field in TIMELINE_FIELDS if field in df.columns]])
+
+
+def prepare_awards(df):
+    """Drop awards without valid dates, sort by end date and add build-time Status/Color."""
+    # Remove rows with invalid dates
+    df = df.dropna(subset=['Project Start Date', 'Project End Date'])
+
+    # Sort by end date
+    df = df.sort_values('Project End Date', ascending=True)
+
+    # Create color coding
+    today = datetime.now()
+    df['Status'] = df['Project End Date'].apply(lambda x: 'Closed' if x < today else 'Active')
+    df['Color'] = df['Status'].map({'Closed': 'grey', 'Active': 'rgb(30, 144, 255)'})
+    return df
+
+
+def build_award_rows(df, manifest):
+    """Serialize each award as JSON, reusing the previous build's JSON for unchanged FAINs.
+
+    Returns (award_rows, award_hashes, award_payloads, award_changes); award_rows
+    holds one JSON string per award in the sorted row order.
+    """
+    # Diff per-FAIN record hashes against the previous build
+    award_hashes = fain_record_hashes(df)
+    award_changes = diff_hashes(manifest.get('awards', {}), award_hashes)
+    stale_fains = set(award_changes['added'] + award_changes['modified'])
+
+    # Convert only new or changed rows to JSON, reusing the previous build's JSON for the rest
+    previous_payloads = manifest.get('award_payloads', {})
+    award_payloads = {fain: previous_payloads[fain] for fain in award_hashes if fain not in stale_fains}
+    df_fains = df['FAIN'].astype(str)
+    stale = df_fains.isin(stale_fains)
+    for fain, payload in zip(df_fains[stale], award_records_json(df[stale])):
+        award_payloads.setdefault(fain, []).append(payload)
+
+    # Assemble the records in the sorted row order
+    payload_iters = {fain: iter(payloads) for fain, payloads in award_payloads.items()}
+    award_rows = [next(payload_iters[fain]) for fain in df_fains]
+    print(f"Re-serialized {len(stale_fains)} of {len(award_hashes)} awards")
+    return award_rows, award_hashes, award_payloads, award_changes
+
+
+def read_amendment_data(use_cache=True, amendment_json=False, profile=None):
+    """(amendment_data, timeline_amendments), or None when the workbook could not be read (the error is reported).
+
+    amendment_data keeps every dated amendment for the shared data;
+    timeline_amendments only those with an Amendment Type, which the timeline draws.
+    """
+    profile = profile or BuildProfile()
+    try:
+        with profile.stage('read'):
+            amendment_df = load_award_details(use_cache=use_cache)
+        profile.count('amendment_rows', len(amendment_df))
+        print(f"\nReading amendment data from {AWARD_DETAILS_PATH}")
+        print(f"Number of records: {len(amendment_df)}")
+
+        if amendment_json:
+            with profile.stage('write'):
+                write_amendment_json(amendment_df)
+
+        # Group amendments by FAIN; blank types are kept for the dashboards and left off the timeline
+        with profile.stage('group'):
+            amendment_data = group_amendments(amendment_df)
+            timeline_amendments = group_amendments(amendment_df, require_type=True)
+
+        print(f"Number of awards with amendments: {len(amendment_data)}")
+        total_amendments = sum(len(amendments) for amendments in amendment_data.values())
+        print(f"Total number of amendments: {total_amendments}")
+        profile.count('awards_with_amendments', len(amendment_data))
+        profile.count('amendments', total_amendments)
         
-        # Only process rows that have a FAIN and a non-empty Amendment Type
-        if pd.isna(fain) or pd.isna(amendment_type) or str(amendment_type).strip() == '':
-            continue
-            
-        if fain not in amendment_data:
-            amendment_data[fain] = []
+        # Print some sample amendment data
+        print("\nSample amendment data:")
+        sample_fains = list(amendment_data.keys())[:3]
+        for fain in sample_fains:
+            print(f"\nFAIN: {fain}")
+            for amendment in amendment_data[fain]:
+                print(f"  - Date: {amendment['date']}, Type: {amendment['type']}")
         
-        # Get the amendment date from Day of Award Issue Date
-        amendment_date = row['Day of Award Issue Date']
-        if pd.notna(amendment_date):
-            if isinstance(amendment_date, pd.Timestamp):
-                amendment_date = amendment_date.strftime('%Y-%m-%d')
-            
-            amendment_data[fain].append({
-                'date': amendment_date,
-                'type': str(amendment_type).strip()
-            })
-    
-    print(f"Number of awards with amendments: {len(amendment_data)}")
-    total_amendments = sum(len(amendments) for amendments in amendment_data.values())
-    print(f"Total number of amendments: {total_amendments}")
-    
-    # Print some sample amendment data
-    print("\nSample amendment data:")
-    sample_fains = list(amendment_data.keys())[:3]
-    for fain in sample_fains:
-        print(f"\nFAIN: {fain}")
-        for amendment in amendment_data[fain]:
-            print(f"  - Date: {amendment['date']}, Type: {amendment['type']}")
-    
-except Exception as e:
-    print(f"Warning: Could not read amendment data: {e}")
-    print("Exception details:", str(e.__class__.__name__))
-    import traceback
-    traceback.print_exc()
-    amendment_data = {}
-
-# Create the HTML file with embedded data
-html_content = f'''<!DOCTYPE html>
-<html>
-<head>
-    <title>GCERC Award Timeline with Filtering</title>
-    <script src="https://d3js.org/d3.v7.min.js"></script>
-    <style>
-        body {{
-            font-family: Arial, sans-serif;
-            margin: 20px;
-            background-color: #f8f9fa;
-        }}
-        .bar {{
-            fill-opacity: 0.8;
-        }}
-        .bar:hover {{
-            fill-opacity: 1;
-        }}
-        .axis text {{
-            font-size: 16px;
-        }}
-        .axis path,
-        .axis line {{
-            fill: none;
-            stroke: #000;
-            shape-rendering: crispEdges;
-        }}
-        .grid line {{
-            stroke: lightgrey;
-            stroke-opacity: 0.7;
-            shape-rendering: crispEdges;
-        }}
-        .grid path {{
-            stroke-width: 0;
-        }}
-        .legend-box {{
-            fill: white;
-            stroke: #ccc;
-            stroke-width: 1px;
-            rx: 5;
-            ry: 5;
-        }}
-        .legend-title {{
-            font-size: 18px;
-            font-weight: bold;
-        }}
-        .legend-subtitle {{
-            font-size: 16px;
-            font-weight: bold;
-            fill: #666;
-        }}
-        .legend-text {{
-            font-size: 14px;
-        }}
-        .legend-total {{
-            font-size: 14px;
-            font-weight: bold;
-            fill: #444;
-        }}
-        .tooltip {{
-            position: absolute;
-            padding: 10px;
-            background: rgba(0, 0, 0, 0.8);
-            color: white;
-            border-radius: 4px;
-            font-size: 14px;
-            pointer-events: none;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.2);
-        }}
-        .today-line {{
-            stroke: red;
-            stroke-width: 2;
-            stroke-dasharray: 5,5;
-        }}
-        .today-date {{
-            fill: red;
-            font-size: 14px;
-            font-weight: bold;
-        }}
-        .filter-controls {{
-            margin-bottom: 20px;
-            padding: 15px;
-            background: white;
-            border-radius: 5px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        .filter-select {{
-            margin-right: 20px;
-            font-size: 14px;
-            padding: 8px;
-            min-width: 200px;
-            border: 1px solid #ccc;
-            border-radius: 4px;
-        }}
-        #timeline {{
-            background: white;
-            padding: 20px;
-            border-radius: 5px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        .graph-title {{
-            font-size: 24px;
-            font-weight: bold;
-            margin-bottom: 20px;
-        }}
-        .date-slider-container {{
-            margin: 20px;
-            padding: 20px;
-            background: white;
-            border-radius: 10px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        .date-label {{
-            font-size: 18px;
-            font-weight: bold;
-            color: #444;
-            margin-bottom: 15px;
-            text-align: center;
-        }}
-        .date-slider {{
-            -webkit-appearance: none;
-            width: 100%;
-            height: 8px;
-            border-radius: 4px;
-            background: #e0e0e0;
-            outline: none;
-            margin: 20px 0;
-            box-shadow: inset 0 1px 3px rgba(0,0,0,0.2);
-        }}
-        .date-slider::-webkit-slider-thumb {{
-            -webkit-appearance: none;
-            appearance: none;
-            width: 24px;
-            height: 24px;
-            border-radius: 50%;
-            background: #2196F3;
-            cursor: pointer;
-            border: 2px solid white;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.2);
-            transition: all 0.2s ease;
-        }}
-        .date-slider::-webkit-slider-thumb:hover {{
-            background: #1976D2;
-            transform: scale(1.1);
-        }}
-        .date-slider::-moz-range-thumb {{
-            width: 24px;
-            height: 24px;
-            border-radius: 50%;
-            background: #2196F3;
-            cursor: pointer;
-            border: 2px solid white;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.2);
-            transition: all 0.2s ease;
-        }}
-        .date-slider::-moz-range-thumb:hover {{
-            background: #1976D2;
-            transform: scale(1.1);
-        }}
-        .date-slider::-webkit-slider-runnable-track {{
-            height: 8px;
-            border-radius: 4px;
-            background: linear-gradient(to right, #e0e0e0, #2196F3);
-        }}
-        .date-slider::-moz-range-track {{
-            height: 8px;
-            border-radius: 4px;
-            background: linear-gradient(to right, #e0e0e0, #2196F3);
-        }}
-        .date-slider:focus {{
-            outline: none;
-        }}
-        .date-slider:focus::-webkit-slider-thumb {{
-            box-shadow: 0 0 0 3px rgba(33, 150, 243, 0.3);
-        }}
-        .date-slider:focus::-moz-range-thumb {{
-            box-shadow: 0 0 0 3px rgba(33, 150, 243, 0.3);
-        }}
-    </style>
-</head>
-<body>
-    <div class="filter-controls">
-        <select id="grantLeadFilter" class="filter-select">
-            <option value="">All Grant Leads</option>
-        </select>
-        <select id="programStaffFilter" class="filter-select">
-            <option value="">All Program Staff</option>
-        </select>
-    </div>
-    <div class="date-slider-container">
-        <div class="date-label">Timeline Position: <span id="selectedDate"></span></div>
-        <input type="range" id="dateSlider" class="date-slider" step="1">
-    </div>
-    <div class="graph-title">GCERC Award Timeline</div>
-    <div id="timeline"></div>
-    <script>
-        // Process data first
-        const today = new Date();
-
-        // Embed the project data directly
-        const jsonData = {json.dumps(json_data)};
-
-        // Embed the amendment data directly
-        const amendmentData = {json.dumps(amendment_data)};
-
-        // Process the embedded data
-        const data = jsonData.map(d => {{
-            const startDate = new Date(d['Project Start Date']);
-            const endDate = new Date(d['Project End Date']);
-            return {{
-                ...d,
-                startDate: startDate,
-                endDate: endDate,
-                status: endDate < today ? 'Closed' : 'Active',
-                color: endDate < today ? 'grey' : 'rgb(30, 144, 255)'
-            }};
-        }})
-        .filter(d => !isNaN(d.startDate) && !isNaN(d.endDate))
-        .sort((a, b) => b.endDate - a.endDate);  // Sort by end date descending
-
-        // Set up date slider
-        const minDate = d3.min(data, d => d.startDate);
-        const maxDate = d3.max(data, d => d.endDate);
-        const dateSlider = document.getElementById('dateSlider');
-        dateSlider.min = minDate.getTime();
-        dateSlider.max = maxDate.getTime();
-        dateSlider.value = today.getTime();
-
-        // Format date for display
-        const formatDate = d3.timeFormat("%B %d, %Y");
-        document.getElementById('selectedDate').textContent = formatDate(today);
-
-        // Update date label when slider moves
-        dateSlider.addEventListener('input', function() {{
-            const selectedDate = new Date(parseInt(this.value));
-            document.getElementById('selectedDate').textContent = formatDate(selectedDate);
-            updateVisualization(getFilteredData(), selectedDate);
-        }});
-
-        console.log("Number of valid projects:", data.length);
-
-        // Populate dropdown menus
-        const grantLeads = [...new Set(data.map(d => d['Grant Lead']).filter(Boolean))].sort();
-        const programStaff = [...new Set(data.map(d => d['Programs Staff Lead']).filter(Boolean))].sort();
-
-        const grantLeadSelect = d3.select("#grantLeadFilter");
-        const programStaffSelect = d3.select("#programStaffFilter");
-
-        grantLeads.forEach(lead => {{
-            grantLeadSelect.append("option")
-                .attr("value", lead)
-                .text(lead);
-        }});
-
-        programStaff.forEach(staff => {{
-            programStaffSelect.append("option")
-                .attr("value", staff)
-                .text(staff);
-        }});
-
-        // Set up dimensions
-        const margin = {{top: 200, right: 100, bottom: 50, left: 250}};
-        const width = 1920 - margin.left - margin.right;
-        const barHeight = 15;
-        const height = Math.max(400, data.length * barHeight);
-
-        // Create SVG
-        const svg = d3.select("#timeline")
-            .append("svg")
-            .attr("width", width + margin.left + margin.right)
-            .attr("height", height + margin.top + margin.bottom)
-            .append("g")
-            .attr("transform", `translate(${{margin.left}},${{margin.top}})`);
-
-        // Set up scales
-        const x = d3.scaleTime()
-            .domain([minDate, maxDate])
-            .range([0, width]);
-
-        const y = d3.scaleBand()
-            .domain(data.map(d => d.FAIN))
-            .range([0, height])
-            .padding(0.2);
-
-        function getFilteredData() {{
-            const selectedGrantLead = d3.select("#grantLeadFilter").property("value");
-            const selectedProgramStaff = d3.select("#programStaffFilter").property("value");
-
-            let filteredData = data;
-
-            if (selectedGrantLead) {{
-                filteredData = filteredData.filter(d => d['Grant Lead'] === selectedGrantLead);
-            }}
-            if (selectedProgramStaff) {{
-                filteredData = filteredData.filter(d => d['Programs Staff Lead'] === selectedProgramStaff);
-            }}
-
-            return filteredData;
-        }}
-
-        // Function to update the visualization
-        function updateVisualization(filteredData, selectedDate) {{
-            // Update status and colors based on selected date
-            filteredData.forEach(d => {{
-                d.status = d.endDate < selectedDate ? 'Closed' : 'Active';
-                d.color = d.endDate < selectedDate ? 'grey' : 'rgb(30, 144, 255)';
-            }});
-
-            // Update y-scale domain with filtered data
-            y.domain(filteredData.map(d => d.FAIN));
-
-            // Update height
-            const newHeight = Math.max(400, filteredData.length * barHeight);
-            d3.select("#timeline svg")
-                .attr("height", newHeight + margin.top + margin.bottom);
-
-            // Update y-scale range
-            y.range([0, newHeight]);
-
-            // Update bars
-            const bars = svg.selectAll(".bar")
-                .data(filteredData, d => d.FAIN);
-
-            // Remove old bars
-            bars.exit().remove();
-
-            // Add new bars and update existing ones
-            bars.enter()
-                .append("rect")
-                .attr("class", "bar")
-                .merge(bars)
-                .attr("x", d => x(d.startDate))
-                .attr("y", d => y(d.FAIN))
-                .attr("width", d => Math.max(1, x(d.endDate) - x(d.startDate)))
-                .attr("height", y.bandwidth())
-                .attr("fill", d => d.color);
-
-            // Update axes
-            svg.selectAll(".axis").remove();
-
-            // Add x-axis
-            svg.append("g")
-                .attr("class", "axis")
-                .attr("transform", `translate(0,${{newHeight}})`)
-                .call(d3.axisBottom(x)
-                    .ticks(d3.timeYear.every(1))
-                    .tickFormat(d3.timeFormat("%Y")));
-
-            // Add y-axis
-            svg.append("g")
-                .attr("class", "axis")
-                .call(d3.axisLeft(y));
-
-            // Add grid lines
-            svg.append("g")
-                .attr("class", "grid")
-                .attr("transform", `translate(0,${{newHeight}})`)
-                .call(d3.axisBottom(x)
-                    .ticks(d3.timeYear.every(1))
-                    .tickSize(-newHeight)
-                    .tickFormat(""));
-
-            // Update date line
-            svg.selectAll(".today-line, .today-date").remove();
-            svg.append("line")
-                .attr("class", "today-line")
-                .attr("x1", x(selectedDate))
-                .attr("x2", x(selectedDate))
-                .attr("y1", 0)
-                .attr("y2", newHeight);
-            
-            svg.append("text")
-                .attr("class", "today-date")
-                .attr("x", x(selectedDate))
-                .attr("y", -5)
-                .attr("text-anchor", "middle")
-                .text(formatDate(selectedDate));
-
-            // Calculate award totals based on selected date
-            const closedTotal = filteredData
-                .filter(d => d.status === 'Closed')
-                .reduce((sum, d) => sum + (typeof d['Award Amount'] === 'number' ? d['Award Amount'] : 0), 0);
-            
-            const activeTotal = filteredData
-                .filter(d => d.status === 'Active')
-                .reduce((sum, d) => sum + (typeof d['Award Amount'] === 'number' ? d['Award Amount'] : 0), 0);
-
-            // Calculate amendments up to selected date
-            const amendmentsUpToDate = Object.entries(amendmentData).reduce((count, [fain, amendments]) => {{
-                const validAmendments = amendments.filter(a => {{
-                    const amendDate = new Date(a.date);
-                    return amendDate <= selectedDate;
-                }});
-                return count + validAmendments.length;
-            }}, 0);
-
-            // Update legend
-            svg.selectAll(".legend").remove();
-            
-            const legend = svg.append("g")
-                .attr("class", "legend")
-                .attr("transform", "translate(" + (-margin.left + 20) + ", " + (-margin.top + 20) + ")");
-
-            // Add legend background
-            const legendPadding = 15;
-            const legendWidth = 480;
-            const legendHeight = 150;
-            
-            legend.append("rect")
-                .attr("class", "legend-box")
-                .attr("x", 0)
-                .attr("y", 0)
-                .attr("width", legendWidth)
-                .attr("height", legendHeight);
-
-            // Calculate grand total based on selected date
-            const grandTotal = filteredData
-                .filter(d => d.startDate <= selectedDate)  // Only include awards that have started by the selected date
-                .reduce((sum, d) => sum + (typeof d['Award Amount'] === 'number' ? d['Award Amount'] : 0), 0);
-
-            // Format currency
-            const formatCurrency = new Intl.NumberFormat('en-US', {{
-                style: 'currency',
-                currency: 'USD',
-                minimumFractionDigits: 2,
-                maximumFractionDigits: 2
-            }});
-
-            // Add main title with grand total
-            legend.append("text")
-                .attr("class", "legend-title")
-                .attr("x", legendPadding)
-                .attr("y", legendPadding + 15)
-                .text("All Awards: ");
-
-            legend.append("text")
-                .attr("class", "legend-subtitle")
-                .attr("x", legendPadding + 120)
-                .attr("y", legendPadding + 15)
-                .style("font-size", "18px")
-                .text(formatCurrency.format(grandTotal));
-
-            const statuses = ['Closed', 'Active'];
-            const colors = ['grey', 'rgb(30, 144, 255)'];
-            const totals = [closedTotal, activeTotal];
-
-            statuses.forEach((status, i) => {{
-                const legendRow = legend.append("g")
-                    .attr("transform", "translate(" + legendPadding + ", " + (legendPadding + 35 + (i * 30)) + ")");
-
-                // Add color box
-                legendRow.append("rect")
-                    .attr("width", 16)
-                    .attr("height", 16)
-                    .attr("fill", colors[i]);
-
-                // Add status label
-                legendRow.append("text")
-                    .attr("class", "legend-text")
-                    .attr("x", 24)
-                    .attr("y", 12)
-                    .text(status + " Awards:");
-
-                // Add total amount
-                legendRow.append("text")
-                    .attr("class", "legend-total")
-                    .attr("x", 24)
-                    .attr("y", 12)
-                    .attr("dx", "120")
-                    .text(formatCurrency.format(totals[i]));
-            }});
-
-            // Add amendment marker to legend
-            const amendmentRow = legend.append("g")
-                .attr("transform", "translate(" + legendPadding + ", " + (legendPadding + 95) + ")");
-
-            // Add amendment line
-            amendmentRow.append("line")
-                .attr("x1", 0)
-                .attr("x2", 0)
-                .attr("y1", 0)
-                .attr("y2", 16)
-                .attr("stroke", "black")
-                .attr("stroke-width", 2);
-
-            // Add amendment label with count up to selected date
-            amendmentRow.append("text")
-                .attr("class", "legend-text")
-                .attr("x", 24)
-                .attr("y", 12)
-                .text("Amendment Date (n = " + amendmentsUpToDate + ")");
-
-            // Add date of data text at bottom right of legend
-            legend.append("text")
-                .attr("class", "data-date")
-                .attr("x", legendWidth - legendPadding)
-                .attr("y", legendHeight - legendPadding)
-                .attr("text-anchor", "end")
-                .style("font-size", "14px")
-                .style("fill", "#666")
-                .text("Date of Source Data = April 19, 2025");
-
-            // Update tooltips
-            svg.selectAll(".bar")
-                .on("mouseover", function(event, d) {{
-                    const tooltip = d3.select("body")
-                        .append("div")
-                        .attr("class", "tooltip")
-                        .style("opacity", 0);
-
-                    tooltip.transition()
-                        .duration(200)
-                        .style("opacity", .9);
-                    tooltip.html(`<b>${{d.Title}}</b><br>
-                                FAIN: ${{d.FAIN}}<br>
-                                Duration: ${{d3.timeFormat("%Y-%m-%d")(d.startDate)}} to ${{d3.timeFormat("%Y-%m-%d")(d.endDate)}}<br>
-                                Award Amount: $${{d['Award Amount']?.toLocaleString() || 'N/A'}}<br>
-                                Grant Lead: ${{d['Grant Lead'] || 'N/A'}}<br>
-                                Program Staff: ${{d['Programs Staff Lead'] || 'N/A'}}`)
-                        .style("left", (event.pageX + 10) + "px")
-                        .style("top", (event.pageY - 28) + "px");
-                }})
-                .on("mouseout", function() {{
-                    d3.selectAll(".tooltip").remove();
-                }});
-
-            // Add amendment lines up to selected date
-            svg.selectAll(".amendment-line").remove();
-            filteredData.forEach(d => {{
-                const amendments = amendmentData[d.FAIN] || [];
-                amendments.forEach(amendment => {{
-                    if (amendment.date) {{
-                        const amendmentDate = new Date(amendment.date);
-                        if (amendmentDate <= selectedDate && amendmentDate >= d.startDate && amendmentDate <= d.endDate) {{
-                            svg.append("line")
-                                .attr("class", "amendment-line")
-                                .attr("x1", x(amendmentDate))
-                                .attr("x2", x(amendmentDate))
-                                .attr("y1", y(d.FAIN))
-                                .attr("y2", y(d.FAIN) + y.bandwidth())
-                                .attr("stroke", "black")
-                                .attr("stroke-width", 2)
-                                .style("pointer-events", "all")
-                                .on("mouseover", function(event) {{
-                                    const tooltip = d3.select("body")
-                                        .append("div")
-                                        .attr("class", "tooltip")
-                                        .style("opacity", 0);
-
-                                    tooltip.transition()
-                                        .duration(200)
-                                        .style("opacity", .9);
-                                    tooltip.html(`Amendment Date: ${{amendment.date}}<br>
-                                                Type: ${{amendment.type || 'N/A'}}`)
-                                        .style("left", (event.pageX + 10) + "px")
-                                        .style("top", (event.pageY - 28) + "px");
-                                }})
-                                .on("mouseout", function() {{
-                                    d3.selectAll(".tooltip").remove();
-                                }});
-                        }}
-                    }}
-                }});
-            }});
-        }}
-
-        // Initial visualization with all data
-        updateVisualization(data, today);
-
-        // Add filter event listeners
-        d3.select("#grantLeadFilter").on("change", function() {{
-            updateVisualization(getFilteredData(), new Date(dateSlider.value));
-        }});
-        d3.select("#programStaffFilter").on("change", function() {{
-            updateVisualization(getFilteredData(), new Date(dateSlider.value));
-        }});
-
-        console.log(`Loaded ${{data.length}} projects`);
-    </script>
-</body>
-</html>
-'''
-
-# Write the HTML file
-with open('project_timeline_d3_filtered.html', 'w', encoding='utf-8') as f:
-    f.write(html_content)
-
-print("D3.js timeline visualization has been saved to 'project_timeline_d3_filtered.html'") 
\ No newline at end of file
+    except SchemaError:
+        raise
+    except Exception as e:
+        print(f"Warning: Could not read amendment data: {e}")
+        print("Exception details:", str(e.__class__.__name__))
+        import traceback
+        traceback.print_exc()
+        return None
+    return amendment_data, timeline_amendments
+
+
+def shared_records(award_rows):
+    """The award records the dashboards share, with their closeout fields (Status/Color are timeline-only)."""
+    return add_closeout_fields([
+        {key: value for key, value in json.loads(row).items() if key not in ('Status', 'Color')}
+        for row in award_rows
+    ])
+
+
+def write_json_array(out, payloads):
+    """Write already-serialized JSON values to out as one array, a record at a time."""
+    out.write('[')
+    for i, payload in enumerate(payloads):
+        if i:
+            out.write(', ')
+        out.write(payload)
+    out.write(']')
+
+
+def write_compact_json(value):
+    """Placeholder value that serializes straight into the output stream."""
+    return lambda out: json.dump(value, out, separators=(',', ':'))
+
+
+def render_timeline(df, timeline_amendments, payload='rows', renderer='svg', path=OUTPUT_PATH):
+    """Stream the timeline page with the awards, amendment index and status series embedded.
+
+    timeline_amendments are grouped with require_type=True, so amendments without a type get no marker.
+
+    The page is only replaced when its content changed; returns its sha256.
+    """
+    # Pick the payload embedded in the page
+    if payload == 'columnar':
+        write_awards = write_compact_json(encode_columnar(df))
+    else:
+        def write_awards(out):
+            write_json_array(out, timeline_records_json(df))
+
+    def write_measured_awards(out):
+        start = out.tell()
+        write_awards(out)
+        print(f"Embedded award payload ({payload}): {out.tell() - start:,} bytes")
+
+    context = {
+        'payload': payload,
+        'renderer': renderer,
+        'awards': write_measured_awards,
+        # Amendments pre-sorted by date with cumulative counts, for binary search on the page
+        'amendment_index': write_compact_json(build_amendment_index(timeline_amendments)),
+        # Running Active/Closed/total funding per filter combination, so slider moves are lookups
+        'status_series': write_compact_json(build_status_series(df)),
+    }
+    output_sha256, changed = render_to_file(TIMELINE_TEMPLATE, context, path)
+    if changed:
+        print(f"D3.js timeline visualization has been saved to '{path}'")
+    else:
+        print(f"\n'{path}' is already up to date")
+    return output_sha256
+
+
+def load_build_manifest(df, full_rebuild=False):
+    """The previous build's manifest; a changed column layout means nothing can be reused."""
+    manifest = {} if full_rebuild else load_manifest()
+    if manifest.get('schema') != schema_hash(df):
+        manifest = {}
+    return manifest
+
+
+def report_changes(manifest, award_changes, amendment_data, n_awards):
+    """Print what changed since the previous build and return it for the manifest."""
+    changes = {
+        'awards': award_changes,
+        'new_amendments': new_amendments(manifest.get('amendments', {}), amendment_data),
+    }
+    if manifest:
+        print_change_report(changes)
+    else:
+        print(f"\nNo previous build manifest; built all {n_awards} awards")
+    return changes
+
+
+def count_build(profile, df, award_changes, data_versions, pages):
+    """Record the award counts and the bytes of every output file written by the build."""
+    profile.count('awards', len(df))
+    profile.count('awards_reserialized', len(award_changes['added']) + len(award_changes['modified']))
+    outputs = [os.path.join(DATA_DIR, name) for name in data_versions] + list(pages) + [OUTPUT_PATH, STORE_PATH]
+    profile.count('output_bytes', sum(os.path.getsize(path) for path in outputs if os.path.exists(path)))
+
+
+def save_build_manifest(df, award_hashes, award_payloads, amendment_data, output_sha256, changes):
+    save_manifest({
+        'schema': schema_hash(df),
+        'awards': award_hashes,
+        'award_payloads': award_payloads,
+        'amendments': {str(fain): amendments for fain, amendments in amendment_data.items()},
+        'output_sha256': output_sha256,
+        'changes': changes,
+    })
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    profile = BuildProfile(args.profile)
+    # A week the history cannot take fails the run before anything is written
+    try:
+        week = None if args.no_history else check_week(args.week)
+    except HistoryError as e:
+        parser.error(str(e))
+
+    # Read and prepare the data (dates and Award Amount are parsed by the loader)
+    with profile.stage('read'):
+        awards = load_master_tracker(use_cache=not args.no_cache)
+    with profile.stage('clean'):
+        df = prepare_awards(awards)
+
+    with profile.stage('serialize'):
+        manifest = load_build_manifest(df, args.full_rebuild)
+        award_rows, award_hashes, award_payloads, award_changes = build_award_rows(df, manifest)
+
+    # Print some debug information
+    print(f"Total number of awards: {len(df)}")
+    print(f"Total award amount: ${df['Award Amount'].sum():,.2f}")
+    print(f"Number of awards with non-zero amount: {(df['Award Amount'] > 0).sum()}")
+
+    amendments = read_amendment_data(use_cache=not args.no_cache, amendment_json=args.amendment_json,
+                                     profile=profile)
+    if amendments is None:
+        # Writing the shared data, store, manifest or history without amendments would make next week's
+        # build report every amendment as new, so only the timeline is drawn, as it always was
+        print("Skipping the shared data, dashboards, award store, manifest and history: no amendment data")
+        with profile.stage('write'):
+            render_timeline(df, {}, args.payload, args.renderer)
+        profile.write_report(args.report)
+        return
+    amendment_data, timeline_amendments = amendments
+    changes = report_changes(manifest, award_changes, amendment_data, len(award_hashes))
+
+    # Write the shared data files the dashboards load, then render the dashboards against them
+    with profile.stage('serialize'):
+        records = shared_records(award_rows)
+    with profile.stage('write'):
+        data_versions = write_shared_data(records, amendment_data)
+        print(f"Shared dashboard data written to data/ (versions: {', '.join(data_versions.values())})")
+        pages = render_dashboards(data_versions)
+        write_award_store(records, amendment_data)
+
+        output_sha256 = render_timeline(df, timeline_amendments, args.payload, args.renderer)
+        save_build_manifest(df, award_hashes, award_payloads, amendment_data, output_sha256, changes)
+        if not args.no_history:
+            record_build(records, amendment_data, week)
+    count_build(profile, df, award_changes, data_versions, pages)
+    profile.write_report(args.report)
+
+
+if __name__ == '__main__':
+    main()
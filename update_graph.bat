@@ -0,0 +1,11 @@
+@echo off
+rem Weekly update: rebuilds the timeline and every dashboard in one run.
+rem Extra arguments are passed through, e.g. update_graph.bat --no-cache
+cd /d "%~dp0"
+if exist venv\Scripts\activate.bat call venv\Scripts\activate.bat
+python build_dashboards.py %*
+if errorlevel 1 (
+    echo Update failed - see the message above.
+    pause
+)
+exit /b %ERRORLEVEL%